@@ -22,6 +22,11 @@ class Command(BaseCommand):
         make_option('--nostatic',
                     action='store_true',
                     help='Skip import of static content'),
+        make_option('--static-workers',
+                    type='int',
+                    dest='static_workers',
+                    default=1,
+                    help='Number of static files to upload at the same time'),
     )
 
     def handle(self, *args, **options):
@@ -46,6 +51,7 @@ class Command(BaseCommand):
             static_content_store=contentstore(), verbose=True,
             do_import_static=do_import_static,
             create_if_not_present=True,
+            static_import_workers=options.get('static_workers') or 1,
         )
 
         for course in course_items:
@@ -316,9 +316,11 @@ class TestCourseListing(ModuleStoreTestCase, XssTestMixin):
             [0, 0, 0]
         )
 
+    # The courses found from the groups are all loaded with one get_courses call, so the
+    # number of queries doesn't depend on how many courses the user has access to.
     @ddt.data(
         (ModuleStoreEnum.Type.split, 3, 13),
-        (ModuleStoreEnum.Type.mongo, USER_COURSES_COUNT, 2)
+        (ModuleStoreEnum.Type.mongo, 1, 2)
     )
     @ddt.unpack
     def test_course_listing_performance(self, store, courses_list_from_group_calls, courses_list_calls):
@@ -416,7 +416,7 @@ def _accessible_courses_list_from_groups(request):
         """ CCXs cannot be edited in Studio and should not be shown in this dashboard """
         return not isinstance(course_access.course_id, CCXLocator)
 
-    courses_list = {}
+    course_keys = []
     in_process_course_actions = []
 
     instructor_courses = UserBasedRole(request.user, CourseInstructorRole.ROLE).courses_with_role()
@@ -428,7 +428,7 @@ def _accessible_courses_list_from_groups(request):
         if course_key is None:
             # If the course_access does not have a course_id, it's an org-based role, so we fall back
             raise AccessListFallback
-        if course_key not in courses_list:
+        if course_key not in course_keys:
             # check for any course action state for this course
             in_process_course_actions.extend(
                 CourseRerunState.objects.find_all(
@@ -437,18 +437,15 @@ def _accessible_courses_list_from_groups(request):
                     course_key=course_key,
                 )
             )
-            # check for the course itself
-            try:
-                course = modulestore().get_course(course_key)
-            except ItemNotFoundError:
-                # If a user has access to a course that doesn't exist, don't do anything with that course
-                pass
-
-            if course is not None and not isinstance(course, ErrorDescriptor):
-                # ignore deleted, errored or ccx courses
-                courses_list[course_key] = course
+            course_keys.append(course_key)
 
-    return courses_list.values(), in_process_course_actions
+    # Load all of the courses together. Courses that a user has access to but that don't
+    # exist aren't returned, and deleted or errored courses are ignored.
+    courses_list = [
+        course for course in modulestore().get_courses(course_keys=course_keys)
+        if not isinstance(course, ErrorDescriptor)
+    ]
+    return courses_list, in_process_course_actions
 
 
 def _accessible_libraries_list(user):
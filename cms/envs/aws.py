@@ -123,6 +123,8 @@ DEFAULT_COURSE_ABOUT_IMAGE_URL = ENV_TOKENS.get('DEFAULT_COURSE_ABOUT_IMAGE_URL'
 # for course data
 GITHUB_REPO_ROOT = ENV_TOKENS.get('GITHUB_REPO_ROOT', GITHUB_REPO_ROOT)
 
+COURSE_IMPORT_STATIC_WORKERS = ENV_TOKENS.get('COURSE_IMPORT_STATIC_WORKERS', COURSE_IMPORT_STATIC_WORKERS)
+
 # STATIC_ROOT specifies the directory where static files are
 # collected
 
@@ -158,6 +160,7 @@ if 'loc_cache' not in CACHES:
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'edx_location_mem_cache',
     }
+COURSE_STRUCTURE_LOCAL_CACHE = ENV_TOKENS.get('COURSE_STRUCTURE_LOCAL_CACHE', COURSE_STRUCTURE_LOCAL_CACHE)
 
 SESSION_COOKIE_DOMAIN = ENV_TOKENS.get('SESSION_COOKIE_DOMAIN')
 SESSION_COOKIE_HTTPONLY = ENV_TOKENS.get('SESSION_COOKIE_HTTPONLY', True)
@@ -324,6 +327,11 @@ MODULESTORE_FIELD_OVERRIDE_PROVIDERS = ENV_TOKENS.get(
     MODULESTORE_FIELD_OVERRIDE_PROVIDERS
 )
 
+CONTENTSERVER_DISK_CACHE_DIR = ENV_TOKENS.get('CONTENTSERVER_DISK_CACHE_DIR', CONTENTSERVER_DISK_CACHE_DIR)
+CONTENTSERVER_DISK_CACHE_MAX_BYTES = ENV_TOKENS.get(
+    'CONTENTSERVER_DISK_CACHE_MAX_BYTES', CONTENTSERVER_DISK_CACHE_MAX_BYTES
+)
+
 XBLOCK_FIELD_DATA_WRAPPERS = ENV_TOKENS.get(
     'XBLOCK_FIELD_DATA_WRAPPERS',
     XBLOCK_FIELD_DATA_WRAPPERS
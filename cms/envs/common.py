@@ -206,6 +206,10 @@ FEATURES = {
 
     # Show Language selector
     'SHOW_LANGUAGE_SELECTOR': False,
+
+    # When a course is published, keep its cached block structure and
+    # recollect only the changed subtrees, if all transformers support it.
+    'ENABLE_INCREMENTAL_BLOCK_STRUCTURE_COLLECTION': False,
 }
 
 ENABLE_JASMINE = False
@@ -439,10 +443,25 @@ MODULESTORE = {
     }
 }
 
+# Process-local cache of deserialized split modulestore course structures, consulted
+# before the 'course_structure_cache'. Structures are immutable, so entries are only
+# evicted to stay within these limits. Set either limit to 0 to disable it.
+COURSE_STRUCTURE_LOCAL_CACHE = {
+    'MAX_ENTRIES': 500,
+    'MAX_BYTES': 256 * 1024 * 1024,
+}
+
 # Modulestore-level field override providers. These field override providers don't
 # require student context.
 MODULESTORE_FIELD_OVERRIDE_PROVIDERS = ()
 
+# A local directory in which the contentserver caches course assets that are
+# too large for the "course_assets" cache (see contentserver.caching), or None
+# to not cache them.
+CONTENTSERVER_DISK_CACHE_DIR = None
+# The most bytes of assets to keep in CONTENTSERVER_DISK_CACHE_DIR.
+CONTENTSERVER_DISK_CACHE_MAX_BYTES = 10 * 1024 * 1024 * 1024
+
 #################### Python sandbox ############################################
 
 CODE_JAIL = {
@@ -456,6 +475,16 @@ CODE_JAIL = {
         # How many CPU seconds can jailed code use?
         'CPU': 1,
     },
+
+    # A pool of persistent sandbox workers, which have already imported the
+    # libraries that problem code uses, to run the code rather than starting
+    # a new sandbox each time.
+    'pool': {
+        # How many workers each process can use.  0 disables the pool.
+        'size': 0,
+        # How many pieces of code each worker runs before it's replaced.
+        'max_jobs_per_worker': 100,
+    },
 }
 
 ############################ DJANGO_BUILTINS ################################
@@ -1070,6 +1099,9 @@ MAX_ASSET_UPLOAD_FILE_SIZE_IN_MB = 10
 # a file that exceeds the above size
 MAX_ASSET_UPLOAD_FILE_SIZE_URL = ""
 
+### Number of static files uploaded to the contentstore at the same time during course import
+COURSE_IMPORT_STATIC_WORKERS = 1
+
 ### Default value for entrance exam minimum score
 ENTRANCE_EXAM_MIN_SCORE_PCT = 50
 
@@ -180,6 +180,12 @@ CACHES = {
     },
 }
 
+# Don't keep course structures around between tests
+COURSE_STRUCTURE_LOCAL_CACHE = {
+    'MAX_ENTRIES': 0,
+    'MAX_BYTES': 0,
+}
+
 # hide ratelimit warnings while running tests
 filterwarnings('ignore', message='No request passed to the backend, unable to rate-limit')
 
@@ -2,4 +2,4 @@
 Serves course assets to end users.
 """
 
-CONTENTSERVER_VERSION = 1
+CONTENTSERVER_VERSION = 2
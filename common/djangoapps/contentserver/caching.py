@@ -1,11 +1,27 @@
 """
 Helper functions for caching course assets.
+
+Small assets are cached, data and all, in the "course_assets" cache.  Larger
+assets can also be cached on local disk (see `DiskContentCache`), in which
+case only their metadata is in the "course_assets" cache.
 """
+import errno
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import tempfile
+
+from django.conf import settings
 from django.core.cache import caches
 from django.core.cache.backends.base import InvalidCacheBackendError
 from opaque_keys import InvalidKeyError
+from xmodule.contentstore.content import StaticContent, StaticContentStream
 from . import CONTENTSERVER_VERSION
 
+log = logging.getLogger(__name__)
+
 # See if there's a "course_assets" cache configured, and if not, fallback to the default cache.
 CONTENT_CACHE = caches['default']
 try:
@@ -13,6 +29,11 @@ try:
 except InvalidCacheBackendError:
     pass
 
+# How many bytes of a memory-mapped asset to return at a time when streaming it.
+MAPPED_CHUNK_SIZE = 64 * 1024
+
+_DISK_CACHE = None
+
 
 def set_cached_content(content):
     """
@@ -47,3 +68,299 @@ def del_cached_content(location):
         pass
 
     CONTENT_CACHE.delete_many(locations, version=CONTENTSERVER_VERSION)
+
+
+def _copy_content(content, content_class, data, *args):
+    """
+    Return a `content_class` with the metadata of `content`, and `data`.
+    """
+    return content_class(
+        content.location, content.name, content.content_type, data, *args,
+        last_modified_at=content.last_modified_at, thumbnail_location=content.thumbnail_location,
+        import_path=content.import_path, length=content.length, locked=content.locked,
+        content_digest=content.content_digest
+    )
+
+
+class DiskCachedContent(StaticContent):
+    """
+    The metadata of an asset whose data is cached in the local disk cache
+    of each server that has served it.
+    """
+    pass
+
+
+class MappedStaticContent(StaticContent):
+    """
+    An asset whose data is a memory-mapped file in the local disk cache.
+    """
+    def __init__(self, loc, name, content_type, data, mapped_file, **kwargs):
+        super(MappedStaticContent, self).__init__(loc, name, content_type, data, **kwargs)
+        self._mapped_file = mapped_file
+
+    @property
+    def data(self):
+        return self._mapped_file[:]
+
+    def stream_data(self):
+        return self.stream_data_in_range(0, self.length - 1)
+
+    def stream_data_in_range(self, first_byte, last_byte):
+        """
+        Stream the data between first_byte and last_byte (included)
+        """
+        for position in xrange(first_byte, last_byte + 1, MAPPED_CHUNK_SIZE):
+            yield self._mapped_file[position:min(position + MAPPED_CHUNK_SIZE, last_byte + 1)]
+
+    def close(self):
+        self._mapped_file.close()
+
+
+class DiskCachingStaticContent(StaticContentStream):
+    """
+    An asset streamed from the contentstore, whose data is written to the
+    local disk cache as it's streamed.  Only streaming all of its data caches
+    it, and only then is its metadata cached in the "course_assets" cache.
+    The disk cache's lock on the asset is held until then, or until the
+    content is closed.
+    """
+    def __init__(self, loc, name, content_type, stream, disk_cache, lock_file, **kwargs):
+        super(DiskCachingStaticContent, self).__init__(loc, name, content_type, stream, **kwargs)
+        self._disk_cache = disk_cache
+        self._lock_file = lock_file
+
+    def stream_data(self):
+        return self.stream_data_in_range(0, self.length - 1)
+
+    def stream_data_in_range(self, first_byte, last_byte):
+        """
+        Stream the data between first_byte and last_byte (included), caching
+        it if that's all of the data.
+        """
+        chunks = super(DiskCachingStaticContent, self).stream_data_in_range(first_byte, last_byte)
+        if self._lock_file is None or (first_byte, last_byte) != (0, self.length - 1):
+            self._release()
+            return chunks
+        return self._stream_to_cache(chunks)
+
+    def _stream_to_cache(self, chunks):
+        """
+        Yield `chunks`, writing them to a temporary file, which is moved into
+        the cache once they've all been written.
+        """
+        temp_file = temp_path = None
+        try:
+            try:
+                # Write to a temporary file first, so that other processes
+                # never see partially written files.
+                temp_fd, temp_path = tempfile.mkstemp(dir=self._disk_cache.directory, prefix=".tmp-")
+                temp_file = os.fdopen(temp_fd, "wb")
+            except (IOError, OSError):
+                log.exception(u"Couldn't cache %s on disk", unicode(self.location))
+            for chunk in chunks:
+                if temp_file is not None:
+                    try:
+                        temp_file.write(chunk)
+                    except (IOError, OSError):
+                        log.exception(u"Couldn't cache %s on disk", unicode(self.location))
+                        temp_file.close()
+                        temp_file = None
+                yield chunk
+            if temp_file is not None:
+                temp_file.close()
+                if self._disk_cache.commit(self, temp_path):
+                    set_cached_content(_copy_content(self, DiskCachedContent, None))
+        finally:
+            if temp_file is not None:
+                temp_file.close()
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            self._release()
+
+    def _release(self):
+        """
+        Release the disk cache's lock on the asset, and remove its lock file.
+        """
+        if self._lock_file is not None:
+            try:
+                # Removed while it's still locked, so that no other process
+                # can lock it in between.
+                os.remove(self._lock_file.name)
+            except OSError:
+                pass
+            finally:
+                self._lock_file.close()
+                self._lock_file = None
+
+    def close(self):
+        self._release()
+        super(DiskCachingStaticContent, self).close()
+
+
+class DiskContentCache(object):
+    """
+    A cache of asset data in files in `directory`, which evicts the least
+    recently used assets when the files take up more than `max_bytes`.
+
+    Files are keyed by the asset's location and digest, so a changed asset is
+    never served from the file of its old version, and they're shared by all
+    of the processes on the server that use the same directory, so the times
+    that they were last used are recorded as the files' modification times.
+    Each asset is only downloaded into the cache by one process at a time,
+    which holds a lock on the asset's lock file, and removes it when done.
+    """
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, content):
+        """
+        Return the path of the file that caches `content`.
+        """
+        # Older assets don't have digests, but do have modification times.
+        version = content.content_digest or content.last_modified_at
+        key = u"{}@{}".format(content.location, version).encode("utf-8")
+        return os.path.join(self.directory, hashlib.sha1(key).hexdigest())
+
+    @staticmethod
+    def _lock_path(path):
+        """
+        Return the path of the lock file of the cache file at `path`.
+        """
+        directory, filename = os.path.split(path)
+        return os.path.join(directory, ".lock-" + filename)
+
+    def get(self, content):
+        """
+        Return a MappedStaticContent with the metadata of `content`, and its
+        cached data, or None if its data isn't cached.
+        """
+        path = self._path(content)
+        try:
+            with open(path, "rb") as cached_file:
+                mapped_file = mmap.mmap(cached_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, OSError, ValueError):
+            return None
+        if len(mapped_file) != content.length:
+            mapped_file.close()
+            return None
+
+        try:
+            os.utime(path, None)
+        except OSError:
+            # It's just been evicted, but we can still use the mapping.
+            pass
+        return _copy_content(content, MappedStaticContent, None, mapped_file)
+
+    def set(self, content):
+        """
+        Start caching the data of `content` (a StaticContentStream).  Returns
+        a DiskCachingStaticContent that caches the data as it's streamed, so
+        that it's only read from the contentstore once, or None if it can't be
+        cached, or if another thread or process is already caching it.
+        """
+        if not content.length or content.length > self.max_bytes:
+            return None
+
+        lock_file = None
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            lock_file = open(self._lock_path(self._path(content)), "a")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except IOError as err:
+                if err.errno not in (errno.EAGAIN, errno.EACCES):
+                    raise
+                lock_file.close()
+                return None
+        except (IOError, OSError):
+            log.exception(u"Couldn't cache %s on disk", unicode(content.location))
+            if lock_file is not None:
+                lock_file.close()
+            return None
+
+        return _copy_content(
+            content, DiskCachingStaticContent, content._stream, self, lock_file  # pylint: disable=protected-access
+        )
+
+    def commit(self, content, temp_path):
+        """
+        Move the temporary file that the data of `content` was written to into
+        the cache, if all of the data was written to it.  Returns whether it
+        was moved.
+        """
+        try:
+            if os.path.getsize(temp_path) != content.length:
+                return False
+            os.rename(temp_path, self._path(content))
+        except OSError:
+            log.exception(u"Couldn't cache %s on disk", unicode(content.location))
+            return False
+        self._evict()
+        return True
+
+    def _evict(self):
+        """
+        Delete the least recently used files until the cache's files take up
+        no more than `max_bytes`.
+        """
+        entries = []
+        for filename in os.listdir(self.directory):
+            if filename.startswith((".tmp-", ".lock-")):
+                continue
+            path = os.path.join(self.directory, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for __, size, __ in entries)
+        for __, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # Another process evicted it first.
+                pass
+            total_bytes -= size
+
+
+def get_disk_cache():
+    """
+    Return the local DiskContentCache, or None if it's not configured.
+    """
+    global _DISK_CACHE  # pylint: disable=global-statement
+    directory = getattr(settings, "CONTENTSERVER_DISK_CACHE_DIR", None)
+    if not directory:
+        return None
+    max_bytes = settings.CONTENTSERVER_DISK_CACHE_MAX_BYTES
+    if _DISK_CACHE is None or (_DISK_CACHE.directory, _DISK_CACHE.max_bytes) != (directory, max_bytes):
+        _DISK_CACHE = DiskContentCache(directory, max_bytes)
+    return _DISK_CACHE
+
+
+def get_disk_cached_content(content):
+    """
+    Given the DiskCachedContent for an asset, return a MappedStaticContent of
+    the asset if it's in the local disk cache, else None.
+    """
+    disk_cache = get_disk_cache()
+    if disk_cache is None:
+        return None
+    return disk_cache.get(content)
+
+
+def set_disk_cached_content(content):
+    """
+    Start caching the data of `content` (a StaticContentStream) in the local
+    disk cache.  Returns a DiskCachingStaticContent to stream the asset from,
+    which caches its data as it's streamed, and then its metadata in the
+    "course_assets" cache, or None if it won't be cached.
+    """
+    disk_cache = get_disk_cache()
+    if disk_cache is None:
+        return None
+    return disk_cache.set(content)
@@ -4,6 +4,7 @@ Middleware to serve assets.
 
 import logging
 import datetime
+import uuid
 import newrelic.agent
 from django.http import (
     HttpResponse, HttpResponseNotModified, HttpResponseForbidden,
@@ -17,7 +18,10 @@ from xmodule.contentstore.content import StaticContent, XASSET_LOCATION_TAG
 from xmodule.modulestore import InvalidLocationError
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.locator import AssetLocator
-from .caching import get_cached_content, set_cached_content
+from .caching import (
+    DiskCachedContent, get_cached_content, get_disk_cache, get_disk_cached_content, set_cached_content,
+    set_disk_cached_content
+)
 from xmodule.modulestore.exceptions import ItemNotFoundError
 from xmodule.exceptions import NotFoundError
 
@@ -26,6 +30,9 @@ from xmodule.exceptions import NotFoundError
 
 log = logging.getLogger(__name__)
 HTTP_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
+# The most (non-overlapping) byte ranges that we'll send parts for. Requests
+# for more ranges get the full content instead.
+MAX_RANGES = 20
 
 
 class StaticContentServer(object):
@@ -108,18 +115,15 @@ class StaticContentServer(object):
                 if if_modified_since == last_modified_at_str:
                     return HttpResponseNotModified()
 
-            # *** File streaming within a byte range ***
+            # *** File streaming within byte ranges ***
             # If a Range is provided, parse Range attribute of the request
             # Add Content-Range in the response if Range is structurally correct
-            # Request -> Range attribute structure: "Range: bytes=first-[last]"
+            # Request -> Range attribute structure: "Range: bytes=first-[last][, first-[last]...]"
             # Response -> Content-Range attribute structure: "Content-Range: bytes first-last/totalLength"
+            # Several ranges are sent back as a multipart/byteranges message.
             # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.35
             response = None
             if request.META.get('HTTP_RANGE'):
-                # If we have a StaticContent, get a StaticContentStream.  Can't manipulate the bytes otherwise.
-                if type(content) == StaticContent:
-                    content = AssetManager.find(loc, as_stream=True)
-
                 header_value = request.META['HTTP_RANGE']
                 try:
                     unit, ranges = parse_range_header(header_value, content.length)
@@ -132,43 +136,49 @@ class StaticContentServer(object):
                     if unit != 'bytes':
                         # Only accept ranges in bytes
                         log.warning(u"Unknown unit in Range header: %s for content: %s", header_value, unicode(loc))
-                    elif len(ranges) > 1:
-                        # According to Http/1.1 spec content for multiple ranges should be sent as a multipart message.
-                        # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.16
-                        # But we send back the full content.
-                        log.warning(
-                            u"More than 1 ranges in Range header: %s for content: %s", header_value, unicode(loc)
-                        )
                     else:
-                        first, last = ranges[0]
-
-                        if 0 <= first <= last < content.length:
-                            # If the byte range is satisfiable
+                        ranges = merge_ranges(
+                            [(first, last) for first, last in ranges if 0 <= first <= last < content.length]
+                        )
+                        if not ranges:
+                            log.warning(
+                                u"Cannot satisfy ranges in Range header: %s for content: %s", header_value, unicode(loc)
+                            )
+                            return HttpResponse(status=416)  # Requested Range Not Satisfiable
+                        elif len(ranges) > MAX_RANGES:
+                            # Don't let clients make us send lots of tiny parts.
+                            log.warning(
+                                u"Too many ranges in Range header: %s for content: %s", header_value, unicode(loc)
+                            )
+                        elif len(ranges) == 1:
+                            first, last = ranges[0]
                             response = HttpResponse(content.stream_data_in_range(first, last))
                             response['Content-Range'] = 'bytes {first}-{last}/{length}'.format(
                                 first=first, last=last, length=content.length
                             )
                             response['Content-Length'] = str(last - first + 1)
-                            response.status_code = 206  # Partial Content
+                            response['Content-Type'] = content.content_type
+                        else:
+                            boundary = uuid.uuid4().hex
+                            response = HttpResponse(stream_byteranges(content, ranges, boundary))
+                            response['Content-Length'] = str(len(response.content))
+                            response['Content-Type'] = 'multipart/byteranges; boundary={}'.format(boundary)
 
+                        if response is not None:
+                            response.status_code = 206  # Partial Content
                             newrelic.agent.add_custom_parameter('contentserver.ranged', True)
-                        else:
-                            log.warning(
-                                u"Cannot satisfy ranges in Range header: %s for content: %s", header_value, unicode(loc)
-                            )
-                            return HttpResponse(status=416)  # Requested Range Not Satisfiable
 
             # If Range header is absent or syntactically invalid return a full content response.
             if response is None:
                 response = HttpResponse(content.stream_data())
                 response['Content-Length'] = content.length
+                response['Content-Type'] = content.content_type
 
             newrelic.agent.add_custom_parameter('contentserver.content_len', content.length)
             newrelic.agent.add_custom_parameter('contentserver.content_type', content.content_type)
 
             # "Accept-Ranges: bytes" tells the user that only "bytes" ranges are allowed
             response['Accept-Ranges'] = 'bytes'
-            response['Content-Type'] = content.content_type
 
             # Set any caching headers, and do any response cleanup needed.  Based on how much
             # middleware we have in place, there's no easy way to use the built-in Django
@@ -263,6 +273,10 @@ class StaticContentServer(object):
 
         # See if we can load this item from cache.
         content = get_cached_content(location)
+        if isinstance(content, DiskCachedContent):
+            # Only the metadata of large assets is cached here, and their data
+            # may be cached on local disk.
+            content = get_disk_cached_content(content)
         if content is None:
             # Not in cache, so just try and load it from the asset manager.
             try:
@@ -276,6 +290,9 @@ class StaticContentServer(object):
             if content.length is not None and content.length < 1048576:
                 content = content.copy_to_in_mem()
                 set_cached_content(content)
+            # Larger assets can be cached on local disk, as they're streamed, if it's configured.
+            elif content.length is not None and get_disk_cache() is not None:
+                content = set_disk_cached_content(content) or content
 
         return content
 
@@ -321,3 +338,38 @@ def parse_range_header(header_value, content_length):
         raise ValueError('Invalid syntax')
 
     return unit, ranges
+
+
+def merge_ranges(ranges):
+    """
+    Returns the given list of (start, end) tuples of ranges, sorted, with
+    overlapping and adjacent ranges merged.
+    """
+    merged = []
+    for first, last in sorted(ranges):
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(last, merged[-1][1]))
+        else:
+            merged.append((first, last))
+    return merged
+
+
+def stream_byteranges(content, ranges, boundary):
+    """
+    Stream the body of a multipart/byteranges message with the given ranges
+    of the content, separated by the boundary.
+
+    See spec for details: http://www.w3.org/Protocols/rfc2616/rfc2616-sec19.html#sec19.2
+    """
+    for first, last in ranges:
+        yield (
+            '--{boundary}\r\n'
+            'Content-Type: {content_type}\r\n'
+            'Content-Range: bytes {first}-{last}/{length}\r\n\r\n'
+        ).format(
+            boundary=boundary, content_type=content.content_type, first=first, last=last, length=content.length
+        )
+        for chunk in content.stream_data_in_range(first, last):
+            yield chunk
+        yield '\r\n'
+    yield '--{boundary}--\r\n'.format(boundary=boundary)
@@ -6,7 +6,11 @@ import copy
 import datetime
 import ddt
 import logging
+import os
+import shutil
 import unittest
+from StringIO import StringIO
+from tempfile import mkdtemp
 from uuid import uuid4
 
 from django.conf import settings
@@ -16,15 +20,19 @@ from django.test.utils import override_settings
 from mock import patch
 
 from xmodule.contentstore.django import contentstore
-from xmodule.contentstore.content import StaticContent
+from xmodule.contentstore.content import StaticContent, StaticContentStream
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.xml_importer import import_course_from_xml
 from xmodule.assetstore.assetmgr import AssetManager
 from opaque_keys import InvalidKeyError
+from opaque_keys.edx.locator import CourseLocator
 from xmodule.modulestore.exceptions import ItemNotFoundError
 
-from contentserver.middleware import parse_range_header, HTTP_DATE_FORMAT, StaticContentServer
+from contentserver.caching import DiskCachedContent, DiskContentCache
+from contentserver.middleware import (
+    merge_ranges, parse_range_header, HTTP_DATE_FORMAT, MAX_RANGES, StaticContentServer
+)
 from student.models import CourseEnrollment
 from student.tests.factories import UserFactory, AdminFactory
 
@@ -206,17 +214,84 @@ class ContentStoreToyCourseTest(SharedModuleStoreTestCase):
 
     def test_range_request_multiple_ranges(self):
         """
-        Test that multiple ranges in request outputs the full content.
+        Test that multiple ranges in request outputs a multipart message with each range.
         """
         first_byte = self.length_unlocked / 4
         last_byte = self.length_unlocked / 2
-        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes={first}-{last}, -100'.format(
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes={first}-{last}, -10'.format(
             first=first_byte, last=last_byte))
 
+        self.assertEqual(resp.status_code, 206)
+        self.assertNotIn('Content-Range', resp)
+        self.assertEqual(resp['Content-Length'], str(len(resp.content)))
+        content_type, boundary = resp['Content-Type'].split('; boundary=')
+        self.assertEqual(content_type, 'multipart/byteranges')
+
+        data = self.contentstore.find(self.unlocked_asset).data
+        parts = resp.content.split('--{}'.format(boundary))
+        self.assertEqual(parts[0], '')
+        self.assertEqual(parts[-1], '--\r\n')
+        expected_ranges = [(first_byte, last_byte), (self.length_unlocked - 10, self.length_unlocked - 1)]
+        for part, (first, last) in zip(parts[1:-1], expected_ranges):
+            headers, body = part.split('\r\n\r\n', 1)
+            self.assertIn('Content-Range: bytes {first}-{last}/{length}'.format(
+                first=first, last=last, length=self.length_unlocked), headers)
+            self.assertEqual(body, data[first:last + 1] + '\r\n')
+
+    def test_range_request_overlapping_ranges(self):
+        """
+        Test that overlapping ranges are merged into one range.
+        """
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes=0-9, 5-19')
+
+        self.assertEqual(resp.status_code, 206)
+        self.assertEqual(resp['Content-Range'], 'bytes 0-19/{length}'.format(length=self.length_unlocked))
+        self.assertEqual(resp['Content-Length'], '20')
+
+    def test_range_request_too_many_ranges(self):
+        """
+        Test that too many ranges in request outputs the full content.
+        """
+        header_value = 'bytes=' + ', '.join('{0}-{0}'.format(byte) for byte in range(0, 2 * MAX_RANGES + 2, 2))
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE=header_value)
+
         self.assertEqual(resp.status_code, 200)
         self.assertNotIn('Content-Range', resp)
         self.assertEqual(resp['Content-Length'], str(self.length_unlocked))
 
+    def test_large_asset_disk_cache(self):
+        """
+        Test that assets too large for the cache are cached on local disk, and served from there.
+        """
+        data = 'abcdefghij' * 150000
+        large_asset = self.course_key.make_asset_key('asset', 'large_asset.txt')
+        self.contentstore.save(StaticContent(large_asset, 'large_asset.txt', 'text/plain', data))
+        cache_dir = mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+
+        with override_settings(CONTENTSERVER_DISK_CACHE_DIR=cache_dir):
+            with patch('contentserver.caching.set_cached_content') as mock_set_cached_content:
+                with patch('contentserver.middleware.AssetManager.find', wraps=AssetManager.find) as mock_find:
+                    resp = self.client.get(unicode(large_asset))
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(resp.content, data)
+            # The asset was cached as it was streamed from the contentstore.
+            self.assertEqual(mock_find.call_count, 1)
+            self.assertEqual(len([name for name in os.listdir(cache_dir) if not name.startswith('.')]), 1)
+
+            # Only the asset's metadata is cached in the cache.
+            metadata = mock_set_cached_content.call_args[0][0]
+            self.assertIsInstance(metadata, DiskCachedContent)
+            self.assertIsNone(metadata.data)
+
+            with patch('contentserver.middleware.get_cached_content', return_value=metadata):
+                with patch('contentserver.middleware.AssetManager.find') as mock_find:
+                    resp = self.client.get(unicode(large_asset), HTTP_RANGE='bytes=100-199, -10')
+            self.assertFalse(mock_find.called)
+            self.assertEqual(resp.status_code, 206)
+            self.assertIn(data[100:200], resp.content)
+            self.assertIn(data[-10:], resp.content)
+
     @ddt.data(
         'bytes 0-',
         'bits=0-',
@@ -411,3 +486,132 @@ class ParseRangeHeaderTestCase(unittest.TestCase):
         self.assertRaisesRegexp(
             exception_class, exception_message_regex, parse_range_header, header_value, self.content_length
         )
+
+
+@ddt.ddt
+class MergeRangesTestCase(unittest.TestCase):
+    """
+    Tests for the merge_ranges function.
+    """
+    @ddt.data(
+        ([(100, 199)], [(100, 199)]),
+        ([(100, 199), (300, 399)], [(100, 199), (300, 399)]),
+        ([(300, 399), (100, 199)], [(100, 199), (300, 399)]),
+        ([(100, 199), (200, 299)], [(100, 299)]),
+        ([(100, 199), (150, 249), (500, 999), (0, 9)], [(0, 9), (100, 249), (500, 999)]),
+        ([(9900, 9999), (9800, 9999)], [(9800, 9999)]),
+    )
+    @ddt.unpack
+    def test_merge_ranges(self, ranges, expected_ranges):
+        self.assertEqual(merge_ranges(ranges), expected_ranges)
+
+
+class DiskContentCacheTestCase(unittest.TestCase):
+    """
+    Tests for the DiskContentCache class.
+    """
+    def setUp(self):
+        super(DiskContentCacheTestCase, self).setUp()
+        self.cache_dir = mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.cache = DiskContentCache(self.cache_dir, 2500)
+        self.course_key = CourseLocator('edX', 'toy', '2012_Fall')
+        patcher = patch('contentserver.caching.set_cached_content')
+        self.mock_set_cached_content = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_content(self, name, data, digest):
+        """
+        Returns a StaticContentStream of an asset.
+        """
+        return StaticContentStream(
+            self.course_key.make_asset_key('asset', name), name, 'text/plain', StringIO(data),
+            length=len(data), content_digest=digest
+        )
+
+    def cache_content(self, name, data, digest):
+        """
+        Caches an asset by streaming it, and returns the streamed data.
+        """
+        return ''.join(self.cache.set(self.make_content(name, data, digest)).stream_data())
+
+    def cached_filenames(self):
+        """
+        Returns the names of the files that cache assets.
+        """
+        return [name for name in os.listdir(self.cache_dir) if not name.startswith('.')]
+
+    def test_set_and_get(self):
+        data = 'abcdefghij' * 100
+        self.assertIsNone(self.cache.get(self.make_content('asset.txt', data, 'digest')))
+        self.assertEqual(self.cache_content('asset.txt', data, 'digest'), data)
+
+        mapped_content = self.cache.get(self.make_content('asset.txt', data, 'digest'))
+        self.assertEqual(mapped_content.data, data)
+        self.assertEqual(mapped_content.content_digest, 'digest')
+        self.assertEqual(''.join(mapped_content.stream_data()), data)
+        self.assertEqual(''.join(mapped_content.stream_data_in_range(10, 19)), data[10:20])
+
+    def test_cached_by_one_at_a_time(self):
+        caching_content = self.cache.set(self.make_content('asset.txt', 'a' * 1000, 'digest'))
+        # The asset is locked until it's been cached.
+        self.assertIsNone(self.cache.set(self.make_content('asset.txt', 'a' * 1000, 'digest')))
+        self.assertIsNotNone(self.cache.set(self.make_content('other_asset.txt', 'a' * 1000, 'digest')))
+
+        ''.join(caching_content.stream_data())
+        self.assertIsNotNone(self.cache.get(self.make_content('asset.txt', 'a' * 1000, 'digest')))
+        self.assertIsNotNone(self.cache.set(self.make_content('asset.txt', 'a' * 1000, 'digest')))
+
+    def test_partially_streamed(self):
+        data = 'abcdefghij' * 100
+        caching_content = self.cache.set(self.make_content('asset.txt', data, 'digest'))
+        self.assertEqual(''.join(caching_content.stream_data_in_range(10, 19)), data[10:20])
+        self.assertIsNone(self.cache.get(self.make_content('asset.txt', data, 'digest')))
+
+        # Closing the content without streaming all of its data releases the lock.
+        caching_content = self.cache.set(self.make_content('asset.txt', data, 'digest'))
+        next(caching_content.stream_data())
+        caching_content.close()
+        self.assertIsNone(self.cache.get(self.make_content('asset.txt', data, 'digest')))
+        # Neither the data nor the lock file are left behind.
+        self.assertEqual(os.listdir(self.cache_dir), [])
+        self.assertEqual(self.cache_content('asset.txt', data, 'digest'), data)
+        self.assertEqual(self.cached_filenames(), os.listdir(self.cache_dir))
+
+    def test_metadata_cached_once_committed(self):
+        data = 'abcdefghij' * 100
+        caching_content = self.cache.set(self.make_content('asset.txt', data, 'digest'))
+        chunks = caching_content.stream_data()
+        next(chunks)
+        self.assertFalse(self.mock_set_cached_content.called)
+
+        ''.join(chunks)
+        self.assertIsNotNone(self.cache.get(self.make_content('asset.txt', data, 'digest')))
+        metadata = self.mock_set_cached_content.call_args[0][0]
+        self.assertIsInstance(metadata, DiskCachedContent)
+        self.assertEqual(metadata.content_digest, 'digest')
+        self.assertIsNone(metadata.data)
+
+    def test_changed_asset(self):
+        self.cache_content('asset.txt', 'a' * 1000, 'digest')
+        self.assertIsNone(self.cache.get(self.make_content('asset.txt', 'a' * 1000, 'new_digest')))
+        self.assertIsNone(self.cache.get(self.make_content('other_asset.txt', 'a' * 1000, 'digest')))
+
+    def test_too_large(self):
+        self.assertIsNone(self.cache.set(self.make_content('asset.txt', 'a' * 3000, 'digest')))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_evicts_least_recently_used(self):
+        for index, name in enumerate(['first.txt', 'second.txt']):
+            self.cache_content(name, 'a' * 1000, 'digest')
+            # Make sure each file has a distinct modification time.
+            path = self.cache._path(self.make_content(name, 'a' * 1000, 'digest'))  # pylint: disable=protected-access
+            os.utime(path, (index, index))
+
+        # Using the first asset makes the second one the least recently used.
+        self.assertIsNotNone(self.cache.get(self.make_content('first.txt', 'a' * 1000, 'digest')))
+        self.cache_content('third.txt', 'a' * 1000, 'digest')
+
+        self.assertIsNotNone(self.cache.get(self.make_content('first.txt', 'a' * 1000, 'digest')))
+        self.assertIsNone(self.cache.get(self.make_content('second.txt', 'a' * 1000, 'digest')))
+        self.assertIsNotNone(self.cache.get(self.make_content('third.txt', 'a' * 1000, 'digest')))
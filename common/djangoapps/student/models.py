@@ -1445,11 +1445,31 @@ class CourseEnrollment(models.Model):
     def enrollments_for_user(cls, user):
         return cls.objects.filter(user=user, is_active=1)
 
-    def is_paid_course(self):
+    @classmethod
+    def prefetch_course_overviews(cls, enrollments):
+        """
+        Loads the current CourseOverviews of the courses of all of the given
+        enrollments with a single query, so that their `course_overview`
+        properties don't each have to query for them.  The overviews of any
+        courses that aren't found are loaded as usual, when they're needed.
+        """
+        course_overviews = CourseOverview.get_many(
+            [enrollment.course_id for enrollment in enrollments],
+            load_missing=False,
+        )
+        for enrollment in enrollments:
+            if enrollment.course_id in course_overviews:
+                enrollment._course_overview = course_overviews[enrollment.course_id]  # pylint: disable=protected-access
+
+    def is_paid_course(self, modes_dict=None):
         """
         Returns True, if course is paid
+
+        If `modes_dict` (a dict of the course's selectable course modes, as
+        returned by CourseMode.modes_for_course_dict) is given, it's used
+        rather than querying the course's modes.
         """
-        paid_course = CourseMode.is_white_label(self.course_id)
+        paid_course = CourseMode.is_white_label(self.course_id, modes_dict=modes_dict)
         if paid_course or CourseMode.is_professional_slug(self.mode):
             return True
 
@@ -1469,10 +1489,16 @@ class CourseEnrollment(models.Model):
         """Changes this `CourseEnrollment` record's mode to `mode`.  Saves immediately."""
         self.update_enrollment(mode=mode)
 
-    def refundable(self):
+    def refundable(self, user_already_has_certs_for=None, modes=None):
         """
         For paid/verified certificates, students may receive a refund if they have
         a verified certificate and the deadline for refunds has not yet passed.
+
+        Arguments:
+            user_already_has_certs_for (set of CourseKey): The ids of the courses
+                in which the user has certificates.  Looked up if not given.
+            modes (list of Mode): The course's unexpired course modes.  Looked up
+                if not given.
         """
         # In order to support manual refunds past the deadline, set can_refund on this object.
         # On unenrolling, the "UNENROLL_DONE" signal calls CertificateItem.refund_cert_callback(),
@@ -1483,28 +1509,36 @@ class CourseEnrollment(models.Model):
             return True
 
         # If the student has already been given a certificate they should not be refunded
-        if GeneratedCertificate.certificate_for_student(self.user, self.course_id) is not None:
+        if user_already_has_certs_for is not None:
+            if self.course_id in user_already_has_certs_for:
+                return False
+        elif GeneratedCertificate.certificate_for_student(self.user, self.course_id) is not None:
+            return False
+
+        course_mode = CourseMode.mode_for_course(self.course_id, 'verified', modes=modes)
+        if course_mode is None:
             return False
 
         # If it is after the refundable cutoff date they should not be refunded.
+        # This is checked last because it may need to ask the E-Commerce service.
         refund_cutoff_date = self.refund_cutoff_date()
         if refund_cutoff_date and datetime.now(UTC) > refund_cutoff_date:
             return False
 
-        course_mode = CourseMode.mode_for_course(self.course_id, 'verified')
-        if course_mode is None:
-            return False
-        else:
-            return True
+        return True
 
     def refund_cutoff_date(self):
         """ Calculate and return the refund window end date. """
-        try:
-            attribute = self.attributes.get(namespace='order', name='order_number')
-        except ObjectDoesNotExist:
+        # Filter the attributes here, so that attributes loaded with
+        # prefetch_related('attributes') are used.
+        order_numbers = [
+            attribute.value for attribute in self.attributes.all()
+            if attribute.namespace == 'order' and attribute.name == 'order_number'
+        ]
+        if not order_numbers:
             return None
 
-        order_number = attribute.value
+        order_number = order_numbers[0]
         order = ecommerce_api_client(self.user).orders(order_number).get()
         refund_window_start_date = max(
             datetime.strptime(order['date_placed'], ECOMMERCE_DATE_FORMAT),
@@ -4,8 +4,10 @@ adding users, removing users, and listing members
 """
 
 from abc import ABCMeta, abstractmethod
+from collections import defaultdict
 
 from django.contrib.auth.models import User
+from django.db.models import Q
 import logging
 
 from student.models import CourseAccessRole
@@ -38,10 +40,25 @@ class RoleCache(object):
     """
     A cache of the CourseAccessRoles held by a particular user
     """
-    def __init__(self, user):
-        self._roles = set(
-            CourseAccessRole.objects.filter(user=user).all()
-        )
+    def __init__(self, user, access_roles=None):
+        if access_roles is None:
+            access_roles = CourseAccessRole.objects.filter(user=user).all()
+        self._roles = set(access_roles)
+
+    @classmethod
+    def prefetch(cls, users):
+        """
+        Load the CourseAccessRoles of all the given users with a single query and cache
+        them on the user objects, so that role checks for these users don't query again.
+        """
+        users = [user for user in users if user.is_authenticated() and not hasattr(user, '_roles')]
+        if not users:
+            return
+        roles_by_user_id = defaultdict(list)
+        for access_role in CourseAccessRole.objects.filter(user__in=users):
+            roles_by_user_id[access_role.user_id].append(access_role)
+        for user in users:
+            user._roles = cls(user, roles_by_user_id[user.id])  # pylint: disable=protected-access
 
     def has_role(self, role, course_id, org):
         """
@@ -55,6 +72,42 @@ class RoleCache(object):
         )
 
 
+class CourseRoleCache(object):
+    """
+    A cache of the CourseAccessRoles that all users hold in a particular course, either
+    in the course itself or across its org, loaded with a single query.
+
+    Use this to check the roles of many users in one course, e.g. for listings and reports.
+    """
+    def __init__(self, course_key):
+        self.course_key = course_key
+        self._roles_by_user_id = defaultdict(set)
+        access_roles = CourseAccessRole.objects.filter(
+            Q(course_id=course_key) | Q(org=course_key.org, course_id=CourseKeyField.Empty)
+        )
+        for access_role in access_roles:
+            self._roles_by_user_id[access_role.user_id].add(access_role)
+
+    def has_role(self, user, role, course_id, org):
+        """
+        Return whether the given user holds the specified role, course_id, and org
+        """
+        return RoleCache(user, self._roles_by_user_id.get(user.id, ())).has_role(role, course_id, org)
+
+    def user_ids_with_course_role(self, *roles):
+        """
+        Return the ids of the users that hold any of the given roles in the course itself
+        """
+        return set(
+            user_id
+            for user_id, access_roles in self._roles_by_user_id.iteritems()
+            if any(
+                access_role.role in roles and access_role.course_id == self.course_key
+                for access_role in access_roles
+            )
+        )
+
+
 class AccessRole(object):
     """
     Object representing a role with particular access to a resource
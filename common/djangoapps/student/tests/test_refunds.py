@@ -112,6 +112,16 @@ class RefundableTest(SharedModuleStoreTestCase):
         self.enrollment.can_refund = True
         self.assertTrue(self.enrollment.refundable())
 
+    def test_refundable_with_prefetched_data(self):
+        """ Assert that refundability can be determined from already loaded certificates and modes."""
+        modes = [self.verified_mode.to_tuple()]
+        with self.assertNumQueries(1):
+            # Only the enrollment's attributes are looked up.
+            self.assertTrue(self.enrollment.refundable(user_already_has_certs_for=set(), modes=modes))
+
+        self.assertFalse(self.enrollment.refundable(user_already_has_certs_for={self.course.id}, modes=modes))
+        self.assertFalse(self.enrollment.refundable(user_already_has_certs_for=set(), modes=[]))
+
     def test_refundable_with_cutoff_date(self):
         """ Assert enrollment is refundable before cutoff and not refundable after."""
         self.assertTrue(self.enrollment.refundable())
@@ -9,7 +9,7 @@ from student.tests.factories import AnonymousUserFactory
 
 from student.roles import (
     GlobalStaff, CourseRole, CourseStaffRole, CourseInstructorRole,
-    OrgStaffRole, OrgInstructorRole, RoleCache, CourseBetaTesterRole
+    OrgStaffRole, OrgInstructorRole, RoleCache, CourseBetaTesterRole, CourseRoleCache
 )
 from opaque_keys.edx.locations import SlashSeparatedCourseKey
 
@@ -193,3 +193,51 @@ class RoleCacheTestCase(TestCase):
     def test_empty_cache(self, role, target):
         cache = RoleCache(self.user)
         self.assertFalse(cache.has_role(*target))
+
+    def test_prefetch(self):
+        CourseStaffRole(self.IN_KEY).add_users(self.user)
+        OrgInstructorRole(self.IN_KEY.org).add_users(self.user)
+        other_user = UserFactory()
+
+        with self.assertNumQueries(1):
+            RoleCache.prefetch([self.user, other_user, AnonymousUserFactory()])
+
+        with self.assertNumQueries(0):
+            self.assertTrue(CourseStaffRole(self.IN_KEY).has_user(self.user))
+            self.assertTrue(OrgInstructorRole(self.IN_KEY.org).has_user(self.user))
+            self.assertFalse(CourseStaffRole(self.NOT_IN_KEY).has_user(self.user))
+            self.assertFalse(CourseStaffRole(self.IN_KEY).has_user(other_user))
+
+        # Users whose roles are already cached are skipped.
+        with self.assertNumQueries(0):
+            RoleCache.prefetch([self.user, other_user])
+
+
+class CourseRoleCacheTestCase(TestCase):
+    """
+    Tests of student.roles.CourseRoleCache
+    """
+    IN_KEY = SlashSeparatedCourseKey('edX', 'toy', '2012_Fall')
+    NOT_IN_KEY = SlashSeparatedCourseKey('edX', 'toy', '2013_Fall')
+
+    def setUp(self):
+        super(CourseRoleCacheTestCase, self).setUp()
+        self.course_staff = StaffFactory(course_key=self.IN_KEY)
+        self.org_instructor = UserFactory()
+        OrgInstructorRole(self.IN_KEY.org).add_users(self.org_instructor)
+        self.other_course_staff = StaffFactory(course_key=self.NOT_IN_KEY)
+
+    def test_has_role(self):
+        with self.assertNumQueries(1):
+            cache = CourseRoleCache(self.IN_KEY)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(cache.has_role(self.course_staff, 'staff', self.IN_KEY, 'edX'))
+            self.assertTrue(cache.has_role(self.org_instructor, 'instructor', None, 'edX'))
+            self.assertFalse(cache.has_role(self.org_instructor, 'staff', self.IN_KEY, 'edX'))
+            self.assertFalse(cache.has_role(self.other_course_staff, 'staff', self.NOT_IN_KEY, 'edX'))
+
+    def test_user_ids_with_course_role(self):
+        cache = CourseRoleCache(self.IN_KEY)
+        self.assertEqual(cache.user_ids_with_course_role('staff', 'instructor'), {self.course_staff.id})
+        self.assertEqual(cache.user_ids_with_course_role('beta_testers'), set())
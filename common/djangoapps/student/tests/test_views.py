@@ -6,7 +6,9 @@ import unittest
 import ddt
 from django.conf import settings
 from django.core.urlresolvers import reverse
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from edx_oauth2_provider.constants import AUTHORIZED_CLIENTS_SESSION_KEY
 from edx_oauth2_provider.tests.factories import ClientFactory, TrustedClientFactory
 from mock import patch
@@ -14,6 +16,7 @@ from pyquery import PyQuery as pq
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory
 
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from student.helpers import DISABLE_UNENROLL_CERT_STATES
 from student.models import CourseEnrollment, LogoutViewConfiguration
 from student.tests.factories import UserFactory, CourseEnrollmentFactory
@@ -42,7 +45,7 @@ class TestStudentDashboardUnenrollments(SharedModuleStoreTestCase):
         self.cert_status = None
         self.client.login(username=self.user.username, password=PASSWORD)
 
-    def mock_cert(self, _user, _course_overview, _course_mode):
+    def mock_cert(self, _user, _course_overview, _course_mode, _cert_status=None):
         """ Return a preset certificate status. """
         if self.cert_status is not None:
             return {
@@ -111,6 +114,51 @@ class TestStudentDashboardUnenrollments(SharedModuleStoreTestCase):
             self.assertEqual(response.status_code, 200)
 
 
+@unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
+class TestStudentDashboardQueryCount(SharedModuleStoreTestCase):
+    """
+    Test that the number of queries that the student dashboard makes doesn't
+    grow with the number of courses that the user is enrolled in.
+    """
+    NUM_COURSES = 6
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestStudentDashboardQueryCount, cls).setUpClass()
+        cls.courses = [CourseFactory.create() for __ in range(cls.NUM_COURSES)]
+
+    def setUp(self):
+        super(TestStudentDashboardQueryCount, self).setUp()
+        self.user = UserFactory()
+        self.client.login(username=self.user.username, password=PASSWORD)
+        for course in self.courses:
+            CourseOverview.get_from_id(course.id)
+
+    def get_dashboard_query_count(self, num_enrollments):
+        """
+        Enroll the user in the first `num_enrollments` courses, and return the
+        number of queries that loading the dashboard makes.
+        """
+        for course in self.courses[:num_enrollments]:
+            if not CourseEnrollment.is_enrolled(self.user, course.id):
+                CourseEnrollmentFactory(course_id=course.id, user=self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('dashboard'))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_query_count_is_constant(self):
+        # Load the dashboard once first, to fill any caches that don't depend
+        # on the user's enrollments.
+        self.get_dashboard_query_count(1)
+
+        self.assertEqual(
+            self.get_dashboard_query_count(2),
+            self.get_dashboard_query_count(self.NUM_COURSES)
+        )
+
+
 @unittest.skipUnless(settings.ROOT_URLCONF == 'lms.urls', 'Test only valid in lms')
 class LogoutTests(TestCase):
     """ Tests for the logout functionality. """
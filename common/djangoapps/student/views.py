@@ -59,7 +59,9 @@ from student.forms import AccountCreationForm, PasswordResetFormNoActive, get_re
 from lms.djangoapps.commerce.utils import EcommerceService  # pylint: disable=import-error
 from lms.djangoapps.verify_student.models import SoftwareSecurePhotoVerification  # pylint: disable=import-error
 from bulk_email.models import Optout, BulkEmailFlag  # pylint: disable=import-error
-from certificates.models import CertificateStatuses, certificate_status_for_student
+from certificates.models import (  # pylint: disable=import-error
+    CertificateStatuses, GeneratedCertificate, certificate_status_for_student, certificate_statuses_for_courses
+)
 from certificates.api import (  # pylint: disable=import-error
     get_certificate_url,
     has_html_certificates_enabled,
@@ -128,6 +130,7 @@ from openedx.core.djangoapps.user_api.preferences import api as preferences_api
 from openedx.core.djangoapps.programs.utils import get_programs_for_dashboard, get_display_category
 from openedx.core.djangoapps.programs.models import ProgramsApiConfig
 from openedx.core.djangoapps.theming import helpers as theming_helpers
+from openedx.core.lib.time_zone_utils import get_user_time_zone
 
 
 log = logging.getLogger("edx.student")
@@ -208,7 +211,7 @@ def process_survey_link(survey_link, user):
     return survey_link.format(UNIQUE_ID=unique_id_for_user(user))
 
 
-def cert_info(user, course_overview, course_mode):
+def cert_info(user, course_overview, course_mode, cert_status=None):
     """
     Get the certificate info needed to render the dashboard section for the given
     student and course.
@@ -217,6 +220,8 @@ def cert_info(user, course_overview, course_mode):
         user (User): A user.
         course_overview (CourseOverview): A course.
         course_mode (str): The enrollment mode (honor, verified, audit, etc.)
+        cert_status (dict): The user's certificate status in the course, as returned
+            by certificate_status_for_student.  Looked up if not given.
 
     Returns:
         dict: Empty dict if certificates are disabled or hidden, or a dictionary with keys:
@@ -231,12 +236,9 @@ def cert_info(user, course_overview, course_mode):
     """
     if not course_overview.may_certify():
         return {}
-    return _cert_info(
-        user,
-        course_overview,
-        certificate_status_for_student(user, course_overview.id),
-        course_mode
-    )
+    if cert_status is None:
+        cert_status = certificate_status_for_student(user, course_overview.id)
+    return _cert_info(user, course_overview, cert_status, course_mode)
 
 
 def reverification_info(statuses):
@@ -277,7 +279,12 @@ def get_course_enrollments(user, org_to_include, orgs_to_exclude):
         generator[CourseEnrollment]: a sequence of enrollments to be displayed
         on the user's dashboard.
     """
-    for enrollment in CourseEnrollment.enrollments_for_user(user):
+    # Load the enrollments' attributes and course overviews up front, rather
+    # than with separate queries for each enrollment.
+    enrollments = list(CourseEnrollment.enrollments_for_user(user).prefetch_related('attributes'))
+    CourseEnrollment.prefetch_course_overviews(enrollments)
+
+    for enrollment in enrollments:
 
         # If the course is missing or broken, log an error and skip it.
         course_overview = enrollment.course_overview
@@ -645,17 +652,6 @@ def dashboard(request):
     # If a course is not included in this dictionary,
     # there is no verification messaging to display.
     verify_status_by_course = check_verify_status_by_course(user, course_enrollments)
-    cert_statuses = {
-        enrollment.course_id: cert_info(request.user, enrollment.course_overview, enrollment.mode)
-        for enrollment in course_enrollments
-    }
-
-    # only show email settings for Mongo course and when bulk email is turned on
-    show_email_settings_for = frozenset(
-        enrollment.course_id for enrollment in course_enrollments if (
-            BulkEmailFlag.feature_enabled(enrollment.course_id)
-        )
-    )
 
     # Verification Attempts
     # Used to generate the "you must reverify for course x" banner
@@ -665,28 +661,6 @@ def dashboard(request):
     statuses = ["approved", "denied", "pending", "must_reverify"]
     reverifications = reverification_info(statuses)
 
-    show_refund_option_for = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if enrollment.refundable()
-    )
-
-    block_courses = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if is_course_blocked(
-            request,
-            CourseRegistrationCode.objects.filter(
-                course_id=enrollment.course_id,
-                registrationcoderedemption__redeemed_by=request.user
-            ),
-            enrollment.course_id
-        )
-    )
-
-    enrolled_courses_either_paid = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if enrollment.is_paid_course()
-    )
-
     # If there are *any* denied reverifications that have not been toggled off,
     # we'll display the banner
     denied_banner = any(item.display for item in reverifications["denied"])
@@ -722,21 +696,15 @@ def dashboard(request):
         'errored_courses': errored_courses,
         'show_courseware_links_for': show_courseware_links_for,
         'all_course_modes': course_mode_info,
-        'cert_statuses': cert_statuses,
-        'credit_statuses': _credit_statuses(user, course_enrollments),
-        'show_email_settings_for': show_email_settings_for,
         'reverifications': reverifications,
         'verification_status': verification_status,
         'verification_status_by_course': verify_status_by_course,
         'verification_msg': verification_msg,
-        'show_refund_option_for': show_refund_option_for,
-        'block_courses': block_courses,
         'denied_banner': denied_banner,
         'billing_email': settings.PAYMENT_SUPPORT_EMAIL,
         'user': user,
         'logout_url': reverse('logout'),
         'platform_name': platform_name,
-        'enrolled_courses_either_paid': enrolled_courses_either_paid,
         'provider_states': [],
         'order_history_list': order_history_list,
         'courses_requirements_not_met': courses_requirements_not_met,
@@ -744,7 +712,10 @@ def dashboard(request):
         'course_programs': course_programs,
         'disable_courseware_js': True,
         'show_program_listing': ProgramsApiConfig.current().show_program_listing,
+        # Looked up once here, rather than for each course listing.
+        'user_time_zone': get_user_time_zone(user),
     }
+    context.update(_dashboard_course_data(request, course_enrollments, course_modes_by_course))
 
     ecommerce_service = EcommerceService()
     if ecommerce_service.is_enabled(request.user):
@@ -756,6 +727,81 @@ def dashboard(request):
     return render_to_response('dashboard.html', context)
 
 
+def _dashboard_course_data(request, course_enrollments, course_modes_by_course):
+    """
+    Loads the per-course data that the dashboard shows for each of the user's
+    enrollments, using one query for each kind of data, rather than one for
+    each enrollment.
+
+    Arguments:
+        request (HttpRequest): The dashboard request.
+        course_enrollments (list[CourseEnrollment]): The user's enrollments.
+        course_modes_by_course (dict): Mapping of course IDs to dictionaries of
+            the course's unexpired course modes, keyed by slug.
+
+    Returns:
+        dict: The dashboard template context for the per-course data:
+            * cert_statuses (dict): The certificate info of each course, as
+                returned by cert_info.
+            * credit_statuses (dict): The credit status of each credit course, as
+                returned by _credit_statuses.
+            * show_email_settings_for (frozenset): The courses that can send
+                bulk email.
+            * show_refund_option_for (frozenset): The refundable enrollments.
+            * block_courses (frozenset): The courses the user redeemed a
+                registration code of an invalid invoice for.
+            * enrolled_courses_either_paid (frozenset): The paid enrollments.
+    """
+    user = request.user
+    course_ids = [enrollment.course_id for enrollment in course_enrollments]
+
+    certificate_statuses = certificate_statuses_for_courses(user, course_ids)
+    user_already_has_certs_for = GeneratedCertificate.course_ids_with_certs_for_user(user)
+
+    redeemed_registration_codes = defaultdict(list)
+    for registration_code in CourseRegistrationCode.objects.filter(
+            course_id__in=course_ids,
+            registrationcoderedemption__redeemed_by=user
+    ).select_related('invoice_item__invoice'):
+        redeemed_registration_codes[registration_code.course_id].append(registration_code)
+
+    # White label courses are determined by their selectable modes, which
+    # don't include credit modes.
+    selectable_modes_by_course = {}
+    for course_id in course_ids:
+        selectable_modes_by_course[course_id] = {
+            slug: mode for slug, mode in course_modes_by_course[course_id].iteritems()
+            if slug not in CourseMode.CREDIT_MODES
+        } or {CourseMode.DEFAULT_MODE_SLUG: CourseMode.DEFAULT_MODE}
+
+    return {
+        'cert_statuses': {
+            enrollment.course_id: cert_info(
+                user, enrollment.course_overview, enrollment.mode, certificate_statuses[enrollment.course_id]
+            )
+            for enrollment in course_enrollments
+        },
+        'credit_statuses': _credit_statuses(user, course_enrollments),
+        # only show email settings for Mongo course and when bulk email is turned on
+        'show_email_settings_for': BulkEmailFlag.courses_with_feature_enabled(course_ids),
+        'show_refund_option_for': frozenset(
+            enrollment.course_id for enrollment in course_enrollments
+            if enrollment.refundable(
+                user_already_has_certs_for=user_already_has_certs_for,
+                modes=course_modes_by_course[enrollment.course_id].values()
+            )
+        ),
+        'block_courses': frozenset(
+            course_id for course_id in course_ids
+            if is_course_blocked(request, redeemed_registration_codes[course_id], course_id)
+        ),
+        'enrolled_courses_either_paid': frozenset(
+            enrollment.course_id for enrollment in course_enrollments
+            if enrollment.is_paid_course(modes_dict=selectable_modes_by_course[enrollment.course_id])
+        ),
+    }
+
+
 def _create_recent_enrollment_message(course_enrollments, course_modes):  # pylint: disable=invalid-name
     """
     Builds a recent course enrollment message.
@@ -1,4 +1,6 @@
 """ Utility functions related to database queries """
+from itertools import islice
+
 from django.conf import settings
 
 
@@ -7,3 +9,16 @@ def use_read_replica_if_available(queryset):
     If there is a database called 'read_replica', use that database for the queryset.
     """
     return queryset.using("read_replica") if "read_replica" in settings.DATABASES else queryset
+
+
+def chunks(items, chunk_size):
+    """
+    Yields the values from the items iterable in lists of size chunk_size
+    (the last list may be smaller), without reading all of the items first,
+    e.g. to query for them in batches.
+    """
+    items = iter(items)
+    chunk = list(islice(items, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(items, chunk_size))
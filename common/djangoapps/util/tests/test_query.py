@@ -0,0 +1,20 @@
+"""
+Tests for util.query
+"""
+from unittest import TestCase
+
+from util.query import chunks
+
+
+class ChunksTestCase(TestCase):
+    """
+    Tests for chunks.
+    """
+    def test_chunks(self):
+        self.assertEqual(list(chunks(xrange(7), 3)), [[0, 1, 2], [3, 4, 5], [6]])
+
+    def test_exact_chunks(self):
+        self.assertEqual(list(chunks(iter(xrange(4)), 2)), [[0, 1], [2, 3]])
+
+    def test_empty(self):
+        self.assertEqual(list(chunks([], 3)), [])
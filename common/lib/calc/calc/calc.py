@@ -73,6 +73,18 @@ SUFFIXES = {
 }
 
 
+# The default functions that can be applied to arrays of samples at once
+# (see `evaluate_samples`).
+VECTORIZED_FUNCTIONS = frozenset(
+    func for name, func in DEFAULT_FUNCTIONS.iteritems()
+    if name not in ('fact', 'factorial', 'arccot')
+)
+
+# The maximum number of compiled expressions to keep (see `compile_expression`).
+COMPILED_EXPRESSIONS_CACHE_SIZE = 1000
+_COMPILED_EXPRESSIONS = {}
+
+
 class UndefinedVariable(Exception):
     """
     Indicate when a student inputs a variable which was not expected.
@@ -200,6 +212,105 @@ def eval_product(parse_result):
     return prod
 
 
+# The following functions define compile actions, which are run on lists of
+# results from each parse component, like the evaluation actions above. Rather
+# than numbers, they return functions that take the dicts of all variables and
+# functions and return the number that the component represents, so that the
+# parse tree only needs to be reduced once for any number of evaluations.
+
+def compile_number(parse_result):
+    """
+    Return a constant function for the number.
+    """
+    value = eval_number(parse_result)
+    return lambda variables, functions: value
+
+
+def compile_atom(parse_result):
+    """
+    Return the function wrapped by the atom, ignoring any parenthesis.
+    """
+    return next(k for k in parse_result if callable(k))
+
+
+def compile_power(parse_result):
+    """
+    Return a function that exponentiates its operands, right to left.
+    """
+    operands = [k for k in parse_result if callable(k)]  # Ignore the '^' marks.
+    if len(operands) == 1:
+        return operands[0]
+
+    def evaluate(variables, functions):
+        """
+        Like `eval_power`, which only accepts numbers.
+        """
+        values = [operand(variables, functions) for operand in reversed(operands)]
+        return reduce(lambda a, b: b ** a, values)
+    return evaluate
+
+
+def compile_parallel(parse_result):
+    """
+    Return a function that computes its operands according to the parallel
+    resistors operator.
+    """
+    operands = [k for k in parse_result if callable(k)]
+    if len(operands) == 1:
+        return operands[0]
+
+    def evaluate(variables, functions):
+        """
+        Like `eval_parallel`, which only accepts numbers.
+        """
+        values = [operand(variables, functions) for operand in operands]
+        if any(isinstance(value, numpy.ndarray) for value in values):
+            return 1. / sum(1. / value for value in values)
+        return eval_parallel(values)
+    return evaluate
+
+
+def _compile_operations(parse_result, operations, initial_value):
+    """
+    Return a function that applies each of the operands in `parse_result` to
+    `initial_value` in turn, with the operations given by the operators that
+    precede them, which are mapped to functions by the dict `operations`.
+    """
+    terms = []
+    current_op = operations[None]
+    for token in parse_result:
+        if callable(token):
+            terms.append((current_op, token))
+        else:
+            current_op = operations[token]
+
+    def evaluate(variables, functions):
+        """
+        Like `eval_sum` and `eval_product`.
+        """
+        total = initial_value
+        for current_op, term in terms:
+            total = current_op(total, term(variables, functions))
+        return total
+    return evaluate
+
+
+def compile_sum(parse_result):
+    """
+    Return a function that adds its operands, keeping in mind their sign.
+    """
+    operations = {None: operator.add, '+': operator.add, '-': operator.sub}
+    return _compile_operations(parse_result, operations, 0.0)
+
+
+def compile_product(parse_result):
+    """
+    Return a function that multiplies its operands.
+    """
+    operations = {None: operator.mul, '*': operator.mul, '/': operator.truediv}
+    return _compile_operations(parse_result, operations, 1.0)
+
+
 def add_defaults(variables, functions, case_sensitive):
     """
     Create dictionaries with both the default and user-defined variables.
@@ -228,34 +339,153 @@ def evaluator(variables, functions, math_expr, case_sensitive=False):
     if math_expr.strip() == "":
         return float('nan')
 
-    # Parse the tree.
-    math_interpreter = ParseAugmenter(math_expr, case_sensitive)
-    math_interpreter.parse_algebra()
+    return compile_expression(math_expr, case_sensitive).evaluate(variables, functions)
 
-    # Get our variables together.
-    all_variables, all_functions = add_defaults(variables, functions, case_sensitive)
 
-    # ...and check them
-    math_interpreter.check_variables(all_variables, all_functions)
+def evaluate_samples(variables_list, functions, math_expr, case_sensitive=False):
+    """
+    Evaluate an expression for each of the dictionaries of variables in
+    `variables_list`, returning the list of the results.
 
-    # Create a recursion to evaluate the tree.
-    if case_sensitive:
-        casify = lambda x: x
-    else:
-        casify = lambda x: x.lower()  # Lowercase for case insens.
-
-    evaluate_actions = {
-        'number': eval_number,
-        'variable': lambda x: all_variables[casify(x[0])],
-        'function': lambda x: all_functions[casify(x[0])](x[1]),
-        'atom': eval_atom,
-        'power': eval_power,
-        'parallel': eval_parallel,
-        'product': eval_product,
-        'sum': eval_sum
-    }
-
-    return math_interpreter.reduce_tree(evaluate_actions)
+    This gives the same results as calling `evaluator` for each of them, but
+    when it can, it evaluates the expression for all of them at once, as
+    numpy arrays.
+    """
+    if math_expr.strip() == "":
+        return [float('nan')] * len(variables_list)
+
+    expression = compile_expression(math_expr, case_sensitive)
+    if len(variables_list) > 1:
+        try:
+            results = expression.evaluate_vectorized(variables_list, functions)
+        except Exception:  # pylint: disable=broad-except
+            # Evaluate them one by one, to raise the same error as `evaluator`.
+            results = None
+        if results is not None:
+            return results
+
+    return [expression.evaluate(variables, functions) for variables in variables_list]
+
+
+def compile_expression(math_expr, case_sensitive=False):
+    """
+    Return the CompiledExpression for `math_expr`.
+
+    Compiled expressions are cached by this process, so that each expression
+    is only parsed once.
+    """
+    key = (math_expr, case_sensitive)
+    expression = _COMPILED_EXPRESSIONS.get(key)
+    if expression is None:
+        expression = CompiledExpression(math_expr, case_sensitive)
+        if len(_COMPILED_EXPRESSIONS) >= COMPILED_EXPRESSIONS_CACHE_SIZE:
+            _COMPILED_EXPRESSIONS.clear()
+        _COMPILED_EXPRESSIONS[key] = expression
+    return expression
+
+
+class CompiledExpression(object):
+    """
+    A parsed math expression, which can be evaluated any number of times.
+
+    The parse tree is reduced (using the compile actions above) to a function
+    of the dicts of all variables and functions, so evaluating the expression
+    doesn't need to parse it or walk its parse tree again.
+    """
+    def __init__(self, math_expr, case_sensitive=False):
+        """
+        Parse and compile the math expression string.
+        """
+        self.math_expr = math_expr
+        self.case_sensitive = case_sensitive
+
+        self.math_interpreter = ParseAugmenter(math_expr, case_sensitive)
+        self.math_interpreter.parse_algebra()
+
+        compile_actions = {
+            'number': compile_number,
+            'variable': self._compile_variable,
+            'function': self._compile_function,
+            'atom': compile_atom,
+            'power': compile_power,
+            'parallel': compile_parallel,
+            'product': compile_product,
+            'sum': compile_sum
+        }
+        self._evaluate = self.math_interpreter.reduce_tree(compile_actions)
+
+    def _casify(self, name):
+        """
+        Return the name that variable or function `name` is looked up by.
+        """
+        return name if self.case_sensitive else name.lower()
+
+    def _compile_variable(self, parse_result):
+        """
+        Return a function that looks up the variable.
+        """
+        name = self._casify(parse_result[0])
+        return lambda variables, functions: variables[name]
+
+    def _compile_function(self, parse_result):
+        """
+        Return a function that applies the function to its argument.
+        """
+        name = self._casify(parse_result[0])
+        argument = parse_result[1]
+        return lambda variables, functions: functions[name](argument(variables, functions))
+
+    def evaluate(self, variables, functions):
+        """
+        Evaluate the expression, with the given (non-default) variables and
+        functions, like `evaluator`.
+        """
+        # Get our variables together.
+        all_variables, all_functions = add_defaults(variables, functions, self.case_sensitive)
+
+        # ...and check them
+        self.math_interpreter.check_variables(all_variables, all_functions)
+
+        return self._evaluate(all_variables, all_functions)
+
+    def evaluate_vectorized(self, variables_list, functions):
+        """
+        Evaluate the expression for all of the dictionaries of variables in
+        `variables_list` at once, with each variable being the numpy array of
+        its values.
+
+        Return the list of results, or None if the expression can't be
+        evaluated this way, i.e. if the dictionaries don't all define the same
+        float or complex variables, the expression uses functions that don't
+        accept arrays, or it doesn't depend on the variables.
+
+        Floating point errors (e.g. division by zero) are raised rather than
+        giving NaN or infinity, so that `evaluate_samples` falls back to
+        evaluating the expression one sample at a time in those cases.
+        """
+        names = set(variables_list[0])
+        if any(set(variables) != names for variables in variables_list):
+            return None
+
+        arrays = {}
+        for name in names:
+            array = numpy.array([variables[name] for variables in variables_list])
+            if array.dtype.kind not in ('f', 'c'):
+                return None
+            arrays[name] = array
+
+        all_variables, all_functions = add_defaults(arrays, functions, self.case_sensitive)
+        self.math_interpreter.check_variables(all_variables, all_functions)
+        if any(all_functions[self._casify(name)] not in VECTORIZED_FUNCTIONS
+               for name in self.math_interpreter.functions_used):
+            return None
+
+        with numpy.errstate(all='raise'):
+            results = self._evaluate(all_variables, all_functions)
+
+        if not isinstance(results, numpy.ndarray) or results.shape != (len(variables_list),):
+            return None
+        return results.tolist()
 
 
 class ParseAugmenter(object):
@@ -559,3 +559,60 @@ class EvaluatorTest(unittest.TestCase):
             calc.evaluator({'r1': 5}, {}, "r1+r2")
         with self.assertRaisesRegexp(calc.UndefinedVariable, 'r1 r3'):
             calc.evaluator(variables, {}, "r1*r3", case_sensitive=True)
+
+
+class EvaluateSamplesTest(unittest.TestCase):
+    """
+    Run tests for calc.evaluate_samples and the compiled expression cache
+    """
+    def setUp(self):
+        super(EvaluateSamplesTest, self).setUp()
+        self.samples = [{'x': x, 'y': y} for x, y in zip([0.5, 1.0, 2.5, -3.0], [1.5, 2.0, 0.25, 4.0])]
+
+    def assert_same_as_evaluator(self, math_expr, samples, functions=None, case_sensitive=False):
+        """
+        Check that evaluate_samples gives the same results as evaluator.
+        """
+        functions = functions or {}
+        results = calc.evaluate_samples(samples, functions, math_expr, case_sensitive=case_sensitive)
+        expected = [calc.evaluator(variables, functions, math_expr, case_sensitive) for variables in samples]
+        self.assertEqual(len(results), len(expected))
+        for result, value in zip(results, expected):
+            self.assertAlmostEqual(result, value, msg="Failed on '{}'".format(math_expr))
+
+    def test_expressions(self):
+        for math_expr in ['x', '-x+y', 'x*y/2', 'x^2^y', 'x||y', 'sin(x)*cos(y)+sqrt(y)', '3k*x - 5%*y', 'X*Y']:
+            self.assert_same_as_evaluator(math_expr, self.samples)
+
+    def test_complex_samples(self):
+        samples = [{'z': complex(x, y)} for x, y in [(1, 2), (3, -1), (0.5, 0.5)]]
+        self.assert_same_as_evaluator('z^2 + j*z', samples)
+
+    def test_constant_expression(self):
+        self.assertEqual(calc.evaluate_samples(self.samples, {}, '1+2'), [3.0] * len(self.samples))
+
+    def test_empty_expression(self):
+        results = calc.evaluate_samples(self.samples, {}, '  ')
+        self.assertEqual(len(results), len(self.samples))
+        self.assertTrue(all(numpy.isnan(result) for result in results))
+
+    def test_custom_functions(self):
+        functions = {'f': lambda value: value if value > 1 else -value}
+        self.assert_same_as_evaluator('f(x)+f(y)', self.samples, functions)
+        self.assert_same_as_evaluator('fact(y*4)', self.samples)
+
+    def test_errors(self):
+        # Errors are raised as by evaluator, rather than giving NaN or infinity.
+        with self.assertRaises(ZeroDivisionError):
+            calc.evaluate_samples(self.samples, {}, '1/(x-1)')
+        with self.assertRaisesRegexp(calc.UndefinedVariable, 'z'):
+            calc.evaluate_samples(self.samples, {}, 'x+z')
+        with self.assertRaisesRegexp(ValueError, 'factorial'):
+            calc.evaluate_samples(self.samples, {}, 'fact(x)')
+        self.assertTrue(numpy.isnan(calc.evaluate_samples(self.samples, {}, '(x-1)||(y+1)')[1]))
+
+    def test_compiled_expressions_cached(self):
+        expression = calc.compile_expression('x+y')
+        self.assertIs(calc.compile_expression('x+y'), expression)
+        self.assertIsNot(calc.compile_expression('x+y', case_sensitive=True), expression)
+        self.assertEqual(expression.evaluate({'x': 1.0, 'y': 2.0}, {}), 3.0)
@@ -15,6 +15,7 @@ This is used by capa_module.
 
 from copy import deepcopy
 from datetime import datetime
+import hashlib
 import logging
 import os.path
 import re
@@ -56,8 +57,13 @@ html_problem_semantics = [
     "openendedrubric",
 ]
 
+# Upper bound on the number of memoized static max scores kept per process
+STATIC_MAX_SCORE_CACHE_SIZE = 10000
+
 log = logging.getLogger(__name__)
 
+_static_max_scores = {}
+
 #-----------------------------------------------------------------------------
 # main class for this module
 
@@ -881,3 +887,65 @@ class LoncapaProblem(object):
         for solution in tree.findall('.//solution'):
             solution.attrib['id'] = "%s_solution_%i" % (self.problem_id, solution_id)
             solution_id += 1
+
+
+def get_static_max_score(problem_text):
+    """
+    Return the maximum score of the problem defined by `problem_text`,
+    computed from its XML alone, or None if it cannot be determined without
+    building a LoncapaProblem (e.g. the problem uses <include> or is invalid).
+
+    Unlike `LoncapaProblem.get_max_score`, this needs no LoncapaSystem, seed or
+    student state and runs no problem scripts.  Results are memoized by a
+    digest of `problem_text`, so each version of a problem definition is only
+    parsed once per process.
+    """
+    if isinstance(problem_text, unicode):
+        digest = hashlib.sha1(problem_text.encode('utf-8')).hexdigest()
+    else:
+        digest = hashlib.sha1(problem_text).hexdigest()
+    if digest not in _static_max_scores:
+        if len(_static_max_scores) >= STATIC_MAX_SCORE_CACHE_SIZE:
+            _static_max_scores.clear()
+        _static_max_scores[digest] = _compute_static_max_score(problem_text)
+    return _static_max_scores[digest]
+
+
+def _compute_static_max_score(problem_text):
+    """
+    Sum the static max scores of every response in `problem_text`, mirroring
+    the response and input field discovery in `LoncapaProblem._preprocess_problem`
+    and the validation in `LoncapaResponse.__init__`.
+    """
+    problem_text = re.sub(r"startouttext\s*/", "text", problem_text)
+    problem_text = re.sub(r"endouttext\s*/", "/text", problem_text)
+    try:
+        tree = etree.XML(problem_text)
+    except (etree.XMLSyntaxError, ValueError):
+        return None
+
+    # Included files can only be read through a LoncapaSystem's filestore.
+    if tree.find('.//include') is not None:
+        return None
+
+    input_tags = inputtypes.registry.registered_tags() + solution_tags
+    max_score = 0
+    for response in tree.xpath('//' + "|//".join(responsetypes.registry.registered_tags())):
+        responsetype_cls = responsetypes.registry.get_class_for_tag(response.tag)
+        inputfields = response.xpath("|".join(['.//' + x for x in input_tags]))
+
+        if any(inputfield.tag not in responsetype_cls.allowed_inputfields for inputfield in inputfields):
+            return None
+        if responsetype_cls.max_inputfields and len(inputfields) > responsetype_cls.max_inputfields:
+            return None
+        if responsetype_cls.max_inputfields == 1 and not inputfields:
+            return None
+        for prop in responsetype_cls.required_attributes:
+            if not (response.get(prop) or '').strip():
+                return None
+
+        try:
+            max_score += responsetype_cls.get_static_max_score(inputfields)
+        except ValueError:
+            return None
+    return max_score
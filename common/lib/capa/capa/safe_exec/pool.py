@@ -0,0 +1,283 @@
+"""
+An optional pool of persistent, pre-warmed sandbox workers for safe_exec.
+
+Starting a sandboxed Python and importing the libraries that problem code
+uses takes much longer than running most problem code, so when the pool is
+configured (see `configure`), safe_exec sends code to one of its workers
+rather than starting a new sandbox for it.
+
+Each worker (see pool_worker.py) is a Python process started as the sandbox
+user, which has imported the common libraries, and forks a child process to
+run each job, so that jobs can't affect each other, and codejail's limits
+apply to each job.  Workers are replaced after running `max_jobs_per_worker`
+jobs, or if one stops responding.
+
+Each worker is started in its own session, and is stopped by killing every
+process in the session, as codejail kills the processes it starts.  When the
+workers run as the sandbox user, this uses `sudo pkill`, which codejail's
+sudoers configuration already allows.
+"""
+import json
+import logging
+import os
+import Queue
+import select
+import subprocess
+import threading
+from time import time
+
+from codejail import jail_code
+from codejail.safe_exec import json_safe, SafeExecException
+from dogapi import dog_stats_api
+
+from . import pool_worker
+
+log = logging.getLogger(__name__)
+
+# The code of the workers, which is run with `python -c`.
+pool_worker_py_file = pool_worker.__file__
+if pool_worker_py_file.endswith("c"):
+    pool_worker_py_file = pool_worker_py_file[:-1]
+
+WORKER_CODE = open(pool_worker_py_file).read()
+
+# How many more seconds than the job's REALTIME limit to wait for a worker
+# to respond, before giving up on it.
+WORKER_TIMEOUT_SLACK = 5
+
+# How many seconds to wait for an idle worker, before giving up on the job,
+# so that requests don't pile up behind a pool that is overloaded.
+WORKER_WAIT_TIMEOUT = 10
+
+# The REALTIME limit of jobs, in seconds, if codejail's is zero (no limit),
+# since the pool always has to be able to give up on a worker.
+DEFAULT_REALTIME = 3
+
+_POOL = None
+
+
+class SandboxWorker(object):
+    """
+    A worker process, which runs jobs one at a time.  `user` is the user it
+    runs as, if it's started with sudo.
+    """
+    def __init__(self, command, user=None):
+        self.user = user
+        with open(os.devnull, "wb") as devnull:
+            self.process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                # The worker captures the output of jobs, so this is only
+                # output of its own, which mustn't go to our stderr.
+                stderr=devnull,
+                close_fds=True,
+                # Start a new session, so that the worker, and all of the
+                # processes that it starts, can be killed together.
+                preexec_fn=os.setsid,
+            )
+        # The process that started the worker, which is the only one that
+        # can use it.
+        self.owner_pid = os.getpid()
+        self.jobs = 0
+        self._buffer = ""
+
+    def run(self, job, timeout):
+        """
+        Run the job, and return its result, waiting up to `timeout` seconds
+        for it (or forever if `timeout` is None).
+
+        Raises IOError if the worker doesn't respond in time.
+        """
+        self.jobs += 1
+        self.process.stdin.write(json.dumps(job) + "\n")
+        self.process.stdin.flush()
+        return json.loads(self._readline(timeout))
+
+    def _readline(self, timeout):
+        """
+        Read a line from the worker's stdout.
+        """
+        deadline = time() + timeout if timeout is not None else None
+        stdout_fd = self.process.stdout.fileno()
+        while "\n" not in self._buffer:
+            remaining = max(deadline - time(), 0) if deadline is not None else None
+            ready, __, __ = select.select([stdout_fd], [], [], remaining)
+            if not ready:
+                raise IOError("Sandbox worker timed out")
+            data = os.read(stdout_fd, 65536)
+            if not data:
+                raise IOError("Sandbox worker exited")
+            self._buffer += data
+        line, self._buffer = self._buffer.split("\n", 1)
+        return line
+
+    def stop(self):
+        """
+        Stop the worker process, and any job that it's running.
+        """
+        # The worker started the session, so its id is the worker's pid.
+        kill_command = ["pkill", "-9", "-s", str(self.process.pid)]
+        if self.user:
+            # We can't kill processes running as the sandbox user ourselves.
+            kill_command = ["sudo"] + kill_command
+        try:
+            with open(os.devnull, "wb") as devnull:
+                subprocess.call(kill_command, stdout=devnull, stderr=devnull, close_fds=True)
+            self.process.wait()
+        except OSError:
+            pass
+
+
+class SandboxPool(object):
+    """
+    A pool of up to `size` sandbox workers, started with `command`, which
+    runs them as `user` (if not None).
+    """
+    def __init__(self, command, size, max_jobs_per_worker, limits, user=None):
+        self.command = command
+        self.user = user
+        self.size = size
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.limits = limits
+        # The idle workers, or None for each worker that hasn't been started.
+        self._workers = Queue.LifoQueue()
+        for __ in xrange(size):
+            self._workers.put(None)
+        self._waiting = 0
+        self._waiting_lock = threading.Lock()
+
+    def can_execute(self, python_path=None, extra_files=None):
+        """
+        Return whether the pool can execute code with `python_path` and
+        `extra_files`.  Workers can't copy files into the sandbox, so every
+        item of the python path must be one of the extra files.
+        """
+        extra_filenames = set(filename for filename, __ in extra_files or [])
+        return all(name in extra_filenames for name in python_path or [])
+
+    def _start_worker(self):
+        """
+        Start a new worker.
+        """
+        dog_stats_api.increment('capa.safe_exec.pool.worker_started')
+        return SandboxWorker(self.command + [WORKER_CODE, json.dumps(self.limits)], self.user)
+
+    def _get_worker(self):
+        """
+        Wait for an idle worker, and return it, starting it if it hasn't been
+        started, or if it has run its share of jobs.
+
+        Raises SafeExecException if no worker is idle within
+        WORKER_WAIT_TIMEOUT seconds.
+        """
+        with self._waiting_lock:
+            self._waiting += 1
+            dog_stats_api.gauge('capa.safe_exec.pool.queue_depth', self._waiting)
+        start_time = time()
+        try:
+            worker = self._workers.get(timeout=WORKER_WAIT_TIMEOUT)
+        except Queue.Empty:
+            dog_stats_api.increment('capa.safe_exec.pool.wait_timeout')
+            raise SafeExecException("Couldn't execute jailed code: no sandbox worker is available")
+        finally:
+            with self._waiting_lock:
+                self._waiting -= 1
+        dog_stats_api.histogram('capa.safe_exec.pool.wait_time', (time() - start_time) * 1000)
+
+        if worker is not None and worker.owner_pid != os.getpid():
+            # This process was forked from the one that started the worker,
+            # so leave it to that one.
+            worker = None
+        if worker is not None and worker.jobs >= self.max_jobs_per_worker:
+            worker.stop()
+            worker = None
+        if worker is None:
+            worker = self._start_worker()
+        return worker
+
+    def safe_exec(self, code, globals_dict, python_path=None, extra_files=None, slug=None):
+        """
+        Execute code like `codejail.safe_exec.safe_exec`, with one of the
+        pool's workers.  Any changes it makes to the (JSON-safe) globals are
+        visible in `globals_dict`, and SafeExecException is raised if it raises
+        an exception.
+        """
+        job = {
+            'code': code,
+            'globals': json_safe(globals_dict),
+            'python_path': python_path,
+            # Files are sent as unicode, so that they can be encoded as JSON.
+            'extra_files': [
+                (filename, contents.decode('latin-1')) for filename, contents in extra_files or []
+            ],
+        }
+        timeout = self.limits['REALTIME'] + WORKER_TIMEOUT_SLACK
+
+        worker = self._get_worker()
+        start_time = time()
+        try:
+            result = worker.run(job, timeout)
+        except (IOError, ValueError) as err:
+            log.warning("Sandbox worker failed running %s: %s", slug, err)
+            worker.stop()
+            worker = None
+            raise SafeExecException("Couldn't execute jailed code: {}".format(err))
+        finally:
+            self._workers.put(worker)
+            dog_stats_api.histogram('capa.safe_exec.pool.exec_time', (time() - start_time) * 1000)
+
+        globals_dict.update(result['globals'])
+        if result['emsg']:
+            raise SafeExecException(
+                "Couldn't execute jailed code: {}, output: {!r}".format(result['emsg'], result['output'])
+            )
+
+    def close(self):
+        """
+        Stop the pool's idle workers.
+        """
+        while True:
+            try:
+                worker = self._workers.get_nowait()
+            except Queue.Empty:
+                break
+            if worker is not None and worker.owner_pid == os.getpid():
+                worker.stop()
+
+
+def configure(python_bin, user=None, size=4, max_jobs_per_worker=100, limits=None):
+    """
+    Configure safe_exec to use a pool of `size` sandbox workers, which run
+    `python_bin` as `user` (if not None), and are replaced after running
+    `max_jobs_per_worker` jobs.
+
+    `limits` is a dict of the CPU seconds ("CPU"), real time seconds
+    ("REALTIME"), bytes of memory ("VMEM") and bytes of written files
+    ("FSIZE") that each job can use, which override codejail's limits.  A
+    limit of zero means no limit, except for FSIZE, where it means that no
+    files can be written, and REALTIME, where DEFAULT_REALTIME is used.
+
+    A `size` of zero disables the pool.
+    """
+    global _POOL  # pylint: disable=global-statement
+    if _POOL is not None:
+        _POOL.close()
+    if not size:
+        _POOL = None
+        return
+
+    command = [python_bin, "-E", "-B", "-c"]
+    if user:
+        command = ["sudo", "-u", user] + command
+    pool_limits = dict(jail_code.LIMITS)
+    pool_limits.update(limits or {})
+    pool_limits['REALTIME'] = pool_limits.get('REALTIME') or DEFAULT_REALTIME
+    _POOL = SandboxPool(command, size, max_jobs_per_worker, pool_limits, user=user)
+
+
+def get_pool():
+    """
+    Return the configured SandboxPool, or None if the pool isn't configured.
+    """
+    return _POOL
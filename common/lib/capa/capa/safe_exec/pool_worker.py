@@ -0,0 +1,211 @@
+"""
+The worker process of capa's sandbox pool (see pool.py).
+
+The worker is started once, as the sandbox user with the sandbox's Python,
+and imports the libraries that problem code commonly uses.  Then, for each
+job that it reads from stdin, it forks a child process, which starts with
+those libraries already imported, to execute the job's code with the job's
+limits.  The results are written to stdout.
+
+Each child runs in its own process group, which is killed once the job is
+done (or has run out of time), so that nothing it started outlives it.
+
+Jobs and results are JSON objects, one per line.  A job has the "code" to
+execute, its "globals", and the "extra_files" to create in its directory,
+which is on the Python path.  A result has the exception traceback ("emsg"),
+if the code raised an exception or was killed, else null; the JSON-safe
+part of the resulting "globals"; and whatever the code wrote to stdout and
+stderr ("output").
+
+This file is run with `python -c`, so it can only use the standard library
+and the sandbox packages.
+"""
+import errno
+import json
+import os
+import resource
+import select
+import shutil
+import signal
+import sys
+import tempfile
+import time
+import traceback
+
+# The libraries to import before forking, so that jobs don't have to.
+PRELOADED_MODULES = [
+    "numpy", "math", "random", "scipy", "calc", "eia",
+    "chem.chemcalc", "chem.chemtools", "chem.miller", "verifiers.draganddrop",
+]
+
+# How many bytes of a job's output are kept.
+OUTPUT_LIMIT = 64 * 1024
+
+
+def json_safe_globals(globals_dict):
+    """
+    Return the JSON-safe part of `globals_dict`.
+    """
+    safe_globals = {}
+    for name, value in globals_dict.items():
+        try:
+            safe_globals[name] = json.loads(json.dumps(value))
+        except Exception:  # pylint: disable=broad-except
+            pass
+    return safe_globals
+
+
+def set_limits(limits):
+    """
+    Set the resource limits of the current process from `limits`, like
+    codejail does: it has the CPU seconds ("CPU") and bytes of memory
+    ("VMEM") it can use, where zero means no limit, and the bytes of files
+    it can write ("FSIZE"), where zero means none.  It can't start any
+    processes.
+    """
+    resource.setrlimit(resource.RLIMIT_NPROC, (0, 0))
+    if limits.get("CPU"):
+        resource.setrlimit(resource.RLIMIT_CPU, (limits["CPU"], limits["CPU"]))
+    if limits.get("VMEM"):
+        resource.setrlimit(resource.RLIMIT_AS, (limits["VMEM"], limits["VMEM"]))
+    fsize = limits.get("FSIZE", 0)
+    resource.setrlimit(resource.RLIMIT_FSIZE, (fsize, fsize))
+
+
+def execute(job, job_dir, limits):
+    """
+    Execute the job in `job_dir`, in the current (forked) process, and
+    return its result.
+    """
+
+    for filename, contents in job.get("extra_files") or []:
+        with open(os.path.join(job_dir, filename), "wb") as extra_file:
+            extra_file.write(contents.encode("latin-1"))
+    os.chdir(job_dir)
+    sys.path[0:0] = [os.path.join(job_dir, name) for name in job.get("python_path") or []]
+
+    set_limits(limits)
+    globals_dict = job["globals"]
+    try:
+        exec compile(job["code"], "jailed_code", "exec") in globals_dict  # pylint: disable=exec-used
+    except Exception:  # pylint: disable=broad-except
+        return {"emsg": traceback.format_exc(), "globals": json_safe_globals(globals_dict)}
+    return {"emsg": None, "globals": json_safe_globals(globals_dict)}
+
+
+def kill_process_group(pgid):
+    """
+    Kill all of the processes in the process group `pgid`, if there are any.
+    """
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except OSError as err:
+        if err.errno != errno.ESRCH:
+            raise
+
+
+def read_result(result_fd, output_fd, pid, realtime):
+    """
+    Read the result of the job run by the child process `pid` from
+    `result_fd`, and its output from `output_fd`, killing the child's
+    process group if it takes more than `realtime` seconds (if `realtime`
+    isn't zero).
+    """
+    deadline = time.time() + realtime if realtime else None
+    chunks = {result_fd: [], output_fd: []}
+    output_size = 0
+    open_fds = [result_fd, output_fd]
+    while open_fds:
+        timeout = max(deadline - time.time(), 0) if deadline else None
+        ready, __, __ = select.select(open_fds, [], [], timeout)
+        if not ready:
+            kill_process_group(pid)
+            break
+        for read_fd in ready:
+            data = os.read(read_fd, 65536)
+            if not data:
+                open_fds.remove(read_fd)
+            elif read_fd == result_fd:
+                chunks[read_fd].append(data)
+            elif output_size < OUTPUT_LIMIT:
+                chunks[read_fd].append(data[:OUTPUT_LIMIT - output_size])
+                output_size += len(data)
+    os.waitpid(pid, 0)
+    # Kill anything else that the job started.
+    kill_process_group(pid)
+
+    output = "".join(chunks[output_fd]).decode("utf-8", "replace")
+    try:
+        result = json.loads("".join(chunks[result_fd]))
+    except ValueError:
+        result = {"emsg": "The code was killed, for exceeding its limits or otherwise", "globals": {}}
+    result["output"] = output
+    return result
+
+
+def run_job(job, limits):
+    """
+    Run the job in a forked child process, and return its result.
+    """
+    job_dir = tempfile.mkdtemp(prefix="codejail-")
+    result_read_fd, result_write_fd = os.pipe()
+    output_read_fd, output_write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.setpgid(0, 0)
+        os.close(result_read_fd)
+        os.close(output_read_fd)
+        # Output from the code mustn't get mixed up with our results, or
+        # reach the stderr that we share with the process that started us.
+        os.dup2(output_write_fd, 1)
+        os.dup2(output_write_fd, 2)
+        os.close(output_write_fd)
+        try:
+            result = execute(job, job_dir, limits)
+            data = json.dumps(result)
+        except BaseException:  # pylint: disable=broad-except
+            data = json.dumps({"emsg": traceback.format_exc(), "globals": {}})
+        with os.fdopen(result_write_fd, "w") as result_file:
+            result_file.write(data)
+        os._exit(0)  # pylint: disable=protected-access
+
+    # Also set the child's process group here, in case we kill it before it
+    # has set its own.
+    try:
+        os.setpgid(pid, pid)
+    except OSError:
+        pass
+    os.close(result_write_fd)
+    os.close(output_write_fd)
+    try:
+        return read_result(result_read_fd, output_read_fd, pid, limits.get("REALTIME"))
+    finally:
+        os.close(result_read_fd)
+        os.close(output_read_fd)
+        shutil.rmtree(job_dir, ignore_errors=True)
+
+
+def main(limits):
+    """
+    Import the preloaded libraries, then run jobs until stdin is closed.
+    """
+    for module_name in PRELOADED_MODULES:
+        try:
+            __import__(module_name)
+        except ImportError:
+            pass
+
+    stdin, stdout = sys.stdin, sys.stdout
+    # Jobs are run in children, but make sure that nothing else writes to stdout.
+    sys.stdout = sys.stderr
+    while True:
+        line = stdin.readline()
+        if not line:
+            break
+        result = run_job(json.loads(line), limits)
+        stdout.write(json.dumps(result) + "\n")
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    main(json.loads(sys.argv[1]))
@@ -3,10 +3,15 @@
 from codejail.safe_exec import safe_exec as codejail_safe_exec
 from codejail.safe_exec import not_safe_exec as codejail_not_safe_exec
 from codejail.safe_exec import json_safe, SafeExecException
-from . import lazymod
+from . import lazymod, pool
 from dogapi import dog_stats_api
 
+import copy
 import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from time import sleep, time
 
 # Establish the Python environment for Capa.
 # Capa assumes float-friendly division always.
@@ -46,6 +51,19 @@ for name, modname in ASSUMED_IMPORTS:
 
 LAZY_IMPORTS = "".join(LAZY_IMPORTS)
 
+# The number of results that are cached by each process, in front of the
+# shared `cache` passed to safe_exec.
+LOCAL_CACHE_SIZE = 1000
+
+# How long, in seconds, to wait for an identical execution that's in flight
+# (in this or another process) to cache its result, before executing the code
+# anyway.
+SINGLE_FLIGHT_TIMEOUT = 10
+
+# How often to check whether an execution in another process has cached its
+# result, in seconds.
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
 
 def update_hash(hasher, obj):
     """
@@ -70,6 +88,197 @@ def update_hash(hasher, obj):
         hasher.update(repr(obj))
 
 
+class LRUCache(object):
+    """
+    A thread-safe cache with .get(key) and .set(key, value) methods, which
+    holds up to `max_size` values, evicting the least recently used ones.
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return the value cached for `key`, or None.
+        """
+        with self._lock:
+            try:
+                value = self._values.pop(key)
+            except KeyError:
+                return None
+            self._values[key] = value
+            return value
+
+    def set(self, key, value):
+        """
+        Cache `value` for `key`.
+        """
+        with self._lock:
+            self._values.pop(key, None)
+            self._values[key] = value
+            if len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all of the cached values.
+        """
+        with self._lock:
+            self._values.clear()
+
+
+# The results cached by this process.
+LOCAL_CACHE = LRUCache(LOCAL_CACHE_SIZE)
+
+# Hashers that have been updated with the code of recent executions, so that
+# the same code isn't hashed again for each of its executions.
+CODE_HASHERS = LRUCache(100)
+
+# Events for the executions that are in flight in this process, by cache key.
+_IN_FLIGHT = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+
+def _cache_key(code, globals_dict, random_seed):
+    """
+    Return the cache key for executing `code` with `globals_dict` and `random_seed`.
+    """
+    code_hasher = CODE_HASHERS.get(code)
+    if code_hasher is None:
+        code_hasher = hashlib.md5()
+        code_hasher.update(repr(code))
+        CODE_HASHERS.set(code, code_hasher)
+    md5er = code_hasher.copy()
+    update_hash(md5er, json_safe(globals_dict))
+    return "safe_exec.%r.%s" % (random_seed, md5er.hexdigest())
+
+
+def _get_cached_result(key, cache):
+    """
+    Return the cached result for `key` from this process's cache, or else
+    from the shared `cache`, or None if it isn't cached.
+    """
+    result = LOCAL_CACHE.get(key)
+    if result is None:
+        result = cache.get(key)
+        if result is not None:
+            LOCAL_CACHE.set(key, result)
+    return result
+
+
+def _set_cached_result(key, cache, result):
+    """
+    Cache `result` for `key` in this process's cache and the shared `cache`.
+    """
+    LOCAL_CACHE.set(key, result)
+    cache.set(key, result)
+
+
+def _use_cached_result(result, globals_dict):
+    """
+    Update `globals_dict` with a cached result, raising its exception, if any.
+    """
+    # The result is a pair: the exception message, if any, else None; and the
+    # resulting globals dictionary.  The globals are copied, since the result
+    # may be cached by this process, and the caller may change them.
+    emsg, cleaned_results = result
+    globals_dict.update(copy.deepcopy(cleaned_results))
+    if emsg:
+        raise SafeExecException(emsg)
+
+
+def _wait_for_result(key, cache):
+    """
+    Wait up to SINGLE_FLIGHT_TIMEOUT seconds for a result to be cached for
+    `key` in the shared `cache`, returning it, or None if it wasn't.
+    """
+    deadline = time() + SINGLE_FLIGHT_TIMEOUT
+    while time() < deadline:
+        sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+        result = cache.get(key)
+        if result is not None:
+            LOCAL_CACHE.set(key, result)
+            return result
+    return None
+
+
+@contextmanager
+def _single_flight(key, cache):
+    """
+    Context manager for executing code with the cache key `key`, that
+    de-duplicates identical executions that are in flight at the same time.
+
+    If an identical execution is in flight, in this process or (if `cache`
+    has an .add(key, value, timeout) method to lock with) in another one,
+    this waits for its result and yields it.  Otherwise, or if the result
+    isn't cached in time, it yields None, and the code should be executed,
+    and its result cached, before exiting the context.
+    """
+    with _IN_FLIGHT_LOCK:
+        event = _IN_FLIGHT.get(key)
+        is_leader = event is None
+        if is_leader:
+            event = _IN_FLIGHT[key] = threading.Event()
+
+    if not is_leader:
+        event.wait(SINGLE_FLIGHT_TIMEOUT)
+        yield _get_cached_result(key, cache)
+        return
+
+    lock_key = key + ".lock"
+    add = getattr(cache, 'add', None)
+    locked = False
+    try:
+        result = None
+        if add is not None:
+            locked = add(lock_key, True, SINGLE_FLIGHT_TIMEOUT)
+            if not locked:
+                result = _wait_for_result(key, cache)
+        yield result
+    finally:
+        if locked:
+            cache.delete(lock_key)
+        with _IN_FLIGHT_LOCK:
+            del _IN_FLIGHT[key]
+        event.set()
+
+
+def _get_exec_fn(unsafely, python_path, extra_files):
+    """
+    Return the function to execute code with: codejail's, or the sandbox
+    pool's, if it's configured and can run the code.
+    """
+    if unsafely:
+        return codejail_not_safe_exec
+    sandbox_pool = pool.get_pool()
+    if sandbox_pool is not None and sandbox_pool.can_execute(python_path, extra_files):
+        return sandbox_pool.safe_exec
+    return codejail_safe_exec
+
+
+def _execute(code, globals_dict, random_seed, python_path, extra_files, slug, unsafely):
+    """
+    Execute the code, without caching, returning the SafeExecException that
+    it raised, or None.
+    """
+    # Create the complete code we'll run.
+    code_prolog = CODE_PROLOG % random_seed
+
+    # Decide which code executor to use.
+    exec_fn = _get_exec_fn(unsafely, python_path, extra_files)
+
+    # Run the code!  Results are side effects in globals_dict.
+    try:
+        exec_fn(
+            code_prolog + LAZY_IMPORTS + code, globals_dict,
+            python_path=python_path, extra_files=extra_files, slug=slug,
+        )
+    except SafeExecException as e:
+        return e
+    return None
+
+
 @dog_stats_api.timed('capa.safe_exec.time')
 def safe_exec(
     code,
@@ -99,57 +308,39 @@ def safe_exec(
 
     `cache` is an object with .get(key) and .set(key, value) methods.  It will be used
     to cache the execution, taking into account the code, the values of the globals,
-    and the random seed.
+    and the random seed.  Results are also cached by each process, in front of `cache`
+    (see LOCAL_CACHE), and identical executions that are in flight at the same time
+    only execute the code once (see `_single_flight`).
 
     `slug` is an arbitrary string, a description that's meaningful to the
     caller, that will be used in log messages.
 
     If `unsafely` is true, then the code will actually be executed without sandboxing.
+    Otherwise, it's executed by the sandbox pool, if it's configured (see pool.py).
 
     """
-    # Check the cache for a previous result.
-    if cache:
-        safe_globals = json_safe(globals_dict)
-        md5er = hashlib.md5()
-        md5er.update(repr(code))
-        update_hash(md5er, safe_globals)
-        key = "safe_exec.%r.%s" % (random_seed, md5er.hexdigest())
-        cached = cache.get(key)
-        if cached is not None:
-            # We have a cached result.  The result is a pair: the exception
-            # message, if any, else None; and the resulting globals dictionary.
-            emsg, cleaned_results = cached
-            globals_dict.update(cleaned_results)
-            if emsg:
-                raise SafeExecException(emsg)
-            return
-
-    # Create the complete code we'll run.
-    code_prolog = CODE_PROLOG % random_seed
+    if not cache:
+        error = _execute(code, globals_dict, random_seed, python_path, extra_files, slug, unsafely)
+        if error:
+            raise error
+        return
 
-    # Decide which code executor to use.
-    if unsafely:
-        exec_fn = codejail_not_safe_exec
-    else:
-        exec_fn = codejail_safe_exec
+    # Check the cache for a previous result.
+    key = _cache_key(code, globals_dict, random_seed)
+    cached = _get_cached_result(key, cache)
+    if cached is None:
+        with _single_flight(key, cache) as cached:
+            if cached is None:
+                error = _execute(code, globals_dict, random_seed, python_path, extra_files, slug, unsafely)
 
-    # Run the code!  Results are side effects in globals_dict.
-    try:
-        exec_fn(
-            code_prolog + LAZY_IMPORTS + code, globals_dict,
-            python_path=python_path, extra_files=extra_files, slug=slug,
-        )
-    except SafeExecException as e:
-        emsg = e.message
-    else:
-        emsg = None
+                # Put the result back in the cache.  This is complicated by the fact that
+                # the globals dict might not be entirely serializable.
+                cleaned_results = json_safe(globals_dict)
+                _set_cached_result(key, cache, (error.message if error else None, cleaned_results))
 
-    # Put the result back in the cache.  This is complicated by the fact that
-    # the globals dict might not be entirely serializable.
-    if cache:
-        cleaned_results = json_safe(globals_dict)
-        cache.set(key, (emsg, cleaned_results))
+                # If an exception happened, raise it now.
+                if error:
+                    raise error
+                return
 
-    # If an exception happened, raise it now.
-    if emsg:
-        raise e
+    _use_cached_result(cached, globals_dict)
@@ -0,0 +1,141 @@
+"""Test pool.py"""
+
+import io
+import os
+import sys
+import unittest
+import zipfile
+
+from mock import patch
+
+from codejail.safe_exec import SafeExecException
+
+from capa.safe_exec import pool, safe_exec
+
+
+class TestSandboxPool(unittest.TestCase):
+    """
+    Run code with a pool of workers that run this Python, unsandboxed.
+    """
+    def setUp(self):
+        super(TestSandboxPool, self).setUp()
+        pool.configure(sys.executable, size=2, max_jobs_per_worker=3, limits={'REALTIME': 5})
+        self.addCleanup(pool.configure, None, size=0)
+        self.pool = pool.get_pool()
+
+    def test_set_values(self):
+        g = {'a': 1}
+        self.pool.safe_exec("b = a + 16", g)
+        self.assertEqual(g['b'], 17)
+
+    def test_exception(self):
+        g = {}
+        with self.assertRaises(SafeExecException) as cm:
+            self.pool.safe_exec("a = 1\nraise ValueError('Oops')", g)
+        self.assertIn("ValueError: Oops", str(cm.exception))
+        # The globals are returned anyway.
+        self.assertEqual(g['a'], 1)
+
+    def test_jobs_are_isolated(self):
+        self.pool.safe_exec("import os; os.environ['POOL_TEST'] = 'leaked'", {})
+        g = {}
+        self.pool.safe_exec("import os; a = os.environ.get('POOL_TEST')", g)
+        self.assertIsNone(g['a'])
+
+    def test_extra_files(self):
+        g = {}
+        self.pool.safe_exec(
+            "import constant; a = constant.VALUE",
+            g,
+            python_path=["lib.zip"],
+            extra_files=[("lib.zip", open_test_zip())],
+        )
+        self.assertEqual(g['a'], 17)
+
+    def test_output_is_captured(self):
+        with self.assertRaisesRegexp(SafeExecException, "Hello from the sandbox"):
+            self.pool.safe_exec("print 'Hello from the sandbox'\nraise ValueError('Oops')", {})
+
+    def test_fsize_limit(self):
+        with self.assertRaises(SafeExecException):
+            self.pool.safe_exec("f = open('big.txt', 'w')\nf.write('x' * 10)\nf.close()", {})
+
+    def test_realtime_limit(self):
+        pool.configure(sys.executable, size=1, limits={'REALTIME': 1})
+        with self.assertRaisesRegexp(SafeExecException, "killed"):
+            pool.get_pool().safe_exec("while True: pass", {})
+        # The worker is still usable.
+        g = {}
+        pool.get_pool().safe_exec("a = 17", g)
+        self.assertEqual(g['a'], 17)
+
+    def test_workers_are_recycled(self):
+        pids = []
+        for __ in xrange(4):
+            g = {}
+            self.pool.safe_exec("import os; ppid = os.getppid()", g)
+            pids.append(g['ppid'])
+        # The first three jobs ran in the same worker, and the fourth in a new one.
+        self.assertEqual(len(set(pids[:3])), 1)
+        self.assertNotEqual(pids[3], pids[0])
+
+    def test_stop_kills_worker(self):
+        worker = self.pool._get_worker()  # pylint: disable=protected-access
+        self.addCleanup(self.pool._workers.put, None)  # pylint: disable=protected-access
+        worker.stop()
+        self.assertIsNotNone(worker.process.returncode)
+
+    def test_no_idle_worker(self):
+        pool.configure(sys.executable, size=1)
+        worker_pool = pool.get_pool()
+        worker = worker_pool._get_worker()  # pylint: disable=protected-access
+        self.addCleanup(worker_pool._workers.put, worker)  # pylint: disable=protected-access
+        with patch.object(pool, 'WORKER_WAIT_TIMEOUT', 0.1):
+            with self.assertRaisesRegexp(SafeExecException, "no sandbox worker is available"):
+                worker_pool.safe_exec("a = 17", {})
+
+    def test_can_execute(self):
+        self.assertTrue(self.pool.can_execute())
+        self.assertTrue(self.pool.can_execute(["lib.zip"], [("lib.zip", "")]))
+        self.assertFalse(self.pool.can_execute(["/usr/lib/course"], [("lib.zip", "")]))
+
+
+class TestPoolConfiguration(unittest.TestCase):
+    def tearDown(self):
+        pool.configure(None, size=0)
+        super(TestPoolConfiguration, self).tearDown()
+
+    def test_not_configured(self):
+        pool.configure(sys.executable, size=0)
+        self.assertIsNone(pool.get_pool())
+
+    def test_command(self):
+        pool.configure("/usr/bin/sandbox-python", user="sandbox")
+        self.assertEqual(
+            pool.get_pool().command,
+            ["sudo", "-u", "sandbox", "/usr/bin/sandbox-python", "-E", "-B", "-c"],
+        )
+
+    def test_default_limits(self):
+        pool.configure(sys.executable, size=1, limits={'CPU': 2})
+        limits = pool.get_pool().limits
+        self.assertEqual(limits['CPU'], 2)
+        self.assertGreater(limits['REALTIME'], 0)
+        self.assertIn('FSIZE', limits)
+
+    def test_safe_exec_uses_pool(self):
+        pool.configure(sys.executable, size=1)
+        g = {}
+        # Unsandboxed codejail would run the code in this process.
+        safe_exec("import os; pid = os.getpid()", g, cache=None)
+        self.assertNotEqual(g['pid'], os.getpid())
+
+
+def open_test_zip():
+    """
+    Return the contents of a zip file with a `constant` module.
+    """
+    zip_contents = io.BytesIO()
+    with zipfile.ZipFile(zip_contents, "w") as zip_file:
+        zip_file.writestr("constant.py", "VALUE = 17\n")
+    return zip_contents.getvalue()
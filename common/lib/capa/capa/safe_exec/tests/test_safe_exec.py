@@ -1,18 +1,24 @@
 """Test safe_exec.py"""
 
 import hashlib
+import importlib
 import os
 import os.path
 import random
 import textwrap
 import unittest
 
+from mock import patch
 from nose.plugins.skip import SkipTest
 
 from capa.safe_exec import safe_exec, update_hash
+from capa.safe_exec.safe_exec import LOCAL_CACHE, LRUCache, _single_flight
 from codejail.safe_exec import SafeExecException
 from codejail.jail_code import is_configured
 
+# The name of the safe_exec module is shadowed by the function in the package.
+safe_exec_module = importlib.import_module('capa.safe_exec.safe_exec')
+
 
 class TestSafeExec(unittest.TestCase):
     def test_set_values(self):
@@ -110,6 +116,10 @@ class DictCache(object):
 class TestSafeExecCaching(unittest.TestCase):
     """Test that caching works on safe_exec."""
 
+    def setUp(self):
+        super(TestSafeExecCaching, self).setUp()
+        LOCAL_CACHE.clear()
+
     def test_cache_miss_then_hit(self):
         g = {}
         cache = {}
@@ -120,8 +130,10 @@ class TestSafeExecCaching(unittest.TestCase):
         # A result has been cached
         self.assertEqual(cache.values()[0], (None, {'a': 3}))
 
-        # Fiddle with the cache, then try it again.
+        # Fiddle with the cache, then try it again.  The results cached by
+        # this process are checked first, so clear them.
         cache[cache.keys()[0]] = (None, {'a': 17})
+        LOCAL_CACHE.clear()
 
         g = {}
         safe_exec("a = int(math.pi)", g, cache=DictCache(cache))
@@ -153,6 +165,7 @@ class TestSafeExecCaching(unittest.TestCase):
 
         # Change the value stored in the cache, the result should change.
         cache[cache.keys()[0]] = ("Hey there!", {})
+        LOCAL_CACHE.clear()
 
         with self.assertRaises(SafeExecException):
             safe_exec(code, g, cache=DictCache(cache))
@@ -163,6 +176,7 @@ class TestSafeExecCaching(unittest.TestCase):
 
         # Change it again, now no exception!
         cache[cache.keys()[0]] = (None, {'a': 17})
+        LOCAL_CACHE.clear()
         safe_exec(code, g, cache=DictCache(cache))
         self.assertEqual(g['a'], 17)
 
@@ -176,6 +190,71 @@ class TestSafeExecCaching(unittest.TestCase):
             except UnicodeEncodeError:
                 self.fail("Tried executing code with non-ASCII unicode: {0}".format(code))
 
+    def test_local_cache(self):
+        g = {}
+        cache = {}
+        safe_exec("a = [int(math.pi)]", g, cache=DictCache(cache))
+
+        # The result is cached by this process, so it's still used after
+        # the shared cache loses it.
+        cache.clear()
+        g = {}
+        with patch.object(safe_exec_module, 'codejail_safe_exec') as mock_exec:
+            safe_exec("a = [int(math.pi)]", g, cache=DictCache(cache))
+        self.assertFalse(mock_exec.called)
+        self.assertEqual(g['a'], [3])
+
+        # Changing the globals doesn't change the cached result.
+        g['a'].append(4)
+        g = {}
+        safe_exec("a = [int(math.pi)]", g, cache=DictCache(cache))
+        self.assertEqual(g['a'], [3])
+
+    def test_single_flight(self):
+        cache = LockingDictCache({})
+        key = 'safe_exec.None.key'
+
+        # While another process holds the lock, wait for it to cache the result.
+        cache.add(key + '.lock', True, 10)
+        with patch.object(safe_exec_module, 'sleep', side_effect=lambda _: cache.set(key, (None, {'a': 1}))):
+            with _single_flight(key, cache) as result:
+                self.assertEqual(result, (None, {'a': 1}))
+
+        # Otherwise, take the lock, and release it afterwards.
+        cache.delete(key + '.lock')
+        with _single_flight('safe_exec.None.other', cache) as result:
+            self.assertIsNone(result)
+            self.assertIn('safe_exec.None.other.lock', cache.cache)
+        self.assertNotIn('safe_exec.None.other.lock', cache.cache)
+
+
+class LockingDictCache(DictCache):
+    """A DictCache that also supports locking with .add() and .delete()."""
+
+    def add(self, key, value, timeout):  # pylint: disable=unused-argument
+        if key in self.cache:
+            return False
+        self.set(key, value)
+        return True
+
+    def delete(self, key):
+        self.cache.pop(key, None)
+
+
+class TestLRUCache(unittest.TestCase):
+    """Test the LRUCache used for the results cached by each process."""
+
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        # 'b' was the least recently used.
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+
 
 class TestUpdateHash(unittest.TestCase):
     """Test the safe_exec.update_hash function to be sure it canonicalizes properly."""
@@ -22,6 +22,7 @@ import calc
 
 from capa.responsetypes import LoncapaProblemError, \
     StudentInputError, ResponseError
+from capa.capa_problem import get_static_max_score
 from capa.correctmap import CorrectMap
 from capa.tests.response_xml_factory import (
     AnnotationResponseXMLFactory,
@@ -2760,3 +2761,56 @@ class ChoiceTextResponseTest(ResponseTest):
                 correctness,
                 msg="{0} should be {1}".format(name, correctness)
             )
+
+
+class StaticMaxScoreTest(unittest.TestCase):
+    """
+    Verify that `get_static_max_score` agrees with `LoncapaProblem.get_max_score`
+    without building the problem.
+    """
+
+    def assert_static_max_score(self, xml, expected):  # pylint: disable=missing-docstring
+        self.assertEqual(get_static_max_score(xml), expected)
+        self.assertEqual(new_loncapa_problem(xml).get_max_score(), expected)
+
+    def test_multiple_responses_and_points(self):
+        xml = textwrap.dedent("""
+            <problem>
+                <numericalresponse answer="27">
+                    <textline label="3^3" />
+                </numericalresponse>
+                <stringresponse answer="one">
+                    <textline points="3" />
+                </stringresponse>
+                <customresponse cfn="check">
+                    <script type="loncapa/python">
+def check(expect, ans):
+    return True
+                    </script>
+                    <textline points="2" />
+                    <textline />
+                </customresponse>
+            </problem>
+        """)
+        self.assert_static_max_score(xml, 7)
+
+    def test_annotation_response(self):
+        xml = AnnotationResponseXMLFactory().build_xml(options=(('x', 'correct'), ('y', 'incorrect')))
+        self.assert_static_max_score(xml, 2)
+
+    def test_no_responses(self):
+        self.assert_static_max_score("<problem><p>Just text</p></problem>", 0)
+
+    def test_undeterminable_problems(self):
+        self.assertIsNone(get_static_max_score('<problem><include file="other.xml"/></problem>'))
+        self.assertIsNone(get_static_max_score('<problem><numericalresponse answer="1"/></problem>'))
+        self.assertIsNone(get_static_max_score('<problem><stringresponse><textline/></stringresponse></problem>'))
+        self.assertIsNone(get_static_max_score('<problem><unclosed></problem>'))
+
+    def test_memoized_by_definition(self):
+        xml = '<problem><stringresponse answer="memo"><textline points="4"/></stringresponse></problem>'
+        with mock.patch('capa.capa_problem._compute_static_max_score', return_value=4) as compute:
+            self.assertEqual(get_static_max_score(xml), 4)
+            self.assertEqual(get_static_max_score(xml), 4)
+            self.assertEqual(get_static_max_score(xml.replace('points="4"', 'points="5"')), 4)
+        self.assertEqual(compute.call_count, 2)
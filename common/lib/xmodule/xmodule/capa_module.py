@@ -10,6 +10,7 @@ from pkg_resources import resource_string
 import dogstats_wrapper as dog_stats_api
 from .capa_base import CapaMixin, CapaFields, ComplexEncoder
 from capa import responsetypes
+from capa.capa_problem import get_static_max_score
 from .progress import Progress
 from xmodule.util.misc import escape_html_characters
 from xmodule.x_module import XModule, module_attr, DEPRECATION_VSCOMPAT_EVENT
@@ -224,6 +225,14 @@ class CapaDescriptor(CapaFields, RawDescriptor):
         registered_tags = responsetypes.registry.registered_tags()
         return set([node.tag for node in tree.iter() if node.tag in registered_tags])
 
+    def static_max_score(self):
+        """
+        Return the problem's max score computed from its XML definition, without
+        binding the problem to a user, or None if it can only be computed by
+        the bound module's `max_score`.
+        """
+        return get_static_max_score(self.data)
+
     def index_dictionary(self):
         """
         Return dictionary prepared with module content and type for indexing.
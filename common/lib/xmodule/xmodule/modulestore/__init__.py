@@ -937,7 +937,8 @@ class ModuleStoreRead(ModuleStoreAssetBase):
         Returns a list containing the top level XModuleDescriptors of the courses
         in this modulestore. This method can take an optional argument 'org' which
         will efficiently apply a filter so that only the courses of the specified
-        ORG in the CourseKey will be fetched.
+        ORG in the CourseKey will be fetched, and an optional argument 'course_keys'
+        which will efficiently fetch only the listed courses.
         '''
         pass
 
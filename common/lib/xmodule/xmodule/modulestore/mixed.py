@@ -6,6 +6,7 @@ In this way, courses can be served up via either SplitMongoModuleStore or MongoM
 """
 
 import logging
+from collections import defaultdict
 from contextlib import contextmanager
 import itertools
 import functools
@@ -314,11 +315,27 @@ class MixedModuleStore(ModuleStoreDraftAndPublished, ModuleStoreWriteBase):
     def get_courses(self, **kwargs):
         '''
         Returns a list containing the top level XModuleDescriptors of the courses in this modulestore.
+
+        If ``course_keys`` is passed, only those courses are returned. Each key is routed
+        to the store that holds its course, and each store loads its courses in bulk rather
+        than one course at a time.
         '''
+        course_keys = kwargs.pop('course_keys', None)
+        if course_keys is None:
+            store_requests = [(store, kwargs) for store in self.modulestores]
+        else:
+            keys_by_store = defaultdict(list)
+            for course_key in course_keys:
+                keys_by_store[self._get_modulestore_for_courselike(course_key)].append(course_key)
+            store_requests = [
+                (store, dict(kwargs, course_keys=keys_by_store[store]))
+                for store in self.modulestores if store in keys_by_store
+            ]
+
         courses = {}
-        for store in self.modulestores:
+        for store, store_kwargs in store_requests:
             # filter out ones which were fetched from earlier stores but locations may not be ==
-            for course in store.get_courses(**kwargs):
+            for course in store.get_courses(**store_kwargs):
                 course_id = self._clean_locator_for_mapping(course.id)
                 if course_id not in courses:
                     # course is indeed unique. save it in result
@@ -1025,15 +1025,24 @@ class MongoModuleStore(ModuleStoreDraftAndPublished, ModuleStoreWriteBase, Mongo
     def get_courses(self, **kwargs):
         '''
         Returns a list of course descriptors. This accepts an optional parameter of 'org' which
-        will apply an efficient filter to only get courses with the specified ORG
+        will apply an efficient filter to only get courses with the specified ORG, and an optional
+        parameter of 'course_keys' which will only get the specified courses (in one query).
         '''
 
         course_org_filter = kwargs.get('org')
+        course_keys = kwargs.get('course_keys')
 
+        query = {'_id.category': 'course'}
         if course_org_filter:
-            course_records = self.collection.find({'_id.category': 'course', '_id.org': course_org_filter})
-        else:
-            course_records = self.collection.find({'_id.category': 'course'})
+            query['_id.org'] = course_org_filter
+        if course_keys is not None:
+            if not course_keys:
+                return []
+            query['$or'] = [
+                {'_id.org': course_key.org, '_id.course': course_key.course, '_id.name': course_key.run}
+                for course_key in course_keys
+            ]
+        course_records = self.collection.find(query)
 
         base_list = sum(
             [
@@ -8,6 +8,8 @@ import zlib
 import pymongo
 import pytz
 import re
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from time import time
 
@@ -15,6 +17,7 @@ from time import time
 from pymongo.errors import DuplicateKeyError  # pylint: disable=unused-import
 
 try:
+    from django.conf import settings
     from django.core.cache import caches, InvalidCacheBackendError
     DJANGO_AVAILABLE = True
 except ImportError:
@@ -223,6 +226,134 @@ def structure_to_mongo(structure, course_context=None):
         return new_structure
 
 
+class LocalStructureCache(object):
+    """
+    A bounded, process-local LRU cache of course structures.
+
+    Structures are immutable and keyed by their version ObjectId, so entries never
+    need to be invalidated; they are only evicted when either the entry count or
+    the total (uncompressed, pickled) size of the cached structures exceeds its limit.
+
+    :class:`CourseStructureCache` stores the uncompressed pickled structures here
+    rather than the structure objects themselves, because split mutates the blocks
+    of the structures it loads (e.g. ``cache_items`` fills in definition fields).
+    """
+    def __init__(self, max_entries, max_bytes):
+        """
+        Arguments:
+            max_entries (int): The maximum number of structures to hold.
+            max_bytes (int): The maximum total size of the held structures, as
+                measured by the length of their pickled representation.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_bytes(self):
+        """
+        The total size of all structures currently held in this cache.
+        """
+        return self._total_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Return the structure cached for ``key``, or None, marking it as most recently used.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries[key] = entry
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, structure, size):
+        """
+        Add ``structure`` to the cache, evicting the least recently used structures
+        as needed to stay within the configured limits.
+
+        Arguments:
+            key: The structure version id.
+            structure: The structure (as stored by the caller).
+            size (int): The size (in bytes) to account to this structure.
+
+        Returns:
+            The number of structures evicted to make room for this one.
+        """
+        if size > self.max_bytes or self.max_entries <= 0:
+            return 0
+
+        evicted = 0
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+
+            while self._entries and (
+                    len(self._entries) >= self.max_entries or
+                    self._total_bytes + size > self.max_bytes
+            ):
+                __, (__, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+                evicted += 1
+
+            self._entries[key] = (structure, size)
+            self._total_bytes += size
+            self.evictions += evicted
+        return evicted
+
+    def clear(self):
+        """
+        Remove all structures from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+_LOCAL_STRUCTURE_CACHE = None
+_LOCAL_STRUCTURE_CACHE_LOCK = threading.Lock()
+
+
+def get_local_structure_cache():
+    """
+    Return the process-wide :class:`LocalStructureCache`, or None if it isn't enabled.
+
+    The cache is configured by the ``COURSE_STRUCTURE_LOCAL_CACHE`` django setting, a dict
+    with the keys ``MAX_ENTRIES`` and ``MAX_BYTES``. If the setting is missing, or either
+    limit is 0, then no process-local caching is done.
+    """
+    global _LOCAL_STRUCTURE_CACHE  # pylint: disable=global-statement
+
+    if not DJANGO_AVAILABLE:
+        return None
+
+    config = getattr(settings, 'COURSE_STRUCTURE_LOCAL_CACHE', None) or {}
+    max_entries = config.get('MAX_ENTRIES', 0)
+    max_bytes = config.get('MAX_BYTES', 0)
+    if not max_entries or not max_bytes:
+        return None
+
+    with _LOCAL_STRUCTURE_CACHE_LOCK:
+        if (
+                _LOCAL_STRUCTURE_CACHE is None or
+                _LOCAL_STRUCTURE_CACHE.max_entries != max_entries or
+                _LOCAL_STRUCTURE_CACHE.max_bytes != max_bytes
+        ):
+            _LOCAL_STRUCTURE_CACHE = LocalStructureCache(max_entries, max_bytes)
+        return _LOCAL_STRUCTURE_CACHE
+
+
 class CourseStructureCache(object):
     """
     Wrapper around django cache object to cache course structure objects.
@@ -230,20 +361,34 @@ class CourseStructureCache(object):
 
     If the 'course_structure_cache' doesn't exist, then don't do anything for
     for set and get.
+
+    If a process-local cache is configured (see :func:`get_local_structure_cache`),
+    it is consulted before the django cache.  It holds the uncompressed pickled
+    structures, so that each caller still gets its own copy of the structure.
     """
     def __init__(self):
         self.cache = None
+        self.local_cache = None
         if DJANGO_AVAILABLE:
             try:
                 self.cache = get_cache('course_structure_cache')
             except InvalidCacheBackendError:
                 pass
+            else:
+                self.local_cache = get_local_structure_cache()
 
     def get(self, key, course_context=None):
         """Pull the compressed, pickled struct data from cache and deserialize."""
         if self.cache is None:
             return None
 
+        if self.local_cache is not None:
+            with TIMER.timer("CourseStructureCache.local_get", course_context) as tagger:
+                pickled_data = self.local_cache.get(key)
+                tagger.tag(from_cache=str(pickled_data is not None).lower())
+                if pickled_data is not None:
+                    return pickle.loads(pickled_data)
+
         with TIMER.timer("CourseStructureCache.get", course_context) as tagger:
             compressed_pickled_data = self.cache.get(key)
             tagger.tag(from_cache=str(compressed_pickled_data is not None).lower())
@@ -258,7 +403,9 @@ class CourseStructureCache(object):
             pickled_data = zlib.decompress(compressed_pickled_data)
             tagger.measure('uncompressed_size', len(pickled_data))
 
-            return pickle.loads(pickled_data)
+            structure = pickle.loads(pickled_data)
+            self._set_local(key, pickled_data, tagger)
+            return structure
 
     def set(self, key, structure, course_context=None):
         """Given a structure, will pickle, compress, and write to cache."""
@@ -275,6 +422,75 @@ class CourseStructureCache(object):
 
             # Stuctures are immutable, so we set a timeout of "never"
             self.cache.set(key, compressed_pickled_data, None)
+            self._set_local(key, pickled_data, tagger)
+
+    def get_many(self, keys, course_context=None):
+        """
+        Pull the structures for all of ``keys`` from the cache, returning a dict
+        of the structures that were found, keyed by structure id.
+        """
+        if self.cache is None:
+            return {}
+
+        structures = {}
+        keys = list(keys)
+        if self.local_cache is not None:
+            with TIMER.timer("CourseStructureCache.local_get_many", course_context) as tagger:
+                for key in keys:
+                    pickled_data = self.local_cache.get(key)
+                    if pickled_data is not None:
+                        structures[key] = pickle.loads(pickled_data)
+                tagger.measure('requested', len(keys))
+                tagger.measure('hits', len(structures))
+            keys = [key for key in keys if key not in structures]
+
+        if not keys:
+            return structures
+
+        with TIMER.timer("CourseStructureCache.get_many", course_context) as tagger:
+            tagger.measure('requested', len(keys))
+            compressed_pickled_data = self.cache.get_many(keys)
+            tagger.measure('hits', len(compressed_pickled_data))
+            if len(compressed_pickled_data) < len(keys):
+                # Always log cache misses, because they are unexpected
+                tagger.sample_rate = 1
+
+            for key, compressed in compressed_pickled_data.iteritems():
+                pickled_data = zlib.decompress(compressed)
+                structures[key] = pickle.loads(pickled_data)
+                self._set_local(key, pickled_data, tagger)
+
+        return structures
+
+    def set_many(self, structures, course_context=None):
+        """Given a dict of structures keyed by structure id, pickle, compress, and write them all to cache."""
+        if self.cache is None or not structures:
+            return None
+
+        with TIMER.timer("CourseStructureCache.set_many", course_context) as tagger:
+            tagger.measure('structures', len(structures))
+            to_cache = {}
+            for key, structure in structures.iteritems():
+                pickled_data = pickle.dumps(structure, pickle.HIGHEST_PROTOCOL)
+                # 1 = Fastest (slightly larger results)
+                to_cache[key] = zlib.compress(pickled_data, 1)
+                self._set_local(key, pickled_data, tagger)
+
+            # Stuctures are immutable, so we set a timeout of "never"
+            self.cache.set_many(to_cache, None)
+
+    def _set_local(self, key, pickled_data, tagger):
+        """
+        Add the uncompressed ``pickled_data`` of a structure to the process-local
+        cache (if there is one), recording any resulting evictions on ``tagger``.
+        """
+        if self.local_cache is None:
+            return
+
+        evicted = self.local_cache.set(key, pickled_data, len(pickled_data))
+        tagger.measure('local_evictions', evicted)
+        tagger.measure('local_entries', len(self.local_cache))
+        tagger.measure('local_size', self.local_cache.total_bytes)
 
 
 class MongoConnection(object):
@@ -341,15 +557,30 @@ class MongoConnection(object):
         """
         Return all structures that specified in ``ids``.
 
+        Structures are first looked up in the structure cache with a single ``get_many``.
+        Only the structures missing from the cache are read from mongo (with one ``$in``
+        query), and those are then added to the cache.
+
         Arguments:
             ids (list): A list of structure ids
         """
         with TIMER.timer("find_structures_by_id", course_context) as tagger:
             tagger.measure("requested_ids", len(ids))
-            docs = [
-                structure_from_mongo(structure, course_context)
-                for structure in self.structures.find({'_id': {'$in': ids}})
-            ]
+            cache = CourseStructureCache()
+
+            cached = cache.get_many(ids, course_context)
+            tagger.measure("cached_structures", len(cached))
+            docs = cached.values()
+
+            missing_ids = [structure_id for structure_id in ids if structure_id not in cached]
+            if missing_ids or not cached:
+                found = {}
+                for structure in self.structures.find({'_id': {'$in': missing_ids}}):
+                    structure = structure_from_mongo(structure, course_context)
+                    found[structure['_id']] = structure
+                    docs.append(structure)
+                cache.set_many(found, course_context)
+
             tagger.measure("structures", len(docs))
             return docs
 
@@ -468,6 +699,45 @@ class MongoConnection(object):
 
             return self.course_index.find(query)
 
+    def find_course_indexes(self, course_keys, branch=None, search_targets=None, org_target=None, course_context=None):
+        """
+        Find the course_indexes for all of ``course_keys`` with a single query.
+
+        Arguments:
+            course_keys (list): The CourseKeys (or LibraryLocators) to find indexes for.
+            branch: If specified, this branch must exist in the returned courses
+            search_targets: If specified, this must be a dictionary specifying field values
+                that must exist in the search_targets of the returned courses
+            org_target: If specified, this is an ORG filter so that only course_indexs are
+                returned for the specified ORG
+        """
+        with TIMER.timer("find_course_indexes", course_context) as tagger:
+            tagger.measure("requested_keys", len(course_keys))
+            if not course_keys:
+                return []
+
+            query = {
+                '$or': [
+                    {
+                        'org': course_key.org,
+                        'course': course_key.course,
+                        'run': course_key.run,
+                    }
+                    for course_key in course_keys
+                ]
+            }
+            if branch is not None:
+                query['versions.{}'.format(branch)] = {'$exists': True}
+
+            if search_targets:
+                for key, value in search_targets.iteritems():
+                    query['search_targets.{}'.format(key)] = value
+
+            if org_target:
+                query['org'] = org_target
+
+            return list(self.course_index.find(query))
+
     def insert_course_index(self, course_index, course_context=None):
         """
         Create the course_index in the db
@@ -493,16 +493,21 @@ class SplitBulkWriteMixin(BulkOperationsMixin):
             block_data.edit_info.original_usage = original_usage
             block_data.edit_info.original_usage_version = original_usage_version
 
-    def find_matching_course_indexes(self, branch=None, search_targets=None, org_target=None):
+    def find_matching_course_indexes(self, branch=None, search_targets=None, org_target=None, course_keys=None):
         """
         Find the course_indexes which have the specified branch and search_targets. An optional org_target
         can be specified to apply an ORG filter to return only the courses that are part of
-        that ORG.
+        that ORG. An optional list of course_keys can be specified to only return the indexes
+        of those courses (which are all fetched with a single query).
 
         Returns:
             a Cursor if there are no changes in flight or a list if some have changed in current bulk op
         """
-        indexes = self.db_connection.find_matching_course_indexes(branch, search_targets, org_target)
+        if course_keys is None:
+            indexes = self.db_connection.find_matching_course_indexes(branch, search_targets, org_target)
+        else:
+            course_ids = set((key.org, key.course, key.run) for key in course_keys)
+            indexes = self.db_connection.find_course_indexes(course_keys, branch, search_targets, org_target)
 
         def _replace_or_append_index(altered_index):
             """
@@ -535,6 +540,10 @@ class SplitBulkWriteMixin(BulkOperationsMixin):
                 if record.index['org'] != org_target:
                     continue
 
+            if course_keys is not None:
+                if (record.index['org'], record.index['course'], record.index['run']) not in course_ids:
+                    continue
+
             if not hasattr(indexes, 'append'):  # Just in time conversion to list from cursor
                 indexes = list(indexes)
 
@@ -896,14 +905,16 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
     def collect_ids_from_matching_indexes(self, branch, **kwargs):
         """
         Find the course_indexes which have the specified branch. if `kwargs` contains `org`
-        to apply an ORG filter to return only the courses that are part of that ORG. Extract `version_guids`
+        to apply an ORG filter to return only the courses that are part of that ORG. If `kwargs`
+        contains `course_keys`, only the indexes for those courses are returned. Extract `version_guids`
         from the course_indexes.
 
         """
         matching_indexes = self.find_matching_course_indexes(
             branch,
             search_targets=None,
-            org_target=kwargs.get('org')
+            org_target=kwargs.get('org'),
+            course_keys=kwargs.get('course_keys'),
         )
 
         # collect ids and then query for those
@@ -964,6 +975,10 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         Note, this is to find the current head of the named branch type.
         To get specific versions via guid use get_course.
 
+        If ``course_keys`` is passed, only those courses are returned. Their indexes are
+        found with one query, and their structures are read with a single cache lookup
+        followed by one query for any structures missing from the cache.
+
         :param branch: the branch for which to return courses.
         """
         # get the blocks for each course index (s/b the root)
@@ -1026,6 +1026,18 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
             published_courses = self.store.get_courses(remove_branch=True)
         self.assertEquals([c.id for c in draft_courses], [c.id for c in published_courses])
 
+    @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
+    def test_get_courses_by_keys(self, default_ms):
+        self.initdb(default_ms)
+        course_key = self.course_locations[self.MONGO_COURSEID].course_key
+        missing_key = self.store.make_course_key('NoSuch', 'Course', 'Run')
+
+        courses = self.store.get_courses(course_keys=[course_key, missing_key])
+        self.assertEqual([course.id for course in courses], [course_key])
+
+        self.assertEqual(self.store.get_courses(course_keys=[missing_key]), [])
+        self.assertEqual(self.store.get_courses(course_keys=[]), [])
+
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_create_child_detached_tabs(self, default_ms):
         """
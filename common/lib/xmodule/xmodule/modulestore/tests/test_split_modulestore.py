@@ -14,6 +14,7 @@ import ddt
 from contracts import contract
 from nose.plugins.attrib import attr
 from django.core.cache import caches, InvalidCacheBackendError
+from django.test.utils import override_settings
 
 from openedx.core.lib import tempdir
 from xblock.fields import Reference, ReferenceList, ReferenceValueDict
@@ -30,6 +31,7 @@ from xmodule.modulestore.inheritance import InheritanceMixin
 from xmodule.x_module import XModuleMixin
 from xmodule.fields import Date, Timedelta
 from xmodule.modulestore.split_mongo.split import SplitMongoModuleStore
+from xmodule.modulestore.split_mongo.mongo_connection import get_local_structure_cache
 from xmodule.modulestore.tests.test_modulestore import check_has_course_method
 from xmodule.modulestore.split_mongo import BlockKey
 from xmodule.modulestore.tests.factories import check_mongo_calls
@@ -645,6 +647,20 @@ class SplitModuleCourseTests(SplitModuleTest):
         self.assertEqual(len(courses), 4)
         self.assertIn(new_draft_course.id.version_agnostic(), [c.id for c in courses])
 
+    def test_find_matching_course_indexes_by_keys(self):
+        store = modulestore()
+        course_keys = [course.id for course in store.get_courses(branch=BRANCH_NAME_DRAFT)]
+        indexes = store.find_matching_course_indexes(BRANCH_NAME_DRAFT, course_keys=course_keys)
+        self.assertEqual(len(list(indexes)), len(course_keys))
+
+        # the other filters still apply when course keys are given
+        indexes = store.find_matching_course_indexes(BRANCH_NAME_DRAFT, org_target='guestx', course_keys=course_keys)
+        self.assertEqual([index['org'] for index in indexes], ['guestx'])
+        indexes = store.find_matching_course_indexes(
+            BRANCH_NAME_DRAFT, search_targets={'wiki_slug': 'no-such-wiki'}, course_keys=course_keys
+        )
+        self.assertEqual(list(indexes), [])
+
     @patch('xmodule.tabs.CourseTab.from_json', side_effect=mock_tab_from_json)
     def test_get_org_courses(self, _from_json):
         courses = modulestore().get_courses(branch=BRANCH_NAME_DRAFT, org='guestx')
@@ -978,6 +994,46 @@ class TestCourseStructureCache(SplitModuleTest):
         # now make sure that you get the same structure
         self.assertEqual(cached_structure, not_cached_structure)
 
+    @patch('xmodule.modulestore.split_mongo.mongo_connection.get_cache')
+    @override_settings(COURSE_STRUCTURE_LOCAL_CACHE={'MAX_ENTRIES': 10, 'MAX_BYTES': 10 * 1024 * 1024})
+    def test_course_structure_local_cache(self, mock_get_cache):
+        mock_get_cache.return_value = self.cache
+        get_local_structure_cache().clear()
+        self.addCleanup(get_local_structure_cache().clear)
+
+        with check_mongo_calls(1):
+            not_cached_structure = self._get_structure(self.new_course)
+
+        # once the structure is cached locally, the django cache isn't used either
+        self.cache.clear()
+        with check_mongo_calls(0):
+            cached_structure = self._get_structure(self.new_course)
+
+        self.assertEqual(cached_structure, not_cached_structure)
+
+        # each caller gets its own copy, so mutating one doesn't affect the others
+        self.assertIsNot(cached_structure, not_cached_structure)
+        for block in cached_structure['blocks'].itervalues():
+            block.fields['display_name'] = 'mutated'
+            block.definition_loaded = True
+        with check_mongo_calls(0):
+            self.assertEqual(self._get_structure(self.new_course), not_cached_structure)
+
+    @patch('xmodule.modulestore.split_mongo.mongo_connection.get_cache')
+    def test_find_structures_by_id_uses_cache(self, mock_get_cache):
+        mock_get_cache.return_value = self.cache
+        structure_id = self.new_course.location.as_object_id(self.new_course.location.version_guid)
+        db_connection = modulestore().db_connection
+
+        with check_mongo_calls(1):
+            not_cached_structures = db_connection.find_structures_by_id([structure_id])
+
+        # the structures read from mongo were added to the cache
+        with check_mongo_calls(0):
+            cached_structures = db_connection.find_structures_by_id([structure_id])
+
+        self.assertEqual(cached_structures, not_cached_structures)
+
     def test_dummy_cache(self):
         with check_mongo_calls(1):
             not_cached_structure = self._get_structure(self.new_course)
@@ -1,7 +1,7 @@
 """ Test the behavior of split_mongo/MongoConnection """
 import unittest
 from mock import patch
-from xmodule.modulestore.split_mongo.mongo_connection import MongoConnection
+from xmodule.modulestore.split_mongo.mongo_connection import MongoConnection, LocalStructureCache
 from xmodule.exceptions import HeartbeatFailure
 
 
@@ -17,3 +17,49 @@ class TestHeartbeatFailureException(unittest.TestCase):
 
             with self.assertRaises(HeartbeatFailure):
                 useless_conn.heartbeat()
+
+
+class TestLocalStructureCache(unittest.TestCase):
+    """ Test the bounds and LRU behavior of the process-local structure cache """
+    def test_get_and_set(self):
+        cache = LocalStructureCache(max_entries=2, max_bytes=100)
+        structure = {'_id': 'a'}
+        self.assertIsNone(cache.get('a'))
+        cache.set('a', structure, 10)
+        self.assertIs(cache.get('a'), structure)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_evicts_least_recently_used_by_count(self):
+        cache = LocalStructureCache(max_entries=2, max_bytes=100)
+        cache.set('a', {}, 10)
+        cache.set('b', {}, 10)
+        # touch 'a', so that 'b' is the least recently used
+        cache.get('a')
+        self.assertEqual(cache.set('c', {}, 10), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('c'))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_evicts_by_size(self):
+        cache = LocalStructureCache(max_entries=10, max_bytes=100)
+        cache.set('a', {}, 40)
+        cache.set('b', {}, 40)
+        self.assertEqual(cache.set('c', {}, 40), 1)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.total_bytes, 80)
+        self.assertIsNone(cache.get('a'))
+
+    def test_oversized_structures_are_not_cached(self):
+        cache = LocalStructureCache(max_entries=10, max_bytes=100)
+        cache.set('a', {}, 50)
+        self.assertEqual(cache.set('b', {}, 101), 0)
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+
+    def test_replace_existing(self):
+        cache = LocalStructureCache(max_entries=10, max_bytes=100)
+        cache.set('a', {}, 50)
+        cache.set('a', {}, 30)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.total_bytes, 30)
@@ -837,8 +837,17 @@ class XMLModuleStore(ModuleStoreReadBase):
         """
         Returns a list of course descriptors.  If there were errors on loading,
         some of these may be ErrorDescriptors instead.
+
+        If 'course_keys' is passed, only those courses are returned.
         """
-        return self.courses.values()
+        course_keys = kwargs.get('course_keys')
+        if course_keys is None:
+            return self.courses.values()
+        course_ids = set((key.org, key.course, key.run) for key in course_keys)
+        return [
+            course for course in self.courses.values()
+            if (course.id.org, course.id.course, course.id.run) in course_ids
+        ]
 
     def get_course_summaries(self, **kwargs):
         """
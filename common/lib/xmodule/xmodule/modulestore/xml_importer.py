@@ -20,8 +20,10 @@ Modulestore virtual   |          XML physical (draft, published)
              (a, a)   |  (a, a) | (x, a) | (x, x) | (x, y) | (a, x)
              (a, b)   |  (a, b) | (x, b) | (x, x) | (x, y) | (a, x)
 """
+import hashlib
 import logging
 from abc import abstractmethod
+from multiprocessing.pool import ThreadPool
 from opaque_keys.edx.locator import LibraryLocator
 import os
 import mimetypes
@@ -56,10 +58,17 @@ log = logging.getLogger(__name__)
 
 def import_static_content(
         course_data_path, static_content_store,
-        target_id, subpath='static', verbose=False):
-
-    remap_dict = {}
-
+        target_id, subpath='static', verbose=False, workers=1):
+    """
+    Imports the files found under `course_data_path`/`subpath` into
+    `static_content_store` as assets of `target_id`, and returns a dictionary
+    mapping each file's path to its asset key.
+
+    Files whose content and metadata match the asset already stored, as told
+    by their md5 digests, are not uploaded again, so reimporting a course, or
+    retrying an import that failed halfway, only uploads what changed. Up to
+    `workers` files are uploaded at the same time.
+    """
     # now import all static assets
     static_dir = course_data_path / subpath
     try:
@@ -76,6 +85,7 @@ def import_static_content(
     mimetypes.add_type('application/octet-stream', '.srt')
     mimetypes_list = mimetypes.types_map.values()
 
+    content_paths = []
     for dirname, _, filenames in os.walk(static_dir):
         for filename in filenames:
 
@@ -86,63 +96,121 @@ def import_static_content(
                     log.debug('skipping static content %s...', content_path)
                 continue
 
+            content_paths.append((content_path, filename))
+
+    if not content_paths:
+        return {}
+
+    existing_assets = _get_existing_assets(static_content_store, target_id)
+
+    def import_file(content_path, filename):
+        """
+        Imports a single static file, returning the path used to reference it
+        in the course and its asset key, or None if it should be skipped.
+        """
+        if verbose:
+            log.debug('importing static content %s...', content_path)
+
+        try:
+            with open(content_path, 'rb') as f:
+                data = f.read()
+        except IOError:
+            if filename.startswith('._'):
+                # OS X "companion files". See
+                # http://www.diigo.com/annotated/0c936fda5da4aa1159c189cea227e174
+                return None
+            # Not a 'hidden file', then re-raise exception
+            raise
+
+        # strip away leading path from the name
+        fullname_with_subpath = content_path.replace(static_dir, '')
+        if fullname_with_subpath.startswith('/'):
+            fullname_with_subpath = fullname_with_subpath[1:]
+        asset_key = StaticContent.compute_location(target_id, fullname_with_subpath)
+
+        policy_ele = policy.get(asset_key.path, {})
+
+        # During export display name is used to create files, strip away slashes from name
+        displayname = escape_invalid_characters(
+            name=policy_ele.get('displayname', filename),
+            invalid_char_list=['/', '\\']
+        )
+        locked = policy_ele.get('locked', False)
+        mime_type = policy_ele.get('contentType')
+
+        # Check extracted contentType in list of all valid mimetypes
+        if not mime_type or mime_type not in mimetypes_list:
+            mime_type = mimetypes.guess_type(filename)[0]   # Assign guessed mimetype
+
+        existing = existing_assets.get(asset_key)
+        if existing is not None and existing == _asset_fingerprint(
+                hashlib.md5(data).hexdigest(), displayname, mime_type, locked, fullname_with_subpath
+        ):
             if verbose:
-                log.debug('importing static content %s...', content_path)
+                log.debug('static content %s is unchanged, skipping upload', content_path)
+            return fullname_with_subpath, asset_key
 
-            try:
-                with open(content_path, 'rb') as f:
-                    data = f.read()
-            except IOError:
-                if filename.startswith('._'):
-                    # OS X "companion files". See
-                    # http://www.diigo.com/annotated/0c936fda5da4aa1159c189cea227e174
-                    continue
-                # Not a 'hidden file', then re-raise exception
-                raise
+        content = StaticContent(
+            asset_key, displayname, mime_type, data,
+            import_path=fullname_with_subpath, locked=locked
+        )
 
-            # strip away leading path from the name
-            fullname_with_subpath = content_path.replace(static_dir, '')
-            if fullname_with_subpath.startswith('/'):
-                fullname_with_subpath = fullname_with_subpath[1:]
-            asset_key = StaticContent.compute_location(target_id, fullname_with_subpath)
+        # first let's save a thumbnail so we can get back a thumbnail location
+        thumbnail_content, thumbnail_location = static_content_store.generate_thumbnail(content)
 
-            policy_ele = policy.get(asset_key.path, {})
+        if thumbnail_content is not None:
+            content.thumbnail_location = thumbnail_location
 
-            # During export display name is used to create files, strip away slashes from name
-            displayname = escape_invalid_characters(
-                name=policy_ele.get('displayname', filename),
-                invalid_char_list=['/', '\\']
-            )
-            locked = policy_ele.get('locked', False)
-            mime_type = policy_ele.get('contentType')
-
-            # Check extracted contentType in list of all valid mimetypes
-            if not mime_type or mime_type not in mimetypes_list:
-                mime_type = mimetypes.guess_type(filename)[0]   # Assign guessed mimetype
-            content = StaticContent(
-                asset_key, displayname, mime_type, data,
-                import_path=fullname_with_subpath, locked=locked
-            )
+        # then commit the content
+        try:
+            static_content_store.save(content)
+        except Exception as err:
+            log.exception(u'Error importing {0}, error={1}'.format(
+                fullname_with_subpath, err
+            ))
 
-            # first let's save a thumbnail so we can get back a thumbnail location
-            thumbnail_content, thumbnail_location = static_content_store.generate_thumbnail(content)
+        return fullname_with_subpath, asset_key
 
-            if thumbnail_content is not None:
-                content.thumbnail_location = thumbnail_location
+    if workers > 1 and len(content_paths) > 1:
+        pool = ThreadPool(min(workers, len(content_paths)))
+        try:
+            imported = pool.map(lambda args: import_file(*args), content_paths)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        imported = [import_file(file_path, filename) for file_path, filename in content_paths]
 
-            # then commit the content
-            try:
-                static_content_store.save(content)
-            except Exception as err:
-                log.exception(u'Error importing {0}, error={1}'.format(
-                    fullname_with_subpath, err
-                ))
+    # store the remapping information which will be needed
+    # to subsitute in the module data
+    return dict(remapping for remapping in imported if remapping is not None)
 
-            # store the remapping information which will be needed
-            # to subsitute in the module data
-            remap_dict[fullname_with_subpath] = asset_key
 
-    return remap_dict
+def _asset_fingerprint(digest, displayname, content_type, locked, import_path):
+    """
+    Returns what has to match for an imported file to be considered unchanged
+    from the stored asset.
+    """
+    return (digest, displayname, content_type, bool(locked), import_path)
+
+
+def _get_existing_assets(static_content_store, course_key):
+    """
+    Returns the fingerprints of the assets already stored for `course_key`,
+    keyed by asset key.
+
+    Thumbnails are saved before the asset itself, so an asset found here has
+    already been through thumbnail generation.
+    """
+    assets, __ = static_content_store.get_all_content_for_course(course_key)
+    return {
+        asset['asset_key']: _asset_fingerprint(
+            asset.get('md5'), asset.get('displayname'), asset.get('contentType'),
+            asset.get('locked', False), asset.get('import_path'),
+        )
+        for asset in assets
+        if asset.get('md5')
+    }
 
 
 class ImportManager(object):
@@ -176,6 +244,8 @@ class ImportManager(object):
         create_if_not_present: If True, then a new courselike is created if it doesn't already exist.
             Otherwise, it throws an InvalidLocationError if the courselike does not exist.
 
+        static_import_workers: the number of static files to upload to static_content_store at the same time.
+
         default_class, load_error_modules: are arguments for constructing the XMLModuleStore (see its doc)
     """
     store_class = XMLModuleStore
@@ -186,7 +256,7 @@ class ImportManager(object):
             load_error_modules=True, static_content_store=None,
             target_id=None, verbose=False,
             do_import_static=True, create_if_not_present=False,
-            raise_on_failure=False
+            raise_on_failure=False, static_import_workers=1
     ):
         self.store = store
         self.user_id = user_id
@@ -199,6 +269,7 @@ class ImportManager(object):
         self.do_import_static = do_import_static
         self.create_if_not_present = create_if_not_present
         self.raise_on_failure = raise_on_failure
+        self.static_import_workers = static_import_workers
         self.xml_module_store = self.store_class(
             data_dir,
             default_class=default_class,
@@ -227,7 +298,8 @@ class ImportManager(object):
             # first pass to find everything in /static/
             import_static_content(
                 data_path, self.static_content_store,
-                dest_id, subpath='static', verbose=self.verbose
+                dest_id, subpath='static', verbose=self.verbose,
+                workers=self.static_import_workers,
             )
 
         elif self.verbose and not self.do_import_static:
@@ -250,7 +322,8 @@ class ImportManager(object):
         if os.path.exists(data_path / simport):
             import_static_content(
                 data_path, self.static_content_store,
-                dest_id, subpath=simport, verbose=self.verbose
+                dest_id, subpath=simport, verbose=self.verbose,
+                workers=self.static_import_workers,
             )
 
     def import_asset_metadata(self, data_dir, course_id):
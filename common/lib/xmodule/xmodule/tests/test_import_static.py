@@ -1,6 +1,7 @@
 """
 Tests that check that we ignore the appropriate files when importing courses.
 """
+import hashlib
 import unittest
 from mock import Mock
 from xmodule.modulestore.xml_importer import import_static_content
@@ -15,6 +16,7 @@ class IgnoredFilesTestCase(unittest.TestCase):
         course_id = SlashSeparatedCourseKey("edX", "tilde", "Fall_2012")
         content_store = Mock()
         content_store.generate_thumbnail.return_value = ("content", "location")
+        content_store.get_all_content_for_course.return_value = ([], 0)
         import_static_content(course_dir, content_store, course_id)
         saved_static_content = [call[0][0] for call in content_store.save.call_args_list]
         name_val = {sc.name: sc.data for sc in saved_static_content}
@@ -30,6 +32,7 @@ class IgnoredFilesTestCase(unittest.TestCase):
         course_id = SlashSeparatedCourseKey("edX", "dot-underscore", "2014_Fall")
         content_store = Mock()
         content_store.generate_thumbnail.return_value = ("content", "location")
+        content_store.get_all_content_for_course.return_value = ([], 0)
         import_static_content(course_dir, content_store, course_id)
         saved_static_content = [call[0][0] for call in content_store.save.call_args_list]
         name_val = {sc.name: sc.data for sc in saved_static_content}
@@ -39,3 +42,48 @@ class IgnoredFilesTestCase(unittest.TestCase):
         self.assertNotIn(".DS_Store", name_val)
         self.assertIn("GREEN", name_val["example.txt"])
         self.assertIn("BLUE", name_val[".example.txt"])
+
+
+class ReimportStaticFilesTestCase(unittest.TestCase):
+    "Tests for reimporting static files"
+    def setUp(self):
+        super(ReimportStaticFilesTestCase, self).setUp()
+        self.course_dir = DATA_DIR / "dot-underscore"
+        self.course_id = SlashSeparatedCourseKey("edX", "dot-underscore", "2014_Fall")
+        self.content_store = Mock()
+        self.content_store.generate_thumbnail.return_value = (None, None)
+
+    def stored_asset(self, filename, data):
+        """
+        Returns the asset listing entry the content store has for `filename`.
+        """
+        return {
+            'asset_key': self.course_id.make_asset_key('asset', filename),
+            'md5': hashlib.md5(data).hexdigest(),
+            'displayname': filename,
+            'contentType': 'text/plain',
+            'locked': False,
+            'import_path': filename,
+        }
+
+    def saved_names(self):
+        """
+        Returns the names of the static files saved to the content store.
+        """
+        return sorted(call[0][0].name for call in self.content_store.save.call_args_list)
+
+    def test_unchanged_files_skipped(self):
+        with open(self.course_dir / "static" / "example.txt", 'rb') as f:
+            data = f.read()
+        self.content_store.get_all_content_for_course.return_value = (
+            [self.stored_asset("example.txt", data), self.stored_asset(".example.txt", "stale")], 2
+        )
+        remap = import_static_content(self.course_dir, self.content_store, self.course_id)
+        self.assertEqual(self.saved_names(), [".example.txt"])
+        self.assertEqual(sorted(remap), [".example.txt", "example.txt"])
+
+    def test_parallel_import(self):
+        self.content_store.get_all_content_for_course.return_value = ([], 0)
+        remap = import_static_content(self.course_dir, self.content_store, self.course_id, workers=4)
+        self.assertEqual(self.saved_names(), [".example.txt", "example.txt"])
+        self.assertEqual(remap["example.txt"], self.course_id.make_asset_key('asset', "example.txt"))
@@ -398,6 +398,23 @@ class BulkEmailFlag(ConfigurationModel):
         else:  # implies enabled == True and require_course_email == False, so email is globally enabled
             return True
 
+    @classmethod
+    def courses_with_feature_enabled(cls, course_ids):
+        """
+        Returns a frozenset of the given course ids for which the bulk email
+        feature is available, as determined by `feature_enabled`, using a
+        single query for all of the courses.
+        """
+        if not BulkEmailFlag.is_enabled():
+            return frozenset()
+        elif BulkEmailFlag.current().require_course_email_auth:
+            return frozenset(
+                authorization.course_id
+                for authorization in CourseAuthorization.objects.filter(course_id__in=course_ids, email_enabled=True)
+            )
+        else:
+            return frozenset(course_ids)
+
     class Meta(object):
         app_label = "bulk_email"
 
@@ -237,3 +237,14 @@ class CourseAuthorizationTest(TestCase):
 
         # Now, course should STILL be authorized!
         self.assertTrue(BulkEmailFlag.feature_enabled(course_id))
+
+    def test_courses_with_feature_enabled(self):
+        course_ids = [CourseKey.from_string('abc/123/doremi'), CourseKey.from_string('blahx/blah101/ehhhhhhh')]
+        CourseAuthorization.objects.create(course_id=course_ids[0], email_enabled=True)
+        self.assertEqual(BulkEmailFlag.courses_with_feature_enabled(course_ids), frozenset())
+
+        BulkEmailFlag.objects.create(enabled=True, require_course_email_auth=True)
+        self.assertEqual(BulkEmailFlag.courses_with_feature_enabled(course_ids), frozenset(course_ids[:1]))
+
+        BulkEmailFlag.objects.create(enabled=True, require_course_email_auth=False)
+        self.assertEqual(BulkEmailFlag.courses_with_feature_enabled(course_ids), frozenset(course_ids))
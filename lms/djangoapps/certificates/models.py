@@ -256,6 +256,14 @@ class GeneratedCertificate(models.Model):
 
         return None
 
+    @classmethod
+    def course_ids_with_certs_for_user(cls, user):
+        """
+        Returns a set of the ids of the courses in which the user has a
+        certificate, of any status.
+        """
+        return set(cert.course_id for cert in cls.objects.filter(user=user).only('course_id'))
+
     @classmethod
     def get_unique_statuses(cls, course_key=None, flat=False):
         """
@@ -496,42 +504,92 @@ def certificate_status_for_student(student, course_id):
     If the student has been graded, the dictionary also contains their
     grade for the course with the key "grade".
     '''
+    try:
+        generated_certificate = GeneratedCertificate.objects.get(  # pylint: disable=no-member
+            user=student, course_id=course_id)
+    except GeneratedCertificate.DoesNotExist:
+        generated_certificate = None
+    return _certificate_status(generated_certificate)
+
+
+def certificate_statuses_for_students(students, course_id):
+    """
+    Returns a dict mapping the id of each of the given students to their
+    certificate status, as returned by certificate_status_for_student, using
+    a single query for all of the students.
+    """
+    generated_certificates = {
+        generated_certificate.user_id: generated_certificate
+        for generated_certificate in GeneratedCertificate.objects.filter(  # pylint: disable=no-member
+            user__in=students, course_id=course_id
+        )
+    }
+    return {
+        student.id: _certificate_status(generated_certificates.get(student.id))
+        for student in students
+    }
+
+
+def certificate_statuses_for_courses(student, course_ids):
+    """
+    Returns a dict mapping each of the given course ids to the student's
+    certificate status in the course, as returned by
+    certificate_status_for_student, using a single query for all of the
+    courses.
+    """
+    generated_certificates = {
+        generated_certificate.course_id: generated_certificate
+        for generated_certificate in GeneratedCertificate.objects.filter(  # pylint: disable=no-member
+            user=student, course_id__in=course_ids
+        )
+    }
+    return {
+        course_id: _certificate_status(generated_certificates.get(course_id))
+        for course_id in course_ids
+    }
+
+
+def _certificate_status(generated_certificate):
+    """
+    Returns the certificate status dictionary described in
+    certificate_status_for_student for the given GeneratedCertificate, which
+    may be None if the student has no certificate.
+    """
     # Import here instead of top of file since this module gets imported before
     # the course_modes app is loaded, resulting in a Django deprecation warning.
     from course_modes.models import CourseMode
 
-    try:
-        generated_certificate = GeneratedCertificate.objects.get(  # pylint: disable=no-member
-            user=student, course_id=course_id)
-        cert_status = {
-            'status': generated_certificate.status,
-            'mode': generated_certificate.mode,
-            'uuid': generated_certificate.verify_uuid,
-        }
-        if generated_certificate.grade:
-            cert_status['grade'] = generated_certificate.grade
+    if generated_certificate is None:
+        return {'status': CertificateStatuses.unavailable, 'mode': GeneratedCertificate.MODES.honor, 'uuid': None}
 
-        if generated_certificate.mode == 'audit':
-            course_mode_slugs = [mode.slug for mode in CourseMode.modes_for_course(course_id)]
-            # Short term fix to make sure old audit users with certs still see their certs
-            # only do this if there if no honor mode
-            if 'honor' not in course_mode_slugs:
-                cert_status['status'] = CertificateStatuses.auditing
-                return cert_status
+    cert_status = {
+        'status': generated_certificate.status,
+        'mode': generated_certificate.mode,
+        'uuid': generated_certificate.verify_uuid,
+    }
+    if generated_certificate.grade:
+        cert_status['grade'] = generated_certificate.grade
 
-        if generated_certificate.status == CertificateStatuses.downloadable:
-            cert_status['download_url'] = generated_certificate.download_url
+    if generated_certificate.mode == 'audit':
+        course_mode_slugs = [mode.slug for mode in CourseMode.modes_for_course(generated_certificate.course_id)]
+        # Short term fix to make sure old audit users with certs still see their certs
+        # only do this if there if no honor mode
+        if 'honor' not in course_mode_slugs:
+            cert_status['status'] = CertificateStatuses.auditing
+            return cert_status
 
-        return cert_status
+    if generated_certificate.status == CertificateStatuses.downloadable:
+        cert_status['download_url'] = generated_certificate.download_url
 
-    except GeneratedCertificate.DoesNotExist:
-        pass
-    return {'status': CertificateStatuses.unavailable, 'mode': GeneratedCertificate.MODES.honor, 'uuid': None}
+    return cert_status
 
 
-def certificate_info_for_user(user, course_id, grade, user_is_whitelisted=None):
+def certificate_info_for_user(user, course_id, grade, user_is_whitelisted=None, certificate_status=None):
     """
     Returns the certificate info for a user for grade report.
+
+    If `user_is_whitelisted` or `certificate_status` are not given, they are
+    looked up.
     """
     if user_is_whitelisted is None:
         user_is_whitelisted = CertificateWhitelist.objects.filter(
@@ -543,7 +601,8 @@ def certificate_info_for_user(user, course_id, grade, user_is_whitelisted=None):
     eligible_for_certificate = 'Y' if (user_is_whitelisted or grade is not None) and user.profile.allow_certificate \
         else 'N'
 
-    certificate_status = certificate_status_for_student(user, course_id)
+    if certificate_status is None:
+        certificate_status = certificate_status_for_student(user, course_id)
     certificate_generated = certificate_status['status'] == CertificateStatuses.downloadable
     if certificate_generated:
         certificate_is_delivered = 'Y'
@@ -19,6 +19,8 @@ from certificates.models import (
     GeneratedCertificate,
     CertificateStatuses,
     CertificateGenerationHistory,
+    certificate_status_for_student,
+    certificate_statuses_for_courses,
 )
 from certificates.tests.factories import (
     CertificateInvalidationFactory,
@@ -240,6 +242,49 @@ class EligibleCertificateManagerTest(SharedModuleStoreTestCase):
         )
 
 
+@attr('shard_1')
+class CertificateStatusesForCoursesTest(TestCase):
+    """
+    Test looking up a user's certificates in many courses at once.
+    """
+    def setUp(self):
+        super(CertificateStatusesForCoursesTest, self).setUp()
+        self.user = UserFactory()
+        self.course_ids = [CourseLocator('edX', 'Course{}'.format(index), 'Run') for index in range(3)]
+        GeneratedCertificateFactory.create(
+            status=CertificateStatuses.downloadable,
+            user=self.user,
+            course_id=self.course_ids[0],
+            download_url='http://www.example.com/cert.pdf',
+        )
+        GeneratedCertificateFactory.create(
+            status=CertificateStatuses.notpassing,
+            user=self.user,
+            course_id=self.course_ids[1],
+        )
+        # Another user's certificate.
+        GeneratedCertificateFactory.create(
+            status=CertificateStatuses.downloadable,
+            user=UserFactory(),
+            course_id=self.course_ids[2],
+        )
+
+    def test_certificate_statuses_for_courses(self):
+        with self.assertNumQueries(1):
+            statuses = certificate_statuses_for_courses(self.user, self.course_ids)
+
+        self.assertEqual(statuses, {
+            course_id: certificate_status_for_student(self.user, course_id) for course_id in self.course_ids
+        })
+        self.assertEqual(statuses[self.course_ids[2]]['status'], CertificateStatuses.unavailable)
+
+    def test_course_ids_with_certs_for_user(self):
+        with self.assertNumQueries(1):
+            course_ids = GeneratedCertificate.course_ids_with_certs_for_user(self.user)
+
+        self.assertEqual(course_ids, set(self.course_ids[:2]))
+
+
 @attr('shard_1')
 @ddt.ddt
 class TestCertificateGenerationHistory(TestCase):
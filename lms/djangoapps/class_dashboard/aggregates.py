@@ -0,0 +1,79 @@
+"""
+Maintains the aggregates in `class_dashboard.models` that the instructor
+dashboard's Metrics tab reads in place of querying the StudentModule table.
+
+The first update of a course builds all of its aggregates.  Later updates only
+recompute the aggregates of blocks whose StudentModule rows were modified (or
+deleted) since the previous update, so they can be run frequently.
+"""
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from pytz import UTC
+
+from courseware.models import StudentModule
+from .models import (
+    AGGREGATED_MODULE_TYPES,
+    DashboardAggregatesStatus,
+    ProblemGradeAggregate,
+    SequentialOpenAggregate,
+    StaleAggregateBlock,
+)
+
+# StudentModule rows modified this long before the previous update are
+# examined again, so that rows committed by long-running transactions are not
+# missed.  Recomputing a block's aggregates more than once is harmless.
+UPDATE_OVERLAP = timedelta(minutes=10)
+
+
+def update_course_aggregates(course_id, rebuild=False):
+    """
+    Bring the aggregates of `course_id` up to date with its StudentModule rows.
+
+    All of the course's aggregates are computed if they have not been built
+    yet, or if `rebuild` is True.
+    """
+    updated_through = datetime.now(UTC)
+    status = DashboardAggregatesStatus.objects.filter(course_id=course_id).first()
+    student_modules = _student_modules_read_only()
+    stale_blocks = list(
+        StaleAggregateBlock.objects.filter(course_id=course_id).values_list('id', 'module_state_key', 'module_type')
+    )
+
+    if status is None or rebuild:
+        problem_keys = sequential_keys = None
+    else:
+        changed_blocks = student_modules.filter(
+            course_id=course_id,
+            modified__gt=status.updated_through - UPDATE_OVERLAP,
+            module_type__in=AGGREGATED_MODULE_TYPES,
+        ).values_list('module_state_key', 'module_type').distinct()
+        usage_keys_by_type = {module_type: set() for module_type in AGGREGATED_MODULE_TYPES}
+        for module_state_key, module_type in list(changed_blocks) + [block[1:] for block in stale_blocks]:
+            usage_keys_by_type[module_type].add(course_id.make_usage_key_from_deprecated_string(module_state_key))
+        problem_keys = usage_keys_by_type['problem']
+        sequential_keys = usage_keys_by_type['sequential']
+
+    with transaction.atomic():
+        ProblemGradeAggregate.rebuild(course_id, student_modules, problem_keys)
+        SequentialOpenAggregate.rebuild(course_id, student_modules, sequential_keys)
+        StaleAggregateBlock.objects.filter(id__in=[block[0] for block in stale_blocks]).delete()
+        DashboardAggregatesStatus.set_updated_through(course_id, updated_through)
+
+
+def courses_with_aggregates():
+    """
+    Returns the keys of the courses whose aggregates have been built.
+    """
+    return [status.course_id for status in DashboardAggregatesStatus.objects.all()]
+
+
+def _student_modules_read_only():
+    """
+    Returns the StudentModule queryset to aggregate, using a read replica if
+    one exists for this environment.
+    """
+    if "read_replica" in settings.DATABASES:
+        return StudentModule.objects.using("read_replica")
+    return StudentModule.objects.all()
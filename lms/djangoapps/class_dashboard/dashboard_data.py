@@ -5,7 +5,7 @@ from util.json_request import JsonResponse
 import json
 
 from courseware import models
-from django.db.models import Count
+from django.db.models import Count, Sum
 from django.utils.translation import ugettext as _
 
 from xmodule.modulestore.django import modulestore
@@ -32,12 +32,8 @@ def get_problem_grade_distribution(course_id):
         attempting the problem
     """
 
-    # Aggregate query on studentmodule table for grade data for all problems in course
-    db_query = models.StudentModule.objects.filter(
-        course_id__exact=course_id,
-        grade__isnull=False,
-        module_type__exact="problem",
-    ).values('module_state_key', 'grade', 'max_grade').annotate(count_grade=Count('grade'))
+    # Aggregate query for grade data for all problems in course
+    db_query = _problem_grade_query(course_id)
 
     prob_grade_distrib = {}
     total_student_count = {}
@@ -75,11 +71,20 @@ def get_sequential_open_distrib(course_id):
     Outputs a dict mapping the 'module_id' to the number of students that have opened that subsection/sequential.
     """
 
-    # Aggregate query on studentmodule table for "opening a subsection" data
-    db_query = models.StudentModule.objects.filter(
-        course_id__exact=course_id,
-        module_type__exact="sequential",
-    ).values('module_state_key').annotate(count_sequential=Count('module_state_key'))
+    # The instructor dashboard imports this module even when the app isn't
+    # installed, so its models are only imported when they're used.
+    from class_dashboard.models import DashboardAggregatesStatus, SequentialOpenAggregate
+
+    # Aggregate query for "opening a subsection" data
+    if DashboardAggregatesStatus.is_available(course_id):
+        db_query = SequentialOpenAggregate.objects.filter(
+            course_id__exact=course_id,
+        ).values('module_state_key').annotate(count_sequential=Sum('count'))
+    else:
+        db_query = models.StudentModule.objects.filter(
+            course_id__exact=course_id,
+            module_type__exact="sequential",
+        ).values('module_state_key').annotate(count_sequential=Count('module_state_key'))
 
     # Build set of "opened" data for each subsection that has "opened" data
     sequential_open_distrib = {}
@@ -90,6 +95,33 @@ def get_sequential_open_distrib(course_id):
     return sequential_open_distrib
 
 
+def _problem_grade_query(course_id, problem_set=None):
+    """
+    Returns a query of the number of students (`count_grade`) with each
+    `grade` and `max_grade` on each problem (`module_state_key`) of the course,
+    or only on the problems in `problem_set` if it is given.
+
+    The counts are read from the course's ProblemGradeAggregates once they
+    have been built, and otherwise aggregated over the studentmodule table.
+    """
+    from class_dashboard.models import DashboardAggregatesStatus, ProblemGradeAggregate
+
+    if DashboardAggregatesStatus.is_available(course_id):
+        db_query = ProblemGradeAggregate.objects.filter(
+            course_id__exact=course_id,
+        ).values('module_state_key', 'grade', 'max_grade').annotate(count_grade=Sum('count'))
+    else:
+        db_query = models.StudentModule.objects.filter(
+            course_id__exact=course_id,
+            grade__isnull=False,
+            module_type__exact="problem",
+        ).values('module_state_key', 'grade', 'max_grade').annotate(count_grade=Count('grade'))
+
+    if problem_set is not None:
+        db_query = db_query.filter(module_state_key__in=problem_set)
+    return db_query
+
+
 def get_problem_set_grade_distrib(course_id, problem_set):
     """
     Returns the grade distribution for the problems specified in `problem_set`.
@@ -105,17 +137,8 @@ def get_problem_set_grade_distrib(course_id, problem_set):
       'grade_distrib' - array of tuples (`grade`,`count`) ordered by `grade`
     """
 
-    # Aggregate query on studentmodule table for grade data for set of problems in course
-    db_query = models.StudentModule.objects.filter(
-        course_id__exact=course_id,
-        grade__isnull=False,
-        module_type__exact="problem",
-        module_state_key__in=problem_set,
-    ).values(
-        'module_state_key',
-        'grade',
-        'max_grade',
-    ).annotate(count_grade=Count('grade')).order_by('module_state_key', 'grade')
+    # Aggregate query for grade data for set of problems in course
+    db_query = _problem_grade_query(course_id, problem_set).order_by('module_state_key', 'grade')
 
     prob_grade_distrib = {}
 
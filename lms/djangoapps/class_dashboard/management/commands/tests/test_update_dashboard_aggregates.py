@@ -0,0 +1,52 @@
+"""
+Tests for update_dashboard_aggregates management command.
+"""
+from datetime import datetime
+
+from django.core.management.base import CommandError
+from django.test import TestCase
+from mock import call, patch
+from opaque_keys.edx.keys import CourseKey
+from pytz import UTC
+
+from class_dashboard.models import DashboardAggregatesStatus
+from .. import update_dashboard_aggregates
+
+
+@patch('class_dashboard.management.commands.update_dashboard_aggregates.update_course_aggregates')
+class TestUpdateDashboardAggregates(TestCase):
+    """
+    Tests update dashboard aggregates management command.
+    """
+    def setUp(self):
+        super(TestUpdateDashboardAggregates, self).setUp()
+        self.course_key = CourseKey.from_string('course-v1:edX+Aggregates+2016')
+        self.command = update_dashboard_aggregates.Command()
+
+    def test_update_course(self, mock_update):
+        self.command.handle(unicode(self.course_key))
+        mock_update.assert_called_once_with(self.course_key, rebuild=False)
+
+    def test_rebuild_course(self, mock_update):
+        self.command.handle(unicode(self.course_key), rebuild=True)
+        mock_update.assert_called_once_with(self.course_key, rebuild=True)
+
+    def test_update_all(self, mock_update):
+        other_course_key = CourseKey.from_string('course-v1:edX+Other+2016')
+        for course_key in (self.course_key, other_course_key):
+            DashboardAggregatesStatus.objects.create(course_id=course_key, updated_through=datetime(2016, 1, 1, tzinfo=UTC))
+        self.command.handle(all=True)
+        self.assertItemsEqual(
+            mock_update.call_args_list,
+            [call(self.course_key, rebuild=False), call(other_course_key, rebuild=False)],
+        )
+
+    def test_no_course_specified(self, mock_update):
+        with self.assertRaisesRegexp(CommandError, 'At least one course or --all must be specified.'):
+            self.command.handle()
+        self.assertFalse(mock_update.called)
+
+    def test_invalid_course_key(self, mock_update):
+        with self.assertRaisesRegexp(CommandError, 'Invalid key specified.'):
+            self.command.handle('not/a/course/key/at/all')
+        self.assertFalse(mock_update.called)
@@ -0,0 +1,70 @@
+"""
+Command to update the instructor dashboard's Metrics aggregates.
+"""
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+from class_dashboard.aggregates import courses_with_aggregates, update_course_aggregates
+
+
+log = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Example usage:
+        $ ./manage.py lms update_dashboard_aggregates --all --settings=devstack
+        $ ./manage.py lms update_dashboard_aggregates 'edX/DemoX/Demo_Course' --settings=devstack
+
+    Naming a course builds its aggregates if it has none yet.  Run with --all
+    periodically (e.g. from cron) to keep the aggregates of those courses up
+    to date.
+    """
+    args = '<course_id course_id ...>'
+    help = 'Builds or updates the instructor dashboard Metrics aggregates for one or more courses.'
+
+    def add_arguments(self, parser):
+        """
+        Entry point for subclassed commands to add custom arguments.
+        """
+        parser.add_argument(
+            '--all',
+            help='Update the aggregates of all courses that have them.',
+            action='store_true',
+            default=False,
+        )
+        parser.add_argument(
+            '--rebuild',
+            help='Recompute all of the aggregates of the requested courses.',
+            action='store_true',
+            default=False,
+        )
+
+    def handle(self, *args, **options):
+
+        if options.get('all'):
+            course_keys = courses_with_aggregates()
+        else:
+            if len(args) < 1:
+                raise CommandError('At least one course or --all must be specified.')
+            try:
+                course_keys = [CourseKey.from_string(arg) for arg in args]
+            except InvalidKeyError:
+                raise CommandError('Invalid key specified.')
+
+        log.info('Updating dashboard aggregates for %d courses.', len(course_keys))
+
+        for course_key in course_keys:
+            try:
+                update_course_aggregates(course_key, rebuild=options.get('rebuild'))
+            except Exception as ex:  # pylint: disable=broad-except
+                log.exception(
+                    'An error occurred while updating dashboard aggregates for %s: %s',
+                    unicode(course_key),
+                    ex.message,
+                )
+
+        log.info('Finished updating dashboard aggregates.')
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import xmodule_django.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardAggregatesStatus',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('course_id', xmodule_django.models.CourseKeyField(unique=True, max_length=255)),
+                ('updated_through', models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ProblemGradeAggregate',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('course_id', xmodule_django.models.CourseKeyField(max_length=255, db_index=True)),
+                ('module_state_key', xmodule_django.models.UsageKeyField(max_length=255)),
+                ('grade', models.FloatField()),
+                ('max_grade', models.FloatField(null=True, blank=True)),
+                ('count', models.IntegerField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SequentialOpenAggregate',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('course_id', xmodule_django.models.CourseKeyField(max_length=255, db_index=True)),
+                ('module_state_key', xmodule_django.models.UsageKeyField(max_length=255)),
+                ('count', models.IntegerField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='StaleAggregateBlock',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('course_id', xmodule_django.models.CourseKeyField(max_length=255, db_index=True)),
+                ('module_state_key', xmodule_django.models.UsageKeyField(max_length=255)),
+                ('module_type', models.CharField(max_length=32)),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='sequentialopenaggregate',
+            unique_together=set([('course_id', 'module_state_key')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='problemgradeaggregate',
+            index_together=set([('course_id', 'module_state_key')]),
+        ),
+    ]
@@ -0,0 +1,170 @@
+"""
+Aggregates of StudentModule data displayed on the instructor dashboard's
+Metrics tab.
+
+Computing these over the StudentModule table on every dashboard load is too
+expensive for large courses, so they are kept in their own tables and brought
+up to date by `class_dashboard.aggregates.update_course_aggregates`.
+"""
+from django.db import models
+from django.db.models import Count
+import request_cache
+
+from xmodule_django.models import CourseKeyField, UsageKeyField
+
+
+# The number of aggregate rows inserted per query
+AGGREGATES_BATCH_SIZE = 1000
+
+# The StudentModule types that have aggregates
+AGGREGATED_MODULE_TYPES = ('problem', 'sequential')
+
+# The name of the request cache of whether the aggregates of each course are available
+AGGREGATES_AVAILABLE_CACHE_NAME = 'class_dashboard.aggregates_available'
+
+
+class ProblemGradeAggregate(models.Model):
+    """
+    The number of students that have a given grade (out of a given max grade)
+    on a problem.
+    """
+    course_id = CourseKeyField(max_length=255, db_index=True)
+    module_state_key = UsageKeyField(max_length=255)
+    grade = models.FloatField()
+    max_grade = models.FloatField(null=True, blank=True)
+    count = models.IntegerField()
+
+    class Meta(object):
+        app_label = "class_dashboard"
+        index_together = (('course_id', 'module_state_key'),)
+
+    @classmethod
+    def rebuild(cls, course_id, student_modules, usage_keys=None):
+        """
+        Recompute the aggregates of the given problem `usage_keys` in
+        `course_id` (or of all of its problems, if `usage_keys` is None) from
+        the `student_modules` queryset.
+        """
+        aggregates = cls.objects.filter(course_id=course_id)
+        rows = student_modules.filter(
+            course_id__exact=course_id,
+            grade__isnull=False,
+            module_type__exact="problem",
+        )
+        if usage_keys is not None:
+            if not usage_keys:
+                return
+            aggregates = aggregates.filter(module_state_key__in=usage_keys)
+            rows = rows.filter(module_state_key__in=usage_keys)
+
+        aggregates.delete()
+        cls.objects.bulk_create(
+            [
+                cls(
+                    course_id=course_id,
+                    module_state_key=course_id.make_usage_key_from_deprecated_string(row['module_state_key']),
+                    grade=row['grade'],
+                    max_grade=row['max_grade'],
+                    count=row['count_grade'],
+                )
+                for row in rows.values('module_state_key', 'grade', 'max_grade').annotate(count_grade=Count('grade'))
+            ],
+            batch_size=AGGREGATES_BATCH_SIZE,
+        )
+
+
+class SequentialOpenAggregate(models.Model):
+    """
+    The number of students that have opened a subsection/sequential.
+    """
+    course_id = CourseKeyField(max_length=255, db_index=True)
+    module_state_key = UsageKeyField(max_length=255)
+    count = models.IntegerField()
+
+    class Meta(object):
+        app_label = "class_dashboard"
+        unique_together = (('course_id', 'module_state_key'),)
+
+    @classmethod
+    def rebuild(cls, course_id, student_modules, usage_keys=None):
+        """
+        Recompute the aggregates of the given sequential `usage_keys` in
+        `course_id` (or of all of its sequentials, if `usage_keys` is None)
+        from the `student_modules` queryset.
+        """
+        aggregates = cls.objects.filter(course_id=course_id)
+        rows = student_modules.filter(
+            course_id__exact=course_id,
+            module_type__exact="sequential",
+        )
+        if usage_keys is not None:
+            if not usage_keys:
+                return
+            aggregates = aggregates.filter(module_state_key__in=usage_keys)
+            rows = rows.filter(module_state_key__in=usage_keys)
+
+        aggregates.delete()
+        cls.objects.bulk_create(
+            [
+                cls(
+                    course_id=course_id,
+                    module_state_key=course_id.make_usage_key_from_deprecated_string(row['module_state_key']),
+                    count=row['count_sequential'],
+                )
+                for row in rows.values('module_state_key').annotate(count_sequential=Count('module_state_key'))
+            ],
+            batch_size=AGGREGATES_BATCH_SIZE,
+        )
+
+
+class DashboardAggregatesStatus(models.Model):
+    """
+    Records that the aggregates of a course have been built, and the time up
+    to which they account for StudentModule changes.
+
+    The dashboard only reads the aggregates of courses that have a status.
+    """
+    course_id = CourseKeyField(max_length=255, unique=True)
+    updated_through = models.DateTimeField()
+
+    class Meta(object):
+        app_label = "class_dashboard"
+
+    def __unicode__(self):
+        return u"[DashboardAggregatesStatus] {}: {}".format(self.course_id, self.updated_through)
+
+    @classmethod
+    def is_available(cls, course_id):
+        """
+        Returns whether the aggregates of `course_id` have been built.
+
+        The result is kept in the request cache, since it is checked for
+        every StudentModule deleted, e.g. when a course's state is reset.
+        """
+        available_cache = request_cache.get_cache(AGGREGATES_AVAILABLE_CACHE_NAME)
+        if course_id not in available_cache:
+            available_cache[course_id] = cls.objects.filter(course_id=course_id).exists()
+        return available_cache[course_id]
+
+    @classmethod
+    def set_updated_through(cls, course_id, updated_through):
+        """
+        Records that the aggregates of `course_id` are up to date with the
+        StudentModule rows modified until `updated_through`.
+        """
+        cls.objects.update_or_create(course_id=course_id, defaults={'updated_through': updated_through})
+        request_cache.get_cache(AGGREGATES_AVAILABLE_CACHE_NAME)[course_id] = True
+
+
+class StaleAggregateBlock(models.Model):
+    """
+    A block whose StudentModule rows were deleted, and whose aggregates must
+    therefore be recomputed even though none of its remaining rows changed.
+    These are recorded by `class_dashboard.signals`.
+    """
+    course_id = CourseKeyField(max_length=255, db_index=True)
+    module_state_key = UsageKeyField(max_length=255)
+    module_type = models.CharField(max_length=32)
+
+    class Meta(object):
+        app_label = "class_dashboard"
@@ -0,0 +1,22 @@
+"""
+Signal handlers that keep the aggregates in `class_dashboard.models` up to date.
+"""
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from courseware.models import StudentModule
+from .models import AGGREGATED_MODULE_TYPES, DashboardAggregatesStatus, StaleAggregateBlock
+
+
+@receiver(post_delete, sender=StudentModule)
+def mark_deleted_student_module_stale(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Deleting a StudentModule row leaves no `modified` time behind, so record
+    its block for the next update of its course's aggregates.
+    """
+    if instance.module_type in AGGREGATED_MODULE_TYPES and DashboardAggregatesStatus.is_available(instance.course_id):
+        StaleAggregateBlock.objects.create(
+            course_id=instance.course_id,
+            module_state_key=instance.module_state_key,
+            module_type=instance.module_type,
+        )
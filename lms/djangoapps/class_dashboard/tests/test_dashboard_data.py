@@ -6,15 +6,20 @@ import json
 
 from django.core.urlresolvers import reverse
 from django.test.client import RequestFactory
+from django.utils import timezone
 from mock import patch
 from nose.plugins.attrib import attr
 
 from capa.tests.response_xml_factory import StringResponseXMLFactory
+from courseware.models import StudentModule
 from courseware.tests.factories import StudentModuleFactory
+from request_cache.middleware import RequestCache
 from student.tests.factories import UserFactory, CourseEnrollmentFactory, AdminFactory
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 
+from class_dashboard.aggregates import update_course_aggregates
+from class_dashboard.models import DashboardAggregatesStatus, StaleAggregateBlock
 from class_dashboard.dashboard_data import (
     get_problem_grade_distribution, get_sequential_open_distrib,
     get_problem_set_grade_distrib, get_d3_problem_grade_distrib,
@@ -133,6 +138,63 @@ class TestGetProblemGradeDistribution(SharedModuleStoreTestCase):
                 sum_attempts += item[1]
             self.assertEquals(USER_COUNT, sum_attempts)
 
+    def _get_distributions(self):
+        """
+        Returns the problem grade, sequential open and problem set grade
+        distributions of the course, with grades in a consistent order.
+        """
+        prob_grade_distrib, total_student_count = get_problem_grade_distribution(self.course.id)
+        for problem_info in prob_grade_distrib.values():
+            problem_info['grade_distrib'].sort()
+        return (
+            prob_grade_distrib,
+            total_student_count,
+            get_sequential_open_distrib(self.course.id),
+            get_problem_set_grade_distrib(self.course.id, [item.location for item in self.items]),
+        )
+
+    def test_distributions_read_from_aggregates(self):
+        distributions = self._get_distributions()
+        update_course_aggregates(self.course.id)
+
+        # The aggregates keep the counts of rows that have since been deleted,
+        # until they are updated.
+        StudentModule.objects.filter(course_id=self.course.id, module_state_key=self.item.location).delete()
+        self.assertEqual(self._get_distributions(), distributions)
+
+        update_course_aggregates(self.course.id)
+        prob_grade_distrib, total_student_count, sequential_open_distrib, __ = self._get_distributions()
+        self.assertNotIn(self.item.location, prob_grade_distrib)
+        self.assertNotIn(self.item.location, total_student_count)
+        self.assertNotIn(self.item.location, sequential_open_distrib)
+        self.assertEqual(len(prob_grade_distrib), len(self.items) - 1)
+
+    def test_deleted_rows_check_aggregates_available_once(self):
+        update_course_aggregates(self.course.id)
+        RequestCache.clear_request_cache()
+        deleted_rows = StudentModule.objects.filter(course_id=self.course.id, module_state_key=self.item.location)
+        deleted_count = deleted_rows.count()
+
+        with patch.object(
+            DashboardAggregatesStatus.objects, 'filter', wraps=DashboardAggregatesStatus.objects.filter,
+        ) as mock_filter:
+            deleted_rows.delete()
+        mock_filter.assert_called_once_with(course_id=self.course.id)
+        self.assertEqual(StaleAggregateBlock.objects.filter(course_id=self.course.id).count(), deleted_count)
+
+    def test_aggregates_updated_with_modified_rows(self):
+        update_course_aggregates(self.course.id)
+        StudentModule.objects.filter(
+            course_id=self.course.id, module_type='problem', module_state_key=self.item.location,
+        ).update(grade=0.5, max_grade=1, modified=timezone.now())
+        update_course_aggregates(self.course.id)
+
+        probset_grade_distrib = get_problem_set_grade_distrib(self.course.id, [self.item.location])
+        self.assertEqual(
+            probset_grade_distrib[self.item.location],
+            {'max_grade': 1, 'grade_distrib': [(0.5, USER_COUNT)]},
+        )
+
     def test_get_d3_problem_grade_distrib(self):
 
         d3_data = get_d3_problem_grade_distrib(self.course.id)
@@ -27,6 +27,15 @@ class BlockCountsTransformer(BlockStructureTransformer):
         # collect basic xblock fields
         block_structure.request_xblock_fields('category')
 
+    @classmethod
+    def collect_incremental(cls, block_structure, changed_usage_keys):
+        """
+        Only xBlock fields are collected, so they only need to be
+        requested again for the reloaded blocks.
+        """
+        cls.collect(block_structure)
+        return True
+
     def transform(self, usage_info, block_structure):
         """
         Mutates block_structure based on the given usage_info.
@@ -19,6 +19,13 @@ class BlockDepthTransformer(BlockStructureTransformer):
     def name(cls):
         return "blocks_api:block_depth"
 
+    @classmethod
+    def collect_incremental(cls, block_structure, changed_usage_keys):
+        """
+        Nothing is collected, as block depths are computed in transform.
+        """
+        return True
+
     @classmethod
     def get_block_depth(cls, block_structure, block_key):
         """
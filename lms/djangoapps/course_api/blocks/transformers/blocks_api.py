@@ -53,6 +53,23 @@ class BlocksAPITransformer(BlockStructureTransformer):
 
         # TODO support olx_data by calling export_to_xml(?)
 
+    @classmethod
+    def collect_incremental(cls, block_structure, changed_usage_keys):
+        """
+        Updates the collected data of the containing transformers for
+        the reloaded subtrees.
+        """
+        block_structure.request_xblock_fields('graded', 'format', 'display_name', 'category')
+        return all(
+            transformer.collect_incremental(block_structure, changed_usage_keys)
+            for transformer in (
+                StudentViewTransformer,
+                BlockCountsTransformer,
+                BlockDepthTransformer,
+                BlockNavigationTransformer,
+            )
+        )
+
     def transform(self, usage_info, block_structure):
         """
         Mutates block_structure based on the given usage_info.
@@ -33,6 +33,15 @@ class ProctoredExamTransformer(FilteringTransformerMixin, BlockStructureTransfor
         block_structure.request_xblock_fields('is_proctored_enabled')
         block_structure.request_xblock_fields('is_practice_exam')
 
+    @classmethod
+    def collect_incremental(cls, block_structure, changed_usage_keys):
+        """
+        Only xBlock fields are collected, so they only need to be
+        requested again for the reloaded blocks.
+        """
+        cls.collect(block_structure)
+        return True
+
     def transform_block_filters(self, usage_info, block_structure):
         if not settings.FEATURES.get('ENABLE_PROCTORED_EXAMS', False):
             return [block_structure.create_universal_filter()]
@@ -26,8 +26,28 @@ class StudentViewTransformer(BlockStructureTransformer):
         """
         # collect basic xblock fields
         block_structure.request_xblock_fields('category')
+        cls._collect_student_view_values(block_structure, block_structure.topological_traversal())
 
-        for block_key in block_structure.topological_traversal():
+    @classmethod
+    def collect_incremental(cls, block_structure, changed_usage_keys):
+        """
+        The collected values of a block only depend on the block itself,
+        so they are recollected for the blocks in the reloaded subtrees.
+        """
+        block_structure.request_xblock_fields('category')
+        for usage_key in changed_usage_keys:
+            cls._collect_student_view_values(
+                block_structure, block_structure.topological_traversal(start_node=usage_key)
+            )
+        return True
+
+    @classmethod
+    def _collect_student_view_values(cls, block_structure, block_keys):
+        """
+        Collects the student_view_multi_device and student_view_data
+        values for each of the given block_keys.
+        """
+        for block_key in block_keys:
             block = block_structure.get_xblock(block_key)
 
             # We're iterating through descriptors (not bound to a user) that are
@@ -36,28 +36,65 @@ class ContentLibraryTransformer(FilteringTransformerMixin, BlockStructureTransfo
         block_structure.request_xblock_fields('mode')
         block_structure.request_xblock_fields('max_count')
         block_structure.request_xblock_fields('category')
-        store = modulestore()
-
-        # needed for analytics purposes
-        def summarize_block(usage_key):
-            """ Basic information about the given block """
-            orig_key, orig_version = store.get_block_original_usage(usage_key)
-            return {
-                "usage_key": unicode(usage_key),
-                "original_usage_key": unicode(orig_key) if orig_key else None,
-                "original_usage_version": unicode(orig_version) if orig_version else None,
-            }
 
         # For each block check if block is library_content.
         # If library_content add children array to content_library_children field
-        for block_key in block_structure.topological_traversal(
-                filter_func=lambda block_key: block_key.block_type == 'library_content',
-                yield_descendants_of_unyielded=True,
-        ):
+        for block_key in cls._traverse_library_content(block_structure):
             xblock = block_structure.get_xblock(block_key)
-            for child_key in xblock.children:
-                summary = summarize_block(child_key)
-                block_structure.set_transformer_block_field(child_key, cls, 'block_analytics_summary', summary)
+            cls._collect_analytics_summaries(block_structure, xblock.children)
+
+    @classmethod
+    def collect_incremental(cls, block_structure, changed_usage_keys):
+        """
+        Recollects the analytics summaries of the library_content children
+        within the reloaded subtrees, including the roots of the subtrees
+        that are themselves children of an unchanged library_content
+        module.
+        """
+        block_structure.request_xblock_fields('mode')
+        block_structure.request_xblock_fields('max_count')
+        block_structure.request_xblock_fields('category')
+
+        cls._collect_analytics_summaries(block_structure, [
+            usage_key for usage_key in changed_usage_keys
+            if any(
+                parent_key.block_type == 'library_content'
+                for parent_key in block_structure.get_parents(usage_key)
+            )
+        ])
+        for usage_key in changed_usage_keys:
+            for block_key in cls._traverse_library_content(block_structure, start_node=usage_key):
+                xblock = block_structure.get_xblock(block_key)
+                cls._collect_analytics_summaries(block_structure, xblock.children)
+        return True
+
+    @staticmethod
+    def _traverse_library_content(block_structure, start_node=None):
+        """
+        Yields the usage keys of the library_content modules within the
+        block structure, or within the subtree of start_node.
+        """
+        return block_structure.topological_traversal(
+            filter_func=lambda block_key: block_key.block_type == 'library_content',
+            yield_descendants_of_unyielded=True,
+            start_node=start_node,
+        )
+
+    @classmethod
+    def _collect_analytics_summaries(cls, block_structure, child_keys):
+        """
+        Stores basic information about each of the given blocks, needed
+        for analytics purposes.
+        """
+        store = modulestore()
+        for child_key in child_keys:
+            orig_key, orig_version = store.get_block_original_usage(child_key)
+            summary = {
+                "usage_key": unicode(child_key),
+                "original_usage_key": unicode(orig_key) if orig_key else None,
+                "original_usage_version": unicode(orig_version) if orig_version else None,
+            }
+            block_structure.set_transformer_block_field(child_key, cls, 'block_analytics_summary', summary)
 
     def transform_block_filters(self, usage_info, block_structure):
         all_library_children = set()
@@ -38,11 +38,58 @@ class SplitTestTransformer(FilteringTransformerMixin, BlockStructureTransformer)
 
         root_block = block_structure.get_xblock(block_structure.root_block_usage_key)
         user_partitions = getattr(root_block, 'user_partitions', [])
+        cls._set_children_group_access(block_structure, user_partitions, cls._traverse_split_tests(block_structure))
 
-        for block_key in block_structure.topological_traversal(
-                filter_func=lambda block_key: block_key.block_type == 'split_test',
-                yield_descendants_of_unyielded=True,
+    @classmethod
+    def collect_incremental(cls, block_structure, changed_usage_keys):
+        """
+        Sets the group access of the children of the split_test modules
+        within the reloaded subtrees.  The children of an unchanged
+        split_test module are not reloaded with it, so their group access
+        can't be set incrementally.
+        """
+        from .user_partitions import UserPartitionTransformer
+
+        if any(
+                parent_key.block_type == 'split_test'
+                for usage_key in changed_usage_keys
+                for parent_key in block_structure.get_parents(usage_key)
         ):
+            return False
+
+        # The course's user partitions were stored by the
+        # UserPartitionTransformer when the block structure was collected.
+        user_partitions = block_structure.get_transformer_data(UserPartitionTransformer, 'user_partitions') or []
+        cls._set_children_group_access(
+            block_structure,
+            user_partitions,
+            (
+                block_key
+                for usage_key in changed_usage_keys
+                for block_key in cls._traverse_split_tests(block_structure, start_node=usage_key)
+            ),
+        )
+        return True
+
+    @staticmethod
+    def _traverse_split_tests(block_structure, start_node=None):
+        """
+        Yields the usage keys of the split_test modules within the block
+        structure, or within the subtree of start_node.
+        """
+        return block_structure.topological_traversal(
+            filter_func=lambda block_key: block_key.block_type == 'split_test',
+            yield_descendants_of_unyielded=True,
+            start_node=start_node,
+        )
+
+    @staticmethod
+    def _set_children_group_access(block_structure, user_partitions, split_test_keys):
+        """
+        Sets the group_access field of the children of each of the given
+        split_test modules per the split_test module's group_id_to_child.
+        """
+        for block_key in split_test_keys:
             xblock = block_structure.get_xblock(block_key)
             partition_for_this_block = next(
                 (
@@ -52,8 +52,27 @@ class StartDateTransformer(FilteringTransformerMixin, BlockStructureTransformer)
         transformer's transform method.
         """
         block_structure.request_xblock_fields('days_early_for_beta')
+        cls._collect_merged_values(block_structure, block_structure.topological_traversal())
 
-        for block_key in block_structure.topological_traversal():
+    @classmethod
+    def collect_incremental(cls, block_structure, changed_usage_keys):
+        """
+        Recomputes the merged start dates for the reloaded subtrees,
+        using the previously merged start dates of their (unchanged)
+        parents.
+        """
+        block_structure.request_xblock_fields('days_early_for_beta')
+        for usage_key in changed_usage_keys:
+            cls._collect_merged_values(block_structure, block_structure.topological_traversal(start_node=usage_key))
+        return True
+
+    @classmethod
+    def _collect_merged_values(cls, block_structure, block_keys):
+        """
+        Computes and stores the merged start date for each of the given
+        block_keys, in topological order.
+        """
+        for block_key in block_keys:
 
             # compute merged value of start date from all parents
             parents = block_structure.get_parents(block_key)
@@ -50,11 +50,41 @@ class UserPartitionTransformer(FilteringTransformerMixin, BlockStructureTransfor
         if not user_partitions:
             return
 
+        cls._collect_merged_group_access(block_structure, user_partitions, block_structure.topological_traversal())
+
+    @classmethod
+    def collect_incremental(cls, block_structure, changed_usage_keys):
+        """
+        Recomputes the merged group access for the reloaded subtrees,
+        using the previously merged group access of their (unchanged)
+        parents.  The course-wide user partitions stored on the root block
+        are unchanged, since edits to the root block are never collected
+        incrementally.
+        """
+        if not SplitTestTransformer.collect_incremental(block_structure, changed_usage_keys):
+            return False
+
+        user_partitions = block_structure.get_transformer_data(cls, 'user_partitions')
+        if not user_partitions:
+            return True
+
+        for usage_key in changed_usage_keys:
+            cls._collect_merged_group_access(
+                block_structure, user_partitions, block_structure.topological_traversal(start_node=usage_key)
+            )
+        return True
+
+    @classmethod
+    def _collect_merged_group_access(cls, block_structure, user_partitions, block_keys):
+        """
+        Computes and stores the merged group access for each of the given
+        block_keys.
+        """
         # For each block, compute merged group access. Because this is a
         # topological sort, we know a block's parents are guaranteed to
         # already have merged group access computed before the block
         # itself.
-        for block_key in block_structure.topological_traversal():
+        for block_key in block_keys:
             xblock = block_structure.get_xblock(block_key)
             parent_keys = block_structure.get_parents(block_key)
             merged_parent_access_list = [
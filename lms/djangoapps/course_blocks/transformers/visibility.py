@@ -46,7 +46,25 @@ class VisibilityTransformer(FilteringTransformerMixin, BlockStructureTransformer
         Collects any information that's necessary to execute this
         transformer's transform method.
         """
-        for block_key in block_structure.topological_traversal():
+        cls._collect_merged_values(block_structure, block_structure.topological_traversal())
+
+    @classmethod
+    def collect_incremental(cls, block_structure, changed_usage_keys):
+        """
+        Recomputes the merged values for the reloaded subtrees, using
+        the previously merged values of their (unchanged) parents.
+        """
+        for usage_key in changed_usage_keys:
+            cls._collect_merged_values(block_structure, block_structure.topological_traversal(start_node=usage_key))
+        return True
+
+    @classmethod
+    def _collect_merged_values(cls, block_structure, block_keys):
+        """
+        Computes and stores the merged value of visible_to_staff_only
+        for each of the given block_keys, in topological order.
+        """
+        for block_key in block_keys:
 
             # compute merged value of visible_to_staff_only from all parents
             parents = block_structure.get_parents(block_key)
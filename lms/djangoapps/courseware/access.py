@@ -14,9 +14,13 @@ from datetime import datetime
 import logging
 import pytz
 
+import crum
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.timezone import UTC
+import dogstats_wrapper as dog_stats_api
 
 from opaque_keys.edx.keys import CourseKey, UsageKey
 
@@ -36,7 +40,7 @@ from external_auth.models import ExternalAuthMap
 from courseware.masquerade import get_masquerade_role, is_masquerading_as_student
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from student import auth
-from student.models import CourseEnrollmentAllowed
+from student.models import CourseAccessRole, CourseEnrollmentAllowed
 from student.roles import (
     CourseBetaTesterRole,
     CourseCcxCoachRole,
@@ -66,9 +70,21 @@ from courseware.access_utils import (
 
 from lms.djangoapps.ccx.custom_exception import CCXLocatorValidationException
 from lms.djangoapps.ccx.models import CustomCourseForEdX
+import request_cache
 
 log = logging.getLogger(__name__)
 
+# Access decisions are memoized for the rest of the request in this request
+# cache, but only while handling requests that do not change any state.
+ACCESS_CACHE_NAME = 'courseware.access'
+ACCESS_CACHE_METHODS = ('GET', 'HEAD')
+ACCESS_CACHE_METRIC_NAME = 'lms.courseware.access_cache'
+ACCESS_CACHE_METRIC_SAMPLE_RATE = 0.1
+
+# Course actions that can be answered from the CourseOverview catalog
+# visibility index for users without course roles.
+CATALOG_VISIBILITY_INDEX_ACTIONS = ('see_exists', 'see_in_catalog', 'see_about_page')
+
 
 def has_ccx_coach_role(user, course_key):
     """
@@ -133,6 +149,15 @@ def has_access(user, action, obj, course_key=None):
     if not user:
         user = AnonymousUser()
 
+    obj_key = _access_cache_obj_key(obj)
+    cache_key = (action, obj_key, course_key) if obj_key is not None else None
+    return _memoize_access(user, cache_key, _has_access, user, action, obj, course_key)
+
+
+def _has_access(user, action, obj, course_key):
+    """
+    Computes has_access for the given user, action and object.
+    """
     if in_preview_mode():
         if not bool(has_staff_access_to_preview_mode(user=user, obj=obj, course_key=course_key)):
             return ACCESS_DENIED
@@ -173,6 +198,131 @@ def has_access(user, action, obj, course_key=None):
                     .format(type(obj)))
 
 
+def clear_access_cache():
+    """
+    Drops all access decisions memoized during the current request.
+
+    Call this after changing anything that access decisions depend on in the
+    middle of a request that only reads them.
+    """
+    request_cache.get_cache(ACCESS_CACHE_NAME).clear()
+
+
+@receiver(post_save, sender=CourseAccessRole)
+@receiver(post_delete, sender=CourseAccessRole)
+def _clear_access_cache_on_role_change(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Course role changes invalidate the memoized access decisions.
+    """
+    clear_access_cache()
+
+
+def _access_cache_obj_key(obj):
+    """
+    Returns the key under which access decisions on `obj` are memoized, or
+    None if they are not.
+    """
+    if isinstance(obj, (CourseDescriptor, CourseOverview)):
+        return obj.id
+    if isinstance(obj, XModule):
+        return obj.location
+    if isinstance(obj, XBlock):
+        return obj.scope_ids.usage_id
+    if isinstance(obj, (CourseKey, UsageKey, basestring)):
+        return obj
+    return None
+
+
+def _memoize_access(user, cache_key, check, *args):
+    """
+    Returns `check(*args)`, memoized under `cache_key` for `user` for the
+    rest of the current request.
+
+    Nothing is memoized when cache_key is None, for masquerading users,
+    outside of a request (e.g. in celery tasks), or while handling requests
+    that may write, so that decisions never outlive the state they were
+    made on.
+    """
+    request = crum.get_current_request()
+    if (
+            cache_key is None or
+            request is None or
+            request.method not in ACCESS_CACHE_METHODS or
+            getattr(user, 'masquerade_settings', None)
+    ):
+        return check(*args)
+
+    cache_key = (getattr(user, 'id', None),) + cache_key
+    access_cache = request_cache.get_cache(ACCESS_CACHE_NAME)
+    if cache_key in access_cache:
+        dog_stats_api.increment(
+            ACCESS_CACHE_METRIC_NAME, tags=[u'result:hit'], sample_rate=ACCESS_CACHE_METRIC_SAMPLE_RATE
+        )
+        return access_cache[cache_key]
+
+    dog_stats_api.increment(
+        ACCESS_CACHE_METRIC_NAME, tags=[u'result:miss'], sample_rate=ACCESS_CACHE_METRIC_SAMPLE_RATE
+    )
+    response = access_cache[cache_key] = check(*args)
+    return response
+
+
+def can_use_catalog_visibility_index(user, action):
+    """
+    Returns whether the given user's access for `action` on courses is the
+    same as any anonymous user's, apart from CourseEnrollmentAllowed entries,
+    so that it can be answered with is_course_visible_to_all.
+
+    Global staff, users with any course or org role (staff, instructors, beta
+    testers...), users with external auth maps when enrollment is restricted
+    by registration method, and preview mode all need per-course checks.
+    """
+    if action not in CATALOG_VISIBILITY_INDEX_ACTIONS or in_preview_mode():
+        return False
+
+    if user is None or not user.is_authenticated():
+        return True
+
+    if GlobalStaff().has_user(user) or CourseAccessRole.objects.filter(user=user).exists():
+        return False
+
+    if settings.FEATURES.get('RESTRICT_ENROLL_BY_REG_METHOD') and ExternalAuthMap.objects.filter(user=user).exists():
+        return False
+
+    return True
+
+
+def is_course_visible_to_all(entry, action, now):
+    """
+    Returns whether `action` is granted at time `now` on the course described
+    by `entry`, a CatalogVisibilityEntry, to a user without any course role.
+
+    This mirrors the see_exists, see_in_catalog and see_about_page checks of
+    _has_access_course.
+    """
+    if action == 'see_in_catalog':
+        return entry.catalog_visibility == CATALOG_VISIBILITY_CATALOG_AND_ABOUT
+
+    if action == 'see_about_page':
+        return entry.catalog_visibility in (CATALOG_VISIBILITY_CATALOG_AND_ABOUT, CATALOG_VISIBILITY_ABOUT)
+
+    if action == 'see_exists':
+        if not entry.visible_to_staff_only and (
+                settings.FEATURES['DISABLE_START_DATES'] or entry.start is None or now > entry.start
+        ):
+            return True
+
+        if entry.invitation_only:
+            return False
+        if settings.FEATURES.get('RESTRICT_ENROLL_BY_REG_METHOD') and entry.enrollment_domain:
+            return False
+        enrollment_start = entry.enrollment_start or datetime.min.replace(tzinfo=pytz.UTC)
+        enrollment_end = entry.enrollment_end or datetime.max.replace(tzinfo=pytz.UTC)
+        return enrollment_start < now < enrollment_end
+
+    raise ValueError(u"Unknown catalog visibility action: '{0}'".format(action))
+
+
 # ================ Implementation helpers ================================
 
 def has_staff_access_to_preview_mode(user, obj, course_key=None):
@@ -736,6 +886,14 @@ def _has_access_to_course(user, access_level, course_key):
 
     access_level = string, either "staff" or "instructor"
     """
+    cache_key = ('course_role', access_level, course_key)
+    return _memoize_access(user, cache_key, _compute_access_to_course, user, access_level, course_key)
+
+
+def _compute_access_to_course(user, access_level, course_key):
+    """
+    Computes _has_access_to_course.
+    """
     if user is None or (not user.is_authenticated()):
         debug("Deny: no user or anon user")
         return ACCESS_DENIED
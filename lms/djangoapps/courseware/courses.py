@@ -21,7 +21,11 @@ from xmodule.modulestore import ModuleStoreEnum
 from xmodule.x_module import STUDENT_VIEW
 from microsite_configuration import microsite
 
-from courseware.access import has_access
+from courseware.access import (
+    can_use_catalog_visibility_index,
+    has_access,
+    is_course_visible_to_all,
+)
 from courseware.date_summary import (
     CourseEndDate,
     CourseStartDate,
@@ -32,7 +36,7 @@ from courseware.date_summary import (
 from courseware.model_data import FieldDataCache
 from courseware.module_render import get_module
 from lms.djangoapps.courseware.courseware_access_exception import CoursewareAccessException
-from student.models import CourseEnrollment
+from student.models import CourseEnrollment, CourseEnrollmentAllowed
 import branding
 
 from opaque_keys.edx.keys import UsageKey
@@ -377,6 +381,10 @@ def get_courses(user, org=None, filter_=None):
     """
     Returns a list of courses available, sorted by course.number and optionally
     filtered by org code (case-insensitive).
+
+    For anonymous users and users without course roles, visibility is read
+    from the CourseOverview catalog visibility index instead of checking
+    access on every course.
     """
     courses = branding.get_visible_courses(org=org, filter_=filter_)
 
@@ -385,9 +393,30 @@ def get_courses(user, org=None, filter_=None):
         settings.COURSE_CATALOG_VISIBILITY_PERMISSION
     )
 
-    courses = [c for c in courses if has_access(user, permission_name, c)]
+    if not can_use_catalog_visibility_index(user, permission_name):
+        return [c for c in courses if has_access(user, permission_name, c)]
 
-    return courses
+    now = datetime.now(pytz.UTC)
+    visible_course_ids = set(
+        unicode(entry.id) for entry in CourseOverview.get_catalog_visibility_index()
+        if is_course_visible_to_all(entry, permission_name, now)
+    )
+
+    # An enrollment allowance lets the user enroll in (and so see) a course
+    # that is otherwise hidden, so those courses are checked one by one.
+    allowed_course_ids = set()
+    if permission_name == 'see_exists' and user is not None and user.is_authenticated():
+        allowed_course_ids = set(
+            unicode(allowed.course_id)
+            for allowed in CourseEnrollmentAllowed.objects.filter(email=user.email).only('course_id')
+        )
+
+    return [
+        c for c in courses
+        if unicode(c.id) in visible_course_ids or (
+            unicode(c.id) in allowed_course_ids and has_access(user, permission_name, c)
+        )
+    ]
 
 
 def get_permission_for_course_about():
@@ -18,6 +18,7 @@ from abc import ABCMeta, abstractmethod
 from contextlib import contextmanager
 import threading
 
+import crum
 from django.conf import settings
 from xblock.field_data import FieldData
 
@@ -28,6 +29,7 @@ from xmodule.modulestore.inheritance import InheritanceMixin
 NOTSET = object()
 ENABLED_OVERRIDE_PROVIDERS_KEY = u'courseware.field_overrides.enabled_providers.{course_id}'
 ENABLED_MODULESTORE_OVERRIDE_PROVIDERS_KEY = u'courseware.modulestore_field_overrides.enabled_providers.{course_id}'
+OVERRIDE_SNAPSHOT_CACHE_NAME = u'courseware.field_overrides.snapshots'
 
 
 def resolve_dotted(name):
@@ -90,6 +92,15 @@ def overrides_disabled():
     return bool(_OVERRIDES_DISABLED.disabled)
 
 
+def clear_override_snapshots():
+    """
+    Forgets every override lookup memoized by `OverrideFieldData` during the
+    current request.  The APIs that write override values call this so that
+    later reads in the same request see the new values.
+    """
+    RequestCache.get_request_cache(OVERRIDE_SNAPSHOT_CACHE_NAME).clear()
+
+
 class FieldOverrideProvider(object):
     """
     Abstract class which defines the interface that a `FieldOverrideProvider`
@@ -198,17 +209,45 @@ class OverrideFieldData(FieldData):
     def __init__(self, user, fallback, providers):
         self.fallback = fallback
         self.providers = tuple(provider(user) for provider in providers)
+        self._snapshot_key = (getattr(user, 'id', None), tuple(providers))
+
+    def _get_snapshot(self):
+        """
+        Returns the request scoped set of (usage id, field name) pairs known
+        to have no override for this user and these providers, or None if
+        lookups should not be memoized.
+
+        Each wrapped block walks its whole lineage when resolving inheritable
+        fields, so the same (block, field) pairs are asked about over and over
+        again while rendering a course.  Only misses are remembered: values
+        are always fetched from the providers, so mutable values are never
+        shared between blocks.
+        """
+        if crum.get_current_request() is None:
+            return None
+        snapshots = RequestCache.get_request_cache(OVERRIDE_SNAPSHOT_CACHE_NAME)
+        return snapshots.setdefault(self._snapshot_key, set())
 
     def get_override(self, block, name):
         """
         Checks for an override for the field identified by `name` in `block`.
         Returns the overridden value or `NOTSET` if no override is found.
         """
-        if not overrides_disabled():
-            for provider in self.providers:
-                value = provider.get(block, name, NOTSET)
-                if value is not NOTSET:
-                    return value
+        if overrides_disabled():
+            return NOTSET
+
+        usage_id = getattr(getattr(block, 'scope_ids', None), 'usage_id', None)
+        snapshot = self._get_snapshot() if usage_id is not None else None
+        if snapshot is not None and (usage_id, name) in snapshot:
+            return NOTSET
+
+        for provider in self.providers:
+            value = provider.get(block, name, NOTSET)
+            if value is not NOTSET:
+                return value
+
+        if snapshot is not None:
+            snapshot.add((usage_id, name))
         return NOTSET
 
     def get(self, block, name):
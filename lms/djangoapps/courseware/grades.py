@@ -1,40 +1,63 @@
 # Compute grades using real division, with no integer truncation
 from __future__ import division
 
+import hashlib
 import json
 import logging
 import random
+import re
 from collections import defaultdict
+from datetime import datetime, timedelta
+from multiprocessing.pool import ThreadPool
 
 import dogstats_wrapper as dog_stats_api
 from course_blocks.api import get_course_blocks
+from course_blocks.transformers.start_date import StartDateTransformer
 from courseware import courses
+from courseware.access import has_access
 from django.conf import settings
 from django.core.cache import cache
+from django.db import IntegrityError, connections, transaction
+from django.db.models import Max, Min
 from django.test.client import RequestFactory
 from opaque_keys import InvalidKeyError
-from opaque_keys.edx.keys import CourseKey
+from opaque_keys.edx.keys import CourseKey, UsageKey
 from opaque_keys.edx.locator import BlockUsageLocator
 from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
 from openedx.core.lib.cache_utils import memoized
 from openedx.core.lib.gating import api as gating_api
+from pytz import UTC
 from courseware.model_data import FieldDataCache, ScoresClient
 from openedx.core.djangoapps.signals.signals import GRADES_UPDATED
 from student.models import anonymous_id_for_user
+from student.roles import CourseBetaTesterRole, RoleCache
 from util.db import outer_atomic
+from util.query import chunks
 from util.module_utils import yield_dynamic_descriptor_descendants
 from xblock.core import XBlock
 from xmodule import graders, block_metadata_utils
 from xmodule.graders import Score
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import ItemNotFoundError
-from .models import StudentModule
+from .models import PersistentCourseGrade, StudentModule
 from .module_render import get_module_for_descriptor
 from .transformers.grades import GradesTransformer
 
 
 log = logging.getLogger("edx.courseware")
 
+# The number of students whose scores are fetched together by iterate_grades_for
+GRADING_STUDENTS_CHUNK_SIZE = 100
+
+# The size of the StudentModule id ranges counted together by answer_distributions
+ANSWER_DISTRIBUTION_CHUNK_SIZE = 10000
+
+# The answer under which answer_distributions counts answers beyond max_answers_per_part
+ANSWER_DISTRIBUTION_OTHER = u'[Other answers]'
+
+_STUDENT_ANSWERS_KEY_RE = re.compile(r'(?<!\\)"student_answers"\s*:\s*')
+_JSON_DECODER = json.JSONDecoder()
+
 
 class ProgressSummary(object):
     """
@@ -170,7 +193,9 @@ def grading_context(course_structure):
     }
 
 
-def answer_distributions(course_key):
+def answer_distributions(
+        course_key, workers=1, chunk_size=ANSWER_DISTRIBUTION_CHUNK_SIZE, max_answers_per_part=None
+):
     """
     Given a course_key, return answer distributions in the form of a dictionary
     mapping:
@@ -197,79 +222,225 @@ def answer_distributions(course_key):
     not be aware of problems that are not visible to the user being used to
     generate the report.
 
+    The StudentModule rows are partitioned into ranges of `chunk_size` ids,
+    which are counted by up to `workers` threads and merged as they finish.
+    If `max_answers_per_part` is given, only that many of the most frequent
+    answers to each problem part are kept, once all of the ranges have been
+    merged; the other answers are counted together under
+    ANSWER_DISTRIBUTION_OTHER.
+
     This method will try to use a read-replica database if one is available.
     """
-    # dict: { module.module_state_key : (url_name, display_name) }
-    state_keys_to_problem_info = {}  # For caching, used by url_and_display_name
+    submitted_problems = StudentModule.all_submitted_problems_read_only(course_key)
+    id_bounds = submitted_problems.aggregate(Min('id'), Max('id'))
+    if id_bounds['id__min'] is None:
+        return {}
+    id_ranges = [
+        (range_start, min(range_start + chunk_size, id_bounds['id__max'] + 1))
+        for range_start in xrange(id_bounds['id__min'], id_bounds['id__max'] + 1, chunk_size)
+    ]
 
-    def url_and_display_name(usage_key):
+    def count_id_range(id_range):
         """
-        For a given usage_key, return the problem's url and display_name.
-        Handle modulestore access and caching. This method ignores permissions.
-
-        Raises:
-            InvalidKeyError: if the usage_key does not parse
-            ItemNotFoundError: if there is no content that corresponds
-                to this usage_key.
+        Count the answers of the submitted problems whose ids are in `id_range`.
         """
-        problem_store = modulestore()
-        if usage_key not in state_keys_to_problem_info:
-            problem = problem_store.get_item(usage_key)
-            problem_info = (problem.url_name, problem.display_name_with_default_escaped)
-            state_keys_to_problem_info[usage_key] = problem_info
+        return _count_answers(course_key, submitted_problems, id_range)
 
-        return state_keys_to_problem_info[usage_key]
+    # dict: { (usage_key, problem_part_id): {answer: count} }
+    answer_counts = {}
+    if workers > 1 and len(id_ranges) > 1:
+        pool = ThreadPool(min(workers, len(id_ranges)))
+        try:
+            for partial_counts in pool.imap_unordered(_close_connections_after(count_id_range), id_ranges):
+                _merge_answer_counts(answer_counts, partial_counts)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        for id_range in id_ranges:
+            _merge_answer_counts(answer_counts, count_id_range(id_range))
+
+    problem_info = _answer_distribution_problem_info(
+        course_key, set(usage_key for usage_key, __ in answer_counts)
+    )
+    return {
+        problem_info[usage_key] + (problem_part_id,): _limit_answer_counts(counts, max_answers_per_part)
+        for (usage_key, problem_part_id), counts in answer_counts.iteritems()
+        if usage_key in problem_info
+    }
+
+
+def _count_answers(course_key, submitted_problems, id_range):
+    """
+    Return the answer counts of the `submitted_problems` rows whose ids fall in
+    the half-open `id_range`, as a dictionary mapping:
 
-    # Iterate through all problems submitted for this course in no particular
-    # order, and build up our answer_counts dict that we will eventually return
+      (problem usage_key, problem_id) -> {dict: answer -> count}
+    """
     answer_counts = defaultdict(lambda: defaultdict(int))
-    for module in StudentModule.all_submitted_problems_read_only(course_key):
+    rows = submitted_problems.filter(
+        id__gte=id_range[0], id__lt=id_range[1],
+    ).values_list('id', 'student_id', 'module_state_key', 'state')
+    for module_id, student_id, module_state_key, state in rows.iterator():
         try:
-            state_dict = json.loads(module.state) if module.state else {}
-            raw_answers = state_dict.get("student_answers", {})
+            raw_answers = _decode_student_answers(state)
         except ValueError:
             log.error(
                 u"Answer Distribution: Could not parse module state for StudentModule id=%s, course=%s",
-                module.id,
+                module_id,
                 course_key,
             )
             continue
 
+        if not raw_answers:
+            continue
+
         try:
-            url, display_name = url_and_display_name(module.module_state_key.map_into_course(course_key))
-            # Each problem part has an ID that is derived from the
-            # module.module_state_key (with some suffix appended)
-            for problem_part_id, raw_answer in raw_answers.items():
-                # Convert whatever raw answers we have (numbers, unicode, None, etc.)
-                # to be unicode values. Note that if we get a string, it's always
-                # unicode and not str -- state comes from the json decoder, and that
-                # always returns unicode for strings.
-                answer = unicode(raw_answer)
-                answer_counts[(url, display_name, problem_part_id)][answer] += 1
-
-        except (ItemNotFoundError, InvalidKeyError):
-            msg = (
-                "Answer Distribution: Item {} referenced in StudentModule {} " +
-                "for user {} in course {} not found; " +
-                "This can happen if a student answered a question that " +
-                "was later deleted from the course. This answer will be " +
-                "omitted from the answer distribution CSV."
-            ).format(
-                module.module_state_key, module.id, module.student_id, course_key
+            if not isinstance(module_state_key, UsageKey):
+                module_state_key = UsageKey.from_string(module_state_key)
+            usage_key = module_state_key.map_into_course(course_key)
+        except InvalidKeyError:
+            log.warning(
+                u"Answer Distribution: Invalid key %s referenced in StudentModule %s for user %s in course %s; "
+                u"this answer will be omitted from the answer distribution CSV.",
+                module_state_key, module_id, student_id, course_key,
             )
-            log.warning(msg)
             continue
 
+        # Each problem part has an ID that is derived from the
+        # module.module_state_key (with some suffix appended)
+        for problem_part_id, raw_answer in raw_answers.items():
+            # Convert whatever raw answers we have (numbers, unicode, None, etc.)
+            # to be unicode values. Note that if we get a string, it's always
+            # unicode and not str -- state comes from the json decoder, and that
+            # always returns unicode for strings.
+            answer = unicode(raw_answer)
+            answer_counts[(usage_key, problem_part_id)][answer] += 1
+
     return answer_counts
 
 
-def grade(student, course, keep_raw_scores=False, course_structure=None):
+def _decode_student_answers(state):
+    """
+    Return the "student_answers" dictionary stored in the JSON `state` of a
+    StudentModule.
+
+    Only the "student_answers" value is decoded; the rest of the state (which
+    also holds the correct map and input state) is skipped.  Raises ValueError
+    if the state is not valid JSON.
+    """
+    if not state:
+        return {}
+    match = _STUDENT_ANSWERS_KEY_RE.search(state)
+    if match is None:
+        # Decode the whole state so that invalid JSON is still reported.
+        raw_answers = json.loads(state).get("student_answers", {})
+    else:
+        raw_answers, __ = _JSON_DECODER.raw_decode(state, match.end())
+    return raw_answers if isinstance(raw_answers, dict) else {}
+
+
+def _merge_answer_counts(answer_counts, partial_counts):
+    """
+    Add the counts in `partial_counts` into `answer_counts`.
+    """
+    for part_key, partial_part_counts in partial_counts.iteritems():
+        part_counts = answer_counts.setdefault(part_key, {})
+        for answer, count in partial_part_counts.iteritems():
+            part_counts[answer] = part_counts.get(answer, 0) + count
+
+
+def _limit_answer_counts(part_counts, max_answers_per_part):
+    """
+    Return the counts of the `max_answers_per_part` most frequent answers in
+    `part_counts`, with the counts of the other answers added up under
+    ANSWER_DISTRIBUTION_OTHER.  Answers that are as frequent as each other
+    are kept in alphabetical order, so that the result is deterministic.
+    """
+    answers = [(answer, count) for answer, count in part_counts.iteritems() if answer != ANSWER_DISTRIBUTION_OTHER]
+    if not max_answers_per_part or len(answers) <= max_answers_per_part:
+        return part_counts
+    answers.sort(key=lambda (answer, count): (-count, answer))
+    limited_counts = dict(answers[:max_answers_per_part])
+    limited_counts[ANSWER_DISTRIBUTION_OTHER] = (
+        part_counts.get(ANSWER_DISTRIBUTION_OTHER, 0) + sum(count for __, count in answers[max_answers_per_part:])
+    )
+    return limited_counts
+
+
+def _answer_distribution_problem_info(course_key, usage_keys):
+    """
+    Return a dictionary mapping each of the given problem `usage_keys` that
+    still exists in the course to its (url_name, display_name).
+
+    Problems are looked up in the course's collected block structure, falling
+    back to the modulestore for problems that are not reachable from the
+    course root.  This method ignores permissions.
+    """
+    course_structure = get_course_in_cache(course_key)
+    problem_info = {}
+    for usage_key in usage_keys:
+        if usage_key in course_structure:
+            problem = course_structure[usage_key]
+        else:
+            try:
+                problem = modulestore().get_item(usage_key)
+            except ItemNotFoundError:
+                log.warning(
+                    u"Answer Distribution: Item %s referenced in StudentModule for course %s not found; "
+                    u"This can happen if a student answered a question that was later deleted from the course. "
+                    u"These answers will be omitted from the answer distribution CSV.",
+                    usage_key, course_key,
+                )
+                continue
+        problem_info[usage_key] = (
+            block_metadata_utils.url_name_for_block(problem),
+            block_metadata_utils.display_name_with_default_escaped(problem),
+        )
+    return problem_info
+
+
+def _close_connections_after(func):
+    """
+    Wrap `func` so that the database connections opened by the worker thread
+    that runs it are closed once it returns.
+    """
+    def wrapper(*args, **kwargs):  # pylint: disable=missing-docstring
+        try:
+            return func(*args, **kwargs)
+        finally:
+            connections.close_all()
+    return wrapper
+
+
+def grade(
+        student, course, keep_raw_scores=False, course_structure=None, scores_client=None,
+        submissions_scores=None, grading_context_result=None, persisted_grade=None,
+):
     """
     Returns the grade of the student.
 
+    When the ENABLE_PERSISTENT_GRADES feature is enabled, the grade stored for
+    the student is returned while it is still valid, and grades that had to be
+    computed are stored, unless the stored grade was invalidated while they
+    were computed.  Callers that pass a pre-fetched `scores_client` should
+    pass the student's `persisted_grade`, as fetched before their scores were.
+
     Also sends a signal to update the minimum grade requirement status.
     """
-    grade_summary = _grade(student, course, keep_raw_scores, course_structure)
+    use_persisted_grade = _can_persist_grade(student, course, keep_raw_scores)
+    grade_summary = None
+    if use_persisted_grade:
+        if persisted_grade is None:
+            persisted_grade = _get_persisted_grades([student.id], course.id)[student.id]
+        grade_summary = _read_persisted_grade(persisted_grade, course)
+    if grade_summary is None:
+        grade_summary = _grade(
+            student, course, keep_raw_scores, course_structure, scores_client,
+            submissions_scores, grading_context_result,
+        )
+        if use_persisted_grade:
+            _persist_grade(persisted_grade, course, grade_summary)
     responses = GRADES_UPDATED.send_robust(
         sender=None,
         username=student.username,
@@ -284,7 +455,140 @@ def grade(student, course, keep_raw_scores=False, course_structure=None):
     return grade_summary
 
 
-def _grade(student, course, keep_raw_scores, course_structure=None):
+def _can_persist_grade(student, course, keep_raw_scores):
+    """
+    Returns whether the grade of the student in the course may be read from,
+    and written to, the persisted grades.
+
+    Raw scores are never stored.  Neither are the grades of staff, who are
+    graded on content that has not been released yet.
+    """
+    return (
+        settings.FEATURES.get('ENABLE_PERSISTENT_GRADES', False) and
+        not keep_raw_scores and
+        not settings.GENERATE_PROFILE_SCORES and
+        student.is_authenticated() and
+        not has_access(student, 'staff', course.id)
+    )
+
+
+def _grade_version(course):
+    """
+    Returns the course structure version and the hash of the grading policy
+    that a grade of the course is computed against.
+    """
+    grading_policy = json.dumps(course.grading_policy, sort_keys=True)
+    return unicode(course.subtree_edited_on or ''), hashlib.sha1(grading_policy).hexdigest()
+
+
+def _next_release_date(course_key):
+    """
+    Returns the earliest date in the future at which a block of the course is
+    released, to learners or to beta testers, or None if the whole course is
+    already released.  Grades have to be computed again from then on.
+    """
+    now = datetime.now(UTC)
+    collected_block_structure = get_course_in_cache(course_key)
+    release_dates = []
+    for block_key in collected_block_structure:
+        start = StartDateTransformer.get_merged_start_date(collected_block_structure, block_key)
+        if not start:
+            continue
+        days_early_for_beta = collected_block_structure.get_xblock_field(block_key, 'days_early_for_beta')
+        if days_early_for_beta is not None:
+            start -= timedelta(days=days_early_for_beta)
+        if start > now:
+            release_dates.append(start)
+    return min(release_dates) if release_dates else None
+
+
+def _get_persisted_grades(user_ids, course_key):
+    """
+    Returns the PersistentCourseGrade of each of the users in the course,
+    keyed by user id, with a single query.  Users who have none get an
+    unsaved one, which is only created once their grade is stored.
+    """
+    persisted_grades = {
+        persisted_grade.user_id: persisted_grade
+        for persisted_grade in PersistentCourseGrade.objects.filter(user_id__in=user_ids, course_id=course_key)
+    }
+    for user_id in set(user_ids) - set(persisted_grades):
+        persisted_grades[user_id] = PersistentCourseGrade(user_id=user_id, course_id=course_key)
+    return persisted_grades
+
+
+def _read_persisted_grade(persisted_grade, course):
+    """
+    Returns the grade summary stored in the PersistentCourseGrade, or None if
+    there is none or it is no longer valid.
+    """
+    is_valid = (
+        persisted_grade.gradeset and
+        (persisted_grade.course_version, persisted_grade.grading_policy_hash) == _grade_version(course) and
+        (persisted_grade.valid_until is None or persisted_grade.valid_until > datetime.now(UTC))
+    )
+    dog_stats_api.increment(
+        'lms.grades.persisted_grade',
+        tags=[u'result:{}'.format('hit' if is_valid else 'miss')],
+    )
+    if not is_valid:
+        return None
+
+    def score_from_dict(encoded):
+        """ Given a formerly JSON-encoded Score tuple, return the Score tuple """
+        if encoded['module_id']:
+            encoded['module_id'] = UsageKey.from_string(encoded['module_id'])
+        return Score(**encoded)
+
+    grade_summary = json.loads(persisted_grade.gradeset)
+    grade_summary['totaled_scores'] = {
+        section_format: [score_from_dict(score) for score in scores]
+        for section_format, scores in grade_summary['totaled_scores'].iteritems()
+    }
+    return grade_summary
+
+
+def _persist_grade(persisted_grade, course, grade_summary):
+    """
+    Stores the grade summary computed for a student in the course in their
+    PersistentCourseGrade, along with what it was computed against.  Nothing
+    is stored if the grade was invalidated, and so its generation bumped,
+    since `persisted_grade` was fetched.
+    """
+    course_version, grading_policy_hash = _grade_version(course)
+    gradeset = dict(grade_summary)
+    gradeset['totaled_scores'] = {
+        section_format: [score._asdict() for score in scores]
+        for section_format, scores in grade_summary['totaled_scores'].iteritems()
+    }
+    values = dict(
+        course_version=course_version,
+        grading_policy_hash=grading_policy_hash,
+        valid_until=_next_release_date(course.id),
+        gradeset=json.dumps(gradeset, default=unicode),
+    )
+    if persisted_grade.id is None:
+        # The student had no stored grade when it was fetched.  If they have
+        # one now, it was created by an invalidation (or another computation)
+        # since, so the grade is only stored if it can still be created.
+        try:
+            with transaction.atomic():
+                PersistentCourseGrade.objects.create(
+                    user_id=persisted_grade.user_id, course_id=persisted_grade.course_id, **values
+                )
+        except IntegrityError:
+            pass
+    else:
+        PersistentCourseGrade.objects.filter(
+            id=persisted_grade.id,
+            generation=persisted_grade.generation,
+        ).update(modified=datetime.now(UTC), **values)
+
+
+def _grade(
+        student, course, keep_raw_scores, course_structure=None, scores_client=None,
+        submissions_scores=None, grading_context_result=None,
+):
     """
     Unwrapped version of "grade"
 
@@ -295,30 +599,38 @@ def _grade(student, course, keep_raw_scores, course_structure=None):
     - course: a CourseDescriptor
     - keep_raw_scores : if True, then value for key 'raw_scores' contains scores
       for every graded module
+    - scores_client : an optional ScoresClient with pre-fetched scores for the
+      student (see ScoresClient.create_for_users)
+    - submissions_scores : optional pre-fetched scores of the student from the
+      submissions API (see get_submissions_scores_for_users)
+    - grading_context_result : an optional grading context already computed
+      from course_structure
 
     More information on the format is in the docstring for CourseGrader.
     """
     if course_structure is None:
         course_structure = get_course_blocks(student, course.location)
-    grading_context_result = grading_context(course_structure)
-    scorable_locations = [block.location for block in grading_context_result['all_graded_blocks']]
-
-    with outer_atomic():
-        scores_client = ScoresClient.create_for_locations(course.id, student.id, scorable_locations)
+    if grading_context_result is None:
+        grading_context_result = grading_context(course_structure)
+    if scores_client is None:
+        scorable_locations = [block.location for block in grading_context_result['all_graded_blocks']]
+        with outer_atomic():
+            scores_client = ScoresClient.create_for_locations(course.id, student.id, scorable_locations)
 
     # Dict of item_ids -> (earned, possible) point tuples. This *only* grabs
     # scores that were registered with the submissions API, which for the moment
     # means only openassessment (edx-ora2)
-    # We need to import this here to avoid a circular dependency of the form:
-    # XBlock --> submissions --> Django Rest Framework error strings -->
-    # Django translation --> ... --> courseware --> submissions
-    from submissions import api as sub_api  # installed from the edx-submissions repository
-
-    with outer_atomic():
-        submissions_scores = sub_api.get_scores(
-            course.id.to_deprecated_string(),
-            anonymous_id_for_user(student, course.id)
-        )
+    if submissions_scores is None:
+        # We need to import this here to avoid a circular dependency of the form:
+        # XBlock --> submissions --> Django Rest Framework error strings -->
+        # Django translation --> ... --> courseware --> submissions
+        from submissions import api as sub_api  # installed from the edx-submissions repository
+
+        with outer_atomic():
+            submissions_scores = sub_api.get_scores(
+                course.id.to_deprecated_string(),
+                anonymous_id_for_user(student, course.id)
+            )
 
     totaled_scores, raw_scores = _calculate_totaled_scores(
         student, grading_context_result, submissions_scores, scores_client, keep_raw_scores
@@ -656,28 +968,135 @@ def iterate_grades_for(course_or_id, students, keep_raw_scores=False):
     - grade_breakdown : A breakdown of the major components that
         make up the final grade. (For display)
     - raw_scores: contains scores for every graded module
+
+    The scores and course roles of the students are fetched
+    GRADING_STUDENTS_CHUNK_SIZE students at a time, rather than student by
+    student, and the course structure and grading context are computed once
+    for all of the students who have the same access to the course.
     """
     if isinstance(course_or_id, (basestring, CourseKey)):
         course = courses.get_course_by_id(course_or_id)
     else:
         course = course_or_id
 
-    for student in students:
-        with dog_stats_api.timer('lms.grades.iterate_grades_for', tags=[u'action:{}'.format(course.id)]):
-            try:
-                gradeset = grade(student, course, keep_raw_scores)
-                yield student, gradeset, ""
-            except Exception as exc:  # pylint: disable=broad-except
-                # Keep marching on even if this student couldn't be graded for
-                # some reason, but log it for future reference.
-                log.exception(
-                    'Cannot grade student %s (%s) in course %s because of exception: %s',
-                    student.username,
-                    student.id,
-                    course.id,
-                    exc.message
-                )
-                yield student, {}, exc.message
+    course_structures = _SharedCourseStructures(course)
+
+    for students_chunk in chunks(students, GRADING_STUDENTS_CHUNK_SIZE):
+        with outer_atomic():
+            # The stored grades are fetched before the scores, so that grades
+            # invalidated while the chunk is graded are not stored.
+            persisted_grades = (
+                _get_persisted_grades([student.id for student in students_chunk], course.id)
+                if settings.FEATURES.get('ENABLE_PERSISTENT_GRADES', False) and not keep_raw_scores else {}
+            )
+            scores_clients = ScoresClient.create_for_users(
+                course.id, [student.id for student in students_chunk], course_structures.scorable_locations
+            )
+            RoleCache.prefetch(students_chunk)
+            submissions_scores = get_submissions_scores_for_users(course.id, students_chunk)
+
+        for student in students_chunk:
+            with dog_stats_api.timer('lms.grades.iterate_grades_for', tags=[u'action:{}'.format(course.id)]):
+                try:
+                    course_structure, grading_context_result = course_structures.for_student(student)
+                    gradeset = grade(
+                        student, course, keep_raw_scores,
+                        course_structure=course_structure,
+                        scores_client=scores_clients[student.id],
+                        submissions_scores=submissions_scores[student.id],
+                        grading_context_result=grading_context_result,
+                        persisted_grade=persisted_grades.get(student.id),
+                    )
+                    yield student, gradeset, ""
+                except Exception as exc:  # pylint: disable=broad-except
+                    # Keep marching on even if this student couldn't be graded for
+                    # some reason, but log it for future reference.
+                    log.exception(
+                        'Cannot grade student %s (%s) in course %s because of exception: %s',
+                        student.username,
+                        student.id,
+                        course.id,
+                        exc.message
+                    )
+                    yield student, {}, exc.message
+
+
+class _SharedCourseStructures(object):
+    """
+    Computes the course block structure of a course, and its grading context,
+    once for all of the students who have the same access to the course.
+
+    Which blocks a student is graded on depends on their staff and beta
+    tester roles and on their group in each of the course's user partitions,
+    which covers cohorts, content groups and split tests.  Students who have
+    all of these in common get the same structure.  Library content blocks
+    select their children student by student, so courses with any get a
+    structure per student.
+    """
+    def __init__(self, course):
+        self.course = course
+        self._structures = {}
+        collected_structure = get_course_in_cache(course.id)
+        self._per_student = any(block_key.block_type == 'library_content' for block_key in collected_structure)
+        # The graded blocks of every student are among those of the course.
+        self.scorable_locations = [
+            block.location for block in grading_context(collected_structure)['all_graded_blocks']
+        ]
+
+    def _access_key(self, student):
+        """
+        Returns what determines the course structure of the student.
+        """
+        if self._per_student:
+            return student.id
+        partition_groups = []
+        for partition in self.course.user_partitions:
+            group = partition.scheme.get_group_for_user(self.course.id, student, partition)
+            partition_groups.append((partition.id, group.id if group is not None else None))
+        return (
+            bool(has_access(student, 'staff', self.course.id)),
+            CourseBetaTesterRole(self.course.id).has_user(student),
+            tuple(partition_groups),
+        )
+
+    def for_student(self, student):
+        """
+        Returns the course structure of the student and its grading context.
+        """
+        access_key = self._access_key(student)
+        if access_key not in self._structures:
+            course_structure = get_course_blocks(student, self.course.location)
+            self._structures[access_key] = (course_structure, grading_context(course_structure))
+        return self._structures[access_key]
+
+
+def get_submissions_scores_for_users(course_key, students):
+    """
+    Returns the scores registered with the submissions API for each of the
+    students in the course, keyed by user id, loaded with a single query.
+
+    Each student's scores are a dict of item ids to (earned, possible) point
+    tuples, as returned by `submissions.api.get_scores`.
+    """
+    # Imported here for the same reason as submissions.api in _grade.
+    from submissions.models import ScoreSummary  # installed from the edx-submissions repository
+
+    user_ids_by_anonymous_id = {
+        anonymous_id_for_user(student, course_key, save=False): student.id for student in students
+    }
+    scores = {student.id: {} for student in students}
+    score_summaries = ScoreSummary.objects.filter(
+        student_item__course_id=course_key.to_deprecated_string(),
+        student_item__student_id__in=user_ids_by_anonymous_id.keys(),
+    ).select_related('latest', 'student_item')
+    for summary in score_summaries:
+        # Reset scores are hidden, as they are by submissions.api.get_scores.
+        if not summary.latest.is_hidden():
+            user_id = user_ids_by_anonymous_id[summary.student_item.student_id]
+            scores[user_id][summary.student_item.item_id] = (
+                summary.latest.points_earned, summary.latest.points_possible
+            )
+    return scores
 
 
 def _get_mock_request(student):
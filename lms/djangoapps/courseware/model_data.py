@@ -71,6 +71,30 @@ def _all_usage_keys(descriptors, aside_types):
     return usage_ids
 
 
+def get_child_descriptors(descriptor, depth=None, descriptor_filter=lambda descriptor: True):
+    """
+    Return a list of all child descriptors down to the specified depth
+    that match the descriptor filter. Includes `descriptor`
+
+    descriptor: The parent to search inside
+    depth: The number of levels to descend, or None for infinite depth
+    descriptor_filter(descriptor): A function that returns True
+        if descriptor should be included in the results
+    """
+    if descriptor_filter(descriptor):
+        descriptors = [descriptor]
+    else:
+        descriptors = []
+
+    if depth is None or depth > 0:
+        new_depth = depth - 1 if depth is not None else depth
+
+        for child in descriptor.get_children() + descriptor.get_required_module_descriptors():
+            descriptors.extend(get_child_descriptors(child, new_depth, descriptor_filter))
+
+    return descriptors
+
+
 def _all_block_types(descriptors, aside_types):
     """
     Return a set of all block_types for the supplied `descriptors` and for
@@ -345,15 +369,77 @@ class DjangoOrmFieldCache(object):
         raise NotImplementedError()
 
 
+class MultiUserStateCache(object):
+    """
+    Scope.user_state xblock field data for a batch of users, which is loaded
+    for all of the users at once.  Passing it to the FieldDataCaches of each
+    of the users (as `prefetched_state`) lets them use this data rather than
+    querying for it user by user.
+    """
+    def __init__(self, users, block_keys):
+        """
+        Arguments:
+            users (list of User): The users to load data for.
+            block_keys (list of UsageKey): The XBlocks to load data for.
+        """
+        self.block_keys = set(block_keys)
+        self._states_by_user = defaultdict(dict)
+        self._modified_by_user = defaultdict(dict)
+
+        client = DjangoXBlockUserStateClient()
+        block_field_state = client.get_many_for_users(
+            [user.username for user in users],
+            list(self.block_keys),
+        )
+        for user_state in block_field_state:
+            self._states_by_user[user_state.username][user_state.block_key] = user_state.state
+            self._modified_by_user[user_state.username][user_state.block_key] = user_state.updated
+
+    @classmethod
+    def for_descriptor_descendents(cls, users, descriptors, descriptor_filter=lambda descriptor: True):
+        """
+        Return a MultiUserStateCache of the data of the given `users` for all of
+        the `descriptors` and their descendants that match `descriptor_filter`,
+        i.e. of the data that `FieldDataCache.cache_for_descriptor_descendents`
+        loads for each user.
+        """
+        block_keys = set()
+        for descriptor in descriptors:
+            with modulestore().bulk_operations(descriptor.location.course_key):
+                block_keys.update(_all_usage_keys(get_child_descriptors(descriptor, None, descriptor_filter), []))
+        return cls(users, block_keys)
+
+    def get_many(self, user, block_keys):
+        """
+        Return a dict mapping each of the `block_keys` that the given `user`
+        has stored state for to (a copy of) that state.
+        """
+        user_states = self._states_by_user.get(user.username, {})
+        return {
+            block_key: dict(user_states[block_key])
+            for block_key in block_keys
+            if block_key in user_states
+        }
+
+    def get_modified(self, user, block_key):
+        """
+        Return when the prefetched state of the given `user` for the given
+        `block_key` was last modified, or None if the user has no stored
+        state for it.
+        """
+        return self._modified_by_user.get(user.username, {}).get(block_key)
+
+
 class UserStateCache(object):
     """
     Cache for Scope.user_state xblock field data.
     """
-    def __init__(self, user, course_id):
+    def __init__(self, user, course_id, prefetched_state=None):
         self._cache = defaultdict(dict)
         self.course_id = course_id
         self.user = user
         self._client = DjangoXBlockUserStateClient(self.user)
+        self._prefetched_state = prefetched_state
 
     def cache_fields(self, fields, xblocks, aside_types):  # pylint: disable=unused-argument
         """
@@ -365,9 +451,17 @@ class UserStateCache(object):
             xblocks (list of :class:`XBlock`): XBlocks to cache fields for.
             aside_types (list of str): Aside types to cache fields for.
         """
+        block_keys = _all_usage_keys(xblocks, aside_types)
+        if self._prefetched_state is not None:
+            prefetched_keys = block_keys & self._prefetched_state.block_keys
+            self._cache.update(self._prefetched_state.get_many(self.user, prefetched_keys))
+            block_keys -= prefetched_keys
+            if not block_keys:
+                return
+
         block_field_state = self._client.get_many(
             self.user.username,
-            _all_usage_keys(xblocks, aside_types),
+            block_keys,
         )
         for user_state in block_field_state:
             self._cache[user_state.block_key] = user_state.state
@@ -686,7 +780,7 @@ class FieldDataCache(object):
     A cache of django model objects needed to supply the data
     for a module and its descendants
     """
-    def __init__(self, descriptors, course_id, user, select_for_update=False, asides=None):
+    def __init__(self, descriptors, course_id, user, select_for_update=False, asides=None, prefetched_state=None):
         """
         Find any courseware.models objects that are needed by any descriptor
         in descriptors. Attempts to minimize the number of queries to the database.
@@ -699,6 +793,8 @@ class FieldDataCache(object):
         user: The user for which to cache data
         select_for_update: Ignored
         asides: The list of aside types to load, or None to prefetch no asides.
+        prefetched_state: A MultiUserStateCache that includes the user, whose
+            Scope.user_state data is used instead of loading it from the database.
         """
         if asides is None:
             self.asides = []
@@ -713,6 +809,7 @@ class FieldDataCache(object):
             Scope.user_state: UserStateCache(
                 self.user,
                 self.course_id,
+                prefetched_state,
             ),
             Scope.user_info: UserInfoCache(
                 self.user,
@@ -751,29 +848,6 @@ class FieldDataCache(object):
                 should be cached
         """
 
-        def get_child_descriptors(descriptor, depth, descriptor_filter):
-            """
-            Return a list of all child descriptors down to the specified depth
-            that match the descriptor filter. Includes `descriptor`
-
-            descriptor: The parent to search inside
-            depth: The number of levels to descend, or None for infinite depth
-            descriptor_filter(descriptor): A function that returns True
-                if descriptor should be included in the results
-            """
-            if descriptor_filter(descriptor):
-                descriptors = [descriptor]
-            else:
-                descriptors = []
-
-            if depth is None or depth > 0:
-                new_depth = depth - 1 if depth is not None else depth
-
-                for child in descriptor.get_children() + descriptor.get_required_module_descriptors():
-                    descriptors.extend(get_child_descriptors(child, new_depth, descriptor_filter))
-
-            return descriptors
-
         with modulestore().bulk_operations(descriptor.location.course_key):
             descriptors = get_child_descriptors(descriptor, depth, descriptor_filter)
 
@@ -782,7 +856,7 @@ class FieldDataCache(object):
     @classmethod
     def cache_for_descriptor_descendents(cls, course_id, user, descriptor, depth=None,
                                          descriptor_filter=lambda descriptor: True,
-                                         select_for_update=False, asides=None):
+                                         select_for_update=False, asides=None, prefetched_state=None):
         """
         course_id: the course in the context of which we want StudentModules.
         user: the django user for whom to load modules.
@@ -792,8 +866,11 @@ class FieldDataCache(object):
         descriptor_filter is a function that accepts a descriptor and return whether the field data
             should be cached
         select_for_update: Ignored
+        prefetched_state: A MultiUserStateCache to use the user's Scope.user_state data from
         """
-        cache = FieldDataCache([], course_id, user, select_for_update, asides=asides)
+        cache = FieldDataCache(
+            [], course_id, user, select_for_update, asides=asides, prefetched_state=prefetched_state
+        )
         cache.add_descriptor_descendents(descriptor, depth, descriptor_filter)
         return cache
 
@@ -988,6 +1065,31 @@ class ScoresClient(object):
         client.fetch_scores(scorable_locations)
         return client
 
+    @classmethod
+    def create_for_users(cls, course_id, user_ids, scorable_locations):
+        """
+        Return a dict mapping each of the given user ids to a ScoresClient with
+        pre-fetched data for the given locations, fetching the scores of all
+        of the users in a single query.
+        """
+        clients = {}
+        for user_id in user_ids:
+            clients[user_id] = cls(course_id, user_id)
+            clients[user_id]._has_fetched = True  # pylint: disable=protected-access
+
+        scores_qset = StudentModule.objects.filter(
+            student_id__in=clients.keys(),
+            course_id=course_id,
+            module_state_key__in=set(scorable_locations),
+        )
+        for user_id, location, correct, total in scores_qset.values_list(
+                'student_id', 'module_state_key', 'grade', 'max_grade'
+        ):
+            location = UsageKey.from_string(location).map_into_course(course_id)
+            scores = clients[user_id]._locations_to_scores  # pylint: disable=protected-access
+            scores[location] = cls.Score(correct, total)
+        return clients
+
 
 # @contract(user_id=int, usage_key=UsageKey, score="number|None", max_score="number|None")
 def set_score(user_id, usage_key, score, max_score):
@@ -18,11 +18,14 @@ import itertools
 from django.contrib.auth.models import User
 from django.conf import settings
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver, Signal
 
 from model_utils.models import TimeStampedModel
-from student.models import user_by_anonymous_id
+from opaque_keys.edx.keys import CourseKey
+from openedx.core.djangoapps.course_groups.models import CohortMembership
+from student.models import CourseAccessRole, CourseEnrollment, user_by_anonymous_id
 from submissions.models import score_set, score_reset
 import coursewarehistoryextended
 
@@ -343,6 +346,58 @@ class OfflineComputedGradeLog(models.Model):
         return "[OCGLog] %s: %s" % (self.course_id.to_deprecated_string(), self.created)  # pylint: disable=no-member
 
 
+class PersistentCourseGrade(TimeStampedModel):
+    """
+    The grade summary computed for a given user and course by
+    `courseware.grades`, including the user's subsection scores, kept so that
+    it does not have to be computed again on every read.
+
+    A stored grade only holds for the course structure version and grading
+    policy it was computed against, and until `valid_until` when more of the
+    course is released.  Score changes for the user invalidate it, and bump
+    its `generation`, so that a grade computed from the scores read before
+    the change is not stored in its place.
+    """
+    user = models.ForeignKey(User, db_index=True)
+    course_id = CourseKeyField(max_length=255, db_index=True)
+
+    course_version = models.CharField(max_length=255, blank=True)
+    grading_policy_hash = models.CharField(max_length=255, blank=True)
+    valid_until = models.DateTimeField(null=True, blank=True)
+    generation = models.IntegerField(default=0)
+
+    gradeset = models.TextField(blank=True)  # grade summary, stored as JSON, or empty if there is none
+
+    class Meta(object):
+        app_label = "courseware"
+        unique_together = (('user', 'course_id'), )
+
+    def __unicode__(self):
+        return u"[PersistentCourseGrade] {}: {} ({})".format(self.user_id, self.course_id, self.modified)
+
+    @classmethod
+    def invalidate(cls, user_id, course_id):
+        """
+        Clears the stored grade of the given user in the given course, and
+        bumps its generation.
+
+        This is done even when the ENABLE_PERSISTENT_GRADES feature is
+        disabled, so that the grades stored while it was enabled are not
+        served once it is enabled again.  While it is enabled, a user who
+        has no stored grade gets an empty one, so that a grade computed
+        from their scores before the change, which would otherwise create
+        it, is not stored.
+        """
+        grades = cls.objects.filter(user_id=user_id, course_id=course_id)
+        if grades.update(gradeset='', generation=F('generation') + 1):
+            return
+        if settings.FEATURES.get('ENABLE_PERSISTENT_GRADES', False):
+            __, created = cls.objects.get_or_create(user_id=user_id, course_id=course_id, defaults={'generation': 1})
+            if not created:
+                # A grade was stored since it was updated.
+                grades.update(gradeset='', generation=F('generation') + 1)
+
+
 class StudentFieldOverride(TimeStampedModel):
     """
     Holds the value of a specific field overriden for a student.  This is used
@@ -457,3 +512,45 @@ def submissions_score_reset_handler(sender, **kwargs):  # pylint: disable=unused
             u"Failed to process score_reset signal from Submissions API. "
             "user: %s, course_id: %s, usage_id: %s", user, course_id, usage_id
         )
+
+
+@receiver(SCORE_CHANGED)
+def invalidate_persistent_grade_on_score_change(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Clears the stored course grade of a user whose score has changed, and
+    bumps its generation, so that it is computed again, with the new score,
+    on the next read.
+    """
+    PersistentCourseGrade.invalidate(kwargs['user_id'], CourseKey.from_string(kwargs['course_id']))
+
+
+@receiver(post_delete, sender=StudentModule)
+def invalidate_persistent_grade_on_state_delete(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Clears the stored course grade of a user whose state for a block was
+    deleted, and bumps its generation.
+    """
+    PersistentCourseGrade.invalidate(instance.student_id, instance.course_id)
+
+
+@receiver(post_save, sender=CourseEnrollment)
+@receiver(post_save, sender=CohortMembership)
+def invalidate_persistent_grade_on_membership_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Clears the stored course grade of a user whose enrollment mode or cohort
+    changed, and bumps its generation, since either can change which parts
+    of the course are graded.
+    """
+    PersistentCourseGrade.invalidate(instance.user_id, instance.course_id)
+
+
+@receiver(post_save, sender=CourseAccessRole)
+@receiver(post_delete, sender=CourseAccessRole)
+def invalidate_persistent_grade_on_role_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Clears the stored course grade of a user whose roles in the course
+    changed, and bumps its generation, since beta testers are graded on
+    content released to them early.
+    """
+    if instance.course_id:
+        PersistentCourseGrade.invalidate(instance.user_id, instance.course_id)
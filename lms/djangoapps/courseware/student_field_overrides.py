@@ -4,10 +4,15 @@ by the individual due dates feature.
 """
 import json
 
-from .field_overrides import FieldOverrideProvider
+import request_cache
+
+from .field_overrides import FieldOverrideProvider, clear_override_snapshots
 from .models import StudentFieldOverride
 
 
+STUDENT_OVERRIDES_CACHE_NAME = 'courseware.student_field_overrides'
+
+
 class IndividualStudentOverrideProvider(FieldOverrideProvider):
     """
     A concrete implementation of
@@ -43,19 +48,47 @@ def _get_overrides_for_user(user, block):
     Gets all of the individual student overrides for given user and block.
     Returns a dictionary of field override values keyed by field name.
     """
-    query = StudentFieldOverride.objects.filter(
-        course_id=block.runtime.course_id,
-        location=block.location,
-        student_id=user.id,
-    )
+    course_overrides = _get_course_overrides_for_user(user, block.runtime.course_id)
+    # Look the block up by its location as stored, without branch and version.
+    location = StudentFieldOverride._meta.get_field('location').get_prep_value(block.location)
     overrides = {}
-    for override in query:
-        field = block.fields[override.field]
-        value = field.from_json(json.loads(override.value))
-        overrides[override.field] = value
+    for field_name, serialized_value in course_overrides.get(location, {}).iteritems():
+        field = block.fields[field_name]
+        overrides[field_name] = field.from_json(json.loads(serialized_value))
     return overrides
 
 
+def _get_course_overrides_for_user(user, course_id):
+    """
+    Returns a snapshot of all of the individual student overrides for the
+    given user in the given course, loaded with a single query and cached for
+    the rest of the request.  The snapshot maps block locations to
+    dictionaries of serialized override values keyed by field name.
+    """
+    overrides_cache = request_cache.get_cache(STUDENT_OVERRIDES_CACHE_NAME)
+    cache_key = (user.id, unicode(course_id))
+    if cache_key not in overrides_cache:
+        query = StudentFieldOverride.objects.filter(
+            course_id=course_id,
+            student_id=user.id,
+        ).values_list('location', 'field', 'value')
+        snapshot = {}
+        for location, field_name, serialized_value in query:
+            snapshot.setdefault(unicode(location), {})[field_name] = serialized_value
+        overrides_cache[cache_key] = snapshot
+    return overrides_cache[cache_key]
+
+
+def _invalidate_overrides_for_user(user, block):
+    """
+    Drops the cached overrides of the `user` for `block`, its course and any
+    memoized override lookups, after one of them has been written.
+    """
+    getattr(block, '_student_overrides', {}).pop(user.id, None)
+    request_cache.get_cache(STUDENT_OVERRIDES_CACHE_NAME).pop((user.id, unicode(block.runtime.course_id)), None)
+    clear_override_snapshots()
+
+
 def override_field_for_user(user, block, name, value):
     """
     Overrides a field for the `user`.  `block` and `name` specify the block
@@ -70,6 +103,7 @@ def override_field_for_user(user, block, name, value):
     field = block.fields[name]
     override.value = json.dumps(field.to_json(value))
     override.save()
+    _invalidate_overrides_for_user(user, block)
 
 
 def clear_override_for_user(user, block, name):
@@ -87,3 +121,5 @@ def clear_override_for_user(user, block, name):
             field=name).delete()
     except StudentFieldOverride.DoesNotExist:
         pass
+    else:
+        _invalidate_overrides_for_user(user, block)
@@ -7,6 +7,7 @@ import ddt
 import itertools
 import pytz
 
+import crum
 from django.contrib.auth.models import User
 from ccx_keys.locator import CCXLocator
 from django.http import Http404
@@ -32,7 +33,7 @@ import courseware.views.views as views
 from courseware.tests.helpers import LoginEnrollmentTestCase
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from student.models import CourseEnrollment
-from student.roles import CourseCcxCoachRole
+from student.roles import CourseCcxCoachRole, CourseStaffRole
 from student.tests.factories import (
     AdminFactory,
     AnonymousUserFactory,
@@ -62,6 +63,7 @@ from util.milestones_helpers import (
 from milestones.tests.utils import MilestonesTestCaseMixin
 
 from lms.djangoapps.ccx.models import CustomCourseForEdX
+from request_cache.middleware import RequestCache
 
 # pylint: disable=protected-access
 
@@ -786,3 +788,71 @@ class CourseOverviewAccessTestCase(ModuleStoreTestCase):
         course_overview = CourseOverview.get_from_id(course.id)
         with self.assertNumQueries(num_queries):
             bool(access.has_access(user, action, course_overview, course_key=course.id))
+
+
+@attr('shard_1')
+class AccessCacheTestCase(ModuleStoreTestCase):
+    """
+    Tests for memoizing access decisions within a request.
+    """
+
+    def setUp(self):
+        super(AccessCacheTestCase, self).setUp()
+        self.course = CourseFactory.create()
+        self.user = UserFactory()
+        self.addCleanup(RequestCache.clear_request_cache)
+        self.addCleanup(crum.set_current_request, None)
+
+    def _start_request(self, method='get'):
+        """
+        Makes a new request with the given method the current request.
+        """
+        RequestCache.clear_request_cache()
+        crum.set_current_request(getattr(RequestFactory(), method)('/'))
+
+    def _count_role_checks(self, num_checks):
+        """
+        Checks staff access to the course `num_checks` times and returns how
+        many times it was actually computed.
+        """
+        with patch(
+            'courseware.access._compute_access_to_course', wraps=access._compute_access_to_course
+        ) as mock_compute:
+            for __ in range(num_checks):
+                self.assertFalse(access.has_access(self.user, 'staff', self.course))
+                self.assertFalse(access.has_access(self.user, 'staff', self.course.id))
+        return mock_compute.call_count
+
+    def test_memoized_within_request(self):
+        self._start_request()
+        self.assertEqual(self._count_role_checks(3), 1)
+
+        # The next request starts over.
+        self._start_request()
+        self.assertEqual(self._count_role_checks(3), 1)
+
+    def test_not_memoized_outside_request(self):
+        self.assertEqual(self._count_role_checks(3), 6)
+
+    def test_not_memoized_for_writes(self):
+        self._start_request('post')
+        self.assertEqual(self._count_role_checks(3), 6)
+
+    def test_not_memoized_when_masquerading(self):
+        self._start_request()
+        self.user.masquerade_settings = {self.course.id: CourseMasquerade(self.course.id, role='student')}
+        self.assertEqual(self._count_role_checks(3), 6)
+
+    def test_role_changes_clear_cache(self):
+        self._start_request()
+        self.assertFalse(access.has_access(self.user, 'staff', self.course))
+        CourseStaffRole(self.course.id).add_users(self.user)
+        self.assertTrue(access.has_access(self.user, 'staff', self.course))
+        CourseStaffRole(self.course.id).remove_users(self.user)
+        self.assertFalse(access.has_access(self.user, 'staff', self.course))
+
+    def test_per_user(self):
+        self._start_request()
+        staff = StaffFactory(course_key=self.course.id)
+        self.assertFalse(access.has_access(self.user, 'staff', self.course))
+        self.assertTrue(access.has_access(staff, 'staff', self.course))
@@ -2,10 +2,13 @@
 """
 Tests for course access
 """
+from datetime import datetime, timedelta
 import itertools
 
 import ddt
+import pytz
 from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
 from django.test.utils import override_settings
 from django.core.urlresolvers import reverse
 from django.test.client import RequestFactory
@@ -13,6 +16,8 @@ import mock
 from nose.plugins.attrib import attr
 from opaque_keys.edx.locations import SlashSeparatedCourseKey
 
+import branding
+from courseware.access import has_access
 from courseware.courses import (
     get_cms_block_link,
     get_cms_course_link,
@@ -28,7 +33,9 @@ from courseware.tests.helpers import get_request_for_user
 from courseware.model_data import FieldDataCache
 from lms.djangoapps.courseware.courseware_access_exception import CoursewareAccessException
 from openedx.core.lib.courses import course_image_url
-from student.tests.factories import UserFactory
+from student.roles import CourseBetaTesterRole, CourseStaffRole
+from student.tests.factories import CourseEnrollmentAllowedFactory, UserFactory
+from xmodule.course_module import CATALOG_VISIBILITY_ABOUT, CATALOG_VISIBILITY_NONE
 from xmodule.modulestore.django import _get_modulestore_branch_setting, modulestore
 from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.xml_importer import import_course_from_xml
@@ -157,6 +164,59 @@ class CoursesTest(ModuleStoreTestCase):
                 "testing get_courses with filter_={}".format(filter_),
             )
 
+    @ddt.data('see_exists', 'see_in_catalog', 'see_about_page')
+    def test_get_courses_matches_has_access(self, permission_name):
+        """
+        Verify that courses listed from the catalog visibility index are the
+        ones that per-course access checks allow, for all kinds of users.
+        """
+        now = datetime.now(pytz.UTC)
+        past, future = now - timedelta(days=10), now + timedelta(days=10)
+        courses = [
+            CourseFactory.create(emit_signals=True, **fields) for fields in (
+                dict(start=past),
+                dict(start=future),
+                dict(start=future, enrollment_start=past, enrollment_end=future),
+                dict(start=future, enrollment_start=past, enrollment_end=future, invitation_only=True),
+                dict(start=past, visible_to_staff_only=True),
+                dict(start=past, catalog_visibility=CATALOG_VISIBILITY_ABOUT),
+                dict(start=future, catalog_visibility=CATALOG_VISIBILITY_NONE),
+            )
+        ]
+
+        allowed_user = UserFactory.create()
+        CourseEnrollmentAllowedFactory.create(email=allowed_user.email, course_id=courses[3].id)
+        beta_tester = UserFactory.create()
+        CourseBetaTesterRole(courses[1].id).add_users(beta_tester)
+        course_staff = UserFactory.create()
+        CourseStaffRole(courses[4].id).add_users(course_staff)
+
+        with override_settings(COURSE_CATALOG_VISIBILITY_PERMISSION=permission_name):
+            for user in (AnonymousUser(), UserFactory.create(), allowed_user, beta_tester, course_staff):
+                self.assertEqual(
+                    [course.id for course in get_courses(user)],
+                    [
+                        course.id for course in branding.get_visible_courses()
+                        if has_access(user, permission_name, course)
+                    ],
+                )
+
+    def test_get_courses_without_access_checks(self):
+        """
+        Verify that courses are listed for users without course roles
+        without checking access on each course.
+        """
+        for __ in range(3):
+            CourseFactory.create(emit_signals=True)
+        user = UserFactory.create()
+        get_courses(user)
+
+        with mock.patch('courseware.courses.has_access') as mock_has_access:
+            with self.assertNumQueries(3):
+                courses = get_courses(user)
+            self.assertFalse(mock_has_access.called)
+        self.assertEqual(len(courses), 3)
+
 
 @attr('shard_1')
 class ModuleStoreBranchSettingTest(ModuleStoreTestCase):
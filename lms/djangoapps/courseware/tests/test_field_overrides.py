@@ -5,15 +5,21 @@ Tests for `field_overrides` module.
 import unittest
 from nose.plugins.attrib import attr
 
+import crum
+from django.test.client import RequestFactory
 from django.test.utils import override_settings
+from mock import Mock
+from request_cache.middleware import RequestCache
 from xblock.field_data import DictFieldData
 from xmodule.modulestore.tests.factories import CourseFactory
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 
 from ..field_overrides import (
     resolve_dotted,
+    clear_override_snapshots,
     disable_overrides,
     FieldOverrideProvider,
+    NOTSET,
     OverrideFieldData,
     OverrideModulestoreFieldData,
 )
@@ -142,6 +148,60 @@ class OverrideModulestoreFieldDataTests(FieldOverrideTestMixin, OverrideFieldDat
         self.assertIsInstance(data, DictFieldData)
 
 
+class CountingOverrideProvider(FieldOverrideProvider):
+    """
+    A `FieldOverrideProvider` which overrides `foo` and counts its lookups.
+    """
+    lookups = 0
+
+    def get(self, block, name, default):
+        CountingOverrideProvider.lookups += 1
+        return 'fu' if name == 'foo' else default
+
+    @classmethod
+    def enabled_for(cls, course):
+        return True
+
+
+@attr('shard_1')
+class OverrideSnapshotTests(unittest.TestCase):
+    """
+    Tests for memoizing override lookups within a request.
+    """
+    def setUp(self):
+        super(OverrideSnapshotTests, self).setUp()
+        RequestCache.clear_request_cache()
+        self.addCleanup(RequestCache.clear_request_cache)
+        self.addCleanup(crum.set_current_request, None)
+        CountingOverrideProvider.lookups = 0
+        self.block = Mock(scope_ids=Mock(usage_id='block'))
+        self.data = OverrideFieldData(Mock(id=1), DictFieldData({}), [CountingOverrideProvider])
+
+    def assert_lookups(self, name, expected_value, expected_lookups):
+        """
+        Reads the override for `name` and checks the value and the number of
+        provider lookups needed so far.
+        """
+        self.assertEqual(self.data.get_override(self.block, name), expected_value)
+        self.assertEqual(CountingOverrideProvider.lookups, expected_lookups)
+
+    def test_misses_memoized_within_request(self):
+        crum.set_current_request(RequestFactory().get('/'))
+        self.assert_lookups('bar', NOTSET, 1)
+        self.assert_lookups('bar', NOTSET, 1)
+        clear_override_snapshots()
+        self.assert_lookups('bar', NOTSET, 2)
+
+    def test_values_not_memoized(self):
+        crum.set_current_request(RequestFactory().get('/'))
+        self.assert_lookups('foo', 'fu', 1)
+        self.assert_lookups('foo', 'fu', 2)
+
+    def test_no_memoization_outside_request(self):
+        self.assert_lookups('bar', NOTSET, 1)
+        self.assert_lookups('bar', NOTSET, 2)
+
+
 @attr('shard_1')
 class ResolveDottedTests(unittest.TestCase):
     """
@@ -1,6 +1,8 @@
 """
 Test grade calculation.
 """
+from datetime import datetime, timedelta
+
 from django.http import Http404
 from django.test import TestCase
 from django.test.client import RequestFactory
@@ -9,27 +11,33 @@ from mock import patch, MagicMock
 from nose.plugins.attrib import attr
 from opaque_keys.edx.locations import SlashSeparatedCourseKey
 from opaque_keys.edx.locator import CourseLocator, BlockUsageLocator
+from pytz import UTC
 
 from courseware.grades import (
     grade,
+    get_submissions_scores_for_users,
     iterate_grades_for,
     ProgressSummary,
     get_module_score
 )
+from courseware import grades
+from courseware.models import PersistentCourseGrade
 from courseware.module_render import get_module
-from courseware.model_data import FieldDataCache, set_score
+from courseware.model_data import FieldDataCache, ScoresClient, set_score
 from courseware.tests.helpers import (
     LoginEnrollmentTestCase,
     get_request_for_user
 )
 from capa.tests.response_xml_factory import MultipleChoiceResponseXMLFactory
 from student.tests.factories import UserFactory
-from student.models import CourseEnrollment
+from student.models import CourseEnrollment, anonymous_id_for_user
+from student.roles import CourseBetaTesterRole, CourseStaffRole
+from submissions import api as sub_api
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 
 
-def _grade_with_errors(student, course, keep_raw_scores=False):
+def _grade_with_errors(student, course, keep_raw_scores=False, **kwargs):
     """This fake grade method will throw exceptions for student3 and
     student4, but allow any other students to go through normal grading.
 
@@ -40,7 +48,7 @@ def _grade_with_errors(student, course, keep_raw_scores=False):
     if student.username in ['student3', 'student4']:
         raise Exception("I don't like {}".format(student.username))
 
-    return grade(student, course, keep_raw_scores=keep_raw_scores)
+    return grade(student, course, keep_raw_scores=keep_raw_scores, **kwargs)
 
 
 @attr('shard_1')
@@ -127,6 +135,41 @@ class TestGradeIteration(SharedModuleStoreTestCase):
         self.assertTrue(all_gradesets[student2])
         self.assertTrue(all_gradesets[student5])
 
+    def test_course_structure_shared(self):
+        """Students with the same access to the course are graded against
+        the same course structure, computed once."""
+        CourseStaffRole(self.course.id).add_users(self.students[0])
+        with patch('courseware.grades.get_course_blocks', wraps=grades.get_course_blocks) as mock_course_blocks:
+            all_gradesets, all_errors = self._gradesets_and_errors_for(self.course.id, self.students)
+        self.assertEqual(all_errors, {})
+        # Once for the course staff member, and once for everyone else.
+        self.assertEqual(mock_course_blocks.call_count, 2)
+        for student in self.students:
+            self.assertEqual(all_gradesets[student]['percent'], grade(student, self.course)['percent'])
+
+    def test_submissions_scores_for_users(self):
+        item_id = 'i4x://org/course/openassessment/ora'
+        for points_earned, student in enumerate(self.students[:2], start=1):
+            submission = sub_api.create_submission(
+                {
+                    'student_id': anonymous_id_for_user(student, self.course.id),
+                    'course_id': self.course.id.to_deprecated_string(),
+                    'item_id': item_id,
+                    'item_type': 'openassessment',
+                },
+                'test answer',
+            )
+            sub_api.set_score(submission['uuid'], points_earned, 2)
+
+        with self.assertNumQueries(1):
+            scores = get_submissions_scores_for_users(self.course.id, self.students)
+        for student in self.students:
+            self.assertEqual(
+                scores[student.id],
+                sub_api.get_scores(self.course.id.to_deprecated_string(), anonymous_id_for_user(student, self.course.id))
+            )
+        self.assertEqual(scores[self.students[1].id], {item_id: (2, 2)})
+
     ################################# Helpers #################################
     def _gradesets_and_errors_for(self, course_id, students):
         """Simple helper method to iterate through student grades and give us
@@ -468,6 +511,132 @@ class TestGetModuleScore(LoginEnrollmentTestCase, SharedModuleStoreTestCase):
         self.assertEqual(score, 1.0)
 
 
+@attr('shard_1')
+@patch.dict('django.conf.settings.FEATURES', {'ENABLE_PERSISTENT_GRADES': True})
+class TestPersistentGrades(LoginEnrollmentTestCase, SharedModuleStoreTestCase):
+    """
+    Test that course grades are stored and served until they become stale.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super(TestPersistentGrades, cls).setUpClass()
+        cls.course = CourseFactory.create()
+        chapter = ItemFactory.create(parent=cls.course, category='chapter')
+        sequential = ItemFactory.create(parent=chapter, category='sequential', graded=True, format='Homework')
+        vertical = ItemFactory.create(parent=sequential, category='vertical')
+        cls.problem = ItemFactory.create(
+            parent=vertical,
+            category='problem',
+            data=MultipleChoiceResponseXMLFactory().build_xml(
+                question_text='The correct answer is Choice 3',
+                choices=[False, False, True, False],
+                choice_names=['choice_0', 'choice_1', 'choice_2', 'choice_3']
+            ),
+        )
+
+    def setUp(self):
+        super(TestPersistentGrades, self).setUp()
+        self.request = get_request_for_user(UserFactory())
+        self.student = self.request.user
+        CourseEnrollment.enroll(self.student, self.course.id)
+
+    def _grade(self, computed):
+        """
+        Grades the student, asserting whether the grade had to be computed.
+        """
+        with patch('courseware.grades._grade', wraps=grades._grade) as mock_grade:
+            grade_summary = grade(self.student, self.course)
+        self.assertEqual(mock_grade.called, computed)
+        return grade_summary
+
+    def test_grade_stored(self):
+        computed_grade = self._grade(computed=True)
+        self.assertTrue(PersistentCourseGrade.objects.filter(user=self.student, course_id=self.course.id).exists())
+        persisted_grade = self._grade(computed=False)
+        self.assertEqual(persisted_grade['percent'], computed_grade['percent'])
+        self.assertEqual(persisted_grade['section_breakdown'], computed_grade['section_breakdown'])
+        self.assertEqual(persisted_grade['totaled_scores'], computed_grade['totaled_scores'])
+
+    def test_fetching_creates_no_grade(self):
+        other_student = UserFactory()
+        with self.assertNumQueries(1):
+            persisted_grades = grades._get_persisted_grades(  # pylint: disable=protected-access
+                [self.student.id, other_student.id], self.course.id
+            )
+        self.assertEqual(set(persisted_grades), {self.student.id, other_student.id})
+        self.assertFalse(PersistentCourseGrade.objects.filter(course_id=self.course.id).exists())
+
+    def test_score_change(self):
+        self.assertEqual(self._grade(computed=True)['percent'], 0)
+        answer_problem(self.course, self.request, self.problem)
+        self.assertGreater(self._grade(computed=True)['percent'], 0)
+        self._grade(computed=False)
+
+    def test_grading_policy_change(self):
+        self._grade(computed=True)
+        PersistentCourseGrade.objects.filter(user=self.student).update(grading_policy_hash='outdated')
+        self._grade(computed=True)
+
+    def test_content_release(self):
+        self._grade(computed=True)
+        PersistentCourseGrade.objects.filter(user=self.student).update(
+            valid_until=datetime.now(UTC) - timedelta(minutes=1)
+        )
+        self._grade(computed=True)
+
+    def test_beta_tester_added(self):
+        self._grade(computed=True)
+        CourseBetaTesterRole(self.course.id).add_users(self.student)
+        self._grade(computed=True)
+        self._grade(computed=False)
+
+    def test_invalidated_while_computed(self):
+        def grade_and_invalidate(student, course, *args):
+            """
+            Computes the grade, while the student's score changes.
+            """
+            grade_summary = grades._grade(student, course, *args)  # pylint: disable=protected-access
+            PersistentCourseGrade.invalidate(student.id, course.id)
+            return grade_summary
+
+        with patch('courseware.grades._grade', side_effect=grade_and_invalidate):
+            grade(self.student, self.course)
+        self._grade(computed=True)
+        self._grade(computed=False)
+
+    def test_invalidated_while_iterating(self):
+        create_for_users = ScoresClient.create_for_users
+
+        def create_and_invalidate(course_id, user_ids, scorable_locations):
+            """
+            Fetches the scores of the students, then changes them.
+            """
+            scores_clients = create_for_users(course_id, user_ids, scorable_locations)
+            for user_id in user_ids:
+                PersistentCourseGrade.invalidate(user_id, course_id)
+            return scores_clients
+
+        with patch('courseware.grades.ScoresClient.create_for_users', side_effect=create_and_invalidate):
+            list(iterate_grades_for(self.course.id, [self.student]))
+        self._grade(computed=True)
+
+    def test_raw_scores_not_stored(self):
+        grade(self.student, self.course, keep_raw_scores=True)
+        self.assertFalse(PersistentCourseGrade.objects.filter(user=self.student).exists())
+
+    @patch.dict('django.conf.settings.FEATURES', {'ENABLE_PERSISTENT_GRADES': False})
+    def test_disabled(self):
+        self._grade(computed=True)
+        self._grade(computed=True)
+        self.assertFalse(PersistentCourseGrade.objects.filter(user=self.student).exists())
+
+    def test_invalidated_while_disabled(self):
+        self._grade(computed=True)
+        with patch.dict('django.conf.settings.FEATURES', {'ENABLE_PERSISTENT_GRADES': False}):
+            answer_problem(self.course, self.request, self.problem)
+        self.assertGreater(self._grade(computed=True)['percent'], 0)
+
+
 def answer_problem(course, request, problem, score=1):
     """
     Records a correct answer for the given problem.
@@ -6,7 +6,7 @@ from mock import Mock, patch
 from nose.plugins.attrib import attr
 from functools import partial
 
-from courseware.model_data import DjangoKeyValueStore, FieldDataCache, InvalidScopeError
+from courseware.model_data import DjangoKeyValueStore, FieldDataCache, InvalidScopeError, MultiUserStateCache
 from courseware.models import StudentModule, XModuleUserStateSummaryField
 from courseware.models import XModuleStudentInfoField, XModuleStudentPrefsField
 
@@ -426,3 +426,56 @@ class TestStudentInfoStorage(OtherUserFailureTestMixin, StorageTestBase, TestCas
     storage_class = XModuleStudentInfoField
     other_key_factory = partial(DjangoKeyValueStore.Key, Scope.user_info, 2, 'mock_problem')  # user_id=2, not 1
     existing_field_name = "existing_field"
+
+
+@attr('shard_1')
+class TestMultiUserStateCache(TestCase):
+    """Tests for loading the user_state of several users at once with MultiUserStateCache"""
+    # Tell Django to clean out all databases, not just default
+    multi_db = True
+
+    def setUp(self):
+        super(TestMultiUserStateCache, self).setUp()
+        self.users = [
+            StudentModuleFactory(state=json.dumps({'a_field': 'value_{}'.format(idx)})).student
+            for idx in range(3)
+        ]
+        self.descriptor = mock_descriptor([mock_field(Scope.user_state, 'a_field')])
+
+    def _kvs_key(self, user):
+        """Returns the key of the a_field user_state field of the given user."""
+        return DjangoKeyValueStore.Key(Scope.user_state, user.id, location('usage_id'), 'a_field')
+
+    def test_prefetched_state(self):
+        # One query for the users, and one for all of their StudentModules
+        with self.assertNumQueries(2):
+            prefetched_state = MultiUserStateCache(self.users, [location('usage_id')])
+
+        for idx, user in enumerate(self.users):
+            with self.assertNumQueries(0):
+                field_data_cache = FieldDataCache(
+                    [self.descriptor], course_id, user, prefetched_state=prefetched_state
+                )
+                self.assertEquals('value_{}'.format(idx), field_data_cache.get(self._kvs_key(user)))
+
+    def test_user_without_state(self):
+        user = UserFactory.create()
+        prefetched_state = MultiUserStateCache(self.users + [user], [location('usage_id')])
+        with self.assertNumQueries(0):
+            field_data_cache = FieldDataCache([self.descriptor], course_id, user, prefetched_state=prefetched_state)
+            self.assertRaises(KeyError, field_data_cache.get, self._kvs_key(user))
+
+    def test_get_modified(self):
+        prefetched_state = MultiUserStateCache(self.users, [location('usage_id')])
+        student_module = StudentModule.objects.get(student=self.users[0])
+        self.assertEquals(student_module.modified, prefetched_state.get_modified(self.users[0], location('usage_id')))
+        self.assertIsNone(prefetched_state.get_modified(UserFactory.create(), location('usage_id')))
+
+    def test_blocks_not_prefetched(self):
+        prefetched_state = MultiUserStateCache(self.users, [])
+        # The state of blocks that weren't prefetched is loaded as usual
+        with self.assertNumQueries(1):
+            field_data_cache = FieldDataCache(
+                [self.descriptor], course_id, self.users[0], prefetched_state=prefetched_state
+            )
+        self.assertEquals('value_0', field_data_cache.get(self._kvs_key(self.users[0])))
@@ -1144,6 +1144,97 @@ class TestAnswerDistributions(TestSubmittingProblems):
                 }
             )
 
+    def test_chunked_counts_are_merged(self):
+        self.submit_question_answer('p1', {'2_1': u'Correct'})
+        self.submit_question_answer('p2', {'2_1': u'Incorrect'})
+
+        # Make the above submissions owned by user2
+        user2 = UserFactory.create()
+        StudentModule.objects.filter(
+            course_id=self.course.id,
+            student=self.student_user
+        ).update(student=user2)
+
+        self.submit_question_answer('p1', {'2_1': u'Correct'})
+        self.submit_question_answer('p2', {'2_1': u'Correct'})
+
+        # Count each StudentModule row in its own chunk
+        self.assertEqual(
+            grades.answer_distributions(self.course.id, chunk_size=1),
+            {
+                ('p1', 'p1', '{}_2_1'.format(self.p1_html_id)): {
+                    'Correct': 2
+                },
+                ('p2', 'p2', '{}_2_1'.format(self.p2_html_id)): {
+                    'Correct': 1,
+                    'Incorrect': 1
+                },
+            }
+        )
+
+    def _submit_answers_of_other_students(self, answers):
+        """
+        Copy the student's submission to p1 for another student per answer
+        in `answers`, with that answer.
+        """
+        student_module = StudentModule.objects.get(
+            course_id=self.course.id,
+            student=self.student_user
+        )
+        for answer in answers:
+            student_module.pk = None
+            student_module.student = UserFactory.create()
+            state = json.loads(student_module.state)
+            state["student_answers"]['{}_2_1'.format(self.p1_html_id)] = answer
+            student_module.state = json.dumps(state)
+            student_module.save()
+
+    def test_max_answers_per_part(self):
+        self.submit_question_answer('p1', {'2_1': u'Correct'})
+        self._submit_answers_of_other_students(['Incorrect', 'Also incorrect', 'Incorrect'])
+
+        distributions = grades.answer_distributions(self.course.id, chunk_size=1, max_answers_per_part=1)
+        self.assertEqual(
+            distributions,
+            {
+                ('p1', 'p1', '{}_2_1'.format(self.p1_html_id)): {
+                    'Incorrect': 2,
+                    grades.ANSWER_DISTRIBUTION_OTHER: 2,
+                },
+            }
+        )
+
+    def test_max_answers_per_part_keeps_most_frequent(self):
+        self.submit_question_answer('p1', {'2_1': u'Correct'})
+        self._submit_answers_of_other_students(['Other'] + ['Incorrect'] * 3 + ['Correct'] * 4)
+
+        # Chunks of more than one row hold several distinct answers.
+        for chunk_size in (1, 2, 4, grades.ANSWER_DISTRIBUTION_CHUNK_SIZE):
+            distributions = grades.answer_distributions(
+                self.course.id, chunk_size=chunk_size, max_answers_per_part=2
+            )
+            self.assertEqual(
+                distributions,
+                {
+                    ('p1', 'p1', '{}_2_1'.format(self.p1_html_id)): {
+                        'Correct': 5,
+                        'Incorrect': 3,
+                        grades.ANSWER_DISTRIBUTION_OTHER: 1,
+                    },
+                }
+            )
+
+    def test_decode_student_answers(self):
+        state = json.dumps({
+            'correct_map': {'p1_2_1': {'msg': u'"student_answers": {"p1_2_1": "Wrong"}'}},
+            'student_answers': {'p1_2_1': u'"Quoted" ⓤⓝⓘⓒⓞⓓⓔ'},
+            'seed': 1,
+        })
+        self.assertEqual(grades._decode_student_answers(state), {'p1_2_1': u'"Quoted" ⓤⓝⓘⓒⓞⓓⓔ'})  # pylint: disable=protected-access
+        self.assertEqual(grades._decode_student_answers('{"seed": 1}'), {})  # pylint: disable=protected-access
+        with self.assertRaises(ValueError):
+            grades._decode_student_answers('invalid json!')  # pylint: disable=protected-access
+
 
 @attr('shard_1')
 class TestConditionalContent(TestSubmittingProblems):
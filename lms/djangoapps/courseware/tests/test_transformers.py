@@ -3,6 +3,7 @@ Test the behavior of the GradesTransformer
 """
 
 import datetime
+from mock import patch
 import pytz
 import random
 
@@ -196,6 +197,50 @@ class GradesTransformerTestCase(CourseStructureTestCase):
             max_score=2,
         )
 
+    def test_max_score_collected_without_binding_problems(self):
+        problem_data = u'''
+            <problem>
+                <stringresponse answer="two">
+                    <textline label="1+1 in words" points="2" />
+                </stringresponse>
+            </problem>
+        '''
+
+        blocks = self.build_course_with_problems(problem_data)
+        get_cache().clear()
+        with patch('courseware.module_render.get_module_for_descriptor') as mock_get_module:
+            block_structure = get_course_blocks(self.student, blocks[u'course'].location, self.transformers)
+
+        self.assertFalse(mock_get_module.called)
+        self.assert_collected_transformer_block_fields(
+            block_structure,
+            blocks[u'problem'].location,
+            self.TRANSFORMER_CLASS_TO_TEST,
+            max_score=2,
+        )
+
+    def test_max_score_falls_back_to_bound_module(self):
+        problem_data = u'''
+            <problem>
+                <include file="elsewhere.xml" />
+            </problem>
+        '''
+
+        blocks = self.build_course_with_problems(problem_data)
+        get_cache().clear()
+        with patch('courseware.module_render.get_module_for_descriptor') as mock_get_module:
+            mock_get_module.return_value.location = blocks[u'problem'].location
+            mock_get_module.return_value.max_score.return_value = 5
+            block_structure = get_course_blocks(self.student, blocks[u'course'].location, self.transformers)
+
+        self.assertEqual(mock_get_module.call_count, 1)
+        self.assert_collected_transformer_block_fields(
+            block_structure,
+            blocks[u'problem'].location,
+            self.TRANSFORMER_CLASS_TO_TEST,
+            max_score=5,
+        )
+
 
 class MultiProblemModulestoreAccessTestCase(CourseStructureTestCase, SharedModuleStoreTestCase):
     """
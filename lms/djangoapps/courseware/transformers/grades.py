@@ -48,7 +48,24 @@ class GradesTransformer(BlockStructureTransformer):
         transformer's transform method.
         """
         block_structure.request_xblock_fields(*cls.FIELDS_TO_COLLECT)
-        cls._collect_max_scores(block_structure)
+        cls._collect_max_scores(block_structure, block_structure.post_order_traversal())
+
+    @classmethod
+    def collect_incremental(cls, block_structure, changed_usage_keys):
+        """
+        The max score of a block only depends on the block itself, so it
+        is recollected for the blocks in the reloaded subtrees.
+        """
+        block_structure.request_xblock_fields(*cls.FIELDS_TO_COLLECT)
+        cls._collect_max_scores(
+            block_structure,
+            (
+                block_locator
+                for usage_key in changed_usage_keys
+                for block_locator in block_structure.post_order_traversal(start_node=usage_key)
+            ),
+        )
+        return True
 
     def transform(self, block_structure, usage_context):
         """
@@ -57,13 +74,39 @@ class GradesTransformer(BlockStructureTransformer):
         pass
 
     @classmethod
-    def _collect_max_scores(cls, block_structure):
+    def _collect_max_scores(cls, block_structure, block_locators):
         """
-        Collect the `max_score` for every block in the provided `block_structure`.
+        Collect the `max_score` for the given blocks in the provided `block_structure`.
+
+        Blocks that can compute their max score statically from their
+        definition (e.g. capa problems) are not bound to a user; only the
+        remaining scorable blocks go through `_iter_scorable_xmodules`.
         """
-        for module in cls._iter_scorable_xmodules(block_structure):
+        blocks_to_bind = []
+        for block_locator in block_locators:
+            block = block_structure.get_xblock(block_locator)
+            if not getattr(block, 'has_score', False):
+                continue
+            score = cls._get_static_max_score(block)
+            if score is None:
+                blocks_to_bind.append(block)
+            else:
+                block_structure.set_transformer_block_field(block.location, cls, 'max_score', score)
+
+        for module in cls._iter_scorable_xmodules(block_structure, blocks_to_bind):
             cls._collect_max_score(block_structure, module)
 
+    @staticmethod
+    def _get_static_max_score(block):
+        """
+        Return the max score of the given block if it can be computed without
+        binding it to a user, otherwise None.
+        """
+        static_max_score = getattr(block, 'static_max_score', None)
+        if callable(static_max_score):
+            return static_max_score()
+        return None
+
     @classmethod
     def _collect_max_score(cls, block_structure, module):
         """
@@ -74,29 +117,22 @@ class GradesTransformer(BlockStructureTransformer):
         block_structure.set_transformer_block_field(module.location, cls, 'max_score', score)
 
     @staticmethod
-    def _iter_scorable_xmodules(block_structure):
+    def _iter_scorable_xmodules(block_structure, blocks):
         """
-        Loop through all the blocks locators in the block structure, and retrieve
-        the module (XModule or XBlock) associated with that locator.
+        Loop through the given scorable blocks from the block structure, and
+        retrieve the module (XModule or XBlock) associated with each of them.
 
         For implementation reasons, we need to pull the max_score from the
         XModule, even though the data is not user specific.  Here we bind the
         data to a SystemUser.
         """
+        if not blocks:
+            return
         request = RequestFactory().get('/dummy-collect-max-grades')
         user = SystemUser()
         request.user = user
         request.session = {}
-        root_block = block_structure.get_xblock(block_structure.root_block_usage_key)
         course_key = block_structure.root_block_usage_key.course_key
-        cache = FieldDataCache.cache_for_descriptor_descendents(
-            course_id=course_key,
-            user=request.user,
-            descriptor=root_block,
-            descriptor_filter=lambda descriptor: descriptor.has_score,
-        )
-        for block_locator in block_structure.post_order_traversal():
-            block = block_structure.get_xblock(block_locator)
-            if getattr(block, 'has_score', False):
-                module = module_render.get_module_for_descriptor(user, request, block, cache, course_key)
-                yield module
+        cache = FieldDataCache(blocks, course_key, request.user)
+        for block in blocks:
+            yield module_render.get_module_for_descriptor(user, request, block, cache, course_key)
@@ -95,6 +95,42 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
                 usage_key = student_module.module_state_key.map_into_course(student_module.course_id)
                 yield (student_module, usage_key)
 
+    def _get_student_modules_for_users(self, usernames, block_keys):
+        """
+        Retrieve the :class:`~StudentModule`s for all of the supplied ``usernames``
+        and ``block_keys``, with a single (chunked) query per course.
+
+        Arguments:
+            usernames (list of str): The names of the users to load `StudentModule`s for.
+            block_keys (list of :class:`~UsageKey`): The set of XBlocks to load data for.
+
+        Yields:
+            (username, student_module, usage_key) tuples.
+        """
+        usernames_by_id = dict(
+            User.objects.filter(username__in=usernames).values_list('id', 'username')
+        )
+        if not usernames_by_id:
+            return
+
+        course_key_func = attrgetter('course_key')
+        by_course = itertools.groupby(
+            sorted(block_keys, key=course_key_func),
+            course_key_func,
+        )
+
+        for course_key, usage_keys in by_course:
+            query = StudentModule.objects.chunked_filter(
+                'module_state_key__in',
+                usage_keys,
+                student_id__in=usernames_by_id.keys(),
+                course_id=course_key,
+            )
+
+            for student_module in query:
+                usage_key = student_module.module_state_key.map_into_course(student_module.course_id)
+                yield (usernames_by_id[student_module.student_id], student_module, usage_key)
+
     def _ddog_increment(self, evt_time, evt_name):
         """
         DataDog increment method.
@@ -169,6 +205,51 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
         self._ddog_histogram(evt_time, 'get_many.blks_out', block_count)
         self._ddog_histogram(evt_time, 'get_many.response_time', (finish_time - evt_time) * 1000)
 
+    def get_many_for_users(self, usernames, block_keys, scope=Scope.user_state, fields=None):
+        """
+        Retrieve the stored XBlock state of all of the specified users for the
+        specified XBlock usages.  This loads the state of all of the users at
+        once, so it should be used instead of calling `get_many` for each user
+        when processing a batch of users (e.g. when grading or rescoring).
+
+        Arguments:
+            usernames: The names of the users whose state should be retrieved
+            block_keys ([UsageKey]): A list of UsageKeys identifying which xblock states to load.
+            scope (Scope): The scope to load data from
+            fields: A list of field values to retrieve. If None, retrieve all stored fields.
+
+        Yields:
+            XBlockUserState tuples for each specified user and UsageKey in block_keys
+            that has stored state.
+        """
+        if scope != Scope.user_state:
+            raise ValueError("Only Scope.user_state is supported, not {}".format(scope))
+
+        evt_time = time()
+        self._ddog_histogram(evt_time, 'get_many_for_users.users_requested', len(usernames))
+        self._ddog_histogram(evt_time, 'get_many_for_users.blks_requested', len(block_keys))
+
+        modules = self._get_student_modules_for_users(usernames, block_keys)
+        for username, module, usage_key in modules:
+            if module.state is None:
+                continue
+
+            state = json.loads(module.state)
+
+            # As in get_many, state that is the empty dict has been deleted.
+            if state == {}:
+                continue
+
+            if fields is not None:
+                state = {
+                    field: state[field]
+                    for field in fields
+                    if field in state
+                }
+            yield XBlockUserState(username, usage_key, state, module.modified, scope)
+
+        self._ddog_histogram(evt_time, 'get_many_for_users.response_time', (time() - evt_time) * 1000)
+
     def set_many(self, username, block_keys_to_state, scope=Scope.user_state):
         """
         Set fields for a particular XBlock.
@@ -46,7 +46,8 @@ from django_comment_client.utils import get_accessible_discussion_xblocks, is_co
 from lms.djangoapps.discussion_api.pagination import DiscussionAPIPagination
 from lms.lib.comment_client.comment import Comment
 from lms.lib.comment_client.thread import Thread
-from lms.lib.comment_client.utils import CommentClientRequestError
+from lms.lib.comment_client.user import User as CommentClientUser
+from lms.lib.comment_client.utils import CommentClientRequestError, perform_concurrent_requests
 from openedx.core.djangoapps.course_groups.cohorts import get_cohort_id
 from openedx.core.lib.exceptions import CourseNotFoundError, PageNotFoundError, DiscussionNotFoundError
 
@@ -98,10 +99,16 @@ def _get_thread_and_context(request, thread_id, retrieve_kwargs=None):
     try:
         if "mark_as_read" not in retrieve_kwargs:
             retrieve_kwargs["mark_as_read"] = False
-        cc_thread = Thread(id=thread_id).retrieve(**retrieve_kwargs)
+        cc_thread = Thread(id=thread_id)
+        cc_requester = CommentClientUser.from_django_user(request.user)
+        perform_concurrent_requests([
+            lambda: cc_thread.retrieve(**retrieve_kwargs),
+            cc_requester.retrieve,
+        ])
         course_key = CourseKey.from_string(cc_thread["course_id"])
         course = _get_course(course_key, request.user)
-        context = get_context(course, request, cc_thread)
+        cc_requester["course_id"] = course.id
+        context = get_context(course, request, cc_thread, cc_requester=cc_requester)
         if (
                 not context["is_requester_privileged"] and
                 cc_thread["group_id"] and
@@ -525,7 +532,10 @@ def get_thread_list(
         })
 
     course = _get_course(course_key, request.user)
-    context = get_context(course, request)
+    # The requester is retrieved concurrently with the threads below, and
+    # its course_id is only set once it has been retrieved.
+    cc_requester = CommentClientUser.from_django_user(request.user)
+    context = get_context(course, request, cc_requester=cc_requester)
 
     query_params = {
         "user_id": unicode(request.user.id),
@@ -551,12 +561,16 @@ def get_thread_list(
             })
 
     if following:
-        paginated_results = context["cc_requester"].subscribed_threads(query_params)
+        cc_subscriber = CommentClientUser.from_django_user(request.user)
+        cc_subscriber["course_id"] = course.id
+        get_threads = lambda: cc_subscriber.subscribed_threads(query_params)
     else:
         query_params["course_id"] = unicode(course.id)
         query_params["commentable_ids"] = ",".join(topic_id_list) if topic_id_list else None
         query_params["text"] = text_search
-        paginated_results = Thread.search(query_params)
+        get_threads = lambda: Thread.search(query_params)
+    __, paginated_results = perform_concurrent_requests([cc_requester.retrieve, get_threads])
+    cc_requester["course_id"] = course.id
     # The comments service returns the last page of results if the requested
     # page is beyond the last page, but we want be consistent with DRF's general
     # behavior and return a PageNotFoundError in that case
@@ -30,10 +30,16 @@ from lms.lib.comment_client.utils import CommentClientRequestError
 from openedx.core.djangoapps.course_groups.cohorts import get_cohort_names
 
 
-def get_context(course, request, thread=None):
+def get_context(course, request, thread=None, cc_requester=None):
     """
     Returns a context appropriate for use with ThreadSerializer or
     (if thread is provided) CommentSerializer.
+
+    If cc_requester (the requester's comment client User) is provided, the
+    caller is responsible for retrieving it, e.g. concurrently with other
+    comments service requests, and for then setting its course_id.  It must
+    not be retrieved after its course_id is set, since retrieving it with a
+    course_id returns different data.
     """
     # TODO: cache staff_user_ids and ta_user_ids if we need to improve perf
     staff_user_ids = {
@@ -50,8 +56,9 @@ def get_context(course, request, thread=None):
         for user in role.users.all()
     }
     requester = request.user
-    cc_requester = CommentClientUser.from_django_user(requester).retrieve()
-    cc_requester["course_id"] = course.id
+    if cc_requester is None:
+        cc_requester = CommentClientUser.from_django_user(requester).retrieve()
+        cc_requester["course_id"] = course.id
     return {
         "course": course,
         "request": request,
@@ -14,6 +14,7 @@ from pytz import UTC
 
 from django.core.exceptions import ValidationError
 from django.test.client import RequestFactory
+from django.test.utils import override_settings
 
 from rest_framework.exceptions import PermissionDenied
 
@@ -883,6 +884,32 @@ class GetThreadListTest(CommentsServiceMockMixin, UrlResetMixin, SharedModuleSto
             urlparse(httpretty.last_request().path).path,
             "/api/v1/users/{}/subscribed_threads".format(self.user.id)
         )
+
+    @ddt.data(False, True)
+    @override_settings(COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS=4)
+    def test_concurrent_requests(self, following):
+        thread = make_minimal_cs_thread({
+            "id": "test_thread",
+            "course_id": unicode(self.course.id),
+            "commentable_id": "topic_x",
+            "user_id": str(self.author.id),
+            "username": self.author.username,
+        })
+        if following:
+            self.register_subscribed_threads_response(self.user, [thread], page=1, num_pages=1)
+        else:
+            self.register_get_threads_response([thread], page=1, num_pages=1)
+        result = get_thread_list(self.request, self.course.id, page=1, page_size=10, following=following).data
+        self.assertEqual([result_thread["id"] for result_thread in result["results"]], ["test_thread"])
+
+        # The requester is retrieved, concurrently with the threads, before
+        # its course_id is set.
+        user_requests = [
+            request for request in httpretty.httpretty.latest_requests
+            if urlparse(request.path).path == "/api/v1/users/{}".format(self.user.id)
+        ]
+        self.assertEqual(len(user_requests), 1)
+        self.assertNotIn("course_id", parse_qs(urlparse(user_requests[0].path).query))
         self.assert_last_query_params({
             "user_id": [unicode(self.user.id)],
             "course_id": [unicode(self.course.id)],
@@ -3152,6 +3179,28 @@ class RetrieveThreadTest(
         with self.assertRaises(ThreadNotFoundError):
             get_thread(self.request, "missing_thread")
 
+    @override_settings(COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS=4)
+    def test_concurrent_requests(self):
+        self.register_thread({"resp_total": 2})
+        result = get_thread(self.request, self.thread_id)
+        self.assertEqual(result["id"], self.thread_id)
+        self.assertEqual(result["response_count"], 2)
+
+        # The requester is retrieved, concurrently with the thread, before its
+        # course_id is set.
+        user_requests = [
+            request for request in httpretty.httpretty.latest_requests
+            if urlparse(request.path).path == "/api/v1/users/{}".format(self.thread_author.id)
+        ]
+        self.assertEqual(len(user_requests), 1)
+        self.assertNotIn("course_id", parse_qs(urlparse(user_requests[0].path).query))
+
+    @override_settings(COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS=4)
+    def test_concurrent_requests_thread_not_found(self):
+        self.register_get_thread_error_response("missing_thread", 404)
+        with self.assertRaises(ThreadNotFoundError):
+            get_thread(self.request, "missing_thread")
+
     def test_nonauthor_enrolled_in_course(self):
         expected_response_data = {
             "author": self.thread_author.username,
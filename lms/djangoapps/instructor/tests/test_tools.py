@@ -8,6 +8,7 @@ import json
 import unittest
 
 from django.utils.timezone import utc
+from django.test import TestCase
 from django.test.utils import override_settings
 from nose.plugins.attrib import attr
 
@@ -87,6 +88,33 @@ class TestRequireStudentIdentifier(unittest.TestCase):
             tools.require_student_from_identifier("invalid")
 
 
+@attr('shard_1')
+class TestGetStudentsFromIdentifiers(TestCase):
+    """
+    Test get_students_from_identifiers()
+    """
+    def test_get_students(self):
+        students = [UserFactory.create() for __ in range(3)]
+        identifiers = [students[0].username, students[1].email, " {} ".format(students[2].username), "invalid"]
+
+        with self.assertNumQueries(2):
+            students_by_identifier = tools.get_students_from_identifiers(identifiers)
+
+        self.assertEqual(
+            students_by_identifier,
+            {
+                students[0].username: students[0],
+                students[1].email: students[1],
+                students[2].username: students[2],
+            }
+        )
+
+    def test_ambiguous_email(self):
+        student = UserFactory.create()
+        UserFactory.create(email=student.email)
+        self.assertEqual(tools.get_students_from_identifiers([student.email]), {})
+
+
 @attr('shard_1')
 class TestParseDatetime(unittest.TestCase):
     """
@@ -246,6 +274,18 @@ class TestSetDueDateExtension(ModuleStoreTestCase):
             tools.set_due_date_extension(self.course, self.week1, self.user, extended)
             self._clear_field_data_cache()
 
+    def test_due_date_extensions_loaded_once(self):
+        extended = datetime.datetime(2013, 12, 25, 0, 0, tzinfo=utc)
+        tools.set_due_date_extension(self.course, self.week1, self.user, extended)
+        tools.set_due_date_extension(self.course, self.assignment, self.user, extended)
+        self._clear_field_data_cache()
+        # All of the user's overrides in the course come from a single query.
+        with self.assertNumQueries(1):
+            self.assertEqual(self.week1.due, extended)
+            self.assertEqual(self.homework.due, extended)
+            self.assertEqual(self.assignment.due, extended)
+            self.assertEqual(self.week2.due, self.due)
+
     def test_set_due_date_extension_invalid_date(self):
         extended = datetime.datetime(2009, 1, 1, 0, 0, tzinfo=utc)
         with self.assertRaises(tools.DashboardError):
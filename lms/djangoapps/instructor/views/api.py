@@ -29,7 +29,7 @@ import random
 import unicodecsv
 import decimal
 from student import auth
-from student.roles import GlobalStaff, CourseSalesAdminRole, CourseFinanceAdminRole
+from student.roles import GlobalStaff, CourseSalesAdminRole, CourseFinanceAdminRole, RoleCache
 from util.file import (
     store_uploaded_file, course_and_time_based_filename_generator,
     FileValidationException, UniversalNewlineIterator
@@ -100,6 +100,7 @@ from .tools import (
     dump_module_extensions,
     find_unit,
     get_student_from_identifier,
+    get_students_from_identifiers,
     require_student_from_identifier,
     handle_dashboard_error,
     parse_datetime,
@@ -766,11 +767,17 @@ def bulk_beta_modify_access(request, course_id):
         secure = request.is_secure()
         email_params = get_email_params(course, auto_enroll=auto_enroll, secure=secure)
 
+    # Look up the users and their current roles in bulk rather than one by one.
+    users_by_identifier = get_students_from_identifiers(identifiers)
+    RoleCache.prefetch(users_by_identifier.values())
+
     for identifier in identifiers:
         try:
             error = False
             user_does_not_exist = False
-            user = get_student_from_identifier(identifier)
+            user = users_by_identifier.get(strip_if_string(identifier))
+            if user is None:
+                user = get_student_from_identifier(identifier)
 
             if action == 'add':
                 allow_access(course, user, rolename)
@@ -1,6 +1,7 @@
 """
 Tools for the instructor dashboard
 """
+from collections import defaultdict
 import dateutil
 import json
 
@@ -77,6 +78,33 @@ def get_student_from_identifier(unique_student_identifier):
     return student
 
 
+def get_students_from_identifiers(unique_student_identifiers):
+    """
+    Gets the student objects for a list of email addresses and/or usernames,
+    with at most one query for each kind of identifier.
+
+    Returns a dict mapping each (stripped) identifier that matches exactly one
+    student to that student; other identifiers are left out, and can be
+    looked up with get_student_from_identifier to get its error.
+    """
+    identifiers = [strip_if_string(identifier) for identifier in unique_student_identifiers]
+    emails = [identifier for identifier in identifiers if "@" in identifier]
+    usernames = [identifier for identifier in identifiers if "@" not in identifier]
+
+    matches = defaultdict(list)
+    if emails:
+        for student in User.objects.filter(email__in=emails):
+            matches[student.email].append(student)
+    if usernames:
+        for student in User.objects.filter(username__in=usernames):
+            matches[student.username].append(student)
+    return {
+        identifier: students[0]
+        for identifier, students in matches.iteritems()
+        if len(students) == 1
+    }
+
+
 def require_student_from_identifier(unique_student_identifier):
     """
     Same as get_student_from_identifier() but will raise a DashboardError if
@@ -43,6 +43,10 @@ SALE_ORDER_FEATURES = ('id', 'company_name', 'company_contact_name', 'company_co
                        'bill_to_country', 'order_type', 'created')
 
 AVAILABLE_FEATURES = STUDENT_FEATURES + PROFILE_FEATURES
+
+# Number of enrolled students fetched per query when streaming student features.
+ENROLLED_STUDENTS_CHUNK_SIZE = 1000
+
 COURSE_REGISTRATION_FEATURES = ('code', 'course_id', 'created_by', 'created_at', 'is_valid')
 COUPON_FEATURES = ('code', 'course_id', 'percentage_discount', 'description', 'expiration_date', 'is_active')
 CERTIFICATE_FEATURES = ('course_id', 'mode', 'status', 'grade', 'created_date', 'is_active', 'error_reason')
@@ -211,6 +215,16 @@ def enrolled_students_features(course_key, features):
         {'username': 'username3', 'first_name': 'firstname3'}
     ]
     """
+    return list(iter_enrolled_students_features(course_key, features))
+
+
+def iter_enrolled_students_features(course_key, features, chunk_size=ENROLLED_STUDENTS_CHUNK_SIZE):
+    """
+    Return a generator of the student features dictionaries returned by
+    enrolled_students_features, which fetches the students (and their
+    prefetched cohorts and teams) in chunks of `chunk_size` students, so that
+    they are never all in memory.
+    """
     include_cohort_column = 'cohort' in features
     include_team_column = 'team' in features
 
@@ -277,15 +291,23 @@ def enrolled_students_features(course_key, features):
             )
         return student_dict
 
-    return [extract_student(student, features) for student in students]
+    last_username = None
+    while True:
+        chunk = students if last_username is None else students.filter(username__gt=last_username)
+        chunk = list(chunk[:chunk_size])
+        for student in chunk:
+            yield extract_student(student, features)
+        if len(chunk) < chunk_size:
+            break
+        last_username = chunk[-1].username
 
 
 def list_may_enroll(course_key, features):
     """
-    Return info about students who may enroll in a course as a dict.
+    Yield info about students who may enroll in a course as dicts.
 
     list_may_enroll(course_key, ['email'])
-    would return [
+    would yield [
         {'email': 'email1'}
         {'email': 'email2'}
         {'email': 'email3'}
@@ -302,12 +324,13 @@ def list_may_enroll(course_key, features):
         """
         return dict((feature, getattr(student, feature)) for feature in features)
 
-    return [extract_student(student, features) for student in may_enroll_and_unenrolled]
+    for student in may_enroll_and_unenrolled.iterator():
+        yield extract_student(student, features)
 
 
 def get_proctored_exam_results(course_key, features):
     """
-    Return info about proctored exam results in a course as a dict.
+    Yield info about proctored exam results in a course as dicts.
     """
     def extract_student(exam_attempt, features):
         """
@@ -321,8 +344,8 @@ def get_proctored_exam_results(course_key, features):
 
         return proctored_exam
 
-    exam_attempts = get_all_exam_attempts(course_key)
-    return [extract_student(exam_attempt, features) for exam_attempt in exam_attempts]
+    for exam_attempt in get_all_exam_attempts(course_key):
+        yield extract_student(exam_attempt, features)
 
 
 def coupon_codes_features(features, coupons_list, course_id):
@@ -380,11 +403,11 @@ def coupon_codes_features(features, coupons_list, course_id):
 
 def list_problem_responses(course_key, problem_location):
     """
-    Return responses to a given problem as a dict.
+    Yield responses to a given problem as dicts.
 
     list_problem_responses(course_key, problem_location)
 
-    would return [
+    would yield [
         {'username': u'user1', 'state': u'...'},
         {'username': u'user2', 'state': u'...'},
         {'username': u'user3', 'state': u'...'},
@@ -399,18 +422,16 @@ def list_problem_responses(course_key, problem_location):
     if not run:
         problem_key = course_key.make_usage_key_from_deprecated_string(problem_location)
     if problem_key.course_key != course_key:
-        return []
+        return
 
     smdat = StudentModule.objects.filter(
         course_id=course_key,
         module_state_key=problem_key
     )
-    smdat = smdat.order_by('student')
+    smdat = smdat.order_by('student').select_related('student')
 
-    return [
-        {'username': response.student.username, 'state': response.state}
-        for response in smdat
-    ]
+    for response in smdat.iterator():
+        yield {'username': response.student.username, 'state': response.state}
 
 
 def course_registration_features(features, registration_codes, csv_type):
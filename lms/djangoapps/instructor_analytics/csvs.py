@@ -70,19 +70,28 @@ def format_dictlist(dictlist, features):
     }
     """
 
-    def dict_to_entry(dct):
-        """ Convert dictionary to a list for a csv row """
-        relevant_items = [(k, v) for (k, v) in dct.items() if k in features]
-        ordered = sorted(relevant_items, key=lambda (k, v): header.index(k))
-        vals = [v for (_, v) in ordered]
-        return vals
-
     header = features
-    datarows = map(dict_to_entry, dictlist)
+    datarows = list(format_dictlist_rows(dictlist, features))
 
     return header, datarows
 
 
+def format_dictlist_rows(dicts, features):
+    """
+    Lazily convert an iterable of dictionaries to datarows, as
+    format_dictlist does.
+
+    `dicts` is an iterable (e.g. a generator) of dictionaries
+    `features` is a list of features
+
+    Returns a generator of datarows, which doesn't read all of `dicts` first.
+    """
+    for dct in dicts:
+        relevant_items = [(k, v) for (k, v) in dct.items() if k in features]
+        ordered = sorted(relevant_items, key=lambda (k, v): features.index(k))
+        yield [v for (_, v) in ordered]
+
+
 def format_instances(instances, features):
     """
     Convert a list of instances into a header list and datarows list.
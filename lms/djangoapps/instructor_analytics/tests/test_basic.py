@@ -80,7 +80,9 @@ class TestAnalyticsBasic(ModuleStoreTestCase):
                 patched_manager.filter.return_value = mock_results
 
                 mock_problem_location = ''
-                problem_responses = list_problem_responses(self.course_key, problem_location=mock_problem_location)
+                problem_responses = list(
+                    list_problem_responses(self.course_key, problem_location=mock_problem_location)
+                )
 
                 # Check if list_problem_responses called UsageKey.from_string to look up problem key:
                 patched_from_string.assert_called_once_with(mock_problem_location)
@@ -185,7 +187,7 @@ class TestAnalyticsBasic(ModuleStoreTestCase):
         self.assertEqual(set(AVAILABLE_FEATURES), set(STUDENT_FEATURES + PROFILE_FEATURES))
 
     def test_list_may_enroll(self):
-        may_enroll = list_may_enroll(self.course_key, ['email'])
+        may_enroll = list(list_may_enroll(self.course_key, ['email']))
         self.assertEqual(len(may_enroll), len(self.students_who_may_enroll) - len(self.users))
         email_adresses = [student.email for student in self.students_who_may_enroll]
         for student in may_enroll:
@@ -217,7 +219,7 @@ class TestAnalyticsBasic(ModuleStoreTestCase):
             'Test Code 3', True, False, 'asd'
         )
 
-        proctored_exam_attempts = get_proctored_exam_results(self.course_key, query_features)
+        proctored_exam_attempts = list(get_proctored_exam_results(self.course_key, query_features))
         self.assertEqual(len(proctored_exam_attempts), 3)
         for proctored_exam_attempt in proctored_exam_attempts:
             self.assertEqual(set(proctored_exam_attempt.keys()), set(query_features))
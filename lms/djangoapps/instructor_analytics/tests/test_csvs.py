@@ -3,7 +3,7 @@
 from django.test import TestCase
 from nose.tools import raises
 
-from instructor_analytics.csvs import create_csv_response, format_dictlist, format_instances
+from instructor_analytics.csvs import create_csv_response, format_dictlist, format_dictlist_rows, format_instances
 
 
 class TestAnalyticsCSVS(TestCase):
@@ -71,6 +71,11 @@ class TestAnalyticsFormatDictlist(TestCase):
         self.assertEqual(header, [])
         self.assertEqual(datarows, [])
 
+    def test_format_dictlist_rows_generator(self):
+        dicts = ({'label1': index, 'label2': -index} for index in range(3))
+        datarows = format_dictlist_rows(dicts, ['label2', 'label1'])
+        self.assertEqual(list(datarows), [[0, 0], [-1, 1], [-2, 2]])
+
     def test_create_csv_response(self):
         header = ['Name', 'Email']
         datarows = [['Jim', 'jim@edy.org'], ['Jake', 'jake@edy.org'], ['Jeeves', 'jeeves@edy.org']]
@@ -14,6 +14,7 @@ ASSUMPTIONS: modules have unique IDs, even across different module_types
 """
 from cStringIO import StringIO
 from gzip import GzipFile
+from tempfile import NamedTemporaryFile, TemporaryFile
 from uuid import uuid4
 import csv
 import json
@@ -21,6 +22,7 @@ import hashlib
 import os.path
 import urllib
 
+from boto.exception import S3ResponseError
 from boto.s3.connection import S3Connection
 from boto.s3.key import Key
 
@@ -179,12 +181,84 @@ class InstructorTask(models.Model):
         return json.dumps({'message': 'Task revoked before running'})
 
 
+class ReportRowsWriter(object):
+    """
+    Writes the rows of a CSV file to a ReportStore incrementally, so that the
+    rows of a report never all need to be in memory.
+
+    Rows are spooled to a temporary file as they are written, and the file is
+    only stored in the ReportStore by `commit()`, so any files that are
+    visible in the ReportStore are complete ones.  When used as a context
+    manager, the writer commits on exit, or discards the rows written so far
+    if an exception is raised.
+    """
+    def __init__(self, report_store, course_id, filename):
+        self.report_store = report_store
+        self.course_id = course_id
+        self.filename = filename
+        self.num_rows = 0
+        self._closed = False
+        self._spool = report_store.create_spool()
+        self._output = report_store.wrap_spool(self._spool)
+        self._csv_writer = csv.writer(self._output)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def writerow(self, row):
+        """
+        Write a single row (an iterable of values, which are converted to
+        unicode).
+        """
+        self._csv_writer.writerow([unicode(item).encode('utf-8') for item in row])
+        self.num_rows += 1
+
+    def writerows(self, rows):
+        """
+        Write all of the rows from the given iterable, which may be a
+        generator.
+        """
+        for row in rows:
+            self.writerow(row)
+
+    def commit(self):
+        """
+        Store the rows written so far in the ReportStore.  Does nothing if the
+        writer has already been committed or aborted.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._output is not self._spool:
+            self._output.close()
+        self._spool.flush()
+        self.report_store.store_spool(self.course_id, self.filename, self._spool)
+        self._spool.close()
+
+    def abort(self):
+        """
+        Discard the rows written so far.  Does nothing if the writer has
+        already been committed or aborted.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._spool.close()
+        self.report_store.discard_spool(self._spool)
+
+
 class ReportStore(object):
     """
     Simple abstraction layer that can fetch and store CSV files for reports
-    download. Should probably refactor later to create a ReportFile object that
-    can simply be appended to for the sake of memory efficiency, rather than
-    passing in the whole dataset. Doing that for now just because it's simpler.
+    download. CSV files can be written incrementally with a `ReportRowsWriter`
+    (see `rows_writer()`), so that reports never need to hold all of their
+    rows in memory.
     """
     @classmethod
     def from_config(cls, config_name):
@@ -198,14 +272,57 @@ class ReportStore(object):
         elif storage_type.lower() == "localfs":
             return LocalFSReportStore.from_config(config_name)
 
-    def _get_utf8_encoded_rows(self, rows):
+    def rows_writer(self, course_id, filename):
+        """
+        Return a `ReportRowsWriter` for writing the rows of the CSV file
+        `filename` for the given `course_id`.
+        """
+        return ReportRowsWriter(self, course_id, filename)
+
+    def store_rows(self, course_id, filename, rows):
+        """
+        Given a `course_id`, `filename`, and `rows` (each row is an iterable of
+        strings), write this data out.  `rows` may be a generator, in which
+        case the rows are written as they are generated.
+        """
+        with self.rows_writer(course_id, filename) as writer:
+            writer.writerows(rows)
+
+    def create_spool(self):
+        """
+        Return a new temporary file for a `ReportRowsWriter` to spool rows to.
+        """
+        return TemporaryFile()
+
+    def wrap_spool(self, spool):
+        """
+        Return the file-like object that a `ReportRowsWriter` should write
+        CSV data to, for it to be written to the given spool.
+        """
+        return spool
+
+    def store_spool(self, course_id, filename, spool):
+        """
+        Store the contents of the given spool as the file `filename` for the
+        given `course_id`.  By default, they are read into memory and passed
+        to `store()`; subclasses can store them without doing so.
+        """
+        spool.seek(0)
+        self.store(course_id, filename, StringIO(spool.read()))
+
+    def discard_spool(self, spool):
+        """
+        Clean up after a spool whose contents won't be stored.
+        """
+        pass
+
+    def _get_utf8_decoded_rows(self, rows):
         """
-        Given a list of `rows` containing unicode strings, return a
-        new list of rows with those strings encoded as utf-8 for CSV
-        compatibility.
+        Given a list of `rows` read from a CSV file, return a new list of
+        rows with their utf-8 encoded strings decoded to unicode.
         """
         for row in rows:
-            yield [unicode(item).encode('utf-8') for item in row]
+            yield [item.decode('utf-8') for item in row]
 
 
 class S3ReportStore(ReportStore):
@@ -299,22 +416,57 @@ class S3ReportStore(ReportStore):
             }
         )
 
-    def store_rows(self, course_id, filename, rows):
+    def wrap_spool(self, spool):
         """
-        Given a `course_id`, `filename`, and `rows` (each row is an iterable of
-        strings), create a buffer that is a gzip'd csv file, and then `store()`
-        that buffer.
+        Rows are stored as a gzip'd csv file.  Even though we store it in gzip
+        format, browsers will transparently download and decompress it.
+        Filenames should end in `.csv`, not `.gz`.
+        """
+        return GzipFile(fileobj=spool, mode="wb")
 
-        Even though we store it in gzip format, browsers will transparently
-        download and decompress it. Filenames should end in `.csv`, not `.gz`.
+    def store_spool(self, course_id, filename, spool):
         """
-        output_buffer = StringIO()
-        gzip_file = GzipFile(fileobj=output_buffer, mode="wb")
-        csvwriter = csv.writer(gzip_file)
-        csvwriter.writerows(self._get_utf8_encoded_rows(rows))
-        gzip_file.close()
+        Upload the contents of the gzip'd spool to the key for `course_id` and
+        `filename`, as `store()` does for a buffer.
+        """
+        key = self.key_for(course_id, filename)
+        spool.seek(0, os.SEEK_END)
+        size = spool.tell()
+        key.content_encoding = 'gzip'
+        key.content_type = 'text/csv'
+        key.set_contents_from_file(
+            spool,
+            headers={
+                "Content-Encoding": 'gzip',
+                "Content-Length": size,
+                "Content-Type": 'text/csv',
+            },
+            rewind=True,
+        )
 
-        self.store(course_id, filename, output_buffer)
+    def read_rows(self, course_id, filename):
+        """
+        Return an iterator of the rows (each a list of unicode strings) of a
+        CSV file previously stored with `store_rows()`.
+
+        Raises IOError if there is no such file.
+        """
+        key = self.key_for(course_id, filename)
+        try:
+            contents = key.get_contents_as_string()
+        except S3ResponseError as error:
+            if error.status != 404:
+                raise
+            raise IOError(u"No report {} found for {}".format(filename, course_id))
+        gzip_file = GzipFile(fileobj=StringIO(contents), mode="rb")
+        return self._get_utf8_decoded_rows(csv.reader(gzip_file))
+
+    def delete(self, course_id, filename):
+        """
+        Delete the file stored for the given `course_id` and `filename`, if
+        there is one.
+        """
+        self.key_for(course_id, filename).delete()
 
     def links_for(self, course_id):
         """
@@ -380,16 +532,51 @@ class LocalFSReportStore(ReportStore):
         with open(full_path, "wb") as f:
             f.write(buff.getvalue())
 
-    def store_rows(self, course_id, filename, rows):
+    def create_spool(self):
         """
-        Given a course_id, filename, and rows (each row is an iterable of strings),
-        write this data out.
+        Spool rows to a temporary file under `root_path` (but outside of any
+        course's directory, so it isn't listed by `links_for()`), so that it
+        can be atomically renamed into place.
         """
-        output_buffer = StringIO()
-        csvwriter = csv.writer(output_buffer)
-        csvwriter.writerows(self._get_utf8_encoded_rows(rows))
+        return NamedTemporaryFile(dir=self.root_path, prefix='.spool-', suffix='.csv', delete=False)
 
-        self.store(course_id, filename, output_buffer)
+    def store_spool(self, course_id, filename, spool):
+        """
+        Move the spool to the file `filename` for the given `course_id`,
+        overwriting anything that was there previously.
+        """
+        full_path = self.path_to(course_id, filename)
+        directory = os.path.dirname(full_path)
+        if not os.path.exists(directory):
+            os.mkdir(directory)
+
+        spool.close()
+        os.rename(spool.name, full_path)
+
+    def discard_spool(self, spool):
+        """
+        Delete the spool file.
+        """
+        if os.path.exists(spool.name):
+            os.remove(spool.name)
+
+    def read_rows(self, course_id, filename):
+        """
+        Return an iterator of the rows (each a list of unicode strings) of a
+        CSV file previously stored with `store_rows()`.
+        """
+        with open(self.path_to(course_id, filename), "rb") as f:
+            for row in self._get_utf8_decoded_rows(csv.reader(f)):
+                yield row
+
+    def delete(self, course_id, filename):
+        """
+        Delete the file stored for the given `course_id` and `filename`, if
+        there is one.
+        """
+        full_path = self.path_to(course_id, filename)
+        if os.path.exists(full_path):
+            os.remove(full_path)
 
     def links_for(self, course_id):
         """
@@ -36,6 +36,7 @@ from instructor_task.tasks_helper import (
     delete_problem_module_state,
     upload_problem_responses_csv,
     upload_grades_csv,
+    upload_grades_csv_subtask,
     upload_problem_grade_report,
     upload_students_csv,
     cohort_students_and_upload,
@@ -79,7 +80,7 @@ def rescore_problem(entry_id, xmodule_instance_args):
         """Filter that matches problems which are marked as being done"""
         return modules_to_update.filter(state__contains='"done": true')
 
-    visit_fcn = partial(perform_module_state_update, update_fcn, filter_fcn)
+    visit_fcn = partial(perform_module_state_update, update_fcn, filter_fcn, prefetch_state=True)
     return run_main_task(entry_id, visit_fcn, action_name)
 
 
@@ -176,6 +177,18 @@ def calculate_grades_csv(entry_id, xmodule_instance_args):
     return run_main_task(entry_id, task_fn, action_name)
 
 
+@task(routing_key=settings.GRADES_DOWNLOAD_ROUTING_KEY)  # pylint: disable=not-callable
+def calculate_grades_csv_subtask(entry_id, subtask_index, student_ids, subtask_status_dict):
+    """
+    Grade a chunk of the students in a course for a grade report.
+
+    Queued by `calculate_grades_csv` for courses with many students.  The
+    subtask that completes the grade report merges the partial reports of
+    all of the subtasks and pushes the results to an S3 bucket for download.
+    """
+    return upload_grades_csv_subtask(entry_id, subtask_index, student_ids, subtask_status_dict)
+
+
 @task(base=BaseInstructorTask, routing_key=settings.GRADES_DOWNLOAD_ROUTING_KEY)  # pylint: disable=not-callable
 def calculate_problem_grade_report(entry_id, xmodule_instance_args):
     """
@@ -5,11 +5,12 @@ running state of a course.
 """
 import json
 import re
+import traceback
 from collections import OrderedDict
 from datetime import datetime
 from django.conf import settings
 from eventtracking import tracker
-from itertools import chain
+from itertools import chain, count
 from time import time
 import unicodecsv
 import logging
@@ -34,6 +35,7 @@ from survey.models import SurveyAnswer
 from track.views import task_track
 from util.db import outer_atomic
 from util.file import course_filename_prefix_generator, UniversalNewlineIterator
+from util.query import chunks
 from xblock.runtime import KvsFieldData
 from xmodule.modulestore.django import modulestore
 from xmodule.split_test_module import get_split_user_partitions
@@ -41,6 +43,7 @@ from django.utils.translation import ugettext as _
 from certificates.models import (
     CertificateWhitelist,
     certificate_info_for_user,
+    certificate_statuses_for_students,
     CertificateStatuses,
     GeneratedCertificate
 )
@@ -48,24 +51,30 @@ from certificates.api import generate_user_certificates
 from courseware.courses import get_course_by_id, get_problems_in_section
 from courseware.grades import iterate_grades_for
 from courseware.models import StudentModule
-from courseware.model_data import DjangoKeyValueStore, FieldDataCache
+from courseware.model_data import DjangoKeyValueStore, FieldDataCache, MultiUserStateCache
 from courseware.module_render import get_module_for_descriptor_internal
 from instructor_analytics.basic import (
-    enrolled_students_features,
+    iter_enrolled_students_features,
     get_proctored_exam_results,
     list_may_enroll,
     list_problem_responses
 )
-from instructor_analytics.csvs import format_dictlist
+from instructor_analytics.csvs import format_dictlist_rows
 from openassessment.data import OraAggregateData
 from instructor_task.models import ReportStore, InstructorTask, PROGRESS
-from lms.djangoapps.lms_xblock.runtime import LmsPartitionService
-from openedx.core.djangoapps.course_groups.cohorts import get_cohort
-from openedx.core.djangoapps.course_groups.models import CourseUserGroup
+from instructor_task.subtasks import (
+    SubtaskStatus,
+    check_subtask_is_valid,
+    queue_subtasks_for_query,
+    update_subtask_status,
+)
+from openedx.core.djangoapps.course_groups.models import CohortMembership, CourseUserGroup
 from openedx.core.djangoapps.content.course_structures.models import CourseStructure
 from opaque_keys.edx.keys import UsageKey
 from openedx.core.djangoapps.course_groups.cohorts import add_user_to_cohort, is_course_cohorted
-from student.models import CourseEnrollment, CourseAccessRole
+from course_modes.models import CourseMode
+from student.models import CourseEnrollment
+from student.roles import CourseRoleCache
 from lms.djangoapps.teams.models import CourseTeamMembership
 from lms.djangoapps.verify_student.models import SoftwareSecurePhotoVerification
 
@@ -83,6 +92,13 @@ UPDATE_STATUS_SKIPPED = 'skipped'
 # The setting name used for events when "settings" (account settings, preferences, profile information) change.
 REPORT_REQUESTED_EVENT_NAME = u'edx.instructor.report.requested'
 
+# Number of graded students whose other grade report data is fetched together.
+GRADE_REPORT_STUDENTS_PER_QUERY = 100
+
+# The number of StudentModules that perform_module_state_update loads, and
+# prefetches the users' state for, at a time
+MODULE_STATE_UPDATE_CHUNK_SIZE = 100
+
 
 class BaseInstructorTask(Task):
     """
@@ -298,7 +314,8 @@ def run_main_task(entry_id, task_fcn, action_name):
     return task_progress
 
 
-def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, task_input, action_name):
+def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, task_input, action_name,
+                                prefetch_state=False):
     """
     Performs generic update by visiting StudentModule instances with the update_fcn provided.
 
@@ -310,9 +327,11 @@ def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, ta
     argument, which is the query being filtered, and returns the filtered version of the query.
 
     The `update_fcn` is called on each StudentModule that passes the resulting filtering.
-    It is passed three arguments:  the module_descriptor for the module pointed to by the
-    module_state_key, the particular StudentModule to update, and the xmodule_instance_args being
-    passed through.  If the value returned by the update function evaluates to a boolean True,
+    It is passed the module_descriptor for the module pointed to by the module_state_key,
+    the particular StudentModule to update, and (as `prefetched_state`) either None or, if
+    `prefetch_state` is True, a MultiUserStateCache with the state of the problems for the
+    students whose modules are being updated along with it.  The modules are updated
+    MODULE_STATE_UPDATE_CHUNK_SIZE at a time, and the state is prefetched for each chunk of modules.  If the value returned by the update function evaluates to a boolean True,
     the update is successful; False indicates the update on the particular student module failed.
     A raised exception indicates a fatal condition -- that no other student modules should be considered.
 
@@ -376,23 +395,31 @@ def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, ta
     task_progress = TaskProgress(action_name, modules_to_update.count(), start_time)
     task_progress.update_task_state()
 
-    for module_to_update in modules_to_update:
-        task_progress.attempted += 1
-        module_descriptor = problems[unicode(module_to_update.module_state_key)]
-        # There is no try here:  if there's an error, we let it throw, and the task will
-        # be marked as FAILED, with a stack trace.
-        with dog_stats_api.timer('instructor_tasks.module.time.step', tags=[u'action:{name}'.format(name=action_name)]):
-            update_status = update_fcn(module_descriptor, module_to_update)
-            if update_status == UPDATE_STATUS_SUCCEEDED:
-                # If the update_fcn returns true, then it performed some kind of work.
-                # Logging of failures is left to the update_fcn itself.
-                task_progress.succeeded += 1
-            elif update_status == UPDATE_STATUS_FAILED:
-                task_progress.failed += 1
-            elif update_status == UPDATE_STATUS_SKIPPED:
-                task_progress.skipped += 1
-            else:
-                raise UpdateProblemModuleStateError("Unexpected update_status returned: {}".format(update_status))
+    modules_to_update = modules_to_update.select_related('student').iterator()
+    for modules_chunk in chunks(modules_to_update, MODULE_STATE_UPDATE_CHUNK_SIZE):
+        prefetched_state = MultiUserStateCache.for_descriptor_descendents(
+            set(module.student for module in modules_chunk),
+            problems.values(),
+        ) if prefetch_state else None
+        for module_to_update in modules_chunk:
+            task_progress.attempted += 1
+            module_descriptor = problems[unicode(module_to_update.module_state_key)]
+            # There is no try here:  if there's an error, we let it throw, and the task will
+            # be marked as FAILED, with a stack trace.
+            with dog_stats_api.timer(
+                    'instructor_tasks.module.time.step', tags=[u'action:{name}'.format(name=action_name)]
+            ):
+                update_status = update_fcn(module_descriptor, module_to_update, prefetched_state=prefetched_state)
+                if update_status == UPDATE_STATUS_SUCCEEDED:
+                    # If the update_fcn returns true, then it performed some kind of work.
+                    # Logging of failures is left to the update_fcn itself.
+                    task_progress.succeeded += 1
+                elif update_status == UPDATE_STATUS_FAILED:
+                    task_progress.failed += 1
+                elif update_status == UPDATE_STATUS_SKIPPED:
+                    task_progress.skipped += 1
+                else:
+                    raise UpdateProblemModuleStateError("Unexpected update_status returned: {}".format(update_status))
 
     return task_progress.update_task_state()
 
@@ -424,16 +451,20 @@ def _get_track_function_for_task(student, xmodule_instance_args=None, source_pag
 
 
 def _get_module_instance_for_task(course_id, student, module_descriptor, xmodule_instance_args=None,
-                                  grade_bucket_type=None, course=None):
+                                  grade_bucket_type=None, course=None, prefetched_state=None):
     """
     Fetches a StudentModule instance for a given `course_id`, `student` object, and `module_descriptor`.
 
     `xmodule_instance_args` is used to provide information for creating a track function and an XQueue callback.
     These are passed, along with `grade_bucket_type`, to get_module_for_descriptor_internal, which sidesteps
     the need for a Request object when instantiating an xmodule instance.
+
+    `prefetched_state` is an optional MultiUserStateCache with the student's state for the module.
     """
     # reconstitute the problem's corresponding XModule:
-    field_data_cache = FieldDataCache.cache_for_descriptor_descendents(course_id, student, module_descriptor)
+    field_data_cache = FieldDataCache.cache_for_descriptor_descendents(
+        course_id, student, module_descriptor, prefetched_state=prefetched_state
+    )
     student_data = KvsFieldData(DjangoKeyValueStore(field_data_cache))
 
     # get request-related tracking information from args passthrough, and supplement with task-specific
@@ -470,7 +501,7 @@ def _get_module_instance_for_task(course_id, student, module_descriptor, xmodule
 
 
 @outer_atomic
-def rescore_problem_module_state(xmodule_instance_args, module_descriptor, student_module):
+def rescore_problem_module_state(xmodule_instance_args, module_descriptor, student_module, prefetched_state=None):
     '''
     Takes an XModule descriptor and a corresponding StudentModule object, and
     performs rescoring on the student's problem submission.
@@ -487,6 +518,16 @@ def rescore_problem_module_state(xmodule_instance_args, module_descriptor, stude
     student = student_module.student
     usage_key = student_module.module_state_key
 
+    if prefetched_state is not None:
+        # The student may have submitted since the state was prefetched, so
+        # lock their module until the rescored state is saved, and only use
+        # the prefetched state if it is still the latest.
+        modified = StudentModule.objects.select_for_update().filter(
+            id=student_module.id
+        ).values_list('modified', flat=True)
+        if list(modified) != [prefetched_state.get_modified(student, usage_key)]:
+            prefetched_state = None
+
     with modulestore().bulk_operations(course_id):
         course = get_course_by_id(course_id)
         # TODO: Here is a call site where we could pass in a loaded course.  I
@@ -498,7 +539,8 @@ def rescore_problem_module_state(xmodule_instance_args, module_descriptor, stude
             module_descriptor,
             xmodule_instance_args,
             grade_bucket_type='rescore',
-            course=course
+            course=course,
+            prefetched_state=prefetched_state,
         )
 
         if instance is None:
@@ -559,7 +601,10 @@ def rescore_problem_module_state(xmodule_instance_args, module_descriptor, stude
 
 
 @outer_atomic
-def reset_attempts_module_state(xmodule_instance_args, _module_descriptor, student_module):
+def reset_attempts_module_state(
+        xmodule_instance_args, _module_descriptor, student_module,
+        prefetched_state=None,  # pylint: disable=unused-argument
+):
     """
     Resets problem attempts to zero for specified `student_module`.
 
@@ -586,7 +631,10 @@ def reset_attempts_module_state(xmodule_instance_args, _module_descriptor, stude
 
 
 @outer_atomic
-def delete_problem_module_state(xmodule_instance_args, _module_descriptor, student_module):
+def delete_problem_module_state(
+        xmodule_instance_args, _module_descriptor, student_module,
+        prefetched_state=None,  # pylint: disable=unused-argument
+):
     """
     Delete the StudentModule entry.
 
@@ -600,31 +648,38 @@ def delete_problem_module_state(xmodule_instance_args, _module_descriptor, stude
     return UPDATE_STATUS_SUCCEEDED
 
 
-def upload_csv_to_report_store(rows, csv_name, course_id, timestamp, config_name='GRADES_DOWNLOAD'):
+def upload_csv_to_report_store(rows, csv_name, course_id, timestamp, config_name='GRADES_DOWNLOAD', min_rows=0):
     """
     Upload data as a CSV using ReportStore.
 
     Arguments:
         rows: CSV data in the following format (first column may be a
-            header):
+            header), which may be a generator, in which case the rows are
+            written out as they are generated:
             [
                 [row1_colum1, row1_colum2, ...],
                 ...
             ]
         csv_name: Name of the resulting CSV
         course_id: ID of the course
+        min_rows: The CSV is only uploaded if it has at least this many rows
+            (including any header row).
+
+    Returns the number of rows written.
     """
     report_store = ReportStore.from_config(config_name)
-    report_store.store_rows(
-        course_id,
-        u"{course_prefix}_{csv_name}_{timestamp_str}.csv".format(
-            course_prefix=course_filename_prefix_generator(course_id),
-            csv_name=csv_name,
-            timestamp_str=timestamp.strftime("%Y-%m-%d-%H%M")
-        ),
-        rows
+    filename = u"{course_prefix}_{csv_name}_{timestamp_str}.csv".format(
+        course_prefix=course_filename_prefix_generator(course_id),
+        csv_name=csv_name,
+        timestamp_str=timestamp.strftime("%Y-%m-%d-%H%M")
     )
+    with report_store.rows_writer(course_id, filename) as writer:
+        writer.writerows(rows)
+        if writer.num_rows < min_rows:
+            writer.abort()
+            return writer.num_rows
     tracker.emit(REPORT_REQUESTED_EVENT_NAME, {"report_type": csv_name, })
+    return writer.num_rows
 
 
 def upload_exec_summary_to_store(data_dict, report_name, course_id, generated_at, config_name='FINANCIAL_REPORTS'):
@@ -657,24 +712,29 @@ def upload_exec_summary_to_store(data_dict, report_name, course_id, generated_at
     tracker.emit(REPORT_REQUESTED_EVENT_NAME, {"report_type": report_name})
 
 
-def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input, action_name):  # pylint: disable=too-many-statements
+def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input, action_name):
     """
     For a given `course_id`, generate a grades CSV file for all students that
     are enrolled, and store using a `ReportStore`. Once created, the files can
     be accessed by instantiating another `ReportStore` (via
     `ReportStore.from_config()`) and calling `link_for()` on it. Writes are
-    buffered, so we'll never write part of a CSV file to S3 -- i.e. any files
+    spooled, so we'll never write part of a CSV file to S3 -- i.e. any files
     that are visible in ReportStore will be complete ones.
 
+    For courses with more than `settings.GRADE_REPORT_STUDENTS_PER_SUBTASK`
+    enrolled students, the students are instead graded by subtasks (see
+    `upload_grades_csv_subtask`), and the last subtask to complete merges
+    their partial reports into the final report.
+
     As we start to add more CSV downloads, it will probably be worthwhile to
     make a more general CSVDoc class instead of building out the rows like we
     do here.
     """
     start_time = time()
     start_date = datetime.now(UTC)
-    status_interval = 100
     enrolled_students = CourseEnrollment.objects.users_enrolled_in(course_id)
-    task_progress = TaskProgress(action_name, enrolled_students.count(), start_time)
+    total_enrolled_students = enrolled_students.count()
+    task_progress = TaskProgress(action_name, total_enrolled_students, start_time)
 
     fmt = u'Task: {task_id}, InstructorTask ID: {entry_id}, Course: {course_id}, Input: {task_input}'
     task_info_string = fmt.format(
@@ -685,8 +745,272 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
     )
     TASK_LOG.info(u'%s, Task type: %s, Starting task execution', task_info_string, action_name)
 
+    students_per_subtask = settings.GRADE_REPORT_STUDENTS_PER_SUBTASK
+    if _entry_id is not None and students_per_subtask and total_enrolled_students > students_per_subtask:
+        TASK_LOG.info(
+            u'%s, Task type: %s, Queuing subtasks to grade total students: %s',
+            task_info_string,
+            action_name,
+            total_enrolled_students
+        )
+        return _queue_grade_report_subtasks(_entry_id, action_name, enrolled_students, total_enrolled_students)
+
     course = get_course_by_id(course_id)
-    course_is_cohorted = is_course_cohorted(course.id)
+    current_step = {'step': 'Calculating Grades'}
+    TASK_LOG.info(
+        u'%s, Task type: %s, Current step: %s, Starting grade calculation for total students: %s',
+        task_info_string,
+        action_name,
+        current_step,
+        total_enrolled_students
+    )
+    # The rows are written out as the students are graded, and the error rows
+    # (which are few) are collected to be written out afterwards.
+    err_rows = [["id", "username", "error_msg"]]
+    rows = _compute_grade_report_rows(course, enrolled_students, task_progress, task_info_string, err_rows)
+    upload_csv_to_report_store(rows, 'grade_report', course_id, start_date)
+    TASK_LOG.info(
+        u'%s, Task type: %s, Current step: %s, Grade calculation completed for students: %s/%s',
+        task_info_string,
+        action_name,
+        current_step,
+        task_progress.attempted,
+        total_enrolled_students
+    )
+
+    current_step = {'step': 'Uploading CSVs'}
+    task_progress.update_task_state(extra_meta=current_step)
+    TASK_LOG.info(u'%s, Task type: %s, Current step: %s', task_info_string, action_name, current_step)
+
+    # If there are any error rows (don't count the header), write them out as well
+    if len(err_rows) > 1:
+        upload_csv_to_report_store(err_rows, 'grade_report_err', course_id, start_date)
+
+    # One last update before we close out...
+    TASK_LOG.info(u'%s, Task type: %s, Finalizing grade task', task_info_string, action_name)
+    return task_progress.update_task_state(extra_meta=current_step)
+
+
+def upload_grades_csv_subtask(entry_id, subtask_index, student_ids, subtask_status_dict):
+    """
+    Grade the students with the given `student_ids` for the grade report of
+    the InstructorTask `entry_id`, and store their rows as a partial report
+    using the `GRADE_REPORT_PARTIALS` `ReportStore`.
+
+    The subtask that completes the InstructorTask merges the partial reports
+    of all of its subtasks, in order of `subtask_index`, into the final grade
+    report.
+
+    Returns the subtask's status as a dict (see `SubtaskStatus`).
+    """
+    subtask_status = SubtaskStatus.from_dict(subtask_status_dict)
+    current_task_id = subtask_status.task_id
+
+    # Reject duplicates of subtasks that are running or have already run.
+    check_subtask_is_valid(entry_id, current_task_id, subtask_status)
+
+    entry = InstructorTask.objects.get(pk=entry_id)
+    course_id = entry.course_id
+    action_name = json.loads(entry.task_output)['action_name']
+    task_progress = TaskProgress(action_name, len(student_ids), time())
+    task_info_string = u'Task: {task_id}, InstructorTask ID: {entry_id}, Course: {course_id}, Subtask: {index}'.format(
+        task_id=entry.task_id,
+        entry_id=entry_id,
+        course_id=course_id,
+        index=subtask_index,
+    )
+
+    try:
+        course = get_course_by_id(course_id)
+        students = User.objects.filter(pk__in=student_ids)
+        err_rows = [["id", "username", "error_msg"]]
+        rows = _compute_grade_report_rows(course, students, task_progress, task_info_string, err_rows)
+
+        report_store = ReportStore.from_config('GRADE_REPORT_PARTIALS')
+        report_store.store_rows(course_id, _grade_report_partial_filename(entry.task_id, subtask_index), rows)
+        report_store.store_rows(
+            course_id, _grade_report_partial_filename(entry.task_id, subtask_index, 'err'), err_rows
+        )
+    except Exception:
+        # Since we don't know how far the subtask got, we count all of its
+        # students as having failed.
+        TASK_LOG.exception(
+            u'%s, Task type: %s, Grade report subtask failed unexpectedly', task_info_string, action_name
+        )
+        subtask_status.increment(failed=len(student_ids), state=FAILURE)
+        if update_subtask_status(entry_id, current_task_id, subtask_status):
+            _merge_grade_report_partials(entry_id)
+        raise
+
+    subtask_status.increment(succeeded=task_progress.succeeded, failed=task_progress.failed, state=SUCCESS)
+    TASK_LOG.info(
+        u'%s, Task type: %s, Grade report subtask completed: %s', task_info_string, action_name, subtask_status
+    )
+    if update_subtask_status(entry_id, current_task_id, subtask_status):
+        _merge_grade_report_partials(entry_id)
+    return subtask_status.to_dict()
+
+
+def _queue_grade_report_subtasks(entry_id, action_name, enrolled_students, total_enrolled_students):
+    """
+    Queue `upload_grades_csv_subtask` subtasks that each grade up to
+    `settings.GRADE_REPORT_STUDENTS_PER_SUBTASK` of the enrolled students.
+
+    Returns the task progress as stored in the InstructorTask.
+    """
+    # The celery tasks are defined in terms of the functions in this module,
+    # so they can't be imported at the top of it.
+    from instructor_task.tasks import calculate_grades_csv_subtask
+
+    entry = InstructorTask.objects.get(pk=entry_id)
+    subtask_indices = count()
+
+    def _create_grade_report_subtask(to_list, initial_subtask_status):
+        """Creates a subtask to grade the given list of students."""
+        return calculate_grades_csv_subtask.subtask(
+            (
+                entry_id,
+                next(subtask_indices),
+                [item['pk'] for item in to_list],
+                initial_subtask_status.to_dict(),
+            ),
+            task_id=initial_subtask_status.task_id,
+            routing_key=settings.GRADES_DOWNLOAD_ROUTING_KEY,
+        )
+
+    return queue_subtasks_for_query(
+        entry,
+        action_name,
+        _create_grade_report_subtask,
+        [enrolled_students.order_by('pk')],
+        [],
+        settings.GRADE_REPORT_STUDENTS_PER_SUBTASK,
+        total_enrolled_students,
+    )
+
+
+def _grade_report_partial_filename(task_id, subtask_index, suffix=None):
+    """
+    Returns the filename of the partial grade report of the given subtask of
+    the grade report task `task_id`.
+    """
+    return u'{task_id}_{index:05d}{suffix}.csv'.format(
+        task_id=task_id,
+        index=subtask_index,
+        suffix=u'_{}'.format(suffix) if suffix else u'',
+    )
+
+
+def _merge_grade_report_partials(entry_id):
+    """
+    Merge the partial grade reports of the subtasks of the InstructorTask
+    `entry_id` into the final grade report (and error report, if any
+    student couldn't be graded), and delete the partial reports.
+
+    If any subtask failed, its students are missing from the partial reports,
+    so the final report is not uploaded and the InstructorTask is marked as
+    failed.
+    """
+    entry = InstructorTask.objects.get(pk=entry_id)
+    course_id = entry.course_id
+    subtask_dict = json.loads(entry.subtasks)
+    start_date = datetime.fromtimestamp(json.loads(entry.task_output)['start_time'], UTC)
+    report_store = ReportStore.from_config('GRADE_REPORT_PARTIALS')
+    filenames = [_grade_report_partial_filename(entry.task_id, index) for index in range(subtask_dict['total'])]
+    err_filenames = [
+        _grade_report_partial_filename(entry.task_id, index, 'err') for index in range(subtask_dict['total'])
+    ]
+
+    try:
+        if subtask_dict['failed']:
+            message = u'{failed} of {total} grade report subtasks failed: not uploading grade report'.format(
+                failed=subtask_dict['failed'],
+                total=subtask_dict['total'],
+            )
+            TASK_LOG.error(u'Task: %s, InstructorTask ID: %s, %s', entry.task_id, entry_id, message)
+            _mark_task_failed(entry, Exception(message))
+            return
+
+        try:
+            upload_csv_to_report_store(
+                _merge_report_rows(report_store, course_id, filenames), 'grade_report', course_id, start_date
+            )
+            # If there are any error rows (don't count the header), write them out as well
+            upload_csv_to_report_store(
+                _merge_report_rows(report_store, course_id, err_filenames),
+                'grade_report_err',
+                course_id,
+                start_date,
+                min_rows=2,
+            )
+        except Exception as exception:
+            TASK_LOG.exception(
+                u'Task: %s, InstructorTask ID: %s, merging grade report subtasks failed', entry.task_id, entry_id
+            )
+            _mark_task_failed(entry, exception, traceback.format_exc())
+            raise
+    finally:
+        for filename in filenames + err_filenames:
+            report_store.delete(course_id, filename)
+
+
+def _mark_task_failed(entry, exception, traceback_string=None):
+    """
+    Mark the InstructorTask `entry`, which its subtasks have already marked
+    as succeeded, as having failed with the given `exception`.
+    """
+    entry.task_state = FAILURE
+    entry.task_output = InstructorTask.create_output_for_failure(exception, traceback_string)
+    entry.save_now()
+
+
+def _merge_report_rows(report_store, course_id, filenames):
+    """
+    Yields the rows of the CSV files with the given filenames in the
+    report_store as the rows of a single report, with the header row of the
+    first file that has one.
+
+    The columns of the rows of any file with a different header row are
+    reordered to match, and are 0.0 for any columns that the file doesn't
+    have (as for grades of sections that a student doesn't have).
+    """
+    header = None
+    for filename in filenames:
+        try:
+            rows = report_store.read_rows(course_id, filename)
+            file_header = next(rows)
+        except (IOError, StopIteration):
+            # Subtasks that didn't grade any students don't store any rows.
+            continue
+
+        if header is None:
+            header = file_header
+            yield header
+
+        if file_header == header:
+            for row in rows:
+                yield row
+        else:
+            columns = [file_header.index(column) if column in file_header else None for column in header]
+            for row in rows:
+                yield [row[column] if column is not None else 0.0 for column in columns]
+
+
+def _compute_grade_report_rows(course, students, task_progress, task_info_string, err_rows):
+    """
+    Grade the given students in the course, updating `task_progress` as they
+    are graded, and yield the grade report rows (starting with the header
+    row, if any student was graded successfully) as they are graded.  The
+    error rows of students who couldn't be graded are appended to
+    `err_rows`.
+
+    The other per-student columns of the grade report are fetched in bulk
+    for each chunk of `GRADE_REPORT_STUDENTS_PER_QUERY` graded students.
+    """
+    course_id = course.id
+    action_name = task_progress.action_name
+    current_step = {'step': 'Calculating Grades'}
+    course_is_cohorted = is_course_cohorted(course_id)
     teams_enabled = course.teams_enabled
     cohorts_header = ['Cohort Name'] if course_is_cohorted else []
     teams_header = ['Team Name'] if teams_enabled else []
@@ -696,48 +1020,33 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
 
     certificate_info_header = ['Certificate Eligible', 'Certificate Delivered', 'Certificate Type']
     certificate_whitelist = CertificateWhitelist.objects.filter(course_id=course_id, whitelist=True)
-    whitelisted_user_ids = [entry.user_id for entry in certificate_whitelist]
+    whitelisted_user_ids = set(entry.user_id for entry in certificate_whitelist)
 
-    # Loop over all our students and build our CSV lists in memory
     header = None
-    rows = []
-    err_rows = [["id", "username", "error_msg"]]
-    current_step = {'step': 'Calculating Grades'}
 
-    total_enrolled_students = enrolled_students.count()
-    student_counter = 0
-    TASK_LOG.info(
-        u'%s, Task type: %s, Current step: %s, Starting grade calculation for total students: %s',
-        task_info_string,
-        action_name,
-        current_step,
+    grades = iterate_grades_for(course_id, students.select_related('profile'))
+    for chunk in chunks(grades, GRADE_REPORT_STUDENTS_PER_QUERY):
+        student_info = _get_grade_report_student_info(
+            course,
+            [student for student, gradeset, __ in chunk if gradeset],
+            course_is_cohorted,
+            experiment_partitions,
+        )
 
-        total_enrolled_students
-    )
-    for student, gradeset, err_msg in iterate_grades_for(course_id, enrolled_students):
-        # Periodically update task status (this is a cache write)
-        if task_progress.attempted % status_interval == 0:
-            task_progress.update_task_state(extra_meta=current_step)
-        task_progress.attempted += 1
+        for student, gradeset, err_msg in chunk:
+            task_progress.attempted += 1
 
-        # Now add a log entry after each student is graded to get a sense
-        # of the task's progress
-        student_counter += 1
-        TASK_LOG.info(
-            u'%s, Task type: %s, Current step: %s, Grade calculation in-progress for students: %s/%s',
-            task_info_string,
-            action_name,
-            current_step,
-            student_counter,
-            total_enrolled_students
-        )
+            if not gradeset:
+                # An empty gradeset means we failed to grade a student.
+                task_progress.failed += 1
+                err_rows.append([student.id, student.username, err_msg])
+                continue
 
-        if gradeset:
             # We were able to successfully grade this student for this course.
             task_progress.succeeded += 1
             if not header:
                 header = [section['label'] for section in gradeset[u'section_breakdown']]
-                rows.append(
+                yield (
                     ["id", "email", "username", "grade"] + header + cohorts_header +
                     group_configs_header + teams_header +
                     ['Enrollment Track', 'Verification Status'] + certificate_info_header
@@ -749,35 +1058,21 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
                 if 'label' in section
             }
 
-            cohorts_group_name = []
-            if course_is_cohorted:
-                group = get_cohort(student, course_id, assign=False)
-                cohorts_group_name.append(group.name if group else '')
-
-            group_configs_group_names = []
-            for partition in experiment_partitions:
-                group = LmsPartitionService(student, course_id).get_group(partition, assign=False)
-                group_configs_group_names.append(group.name if group else '')
-
-            team_name = []
-            if teams_enabled:
-                try:
-                    membership = CourseTeamMembership.objects.get(user=student, team__course_id=course_id)
-                    team_name.append(membership.team.name)
-                except CourseTeamMembership.DoesNotExist:
-                    team_name.append('')
-
-            enrollment_mode = CourseEnrollment.enrollment_mode_for_user(student, course_id)[0]
+            info = student_info[student.id]
+            cohorts_group_name = [info['cohort_name']] if course_is_cohorted else []
+            team_name = [info['team_name']] if teams_enabled else []
             verification_status = SoftwareSecurePhotoVerification.verification_status_for_user(
                 student,
                 course_id,
-                enrollment_mode
+                info['enrollment_mode'],
+                user_is_verified=info['is_verified'],
             )
             certificate_info = certificate_info_for_user(
                 student,
                 course_id,
                 gradeset['grade'],
-                student.id in whitelisted_user_ids
+                user_is_whitelisted=student.id in whitelisted_user_ids,
+                certificate_status=info['certificate_status'],
             )
 
             # Not everybody has the same gradable items. If the item is not
@@ -787,40 +1082,94 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
             # possible for a student to have a 0.0 show up in their row but
             # still have 100% for the course.
             row_percents = [percents.get(label, 0.0) for label in header]
-            rows.append(
+            yield (
                 [student.id, student.email, student.username, gradeset['percent']] +
-                row_percents + cohorts_group_name + group_configs_group_names + team_name +
-                [enrollment_mode] + [verification_status] + certificate_info
+                row_percents + cohorts_group_name + info['experiment_group_names'] + team_name +
+                [info['enrollment_mode']] + [verification_status] + certificate_info
             )
-        else:
-            # An empty gradeset means we failed to grade a student.
-            task_progress.failed += 1
-            err_rows.append([student.id, student.username, err_msg])
 
-    TASK_LOG.info(
-        u'%s, Task type: %s, Current step: %s, Grade calculation completed for students: %s/%s',
-        task_info_string,
-        action_name,
-        current_step,
-        student_counter,
-        total_enrolled_students
-    )
+        # Periodically update task status (this is a cache write), and log
+        # to get a sense of the task's progress.
+        task_progress.update_task_state(extra_meta=current_step)
+        TASK_LOG.info(
+            u'%s, Task type: %s, Current step: %s, Grade calculation in-progress for students: %s/%s',
+            task_info_string,
+            action_name,
+            current_step,
+            task_progress.attempted,
+            task_progress.total
+        )
 
-    # By this point, we've got the rows we're going to stuff into our CSV files.
-    current_step = {'step': 'Uploading CSVs'}
-    task_progress.update_task_state(extra_meta=current_step)
-    TASK_LOG.info(u'%s, Task type: %s, Current step: %s', task_info_string, action_name, current_step)
 
-    # Perform the actual upload
-    upload_csv_to_report_store(rows, 'grade_report', course_id, start_date)
+def _get_grade_report_student_info(course, students, course_is_cohorted, experiment_partitions):
+    """
+    Return a dict mapping the id of each of the given students to a dict of
+    their grade report data that doesn't depend on their grades, fetched
+    with a fixed number of queries for all of the students:
+
+        'cohort_name': name of the student's cohort, or '' (only looked up
+            if course_is_cohorted)
+        'experiment_group_names': list of the names of the student's groups
+            in each of experiment_partitions, or '' for each partition the
+            student isn't assigned to
+        'team_name': name of the student's team, or '' (only looked up if
+            teams are enabled for the course)
+        'enrollment_mode': the student's enrollment mode
+        'is_verified': whether the student is ID verified (only looked up
+            for students in verified modes)
+        'certificate_status': the student's certificate status, as returned
+            by `certificate_status_for_student`
+
+    Since grading may assign students to cohorts and experiment groups, this
+    should be called after the students are graded.
+    """
+    course_id = course.id
+    if not students:
+        return {}
+
+    cohort_names = {}
+    if course_is_cohorted:
+        cohort_names = dict(
+            CohortMembership.objects.filter(
+                course_id=course_id, user__in=students
+            ).values_list('user_id', 'course_user_group__name')
+        )
 
-    # If there are any error rows (don't count the header), write them out as well
-    if len(err_rows) > 1:
-        upload_csv_to_report_store(err_rows, 'grade_report_err', course_id, start_date)
+    experiment_groups = [
+        partition.scheme.get_groups_for_users(course_id, students, partition)
+        for partition in experiment_partitions
+    ]
 
-    # One last update before we close out...
-    TASK_LOG.info(u'%s, Task type: %s, Finalizing grade task', task_info_string, action_name)
-    return task_progress.update_task_state(extra_meta=current_step)
+    team_names = {}
+    if course.teams_enabled:
+        team_names = dict(
+            CourseTeamMembership.objects.filter(
+                user__in=students, team__course_id=course_id
+            ).values_list('user_id', 'team__name')
+        )
+
+    enrollment_modes = dict(
+        CourseEnrollment.objects.filter(course_id=course_id, user__in=students).values_list('user_id', 'mode')
+    )
+    verified_user_ids = SoftwareSecurePhotoVerification.verified_user_ids([
+        student for student in students if enrollment_modes.get(student.id) in CourseMode.VERIFIED_MODES
+    ])
+    certificate_statuses = certificate_statuses_for_students(students, course_id)
+
+    return {
+        student.id: {
+            'cohort_name': cohort_names.get(student.id, ''),
+            'experiment_group_names': [
+                groups[student.id].name if student.id in groups else ''
+                for groups in experiment_groups
+            ],
+            'team_name': team_names.get(student.id, ''),
+            'enrollment_mode': enrollment_modes.get(student.id),
+            'is_verified': student.id in verified_user_ids,
+            'certificate_status': certificate_statuses[student.id],
+        }
+        for student in students
+    }
 
 
 def _order_problems(blocks):
@@ -889,12 +1238,7 @@ def upload_problem_responses_csv(_xmodule_instance_args, _entry_id, course_id, t
     problem_location = task_input.get('problem_location')
     student_data = list_problem_responses(course_id, problem_location)
     features = ['username', 'state']
-    header, rows = format_dictlist(student_data, features)
-
-    task_progress.attempted = task_progress.succeeded = len(rows)
-    task_progress.skipped = task_progress.total - task_progress.attempted
-
-    rows.insert(0, header)
+    rows = chain([features], format_dictlist_rows(student_data, features))
 
     current_step = {'step': 'Uploading CSV'}
     task_progress.update_task_state(extra_meta=current_step)
@@ -902,7 +1246,10 @@ def upload_problem_responses_csv(_xmodule_instance_args, _entry_id, course_id, t
     # Perform the upload
     problem_location = re.sub(r'[:/]', '_', problem_location)
     csv_name = 'student_state_from_{}'.format(problem_location)
-    upload_csv_to_report_store(rows, csv_name, course_id, start_date)
+    num_rows = upload_csv_to_report_store(rows, csv_name, course_id, start_date)
+
+    task_progress.attempted = task_progress.succeeded = num_rows - 1
+    task_progress.skipped = task_progress.total - task_progress.attempted
 
     return task_progress.update_task_state(extra_meta=current_step)
 
@@ -932,48 +1279,53 @@ def upload_problem_grade_report(_xmodule_instance_args, _entry_id, course_id, _t
             extra_meta={'step': 'Generating course structure. Please refresh and try again.'}
         )
 
-    # Just generate the static fields for now.
-    rows = [list(header_row.values()) + ['Final Grade'] + list(chain.from_iterable(problems.values()))]
     error_rows = [list(header_row.values()) + ['error_msg']]
     current_step = {'step': 'Calculating Grades'}
 
-    for student, gradeset, err_msg in iterate_grades_for(course_id, enrolled_students, keep_raw_scores=True):
-        student_fields = [getattr(student, field_name) for field_name in header_row]
-        task_progress.attempted += 1
+    def _problem_grade_rows():
+        """
+        Yield the rows of the report as the students are graded, appending the
+        rows of any students who couldn't be graded to `error_rows`.
+        """
+        # Just generate the static fields for now.
+        yield list(header_row.values()) + ['Final Grade'] + list(chain.from_iterable(problems.values()))
 
-        if 'percent' not in gradeset or 'raw_scores' not in gradeset:
-            # There was an error grading this student.
-            # Generally there will be a non-empty err_msg, but that is not always the case.
-            if not err_msg:
-                err_msg = u"Unknown error"
-            error_rows.append(student_fields + [err_msg])
-            task_progress.failed += 1
-            continue
+        for student, gradeset, err_msg in iterate_grades_for(course_id, enrolled_students, keep_raw_scores=True):
+            student_fields = [getattr(student, field_name) for field_name in header_row]
+            task_progress.attempted += 1
 
-        final_grade = gradeset['percent']
-        # Only consider graded problems
-        problem_scores = {unicode(score.module_id): score for score in gradeset['raw_scores'] if score.graded}
-        earned_possible_values = list()
-        for problem_id in problems:
-            try:
-                problem_score = problem_scores[problem_id]
-                earned_possible_values.append([problem_score.earned, problem_score.possible])
-            except KeyError:
-                # The student has not been graded on this problem.  For example,
-                # iterate_grades_for skips problems that students have never
-                # seen in order to speed up report generation.  It could also be
-                # the case that the student does not have access to it (e.g. A/B
-                # test or cohorted courseware).
-                earned_possible_values.append(['N/A', 'N/A'])
-        rows.append(student_fields + [final_grade] + list(chain.from_iterable(earned_possible_values)))
-
-        task_progress.succeeded += 1
-        if task_progress.attempted % status_interval == 0:
-            task_progress.update_task_state(extra_meta=current_step)
+            if 'percent' not in gradeset or 'raw_scores' not in gradeset:
+                # There was an error grading this student.
+                # Generally there will be a non-empty err_msg, but that is not always the case.
+                if not err_msg:
+                    err_msg = u"Unknown error"
+                error_rows.append(student_fields + [err_msg])
+                task_progress.failed += 1
+                continue
+
+            final_grade = gradeset['percent']
+            # Only consider graded problems
+            problem_scores = {unicode(score.module_id): score for score in gradeset['raw_scores'] if score.graded}
+            earned_possible_values = list()
+            for problem_id in problems:
+                try:
+                    problem_score = problem_scores[problem_id]
+                    earned_possible_values.append([problem_score.earned, problem_score.possible])
+                except KeyError:
+                    # The student has not been graded on this problem.  For example,
+                    # iterate_grades_for skips problems that students have never
+                    # seen in order to speed up report generation.  It could also be
+                    # the case that the student does not have access to it (e.g. A/B
+                    # test or cohorted courseware).
+                    earned_possible_values.append(['N/A', 'N/A'])
+            yield student_fields + [final_grade] + list(chain.from_iterable(earned_possible_values))
+
+            task_progress.succeeded += 1
+            if task_progress.attempted % status_interval == 0:
+                task_progress.update_task_state(extra_meta=current_step)
 
     # Perform the upload if any students have been successfully graded
-    if len(rows) > 1:
-        upload_csv_to_report_store(rows, 'problem_grade_report', course_id, start_date)
+    upload_csv_to_report_store(_problem_grade_rows(), 'problem_grade_report', course_id, start_date, min_rows=2)
     # If there are any error rows, write them out as well
     if len(error_rows) > 1:
         upload_csv_to_report_store(error_rows, 'problem_grade_report_err', course_id, start_date)
@@ -997,19 +1349,17 @@ def upload_students_csv(_xmodule_instance_args, _entry_id, course_id, task_input
 
     # compute the student features table and format it
     query_features = task_input
-    student_data = enrolled_students_features(course_id, query_features)
-    header, rows = format_dictlist(student_data, query_features)
-
-    task_progress.attempted = task_progress.succeeded = len(rows)
-    task_progress.skipped = task_progress.total - task_progress.attempted
-
-    rows.insert(0, header)
+    student_data = iter_enrolled_students_features(course_id, query_features)
+    rows = chain([query_features], format_dictlist_rows(student_data, query_features))
 
     current_step = {'step': 'Uploading CSV'}
     task_progress.update_task_state(extra_meta=current_step)
 
     # Perform the upload
-    upload_csv_to_report_store(rows, 'student_profile_info', course_id, start_date)
+    num_rows = upload_csv_to_report_store(rows, 'student_profile_info', course_id, start_date)
+
+    task_progress.attempted = task_progress.succeeded = num_rows - 1
+    task_progress.skipped = task_progress.total - task_progress.attempted
 
     return task_progress.update_task_state(extra_meta=current_step)
 
@@ -1035,13 +1385,10 @@ def upload_enrollment_report(_xmodule_instance_args, _entry_id, course_id, _task
     )
     TASK_LOG.info(u'%s, Task type: %s, Starting task execution', task_info_string, action_name)
 
-    # Loop over all our students and build our CSV lists in memory
-    rows = []
-    header = None
+    # Loop over all our students, and write out their rows as we go
     current_step = {'step': 'Gathering Profile Information'}
     enrollment_report_provider = PaidCourseEnrollmentReportProvider()
     total_students = students_in_course.count()
-    student_counter = 0
     TASK_LOG.info(
         u'%s, Task type: %s, Current step: %s, generating detailed enrollment report for total students: %s',
         task_info_string,
@@ -1050,86 +1397,93 @@ def upload_enrollment_report(_xmodule_instance_args, _entry_id, course_id, _task
         total_students
     )
 
-    for student in students_in_course:
-        # Periodically update task status (this is a cache write)
-        if task_progress.attempted % status_interval == 0:
-            task_progress.update_task_state(extra_meta=current_step)
-        task_progress.attempted += 1
-
-        # Now add a log entry after certain intervals to get a hint that task is in progress
-        student_counter += 1
-        if student_counter % 100 == 0:
-            TASK_LOG.info(
-                u'%s, Task type: %s, Current step: %s, gathering enrollment profile for students in progress: %s/%s',
-                task_info_string,
-                action_name,
-                current_step,
-                student_counter,
-                total_students
-            )
+    def _enrollment_report_rows():
+        """
+        Yield the rows of the report, starting with the header row, as the
+        students' profiles are gathered.
+        """
+        header = None
+        student_counter = 0
+        for student in students_in_course.iterator():
+            # Periodically update task status (this is a cache write)
+            if task_progress.attempted % status_interval == 0:
+                task_progress.update_task_state(extra_meta=current_step)
+            task_progress.attempted += 1
 
-        user_data = enrollment_report_provider.get_user_profile(student.id)
-        course_enrollment_data = enrollment_report_provider.get_enrollment_info(student, course_id)
-        payment_data = enrollment_report_provider.get_payment_info(student, course_id)
-
-        # display name map for the column headers
-        enrollment_report_headers = {
-            'User ID': _('User ID'),
-            'Username': _('Username'),
-            'Full Name': _('Full Name'),
-            'First Name': _('First Name'),
-            'Last Name': _('Last Name'),
-            'Company Name': _('Company Name'),
-            'Title': _('Title'),
-            'Language': _('Language'),
-            'Year of Birth': _('Year of Birth'),
-            'Gender': _('Gender'),
-            'Level of Education': _('Level of Education'),
-            'Mailing Address': _('Mailing Address'),
-            'Goals': _('Goals'),
-            'City': _('City'),
-            'Country': _('Country'),
-            'Enrollment Date': _('Enrollment Date'),
-            'Currently Enrolled': _('Currently Enrolled'),
-            'Enrollment Source': _('Enrollment Source'),
-            'Manual (Un)Enrollment Reason': _('Manual (Un)Enrollment Reason'),
-            'Enrollment Role': _('Enrollment Role'),
-            'List Price': _('List Price'),
-            'Payment Amount': _('Payment Amount'),
-            'Coupon Codes Used': _('Coupon Codes Used'),
-            'Registration Code Used': _('Registration Code Used'),
-            'Payment Status': _('Payment Status'),
-            'Transaction Reference Number': _('Transaction Reference Number')
-        }
+            # Now add a log entry after certain intervals to get a hint that task is in progress
+            student_counter += 1
+            if student_counter % 100 == 0:
+                TASK_LOG.info(
+                    u'%s, Task type: %s, Current step: %s, '
+                    u'gathering enrollment profile for students in progress: %s/%s',
+                    task_info_string,
+                    action_name,
+                    current_step,
+                    student_counter,
+                    total_students
+                )
 
-        if not header:
-            header = user_data.keys() + course_enrollment_data.keys() + payment_data.keys()
-            display_headers = []
-            for header_element in header:
-                # translate header into a localizable display string
-                display_headers.append(enrollment_report_headers.get(header_element, header_element))
-            rows.append(display_headers)
+            user_data = enrollment_report_provider.get_user_profile(student.id)
+            course_enrollment_data = enrollment_report_provider.get_enrollment_info(student, course_id)
+            payment_data = enrollment_report_provider.get_payment_info(student, course_id)
+
+            # display name map for the column headers
+            enrollment_report_headers = {
+                'User ID': _('User ID'),
+                'Username': _('Username'),
+                'Full Name': _('Full Name'),
+                'First Name': _('First Name'),
+                'Last Name': _('Last Name'),
+                'Company Name': _('Company Name'),
+                'Title': _('Title'),
+                'Language': _('Language'),
+                'Year of Birth': _('Year of Birth'),
+                'Gender': _('Gender'),
+                'Level of Education': _('Level of Education'),
+                'Mailing Address': _('Mailing Address'),
+                'Goals': _('Goals'),
+                'City': _('City'),
+                'Country': _('Country'),
+                'Enrollment Date': _('Enrollment Date'),
+                'Currently Enrolled': _('Currently Enrolled'),
+                'Enrollment Source': _('Enrollment Source'),
+                'Manual (Un)Enrollment Reason': _('Manual (Un)Enrollment Reason'),
+                'Enrollment Role': _('Enrollment Role'),
+                'List Price': _('List Price'),
+                'Payment Amount': _('Payment Amount'),
+                'Coupon Codes Used': _('Coupon Codes Used'),
+                'Registration Code Used': _('Registration Code Used'),
+                'Payment Status': _('Payment Status'),
+                'Transaction Reference Number': _('Transaction Reference Number')
+            }
 
-        rows.append(user_data.values() + course_enrollment_data.values() + payment_data.values())
-        task_progress.succeeded += 1
+            if not header:
+                header = user_data.keys() + course_enrollment_data.keys() + payment_data.keys()
+                display_headers = []
+                for header_element in header:
+                    # translate header into a localizable display string
+                    display_headers.append(enrollment_report_headers.get(header_element, header_element))
+                yield display_headers
+
+            yield user_data.values() + course_enrollment_data.values() + payment_data.values()
+            task_progress.succeeded += 1
 
+    upload_csv_to_report_store(
+        _enrollment_report_rows(), 'enrollment_report', course_id, start_date, config_name='FINANCIAL_REPORTS'
+    )
     TASK_LOG.info(
         u'%s, Task type: %s, Current step: %s, Detailed enrollment report generated for students: %s/%s',
         task_info_string,
         action_name,
         current_step,
-        student_counter,
+        task_progress.attempted,
         total_students
     )
 
-    # By this point, we've got the rows we're going to stuff into our CSV files.
     current_step = {'step': 'Uploading CSVs'}
     task_progress.update_task_state(extra_meta=current_step)
     TASK_LOG.info(u'%s, Task type: %s, Current step: %s', task_info_string, action_name, current_step)
 
-    # Perform the actual upload
-    upload_csv_to_report_store(rows, 'enrollment_report', course_id, start_date, config_name='FINANCIAL_REPORTS')
-
     # One last update before we close out...
     TASK_LOG.info(u'%s, Task type: %s, Finalizing detailed enrollment task', task_info_string, action_name)
     return task_progress.update_task_state(extra_meta=current_step)
@@ -1151,18 +1505,16 @@ def upload_may_enroll_csv(_xmodule_instance_args, _entry_id, course_id, task_inp
     # Compute result table and format it
     query_features = task_input.get('features')
     student_data = list_may_enroll(course_id, query_features)
-    header, rows = format_dictlist(student_data, query_features)
-
-    task_progress.attempted = task_progress.succeeded = len(rows)
-    task_progress.skipped = task_progress.total - task_progress.attempted
-
-    rows.insert(0, header)
+    rows = chain([query_features], format_dictlist_rows(student_data, query_features))
 
     current_step = {'step': 'Uploading CSV'}
     task_progress.update_task_state(extra_meta=current_step)
 
     # Perform the upload
-    upload_csv_to_report_store(rows, 'may_enroll_info', course_id, start_date)
+    num_rows = upload_csv_to_report_store(rows, 'may_enroll_info', course_id, start_date)
+
+    task_progress.attempted = task_progress.succeeded = num_rows - 1
+    task_progress.skipped = task_progress.total - task_progress.attempted
 
     return task_progress.update_task_state(extra_meta=current_step)
 
@@ -1260,11 +1612,10 @@ def upload_exec_summary_report(_xmodule_instance_args, _entry_id, course_id, _ta
     status_interval = 100
 
     enrolled_users = CourseEnrollment.objects.users_enrolled_in(course_id)
+    filtered_out_user_ids = CourseRoleCache(course_id).user_ids_with_course_role(*FILTERED_OUT_ROLES)
     true_enrollment_count = 0
-    for user in enrolled_users:
-        if not user.is_staff and not CourseAccessRole.objects.filter(
-                user=user, course_id=course_id, role__in=FILTERED_OUT_ROLES
-        ).exists():
+    for user in enrolled_users.only('id', 'is_staff'):
+        if not user.is_staff and user.id not in filtered_out_user_ids:
             true_enrollment_count += 1
 
     task_progress = TaskProgress(action_name, true_enrollment_count, start_time)
@@ -1386,18 +1737,16 @@ def upload_proctored_exam_results_report(_xmodule_instance_args, _entry_id, cour
     # Compute result table and format it
     query_features = _task_input.get('features')
     student_data = get_proctored_exam_results(course_id, query_features)
-    header, rows = format_dictlist(student_data, query_features)
-
-    task_progress.attempted = task_progress.succeeded = len(rows)
-    task_progress.skipped = task_progress.total - task_progress.attempted
-
-    rows.insert(0, header)
+    rows = chain([query_features], format_dictlist_rows(student_data, query_features))
 
     current_step = {'step': 'Uploading CSV'}
     task_progress.update_task_state(extra_meta=current_step)
 
     # Perform the upload
-    upload_csv_to_report_store(rows, 'proctored_exam_results_report', course_id, start_date)
+    num_rows = upload_csv_to_report_store(rows, 'proctored_exam_results_report', course_id, start_date)
+
+    task_progress.attempted = task_progress.succeeded = num_rows - 1
+    task_progress.skipped = task_progress.total - task_progress.attempted
 
     return task_progress.update_task_state(extra_meta=current_step)
 
@@ -1658,7 +2007,7 @@ def upload_ora2_data(
 
     try:
         header, datarows = OraAggregateData.collect_ora2_data(course_id)
-        rows = [header] + [row for row in datarows]
+        rows = chain([header], datarows)
     # Update progress to failed regardless of error type
     except Exception:  # pylint: disable=broad-except
         TASK_LOG.exception('Failed to get ORA data.')
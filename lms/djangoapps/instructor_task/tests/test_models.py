@@ -3,6 +3,7 @@ Tests for instructor_task/models.py.
 """
 
 from cStringIO import StringIO
+from boto.exception import S3ResponseError
 import mock
 import time
 from datetime import datetime
@@ -25,6 +26,16 @@ class MockKey(object):
         """ Expected method on a Key object. """
         self.bucket.store_key(self)
 
+    def set_contents_from_file(self, fp, headers, rewind):  # pylint: disable=unused-argument
+        """ Expected method on a Key object. """
+        self.bucket.store_key(self)
+
+    def get_contents_as_string(self):
+        """ Expected method on a Key object. """
+        if not any(key.key == self.key for key in self.bucket.keys):  # pylint: disable=no-member
+            raise S3ResponseError(404, 'Not Found')
+        return ''
+
     def generate_url(self, expires_in):  # pylint: disable=unused-argument
         """ Expected method on a Key object. """
         return "http://fake-edx-s3.edx.org/"
@@ -84,6 +95,41 @@ class ReportStoreTestMixin(object):
             ['new_file', 'middle_file', 'old_file']
         )
 
+    def test_rows_writer_commit(self):
+        """
+        Test that rows written with ReportStore.rows_writer() are only stored
+        once the writer is committed.
+        """
+        report_store = self.create_report_store()
+        with report_store.rows_writer(self.course_id, 'report.csv') as writer:
+            writer.writerows(([u'row', unicode(index)] for index in range(3)))
+            self.assertEqual(writer.num_rows, 3)
+            self.assertEqual(report_store.links_for(self.course_id), [])
+
+        self.assertEqual([link[0] for link in report_store.links_for(self.course_id)], ['report.csv'])
+
+    def test_rows_writer_abort(self):
+        """
+        Test that nothing is stored if an exception is raised while writing
+        rows with ReportStore.rows_writer().
+        """
+        report_store = self.create_report_store()
+        with self.assertRaises(ValueError):
+            with report_store.rows_writer(self.course_id, 'report.csv') as writer:
+                writer.writerow([u'header'])
+                raise ValueError
+
+        self.assertEqual(report_store.links_for(self.course_id), [])
+
+    def test_read_rows_missing(self):
+        """
+        Test that ReportStore.read_rows() raises IOError for a file that
+        was never stored.
+        """
+        report_store = self.create_report_store()
+        with self.assertRaises(IOError):
+            list(report_store.read_rows(self.course_id, 'missing.csv'))
+
 
 class LocalFSReportStoreTestCase(ReportStoreTestMixin, TestReportMixin, TestCase):
     """
@@ -19,6 +19,7 @@ from xmodule.modulestore.exceptions import ItemNotFoundError
 from opaque_keys.edx.locations import i4xEncoder
 
 from courseware.models import StudentModule
+from courseware.model_data import FieldDataCache, MultiUserStateCache
 from courseware.tests.factories import StudentModuleFactory
 from student.tests.factories import UserFactory, CourseEnrollmentFactory
 
@@ -276,6 +277,40 @@ class TestRescoreInstructorTask(TestInstructorTasks):
         self.assertEquals(output.get('action_name'), 'rescored')
         self.assertGreater(output.get('duration_ms'), 0)
 
+    def test_rescoring_state_changed_since_prefetched(self):
+        num_students = 3
+        students = self._create_students_with_state(num_students, json.dumps({'done': True}))
+        task_entry = self._create_input_entry()
+        mock_instance = Mock()
+        mock_instance.rescore_problem = Mock(return_value={'success': 'correct'})
+
+        def prefetch_and_submit(users, descriptors):
+            """Prefetches the state, then has the first student submit again."""
+            prefetched_state = for_descriptor_descendents(users, descriptors)
+            StudentModule.objects.get(student=students[0]).save()
+            return prefetched_state
+
+        for_descriptor_descendents = MultiUserStateCache.for_descriptor_descendents
+        with patch.object(
+            MultiUserStateCache, 'for_descriptor_descendents', side_effect=prefetch_and_submit
+        ), patch.object(
+            FieldDataCache, 'cache_for_descriptor_descendents', wraps=FieldDataCache.cache_for_descriptor_descendents
+        ) as mock_cache_for_descriptor_descendents, patch(
+            'instructor_task.tasks_helper.get_module_for_descriptor_internal', return_value=mock_instance
+        ):
+            self._run_task_with_mock_celery(rescore_problem, task_entry.id, task_entry.task_id)
+
+        # Only the state of the student who submitted since it was
+        # prefetched is read again.
+        prefetched_by_student = {
+            call[0][1]: call[1]['prefetched_state'] is not None
+            for call in mock_cache_for_descriptor_descendents.call_args_list
+        }
+        self.assertEquals(
+            prefetched_by_student,
+            {student: student != students[0] for student in students},
+        )
+
     def test_rescoring_bad_result(self):
         # Confirm that rescoring does not succeed if "success" key is not an expected value.
         input_state = json.dumps({'done': True})
@@ -354,6 +389,13 @@ class TestResetAttemptsInstructorTask(TestInstructorTasks):
         # check that entries were reset
         self._assert_num_attempts(students, 0)
 
+    def test_reset_does_not_prefetch_state(self):
+        num_students = 3
+        self._create_students_with_state(num_students, json.dumps({'attempts': 3}))
+        with patch.object(MultiUserStateCache, 'for_descriptor_descendents') as mock_for_descriptor_descendents:
+            self._test_run_with_task(reset_problem_attempts, 'reset', num_students)
+        self.assertFalse(mock_for_descriptor_descendents.called)
+
     def test_reset_with_zero_attempts(self):
         initial_attempts = 0
         input_state = json.dumps({'attempts': initial_attempts})
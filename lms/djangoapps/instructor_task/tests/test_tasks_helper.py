@@ -8,13 +8,16 @@ Unit tests for LMS instructor-initiated background tasks helper functions.
 
 """
 
+import json
 import os
 import shutil
 from datetime import datetime
 import urllib
+from uuid import uuid4
 
 import ddt
 from freezegun import freeze_time
+from celery.states import SUCCESS, FAILURE
 from mock import Mock, patch
 from nose.plugins.attrib import attr
 import tempfile
@@ -45,7 +48,8 @@ from student.models import CourseEnrollment, CourseEnrollmentAllowed, ManualEnro
 from lms.djangoapps.verify_student.tests.factories import SoftwareSecurePhotoVerificationFactory
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 from xmodule.partitions.partitions import Group, UserPartition
-from instructor_task.models import ReportStore
+from instructor_task.models import InstructorTask, ReportStore
+from instructor_task.tests.factories import InstructorTaskFactory
 from survey.models import SurveyForm, SurveyAnswer
 from instructor_task.tasks_helper import (
     cohort_students_and_upload,
@@ -343,6 +347,64 @@ class TestTeamGradeReport(InstructorGradeReportTestCase):
         self._verify_cell_data_for_user(self.student2.username, self.course.id, 'Team Name', team2.name)
 
 
+@override_settings(GRADE_REPORT_STUDENTS_PER_SUBTASK=2)
+class TestGradeReportSubtasks(InstructorGradeReportTestCase):
+    """
+    Test that grade reports for courses with many students are generated by
+    subtasks, and merged into a single report.
+    """
+    def setUp(self):
+        super(TestGradeReportSubtasks, self).setUp()
+        self.course = CourseFactory.create()
+        self.students = [self.create_student(u'student{}'.format(index)) for index in range(5)]
+        self.entry = InstructorTaskFactory.create(
+            course_id=self.course.id,
+            task_id=str(uuid4()),
+            task_type='grade_course',
+        )
+
+    def _upload_grades_csv(self):
+        """
+        Runs the grade report task for the InstructorTask entry, with its
+        subtasks running eagerly, and returns the updated entry.
+        """
+        with patch('instructor_task.tasks_helper._get_current_task'):
+            upload_grades_csv(None, self.entry.id, self.course.id, None, 'graded')
+        return InstructorTask.objects.get(pk=self.entry.id)
+
+    def test_subtasks_merged(self):
+        entry = self._upload_grades_csv()
+        self.assertEqual(entry.task_state, SUCCESS)
+        self.assertEqual(json.loads(entry.subtasks)['total'], 3)
+        self.assertDictContainsSubset(
+            {'attempted': 5, 'succeeded': 5, 'failed': 0},
+            json.loads(entry.task_output),
+        )
+
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        links = report_store.links_for(self.course.id)
+        self.assertEqual(len(links), 1)
+        with open(report_store.path_to(self.course.id, links[0][0])) as csv_file:
+            usernames = [row['username'] for row in unicodecsv.DictReader(csv_file)]
+        self.assertEqual(usernames, [student.username for student in self.students])
+
+        # The partial reports are deleted once they are merged.
+        partials_store = ReportStore.from_config(config_name='GRADE_REPORT_PARTIALS')
+        self.assertEqual(partials_store.links_for(self.course.id), [])
+
+    @patch('instructor_task.tasks_helper.get_course_by_id')
+    def test_subtask_failure(self, mock_get_course_by_id):
+        mock_get_course_by_id.side_effect = Exception('Cannot load course')
+        entry = self._upload_grades_csv()
+        self.assertEqual(json.loads(entry.subtasks)['failed'], 3)
+        self.assertEqual(entry.task_state, FAILURE)
+        self.assertIn('3 of 3 grade report subtasks failed', json.loads(entry.task_output)['message'])
+
+        # No grade report is uploaded when a subtask fails.
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        self.assertEqual(report_store.links_for(self.course.id), [])
+
+
 class TestProblemResponsesReport(TestReportMixin, InstructorTaskCourseTestCase):
     """
     Tests that generation of CSV files listing student answers to a
@@ -2213,13 +2275,13 @@ class TestInstructorOra2Report(SharedModuleStoreTestCase):
             with patch('instructor_task.tasks_helper.OraAggregateData.collect_ora2_data') as mock_collect_data:
                 mock_collect_data.return_value = (test_header, test_rows)
 
-                with patch('instructor_task.models.LocalFSReportStore.store_rows') as mock_store_rows:
-                    return_val = upload_ora2_data(None, None, self.course.id, None, 'generated')
+                return_val = upload_ora2_data(None, None, self.course.id, None, 'generated')
 
-                    # pylint: disable=maybe-no-member
-                    timestamp_str = datetime.now(UTC).strftime('%Y-%m-%d-%H%M')
-                    course_id_string = urllib.quote(self.course.id.to_deprecated_string().replace('/', '_'))
-                    filename = u'{}_ORA_data_{}.csv'.format(course_id_string, timestamp_str)
+                # pylint: disable=maybe-no-member
+                timestamp_str = datetime.now(UTC).strftime('%Y-%m-%d-%H%M')
+                course_id_string = urllib.quote(self.course.id.to_deprecated_string().replace('/', '_'))
+                filename = u'{}_ORA_data_{}.csv'.format(course_id_string, timestamp_str)
 
-                    self.assertEqual(return_val, UPDATE_STATUS_SUCCEEDED)
-                    mock_store_rows.assert_called_once_with(self.course.id, filename, [test_header] + test_rows)
+                self.assertEqual(return_val, UPDATE_STATUS_SUCCEEDED)
+                report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+                self.assertEqual(list(report_store.read_rows(self.course.id, filename)), [test_header] + test_rows)
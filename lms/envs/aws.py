@@ -218,6 +218,7 @@ if 'loc_cache' not in CACHES:
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'edx_location_mem_cache',
     }
+COURSE_STRUCTURE_LOCAL_CACHE = ENV_TOKENS.get('COURSE_STRUCTURE_LOCAL_CACHE', COURSE_STRUCTURE_LOCAL_CACHE)
 
 # Email overrides
 DEFAULT_FROM_EMAIL = ENV_TOKENS.get('DEFAULT_FROM_EMAIL', DEFAULT_FROM_EMAIL)
@@ -304,6 +305,17 @@ VIRTUAL_UNIVERSITIES = ENV_TOKENS.get('VIRTUAL_UNIVERSITIES', [])
 META_UNIVERSITIES = ENV_TOKENS.get('META_UNIVERSITIES', {})
 COMMENTS_SERVICE_URL = ENV_TOKENS.get("COMMENTS_SERVICE_URL", '')
 COMMENTS_SERVICE_KEY = ENV_TOKENS.get("COMMENTS_SERVICE_KEY", '')
+COMMENTS_SERVICE_CONNECTION_POOL_SIZE = ENV_TOKENS.get(
+    "COMMENTS_SERVICE_CONNECTION_POOL_SIZE", COMMENTS_SERVICE_CONNECTION_POOL_SIZE
+)
+COMMENTS_SERVICE_CONNECT_RETRIES = ENV_TOKENS.get("COMMENTS_SERVICE_CONNECT_RETRIES", COMMENTS_SERVICE_CONNECT_RETRIES)
+COMMENTS_SERVICE_RETRY_BACKOFF_FACTOR = ENV_TOKENS.get(
+    "COMMENTS_SERVICE_RETRY_BACKOFF_FACTOR", COMMENTS_SERVICE_RETRY_BACKOFF_FACTOR
+)
+COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS = ENV_TOKENS.get(
+    "COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS", COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS
+)
+COMMENTS_SERVICE_CACHE_TIMEOUT = ENV_TOKENS.get("COMMENTS_SERVICE_CACHE_TIMEOUT", COMMENTS_SERVICE_CACHE_TIMEOUT)
 CERT_QUEUE = ENV_TOKENS.get("CERT_QUEUE", 'test-pull')
 ZENDESK_URL = ENV_TOKENS.get("ZENDESK_URL")
 FEEDBACK_SUBMISSION_EMAIL = ENV_TOKENS.get("FEEDBACK_SUBMISSION_EMAIL")
@@ -449,6 +461,11 @@ MODULESTORE_FIELD_OVERRIDE_PROVIDERS = ENV_TOKENS.get(
     MODULESTORE_FIELD_OVERRIDE_PROVIDERS
 )
 
+CONTENTSERVER_DISK_CACHE_DIR = ENV_TOKENS.get('CONTENTSERVER_DISK_CACHE_DIR', CONTENTSERVER_DISK_CACHE_DIR)
+CONTENTSERVER_DISK_CACHE_MAX_BYTES = ENV_TOKENS.get(
+    'CONTENTSERVER_DISK_CACHE_MAX_BYTES', CONTENTSERVER_DISK_CACHE_MAX_BYTES
+)
+
 XBLOCK_FIELD_DATA_WRAPPERS = ENV_TOKENS.get(
     'XBLOCK_FIELD_DATA_WRAPPERS',
     XBLOCK_FIELD_DATA_WRAPPERS
@@ -573,6 +590,14 @@ VERIFY_STUDENT = AUTH_TOKENS.get("VERIFY_STUDENT", VERIFY_STUDENT)
 GRADES_DOWNLOAD_ROUTING_KEY = HIGH_MEM_QUEUE
 
 GRADES_DOWNLOAD = ENV_TOKENS.get("GRADES_DOWNLOAD", GRADES_DOWNLOAD)
+GRADE_REPORT_STUDENTS_PER_SUBTASK = ENV_TOKENS.get(
+    "GRADE_REPORT_STUDENTS_PER_SUBTASK", GRADE_REPORT_STUDENTS_PER_SUBTASK
+)
+# By default, store partial grade reports alongside (but not in) GRADES_DOWNLOAD.
+GRADE_REPORT_PARTIALS = ENV_TOKENS.get(
+    "GRADE_REPORT_PARTIALS",
+    dict(GRADES_DOWNLOAD, ROOT_PATH=GRADES_DOWNLOAD.get('ROOT_PATH', '').rstrip('/') + '_partials')
+)
 
 # financial reports
 FINANCIAL_REPORTS = ENV_TOKENS.get("FINANCIAL_REPORTS", FINANCIAL_REPORTS)
@@ -60,6 +60,20 @@ DISCUSSION_SETTINGS = {
     'MAX_COMMENT_DEPTH': 2,
 }
 
+# Connections to the comments service are pooled (and kept alive) by a
+# process-wide requests Session; requests that fail to connect are retried
+# with exponential backoff.
+COMMENTS_SERVICE_CONNECTION_POOL_SIZE = 10
+COMMENTS_SERVICE_CONNECT_RETRIES = 2
+COMMENTS_SERVICE_RETRY_BACKOFF_FACTOR = 0.1
+# The maximum number of independent comments service requests that are made
+# concurrently by lms.lib.comment_client.utils.perform_concurrent_requests.
+COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS = 4
+# The number of seconds to cache the responses to read-only comments service
+# requests for (see lms.lib.comment_client.response_cache), or 0 to disable
+# the cache.
+COMMENTS_SERVICE_CACHE_TIMEOUT = 0
+
 
 # Features
 FEATURES = {
@@ -363,6 +377,16 @@ FEATURES = {
 
     # WIP -- will be removed in Ticket #TNL-4750.
     'ENABLE_TIME_ZONE_PREFERENCE': False,
+
+    # When a course is published, keep its cached block structure and
+    # recollect only the changed subtrees, if all transformers support it.
+    'ENABLE_INCREMENTAL_BLOCK_STRUCTURE_COLLECTION': False,
+
+    # Store each learner's course grade, and serve it until their scores,
+    # the course structure or the grading policy change. Stored grades are
+    # still invalidated while this is disabled, so it can safely be enabled
+    # again later.
+    'ENABLE_PERSISTENT_GRADES': False,
 }
 
 # Ignore static asset files on import which match this pattern
@@ -745,6 +769,14 @@ MODULESTORE = {
     }
 }
 
+# Process-local cache of deserialized split modulestore course structures, consulted
+# before the 'course_structure_cache'. Structures are immutable, so entries are only
+# evicted to stay within these limits. Set either limit to 0 to disable it.
+COURSE_STRUCTURE_LOCAL_CACHE = {
+    'MAX_ENTRIES': 500,
+    'MAX_BYTES': 256 * 1024 * 1024,
+}
+
 #################### Python sandbox ############################################
 
 CODE_JAIL = {
@@ -758,6 +790,16 @@ CODE_JAIL = {
         # How many CPU seconds can jailed code use?
         'CPU': 1,
     },
+
+    # A pool of persistent sandbox workers, which have already imported the
+    # libraries that problem code uses, to run the code rather than starting
+    # a new sandbox each time.
+    'pool': {
+        # How many workers each process can use.  0 disables the pool.
+        'size': 0,
+        # How many pieces of code each worker runs before it's replaced.
+        'max_jobs_per_worker': 100,
+    },
 }
 
 # Some courses are allowed to run unsafe code. This is a list of regexes, one
@@ -2264,7 +2306,7 @@ VERIFY_STUDENT = {
 ### This enables the Metrics tab for the Instructor dashboard ###########
 FEATURES['CLASS_DASHBOARD'] = False
 if FEATURES.get('CLASS_DASHBOARD'):
-    INSTALLED_APPS += ('class_dashboard',)
+    INSTALLED_APPS += ('class_dashboard.apps.ClassDashboardConfig',)
 
 ################ Enable credit eligibility feature ####################
 ENABLE_CREDIT_ELIGIBILITY = True
@@ -2349,6 +2391,20 @@ FINANCIAL_REPORTS = {
     'ROOT_PATH': '/tmp/edx-s3/financial_reports',
 }
 
+# Grade reports for courses with more than this many enrolled students are
+# generated by subtasks that each grade this many of the students. Set to 0
+# to always generate grade reports in a single task.
+GRADE_REPORT_STUDENTS_PER_SUBTASK = 5000
+
+# Where the partial grade reports generated by grade report subtasks are
+# stored until they are merged. This must be storage that all workers share,
+# in a different location than GRADES_DOWNLOAD.
+GRADE_REPORT_PARTIALS = {
+    'STORAGE_TYPE': 'localfs',
+    'BUCKET': 'edx-grades',
+    'ROOT_PATH': '/tmp/edx-s3/grade_report_partials',
+}
+
 #### PASSWORD POLICY SETTINGS #####
 PASSWORD_MIN_LENGTH = 8
 PASSWORD_MAX_LENGTH = None
@@ -2751,6 +2807,13 @@ FIELD_OVERRIDE_PROVIDERS = ()
 # require student context.
 MODULESTORE_FIELD_OVERRIDE_PROVIDERS = ()
 
+# A local directory in which the contentserver caches course assets that are
+# too large for the "course_assets" cache (see contentserver.caching), or None
+# to not cache them.
+CONTENTSERVER_DISK_CACHE_DIR = None
+# The most bytes of assets to keep in CONTENTSERVER_DISK_CACHE_DIR.
+CONTENTSERVER_DISK_CACHE_MAX_BYTES = 10 * 1024 * 1024 * 1024
+
 # PROFILE IMAGE CONFIG
 # WARNING: Certain django storage backends do not support atomic
 # file overwrites (including the default, OverwriteStorage) - instead
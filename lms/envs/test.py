@@ -60,6 +60,10 @@ FEATURES['DISABLE_START_DATES'] = True
 # the one in cms/envs/test.py
 FEATURES['ENABLE_DISCUSSION_SERVICE'] = False
 
+# Make comments service requests one at a time, in order, so that tests can
+# make assertions about the last mocked request.
+COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS = 1
+
 FEATURES['ENABLE_SERVICE_STATUS'] = True
 
 FEATURES['ENABLE_SHOPPING_CART'] = True
@@ -72,6 +76,7 @@ FEATURES['ALLOW_COURSE_STAFF_GRADE_DOWNLOADS'] = True
 
 GRADES_DOWNLOAD['ROOT_PATH'] += "-{}".format(os.getpid())
 FINANCIAL_REPORTS['ROOT_PATH'] += "-{}".format(os.getpid())
+GRADE_REPORT_PARTIALS['ROOT_PATH'] += "-{}".format(os.getpid())
 
 
 # Toggles embargo on for testing
@@ -231,6 +236,12 @@ CACHES = {
     },
 }
 
+# Don't keep course structures around between tests
+COURSE_STRUCTURE_LOCAL_CACHE = {
+    'MAX_ENTRIES': 0,
+    'MAX_BYTES': 0,
+}
+
 # Dummy secret key for dev
 SECRET_KEY = '85920908f28904ed733fe576320db18cabd7b6cd'
 
@@ -1,4 +1,5 @@
 from .utils import CommentClientRequestError, perform_request
+from .response_cache import course_scope, thread_scope, user_scope
 
 from .thread import Thread, _url_for_flag_abuse_thread, _url_for_unflag_abuse_thread
 from lms.lib.comment_client import models
@@ -36,6 +37,17 @@ class Comment(models.Model):
         """Return the context of the thread which this comment belongs to."""
         return self.thread.context
 
+    @property
+    def _cache_scopes(self):
+        scopes = []
+        if self.attributes.get('thread_id'):
+            scopes.append(thread_scope(self.attributes['thread_id']))
+        if self.attributes.get('course_id'):
+            scopes.append(course_scope(self.attributes['course_id']))
+        if self.attributes.get('user_id'):
+            scopes.append(user_scope(self.attributes['user_id']))
+        return scopes
+
     @classmethod
     def url_for_comments(cls, params={}):
         if params.get('parent_id'):
@@ -66,6 +78,7 @@ class Comment(models.Model):
             metric_action='comment.abuse.flagged'
         )
         voteable._update_from_response(response)
+        voteable._invalidate_cached_responses()
 
     def unFlagAbuse(self, user, voteable, removeAll):
         if voteable.type == 'thread':
@@ -87,6 +100,7 @@ class Comment(models.Model):
             metric_action='comment.abuse.unflagged'
         )
         voteable._update_from_response(response)
+        voteable._invalidate_cached_responses()
 
 
 def _url_for_thread_comments(thread_id):
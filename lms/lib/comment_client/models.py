@@ -1,5 +1,6 @@
 import logging
 
+from . import response_cache
 from .utils import extract, perform_request, CommentClientRequestError
 
 
@@ -94,6 +95,20 @@ class Model(object):
         tags.append(u'model_class:{}'.format(self.__class__.__name__))
         return tags
 
+    @property
+    def _cache_scopes(self):
+        """
+        Returns the response_cache scopes of the cached responses that
+        include this model's data, which are invalidated when it's written.
+        """
+        return []
+
+    def _invalidate_cached_responses(self):
+        """
+        Invalidates the cached responses that include this model's data.
+        """
+        response_cache.invalidate(self._cache_scopes)
+
     @classmethod
     def find(cls, id):
         return cls(id=id)
@@ -152,6 +167,7 @@ class Model(object):
             )
         self.retrieved = True
         self._update_from_response(response)
+        self._invalidate_cached_responses()
         self.after_save(self)
 
     def delete(self):
@@ -159,6 +175,7 @@ class Model(object):
         response = perform_request('delete', url, metric_tags=self._metric_tags, metric_action='model.delete')
         self.retrieved = True
         self._update_from_response(response)
+        self._invalidate_cached_responses()
 
     @classmethod
     def url_with_id(cls, params={}):
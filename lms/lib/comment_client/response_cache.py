@@ -0,0 +1,150 @@
+"""
+An optional, short-lived cache of comments service GET responses, shared by
+all of the LMS processes through the default Django cache.
+
+It is enabled by setting COMMENTS_SERVICE_CACHE_TIMEOUT to the number of
+seconds to cache responses for.
+
+Each cached response belongs to one or more scopes (e.g. the course or
+thread that it includes data from), and the key it is cached under includes
+the current generation of each of its scopes.  Writes to the comments service
+increment the generations of the scopes that they affect (see `invalidate`),
+so the responses cached for those scopes are never returned again.
+
+Concurrent requests for the same response are coalesced: while one request
+is being made to the comments service, identical requests wait for its
+response to be cached rather than making the same request.
+"""
+import hashlib
+from time import sleep, time
+
+import dogstats_wrapper as dog_stats_api
+from django.conf import settings
+from django.core.cache import cache
+
+RESPONSE_KEY_PREFIX = 'comment_client.response'
+GENERATION_KEY_PREFIX = 'comment_client.generation'
+
+# How often requests waiting for a coalesced request check whether its
+# response has been cached, in seconds.
+POLL_INTERVAL = 0.05
+
+
+def get_timeout():
+    """
+    Return the number of seconds to cache responses for, which is 0 if the
+    cache is disabled.
+    """
+    return getattr(settings, 'COMMENTS_SERVICE_CACHE_TIMEOUT', 0)
+
+
+def course_scope(course_id):
+    """Return the scope of responses that include data from the given course."""
+    return u'course:{}'.format(course_id)
+
+
+def thread_scope(thread_id):
+    """Return the scope of responses that include the given thread (or its comments)."""
+    return u'thread:{}'.format(thread_id)
+
+
+def user_scope(user_id):
+    """Return the scope of responses that include the given user's data (e.g. read states)."""
+    return u'user:{}'.format(user_id)
+
+
+def _generation_key(scope):
+    """Return the cache key of the generation of the given scope."""
+    return u'{}.{}'.format(GENERATION_KEY_PREFIX, hashlib.sha1(scope.encode('utf-8')).hexdigest())
+
+
+def _new_generation():
+    """
+    Return the generation of a scope that doesn't have one in the cache.
+    Generations start at the current time, so that a scope whose generation
+    is evicted from the cache never reuses one of its earlier generations.
+    """
+    return int(time() * 1000)
+
+
+def _get_generations(scopes):
+    """Return the list of the current generations of the given scopes."""
+    keys = [_generation_key(scope) for scope in scopes]
+    generations = cache.get_many(keys)
+    missing_keys = [key for key in keys if key not in generations]
+    if missing_keys:
+        for key in missing_keys:
+            cache.add(key, _new_generation(), None)
+        generations.update(cache.get_many(missing_keys))
+    return [generations.get(key) for key in keys]
+
+
+def _response_key(url, params, language, scopes):
+    """
+    Return the cache key of the response to the GET request for `url` with
+    `params` in `language`, in the current generations of its `scopes`.
+    """
+    key = repr((url, sorted(params.items()), language, zip(scopes, _get_generations(scopes))))
+    return u'{}.{}'.format(RESPONSE_KEY_PREFIX, hashlib.sha1(key).hexdigest())
+
+
+def get_response(url, params, language, scopes, fetch, wait_timeout):
+    """
+    Return the (decoded JSON) response to the GET request for `url` with
+    `params` in `language`, which belongs to the given `scopes`, from the
+    cache.  If it isn't cached, it is returned by calling `fetch`, and cached,
+    unless the same request is already being made, in which case this waits
+    up to `wait_timeout` seconds for its response instead.
+    """
+    key = _response_key(url, params, language, scopes)
+    response = cache.get(key)
+    if response is not None:
+        dog_stats_api.increment('comment_client.cache.hit')
+        return response
+
+    lock_key = key + '.lock'
+    if not cache.add(lock_key, True, int(wait_timeout) + 1):
+        response = _wait_for_response(key, wait_timeout)
+        if response is not None:
+            dog_stats_api.increment('comment_client.cache.coalesced')
+            return response
+        # The request being made didn't complete in time, so make our own.
+        dog_stats_api.increment('comment_client.cache.miss')
+        return fetch()
+
+    dog_stats_api.increment('comment_client.cache.miss')
+    try:
+        response = fetch()
+        cache.set(key, response, get_timeout())
+    finally:
+        cache.delete(lock_key)
+    return response
+
+
+def _wait_for_response(key, wait_timeout):
+    """
+    Wait up to `wait_timeout` seconds for a response to be cached under
+    `key`, returning it, or None if it wasn't.
+    """
+    deadline = time() + wait_timeout
+    while time() < deadline:
+        sleep(POLL_INTERVAL)
+        response = cache.get(key)
+        if response is not None:
+            return response
+    return None
+
+
+def invalidate(scopes):
+    """
+    Invalidate all of the cached responses that belong to any of the given
+    scopes.
+    """
+    if not get_timeout():
+        return
+    for scope in scopes:
+        key = _generation_key(scope)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _new_generation(), None)
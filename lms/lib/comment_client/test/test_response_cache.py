@@ -0,0 +1,76 @@
+"""
+Tests for the comments service response cache.
+"""
+from django.core.cache import cache
+from django.test.utils import override_settings
+from mock import Mock, patch
+
+from lms.lib.comment_client import response_cache
+from lms.lib.comment_client.thread import Thread
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+
+
+def _mock_response(data):
+    """Returns a mock requests response with the given JSON data."""
+    return Mock(status_code=200, text='', json=Mock(return_value=data))
+
+
+@override_settings(COMMENTS_SERVICE_CACHE_TIMEOUT=60)
+@patch('lms.lib.comment_client.utils.pooled_request')
+class ResponseCacheTestCase(CacheIsolationTestCase):
+    """
+    Tests for caching comments service responses.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(ResponseCacheTestCase, self).setUp()
+        self.query_params = {'course_id': 'org/course/run', 'user_id': '1'}
+
+    def test_search_cached(self, mock_request):
+        mock_request.return_value = _mock_response({'collection': [{'id': 'thread'}], 'page': 1, 'num_pages': 1})
+        first = Thread.search(self.query_params)
+        second = Thread.search(self.query_params)
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(first.collection, second.collection)
+
+        # Other requests aren't served from the cache.
+        Thread.search(dict(self.query_params, user_id='2'))
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_invalidated_by_save(self, mock_request):
+        mock_request.return_value = _mock_response({'id': 'thread', 'course_id': 'org/course/run'})
+        Thread.search(self.query_params)
+        Thread(id='thread', course_id='org/course/run', title='Title').save()
+        Thread.search(self.query_params)
+        self.assertEqual(mock_request.call_count, 3)
+
+    def test_mark_as_read_not_cached(self, mock_request):
+        mock_request.return_value = _mock_response({'id': 'thread'})
+        Thread(id='thread').retrieve(user_id='1', mark_as_read=True)
+        Thread(id='thread').retrieve(user_id='1', mark_as_read=True)
+        self.assertEqual(mock_request.call_count, 2)
+
+        Thread(id='thread').retrieve(user_id='1', mark_as_read=False)
+        Thread(id='thread').retrieve(user_id='1', mark_as_read=False)
+        self.assertEqual(mock_request.call_count, 3)
+
+    @override_settings(COMMENTS_SERVICE_CACHE_TIMEOUT=0)
+    def test_disabled(self, mock_request):
+        mock_request.return_value = _mock_response({'collection': []})
+        Thread.search(self.query_params)
+        Thread.search(self.query_params)
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_coalesced(self, mock_request):
+        scopes = [response_cache.course_scope('org/course/run')]
+        key = response_cache._response_key('url', {}, 'en', scopes)  # pylint: disable=protected-access
+        fetch = Mock(return_value={'fetched': True})
+
+        # While another request holds the lock, wait for it to cache its
+        # response instead of fetching it.
+        cache.add(key + '.lock', True)
+        with patch.object(response_cache, 'sleep', side_effect=lambda _: cache.set(key, {'fetched': False})):
+            self.assertEqual(response_cache.get_response('url', {}, 'en', scopes, fetch, 5), {'fetched': False})
+        self.assertFalse(fetch.called)
+        self.assertFalse(mock_request.called)
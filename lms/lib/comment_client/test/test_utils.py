@@ -0,0 +1,67 @@
+"""
+Tests for the comment client utilities.
+"""
+from threading import Event
+
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils.translation import get_language, override as override_language
+
+from lms.lib.comment_client.utils import get_session, perform_concurrent_requests
+
+
+class GetSessionTestCase(TestCase):
+    """
+    Tests for get_session.
+    """
+    def test_session_is_shared(self):
+        session = get_session()
+        self.assertIs(get_session(), session)
+        adapter = session.get_adapter('http://localhost:4567/api/v1/threads')
+        self.assertEqual(adapter.max_retries.read, 0)
+
+
+@override_settings(COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS=4)
+class PerformConcurrentRequestsTestCase(TestCase):
+    """
+    Tests for perform_concurrent_requests.
+    """
+    def test_results_in_order(self):
+        self.assertEqual(
+            perform_concurrent_requests([lambda value=value: value for value in range(6)]),
+            range(6)
+        )
+
+    def test_concurrent(self):
+        # The first function can only return once the second has been called,
+        # which would never happen if they were called one at a time.
+        second_called = Event()
+
+        def first():
+            """Wait for the second function."""
+            return second_called.wait(5)
+
+        def second():
+            """Let the first function return."""
+            second_called.set()
+            return True
+
+        self.assertEqual(perform_concurrent_requests([first, second]), [True, True])
+
+    def test_language(self):
+        with override_language('eo'):
+            self.assertEqual(perform_concurrent_requests([get_language, get_language]), ['eo', 'eo'])
+
+    def test_first_exception_raised(self):
+        def fail(exception):
+            """Raise the given exception."""
+            raise exception
+
+        with self.assertRaises(KeyError):
+            perform_concurrent_requests([lambda: 1, lambda: fail(KeyError()), lambda: fail(ValueError())])
+
+    @override_settings(COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS=1)
+    def test_disabled(self):
+        calls = []
+        perform_concurrent_requests([lambda: calls.append(1), lambda: calls.append(2)])
+        self.assertEqual(calls, [1, 2])
@@ -3,6 +3,7 @@ import logging
 from eventtracking import tracker
 from .utils import merge_dict, strip_blank, strip_none, extract, perform_request, CommentClientPaginatedResult
 from .utils import CommentClientRequestError
+from .response_cache import course_scope, invalidate, thread_scope, user_scope
 import models
 import settings
 
@@ -57,13 +58,17 @@ class Thread(models.Model):
             url = cls.url(action='get_all', params=extract(params, 'commentable_id'))
             if params.get('commentable_id'):
                 del params['commentable_id']
+        cache_scopes = [course_scope(params['course_id'])]
+        if params.get('user_id'):
+            cache_scopes.append(user_scope(params['user_id']))
         response = perform_request(
             'get',
             url,
             params,
             metric_tags=[u'course_id:{}'.format(query_params['course_id'])],
             metric_action='thread.search',
-            paged_results=True
+            paged_results=True,
+            cache_scopes=cache_scopes
         )
         if query_params.get('text'):
             search_query = query_params['text']
@@ -138,14 +143,34 @@ class Thread(models.Model):
         }
         request_params = strip_none(request_params)
 
+        # Retrieving a thread marks it as read, unless mark_as_read is False,
+        # so only those retrievals can be cached.
+        cache_scopes = None
+        if not request_params['mark_as_read']:
+            cache_scopes = [thread_scope(self.id)]
+            if request_params.get('user_id'):
+                cache_scopes.append(user_scope(request_params['user_id']))
+
         response = perform_request(
             'get',
             url,
             request_params,
             metric_action='model.retrieve',
-            metric_tags=self._metric_tags
+            metric_tags=self._metric_tags,
+            cache_scopes=cache_scopes
         )
         self._update_from_response(response)
+        if request_params['mark_as_read'] and request_params.get('user_id'):
+            invalidate([user_scope(request_params['user_id'])])
+
+    @property
+    def _cache_scopes(self):
+        scopes = [thread_scope(self.id)]
+        if self.attributes.get('course_id'):
+            scopes.append(course_scope(self.attributes['course_id']))
+        if self.attributes.get('user_id'):
+            scopes.append(user_scope(self.attributes['user_id']))
+        return scopes
 
     def flagAbuse(self, user, voteable):
         if voteable.type == 'thread':
@@ -163,6 +188,7 @@ class Thread(models.Model):
             metric_tags=self._metric_tags
         )
         voteable._update_from_response(response)
+        voteable._invalidate_cached_responses()
 
     def unFlagAbuse(self, user, voteable, removeAll):
         if voteable.type == 'thread':
@@ -184,6 +210,7 @@ class Thread(models.Model):
             metric_action='thread.abuse.unflagged'
         )
         voteable._update_from_response(response)
+        voteable._invalidate_cached_responses()
 
     def pin(self, user, thread_id):
         url = _url_for_pin_thread(thread_id)
@@ -196,6 +223,7 @@ class Thread(models.Model):
             metric_action='thread.pin'
         )
         self._update_from_response(response)
+        self._invalidate_cached_responses()
 
     def un_pin(self, user, thread_id):
         url = _url_for_un_pin_thread(thread_id)
@@ -208,6 +236,7 @@ class Thread(models.Model):
             metric_action='thread.unpin'
         )
         self._update_from_response(response)
+        self._invalidate_cached_responses()
 
 
 def _url_for_flag_abuse_thread(thread_id):
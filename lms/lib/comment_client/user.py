@@ -1,5 +1,6 @@
 """ User model wrapper for comment service"""
 from .utils import merge_dict, perform_request, CommentClientRequestError, CommentClientPaginatedResult
+from .response_cache import course_scope, user_scope
 
 import models
 import settings
@@ -30,6 +31,10 @@ class User(models.Model):
                    external_id=str(user.id),
                    username=user.username)
 
+    @property
+    def _cache_scopes(self):
+        return [user_scope(self.id)]
+
     def read(self, source):
         """
         Calls cs_comments_service to mark thread as read for the user
@@ -42,6 +47,7 @@ class User(models.Model):
             metric_action='user.read',
             metric_tags=self._metric_tags + ['target.type:{}'.format(source.type)],
         )
+        self._invalidate_cached_responses()
 
     def follow(self, source):
         params = {'source_type': source.type, 'source_id': source.id}
@@ -52,6 +58,7 @@ class User(models.Model):
             metric_action='user.follow',
             metric_tags=self._metric_tags + ['target.type:{}'.format(source.type)],
         )
+        self._invalidate_cached_responses()
 
     def unfollow(self, source):
         params = {'source_type': source.type, 'source_id': source.id}
@@ -62,6 +69,7 @@ class User(models.Model):
             metric_action='user.unfollow',
             metric_tags=self._metric_tags + ['target.type:{}'.format(source.type)],
         )
+        self._invalidate_cached_responses()
 
     def vote(self, voteable, value):
         if voteable.type == 'thread':
@@ -79,6 +87,8 @@ class User(models.Model):
             metric_tags=self._metric_tags + ['target.type:{}'.format(voteable.type)],
         )
         voteable._update_from_response(response)
+        voteable._invalidate_cached_responses()
+        self._invalidate_cached_responses()
 
     def unvote(self, voteable):
         if voteable.type == 'thread':
@@ -96,6 +106,8 @@ class User(models.Model):
             metric_tags=self._metric_tags + ['target.type:{}'.format(voteable.type)],
         )
         voteable._update_from_response(response)
+        voteable._invalidate_cached_responses()
+        self._invalidate_cached_responses()
 
     def active_threads(self, query_params={}):
         if not self.course_id:
@@ -110,6 +122,7 @@ class User(models.Model):
             metric_action='user.active_threads',
             metric_tags=self._metric_tags,
             paged_results=True,
+            cache_scopes=[course_scope(params['course_id']), user_scope(self.id)],
         )
         return response.get('collection', []), response.get('page', 1), response.get('num_pages', 1)
 
@@ -125,7 +138,8 @@ class User(models.Model):
             params,
             metric_action='user.subscribed_threads',
             metric_tags=self._metric_tags,
-            paged_results=True
+            paged_results=True,
+            cache_scopes=[course_scope(params['course_id']), user_scope(self.id)],
         )
         return CommentClientPaginatedResult(
             collection=response.get('collection', []),
@@ -149,6 +163,7 @@ class User(models.Model):
                 retrieve_params,
                 metric_action='model.retrieve',
                 metric_tags=self._metric_tags,
+                cache_scopes=[user_scope(self.id)],
             )
         except CommentClientRequestError as e:
             if e.status_code == 404:
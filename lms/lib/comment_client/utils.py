@@ -3,13 +3,29 @@ from contextlib import contextmanager
 import dogstats_wrapper as dog_stats_api
 import logging
 import requests
+import sys
 from django.conf import settings
+from django.db import connection
+from Queue import Empty, Queue
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+from threading import Lock, Thread
 from time import time
 from uuid import uuid4
-from django.utils.translation import get_language
+from django.utils.translation import get_language, override as override_language
+
+import request_cache
+from request_cache.middleware import RequestCache
+
+from . import response_cache
 
 log = logging.getLogger(__name__)
 
+REQUEST_CACHE_NAME = 'comment_client'
+
+_SESSION = None
+_SESSION_LOCK = Lock()
+
 
 def strip_none(dic):
     return dict([(k, v) for k, v in dic.iteritems() if v is not None])
@@ -32,6 +48,115 @@ def merge_dict(dic1, dic2):
     return dict(dic1.items() + dic2.items())
 
 
+def get_session():
+    """
+    Return the process-wide requests Session used for comments service
+    requests, creating it on first use.
+
+    The Session keeps up to COMMENTS_SERVICE_CONNECTION_POOL_SIZE connections
+    to the comments service alive between requests, and retries requests
+    that fail to connect according to COMMENTS_SERVICE_CONNECT_RETRIES and
+    COMMENTS_SERVICE_RETRY_BACKOFF_FACTOR.  Requests that reached the
+    comments service are never retried, since they may not be idempotent.
+    """
+    global _SESSION  # pylint: disable=global-statement
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                pool_size = getattr(settings, 'COMMENTS_SERVICE_CONNECTION_POOL_SIZE', 10)
+                retries = Retry(
+                    connect=getattr(settings, 'COMMENTS_SERVICE_CONNECT_RETRIES', 2),
+                    read=0,
+                    backoff_factor=getattr(settings, 'COMMENTS_SERVICE_RETRY_BACKOFF_FACTOR', 0.1),
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retries)
+                session = requests.Session()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _SESSION = session
+    return _SESSION
+
+
+def pooled_request(method, url, **kwargs):
+    """
+    Make a request with the pooled Session (see `get_session`), taking the
+    same arguments as `requests.request`.
+    """
+    return get_session().request(method, url, **kwargs)
+
+
+def get_connection_timeout():
+    """
+    Return the timeout for comments service requests, which is read from the
+    ForumsConfig once per request.
+    """
+    # To avoid dependency conflict
+    from django_comment_common.models import ForumsConfig
+
+    cache = request_cache.get_cache(REQUEST_CACHE_NAME)
+    if 'connection_timeout' not in cache:
+        cache['connection_timeout'] = ForumsConfig.current().connection_timeout
+    return cache['connection_timeout']
+
+
+def perform_concurrent_requests(functions):
+    """
+    Call the given functions, which take no arguments and make independent
+    comments service requests (e.g. `Thread(id=thread_id).retrieve`), in up
+    to COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS threads, and return the list
+    of their results, in order.
+
+    If any of the functions raise an exception, the exception raised by the
+    first of them is re-raised once they have all returned.  If concurrent
+    requests are disabled (by setting COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS
+    to 1), the functions are simply called in order.
+    """
+    max_threads = min(getattr(settings, 'COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS', 4), len(functions))
+    if max_threads <= 1:
+        return [function() for function in functions]
+
+    # The threads make their requests with the language and cached
+    # comment client state of this one.
+    get_connection_timeout()
+    language = get_language()
+    cached = dict(request_cache.get_cache(REQUEST_CACHE_NAME))
+    results = [None] * len(functions)
+    exc_infos = [None] * len(functions)
+    work = Queue()
+    for item in enumerate(functions):
+        work.put(item)
+
+    def _call_functions():
+        """Call functions from the queue until it's empty."""
+        request_cache.get_cache(REQUEST_CACHE_NAME).update(cached)
+        try:
+            with override_language(language):
+                while True:
+                    try:
+                        index, function = work.get_nowait()
+                    except Empty:
+                        return
+                    try:
+                        results[index] = function()
+                    except Exception:  # pylint: disable=broad-except
+                        exc_infos[index] = sys.exc_info()
+        finally:
+            RequestCache.clear_request_cache()
+            # Don't leak the thread's database connection, if it opened one.
+            connection.close()
+
+    threads = [Thread(target=_call_functions) for __ in range(max_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for exc_info in exc_infos:
+        if exc_info is not None:
+            raise exc_info[0], exc_info[1], exc_info[2]
+    return results
+
+
 @contextmanager
 def request_timer(request_id, method, url, tags=None):
     start = time()
@@ -52,9 +177,24 @@ def request_timer(request_id, method, url, tags=None):
 
 
 def perform_request(method, url, data_or_params=None, raw=False,
-                    metric_action=None, metric_tags=None, paged_results=False):
-    # To avoid dependency conflict
-    from django_comment_common.models import ForumsConfig
+                    metric_action=None, metric_tags=None, paged_results=False, cache_scopes=None):
+    """
+    Make a request to the comments service, returning its decoded JSON
+    response (or its text, if `raw`).
+
+    The responses to GET requests that are made with `cache_scopes` (a list
+    of response_cache scopes, which must include every scope whose data the
+    response includes) are cached if the response cache is enabled.
+    """
+    if cache_scopes is not None and method == 'get' and not raw and response_cache.get_timeout():
+        return response_cache.get_response(
+            url,
+            data_or_params or {},
+            get_language(),
+            cache_scopes,
+            lambda: perform_request(method, url, data_or_params, raw, metric_action, metric_tags, paged_results),
+            get_connection_timeout(),
+        )
 
     if metric_tags is None:
         metric_tags = []
@@ -78,15 +218,15 @@ def perform_request(method, url, data_or_params=None, raw=False,
     else:
         data = None
         params = merge_dict(data_or_params, request_id_dict)
+    timeout = get_connection_timeout()
     with request_timer(request_id, method, url, metric_tags):
-        config = ForumsConfig.current()
-        response = requests.request(
+        response = pooled_request(
             method,
             url,
             data=data,
             params=params,
             headers=headers,
-            timeout=config.connection_timeout
+            timeout=timeout
         )
 
     metric_tags.append(u'status_code:{}'.format(response.status_code))
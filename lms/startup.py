@@ -55,6 +55,8 @@ def run():
 
     add_mimetypes()
 
+    configure_sandbox_pool()
+
     # Mako requires the directories to be added after the django setup.
     microsite.enable_microsites(log)
 
@@ -86,6 +88,26 @@ def run():
     xmodule.x_module.descriptor_global_local_resource_url = lms_xblock.runtime.local_resource_url
 
 
+def configure_sandbox_pool():
+    """
+    Configure the pool of sandbox workers that run Python problem code, if
+    it's enabled by CODE_JAIL.
+
+    If you change this, be sure to also change it in cms/startup.py.
+    """
+    code_jail = settings.CODE_JAIL
+    pool_settings = code_jail.get('pool', {})
+    if code_jail.get('python_bin') and pool_settings.get('size'):
+        from capa.safe_exec import pool
+        pool.configure(
+            code_jail['python_bin'],
+            user=code_jail.get('user'),
+            size=pool_settings['size'],
+            max_jobs_per_worker=pool_settings.get('max_jobs_per_worker', 100),
+            limits=code_jail.get('limits'),
+        )
+
+
 def add_mimetypes():
     """
     Add extra mimetypes. Used in xblock_resource.
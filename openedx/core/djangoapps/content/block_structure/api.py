@@ -19,13 +19,16 @@ def get_course_in_cache(course_key):
     return get_block_structure_manager(course_key).get_collected()
 
 
-def update_course_in_cache(course_key):
+def update_course_in_cache(course_key, incremental=False):
     """
     A higher order function implemented on top of the
     block_structure.updated_collected function that updates the block
     structure in the cache for the given course_key.
+
+    If incremental is True, only the changed parts of the course are
+    recollected when possible.
     """
-    return get_block_structure_manager(course_key).update_collected()
+    return get_block_structure_manager(course_key).update_collected(incremental=incremental)
 
 
 def clear_course_from_cache(course_key):
@@ -42,6 +45,16 @@ def clear_course_from_cache(course_key):
     get_block_structure_manager(course_key).clear()
 
 
+def stash_course_in_cache(course_key):
+    """
+    A higher order function implemented on top of the
+    block_structure.stash function that stops serving the block
+    structure in the cache for the given course_key, but keeps it for
+    an incremental update_course_in_cache.
+    """
+    get_block_structure_manager(course_key).stash()
+
+
 def get_block_structure_manager(course_key):
     """
     Returns the manager for managing Block Structures for the given course.
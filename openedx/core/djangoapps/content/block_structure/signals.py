@@ -1,11 +1,12 @@
 """
 Signal handlers for invalidating cached data.
 """
+from django.conf import settings
 from django.dispatch.dispatcher import receiver
 
 from xmodule.modulestore.django import SignalHandler
 
-from .api import clear_course_from_cache
+from .api import clear_course_from_cache, stash_course_in_cache
 from .tasks import update_course_in_cache
 
 
@@ -14,12 +15,20 @@ def _listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable
     """
     Catches the signal that a course has been published in the module
     store and creates/updates the corresponding cache entry.
+
+    If incremental collection is enabled, the existing cache entry is
+    stashed rather than cleared, so that it is no longer served, but the
+    task only has to update the changed parts of the course.
     """
-    clear_course_from_cache(course_key)
+    incremental = settings.FEATURES.get('ENABLE_INCREMENTAL_BLOCK_STRUCTURE_COLLECTION', False)
+    if incremental:
+        stash_course_in_cache(course_key)
+    else:
+        clear_course_from_cache(course_key)
 
     # The countdown=0 kwarg ensures the call occurs after the signal emitter
     # has finished all operations.
-    update_course_in_cache.apply_async([unicode(course_key)], countdown=0)
+    update_course_in_cache.apply_async([unicode(course_key)], {'incremental': incremental}, countdown=0)
 
 
 @receiver(SignalHandler.course_deleted)
@@ -1,10 +1,12 @@
 """
 Unit tests for the Course Blocks signals
 """
+from django.conf import settings
+from mock import patch
 
 from xmodule.modulestore.exceptions import ItemNotFoundError
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
-from xmodule.modulestore.tests.factories import CourseFactory
+from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 
 from ..api import get_block_structure_manager
 from .helpers import is_course_in_block_structure_cache
@@ -41,6 +43,26 @@ class CourseBlocksSignalTest(ModuleStoreTestCase):
             updated_block_structure.get_xblock_field(self.course_usage_key, 'display_name')
         )
 
+    @patch.dict(settings.FEATURES, {'ENABLE_INCREMENTAL_BLOCK_STRUCTURE_COLLECTION': True})
+    def test_course_update_incremental_not_stale(self):
+        test_display_name = "Lightsabers 102"
+        chapter = ItemFactory.create(parent=self.course, category='chapter')
+
+        bs_manager = get_block_structure_manager(self.course.id)
+        bs_manager.get_collected()
+
+        # Until the update task runs, the outdated block structure
+        # must not be served.
+        with patch('openedx.core.djangoapps.content.block_structure.signals.update_course_in_cache'):
+            chapter.display_name = test_display_name
+            self.store.update_item(chapter, self.user.id)
+            updated_block_structure = bs_manager.get_collected()
+
+        self.assertEqual(
+            test_display_name,
+            updated_block_structure.get_xblock_field(chapter.location, 'display_name')
+        )
+
     def test_course_delete(self):
         bs_manager = get_block_structure_manager(self.course.id)
         self.assertIsNotNone(bs_manager.get_collected())
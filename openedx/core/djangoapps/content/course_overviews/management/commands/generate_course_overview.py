@@ -3,8 +3,10 @@ Command to load course overviews.
 """
 
 import logging
+from multiprocessing.pool import ThreadPool
 
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
 from xmodule.modulestore.django import modulestore
@@ -20,6 +22,11 @@ class Command(BaseCommand):
     Example usage:
         $ ./manage.py lms generate_course_overview --all --settings=devstack
         $ ./manage.py lms generate_course_overview 'edX/DemoX/Demo_Course' --settings=devstack
+
+    Overviews that are already up to date are left alone, so running this with
+    --all after a deploy that changes CourseOverview.VERSION pre-warms all of
+    them before traffic reaches the new version. Use --workers to generate
+    several overviews at once.
     """
     args = '<course_id course_id ...>'
     help = 'Generates and stores course overview for one or more courses.'
@@ -35,6 +42,13 @@ class Command(BaseCommand):
             default=False,
             help='Generate course overview for all courses.',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            dest='workers',
+            default=1,
+            help='Number of course overviews to generate in parallel.',
+        )
 
     def handle(self, *args, **options):
 
@@ -48,4 +62,33 @@ class Command(BaseCommand):
             except InvalidKeyError:
                 raise CommandError('Invalid key specified.')
 
-        CourseOverview.get_select_courses(course_keys)
+        up_to_date = CourseOverview.get_many(course_keys, load_missing=False)
+        outdated_keys = [course_key for course_key in course_keys if course_key not in up_to_date]
+        workers = min(options.get('workers') or 1, len(outdated_keys))
+        log.info(
+            'Generating %d of %d course overviews with %d worker(s).',
+            len(outdated_keys), len(course_keys), workers,
+        )
+
+        if workers > 1:
+            pool = ThreadPool(workers)
+            try:
+                pool.map(_generate_course_overviews, [outdated_keys[i::workers] for i in range(workers)])
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            CourseOverview.get_many(outdated_keys)
+
+        log.info('Finished generating course overviews.')
+
+
+def _generate_course_overviews(course_keys):
+    """
+    Generate the course overviews for the given course keys in a worker thread.
+    """
+    try:
+        CourseOverview.get_many(course_keys)
+    finally:
+        # Each thread has its own database connection.
+        connection.close()
@@ -49,6 +49,30 @@ class TestGenerateCourseOverview(ModuleStoreTestCase):
         # CourseOverview will be populated with all courses in the modulestore
         self._assert_courses_in_overview(self.course_key_1, self.course_key_2)
 
+    @patch.object(generate_course_overview, 'ThreadPool')
+    def test_generate_all_in_parallel(self, mock_thread_pool):
+        """
+        Test that course overviews are split between several workers.
+        """
+        self.command.handle(all=True, workers=2)
+        mock_thread_pool.assert_called_once_with(2)
+        mock_map = mock_thread_pool.return_value.map
+        function, chunks = mock_map.call_args[0]
+        self.assertEqual(function, generate_course_overview._generate_course_overviews)  # pylint: disable=protected-access
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(set(sum(chunks, [])), {self.course_key_1, self.course_key_2})
+
+    def test_up_to_date_not_regenerated(self):
+        """
+        Test that up to date course overviews are left alone.
+        """
+        CourseOverview.get_from_id(self.course_key_1)
+        load_from_module_store = CourseOverview.load_from_module_store
+        with patch.object(CourseOverview, 'load_from_module_store', wraps=load_from_module_store) as mock_load:
+            self.command.handle(all=True)
+        mock_load.assert_called_once_with(self.course_key_2)
+        self._assert_courses_in_overview(self.course_key_1, self.course_key_2)
+
     def test_generate_one(self):
         """
         Test that a specified course is loaded into course overviews.
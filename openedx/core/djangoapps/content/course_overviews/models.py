@@ -3,8 +3,12 @@ Declaration of CourseOverview model
 """
 import json
 import logging
+import time
+from collections import namedtuple
 from urlparse import urlparse, urlunparse
+from uuid import uuid4
 
+from django.core.cache import cache
 from django.db import models, transaction
 from django.db.models.fields import BooleanField, DateTimeField, DecimalField, TextField, FloatField, IntegerField
 from django.db.utils import IntegrityError
@@ -29,6 +33,19 @@ from xmodule_django.models import CourseKeyField, UsageKeyField
 
 log = logging.getLogger(__name__)
 
+# The access-related fields of a CourseOverview that are stored in the
+# catalog visibility index. `id` is the CourseKey of the course.
+CatalogVisibilityEntry = namedtuple('CatalogVisibilityEntry', [
+    'id',
+    'catalog_visibility',
+    'visible_to_staff_only',
+    'start',
+    'enrollment_start',
+    'enrollment_end',
+    'enrollment_domain',
+    'invitation_only',
+])
+
 
 class CourseOverview(TimeStampedModel):
     """
@@ -48,6 +65,13 @@ class CourseOverview(TimeStampedModel):
     # IMPORTANT: Bump this whenever you modify this model and/or add a migration.
     VERSION = 4
 
+    # Only one process at a time rebuilds an overview from the modulestore;
+    # the others wait up to LOAD_WAIT_TIMEOUT seconds for it, or keep
+    # serving the old version of the overview if there is one.
+    LOAD_LOCK_TIMEOUT = 60
+    LOAD_WAIT_TIMEOUT = 10
+    LOAD_POLL_INTERVAL = 0.1
+
     # Cache entry versioning.
     version = IntegerField()
 
@@ -262,20 +286,95 @@ class CourseOverview(TimeStampedModel):
         """
         try:
             course_overview = cls.objects.select_related('image_set').get(id=course_id)
-            if course_overview.version < cls.VERSION:
-                # Throw away old versions of CourseOverview, as they might contain stale data.
-                course_overview.delete()
-                course_overview = None
         except cls.DoesNotExist:
             course_overview = None
 
+        return cls._get_current(course_id, course_overview)
+
+    @classmethod
+    def get_many(cls, course_ids, load_missing=True):
+        """
+        Load the CourseOverview objects for many course IDs with a single
+        query.
+
+        Overviews that are missing or of an old version are loaded from the
+        modulestore as in get_from_id, unless load_missing is False, in which
+        case they are left out.  Courses that can't be loaded are left out.
+
+        Arguments:
+            course_ids (iterable of CourseKey): the IDs of the course
+                overviews to be loaded.
+            load_missing (bool): whether to load the overviews that aren't
+                up to date in the database.
+
+        Returns:
+            dict: the CourseOverviews found, keyed by course ID.
+        """
+        course_ids = set(course_ids)
+        course_overviews = {
+            course_overview.id: course_overview
+            for course_overview in cls.objects.filter(id__in=course_ids).select_related('image_set')
+        }
+
+        result = {}
+        for course_id in course_ids:
+            course_overview = course_overviews.get(course_id)
+            if not load_missing and (course_overview is None or course_overview.version < cls.VERSION):
+                continue
+            try:
+                result[course_id] = cls._get_current(course_id, course_overview)
+            except (cls.DoesNotExist, IOError):
+                log.exception(u'Could not load the course overview for %s.', unicode(course_id))
+        return result
+
+    @classmethod
+    def _get_current(cls, course_id, course_overview):
+        """
+        Return the given CourseOverview read from the database, or a new one
+        loaded from the modulestore if it is None or of an old version.
+        """
+        if course_overview is None or course_overview.version < cls.VERSION:
+            return cls._load_single_flight(course_id, course_overview)
+
         # Regenerate the thumbnail images if they're missing (either because
         # they were never generated, or because they were flushed out after
         # a change to CourseOverviewImageConfig.
-        if course_overview and not hasattr(course_overview, 'image_set'):
+        if not hasattr(course_overview, 'image_set'):
             CourseOverviewImageSet.create_for_course(course_overview)
 
-        return course_overview or cls.load_from_module_store(course_id)
+        return course_overview
+
+    @classmethod
+    def _load_single_flight(cls, course_id, old_course_overview):
+        """
+        Load the overview of the given course from the modulestore, unless
+        another process already is.  In that case, return
+        old_course_overview if there is one, or else wait for the other
+        process's overview.
+        """
+        lock_key = u'course_overviews.load.{}'.format(course_id)
+        if cache.add(lock_key, True, cls.LOAD_LOCK_TIMEOUT):
+            try:
+                if old_course_overview is not None:
+                    # Throw away old versions of CourseOverview, as they might contain stale data.
+                    old_course_overview.delete()
+                return cls.load_from_module_store(course_id)
+            finally:
+                cache.delete(lock_key)
+
+        if old_course_overview is not None:
+            return old_course_overview
+
+        deadline = time.time() + cls.LOAD_WAIT_TIMEOUT
+        while cache.get(lock_key) is not None and time.time() < deadline:
+            time.sleep(cls.LOAD_POLL_INTERVAL)
+
+        try:
+            course_overview = cls.objects.select_related('image_set').get(id=course_id, version__gte=cls.VERSION)
+        except cls.DoesNotExist:
+            # The other process failed or is taking too long.
+            return cls.load_from_module_store(course_id)
+        return cls._get_current(course_id, course_overview)
 
     def clean_id(self, padding_char='='):
         """
@@ -511,6 +610,74 @@ class CourseOverview(TimeStampedModel):
             for course_overview in CourseOverview.objects.values('id')
         ]
 
+    CATALOG_VISIBILITY_INDEX_CACHE_KEY = 'course_overviews.catalog_visibility_index'
+    CATALOG_VISIBILITY_INDEX_TIMEOUT = 60 * 60
+    # The index is cached in chunks of this many entries, so that each
+    # cached value stays well below memcached's 1MB limit.
+    CATALOG_VISIBILITY_INDEX_CHUNK_SIZE = 1000
+
+    @classmethod
+    def get_catalog_visibility_index(cls):
+        """
+        Returns a list of CatalogVisibilityEntry tuples, one for every
+        CourseOverview in the database.
+
+        The index holds just the fields that decide whether a course is
+        visible to users without any course role, so that catalog listings
+        can be filtered without loading and checking every course. It is
+        built with a single query and kept in the cache until a
+        CourseOverview changes.
+        """
+        cached_version = cache.get(cls.CATALOG_VISIBILITY_INDEX_CACHE_KEY)
+        if cached_version is not None:
+            version, num_chunks = cached_version
+            chunk_keys = [cls._catalog_visibility_index_chunk_key(version, chunk) for chunk in xrange(num_chunks)]
+            chunks = cache.get_many(chunk_keys)
+            if len(chunks) == num_chunks:
+                return [entry for chunk_key in chunk_keys for entry in chunks[chunk_key]]
+        return cls.rebuild_catalog_visibility_index()
+
+    @classmethod
+    def rebuild_catalog_visibility_index(cls):
+        """
+        Rebuilds the catalog visibility index from the database, caches it
+        and returns it.
+        """
+        index = [
+            CatalogVisibilityEntry(**values)
+            for values in CourseOverview.objects.values(*CatalogVisibilityEntry._fields)
+        ]
+
+        # The chunks of each rebuild are cached under new keys, and the key
+        # of the index only points to them once they are all cached, so that
+        # chunks of different rebuilds are never mixed.
+        version = uuid4().hex
+        chunk_size = cls.CATALOG_VISIBILITY_INDEX_CHUNK_SIZE
+        chunks = {
+            cls._catalog_visibility_index_chunk_key(version, chunk): index[start:start + chunk_size]
+            for chunk, start in enumerate(xrange(0, len(index), chunk_size))
+        }
+        cache.set_many(chunks, cls.CATALOG_VISIBILITY_INDEX_TIMEOUT)
+        cache.set(
+            cls.CATALOG_VISIBILITY_INDEX_CACHE_KEY, (version, len(chunks)), cls.CATALOG_VISIBILITY_INDEX_TIMEOUT
+        )
+        return index
+
+    @classmethod
+    def _catalog_visibility_index_chunk_key(cls, version, chunk):
+        """
+        Returns the cache key of the given chunk of the given version of the
+        catalog visibility index.
+        """
+        return '{}.{}.{}'.format(cls.CATALOG_VISIBILITY_INDEX_CACHE_KEY, version, chunk)
+
+    @classmethod
+    def invalidate_catalog_visibility_index(cls):
+        """
+        Drops the cached catalog visibility index; it is rebuilt on next use.
+        """
+        cache.delete(cls.CATALOG_VISIBILITY_INDEX_CACHE_KEY)
+
     def is_discussion_tab_enabled(self):
         """
         Returns True if course has discussion tab and is enabled
@@ -1,6 +1,7 @@
 """
 Signal handler for invalidating cached course overviews
 """
+from django.db.models.signals import post_delete, post_save
 from django.dispatch.dispatcher import receiver
 
 from .models import CourseOverview
@@ -15,6 +16,7 @@ def _listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable
     """
     CourseOverview.objects.filter(id=course_key).delete()
     CourseOverview.load_from_module_store(course_key)
+    CourseOverview.rebuild_catalog_visibility_index()
 
 
 @receiver(SignalHandler.course_deleted)
@@ -28,3 +30,13 @@ def _listen_for_course_delete(sender, course_key, **kwargs):  # pylint: disable=
     from cms.djangoapps.contentstore.courseware_index import CourseAboutSearchIndexer
     # Delete course entry from Course About Search_index
     CourseAboutSearchIndexer.remove_deleted_items(course_key)
+
+
+@receiver(post_save, sender=CourseOverview)
+@receiver(post_delete, sender=CourseOverview)
+def _listen_for_course_overview_update(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidates the catalog visibility index whenever a CourseOverview is
+    created, updated or deleted.
+    """
+    CourseOverview.invalidate_catalog_visibility_index()
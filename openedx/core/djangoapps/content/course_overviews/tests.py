@@ -11,6 +11,7 @@ from nose.plugins.attrib import attr
 import pytz
 
 from django.conf import settings
+from django.core.cache import cache
 from django.test.utils import override_settings
 from django.utils import timezone
 from PIL import Image
@@ -459,6 +460,48 @@ class CourseOverviewTestCase(ModuleStoreTestCase):
             set(select_course_ids),
         )
 
+    def test_get_many(self):
+        course_ids = [CourseFactory.create().id for __ in range(3)]
+        for course_id in course_ids[:2]:
+            CourseOverview.get_from_id(course_id)
+        missing_course_id = course_ids[0].replace(run='missing')
+
+        # Up to date overviews are loaded with a single query.
+        with self.assertNumQueries(1):
+            course_overviews = CourseOverview.get_many(course_ids[:2] + [missing_course_id], load_missing=False)
+        self.assertEqual(set(course_overviews), set(course_ids[:2]))
+
+        # Missing overviews are loaded from the modulestore, and courses that
+        # don't exist are left out.
+        course_overviews = CourseOverview.get_many(course_ids + [missing_course_id])
+        self.assertEqual(set(course_overviews), set(course_ids))
+        for course_id, course_overview in course_overviews.iteritems():
+            self.assertEqual(course_overview.id, course_id)
+
+    def test_old_version_served_while_loading(self):
+        course = CourseFactory.create()
+        course_overview = CourseOverview.get_from_id(course.id)
+        course_overview.version = CourseOverview.VERSION - 1
+        course_overview.save()
+
+        # Another process is loading the overview.
+        cache.add(u'course_overviews.load.{}'.format(course.id), True)
+        with mock.patch.object(CourseOverview, 'load_from_module_store') as mock_load:
+            self.assertEqual(CourseOverview.get_from_id(course.id).version, CourseOverview.VERSION - 1)
+            self.assertFalse(mock_load.called)
+
+        cache.delete(u'course_overviews.load.{}'.format(course.id))
+        self.assertEqual(CourseOverview.get_from_id(course.id).version, CourseOverview.VERSION)
+        self.assertEqual(CourseOverview.objects.get(id=course.id).version, CourseOverview.VERSION)
+
+    @mock.patch.object(CourseOverview, 'LOAD_WAIT_TIMEOUT', 0)
+    def test_missing_overview_loaded_after_wait(self):
+        course = CourseFactory.create()
+
+        # Another process has been loading the overview for too long.
+        cache.add(u'course_overviews.load.{}'.format(course.id), True)
+        self.assertEqual(CourseOverview.get_from_id(course.id).id, course.id)
+
     def test_get_all_courses(self):
         course_ids = [CourseFactory.create(emit_signals=True).id for __ in range(3)]
         self.assertEqual(
@@ -517,6 +560,46 @@ class CourseOverviewTestCase(ModuleStoreTestCase):
                 "testing CourseOverview.get_all_courses with filter_={}".format(filter_),
             )
 
+    def test_catalog_visibility_index(self):
+        course = CourseFactory.create(catalog_visibility=CATALOG_VISIBILITY_ABOUT, emit_signals=True)
+        index = CourseOverview.get_catalog_visibility_index()
+        self.assertEqual([entry.id for entry in index], [course.id])
+        self.assertEqual(index[0].catalog_visibility, CATALOG_VISIBILITY_ABOUT)
+
+        # The index is cached.
+        with self.assertNumQueries(0):
+            self.assertEqual(CourseOverview.get_catalog_visibility_index(), index)
+
+        # Publishing rebuilds the index.
+        course.catalog_visibility = CATALOG_VISIBILITY_NONE
+        with self.store.branch_setting(ModuleStoreEnum.Branch.draft_preferred):
+            self.store.update_item(course, ModuleStoreEnum.UserID.test)
+        with self.assertNumQueries(0):
+            index = CourseOverview.get_catalog_visibility_index()
+        self.assertEqual(index[0].catalog_visibility, CATALOG_VISIBILITY_NONE)
+
+        # Any change to a CourseOverview invalidates it.
+        CourseOverview.objects.filter(id=course.id).delete()
+        with self.assertNumQueries(1):
+            self.assertEqual(CourseOverview.get_catalog_visibility_index(), [])
+
+    @mock.patch.object(CourseOverview, 'CATALOG_VISIBILITY_INDEX_CHUNK_SIZE', 2)
+    def test_catalog_visibility_index_chunks(self):
+        course_ids = set(CourseFactory.create(emit_signals=True).id for __ in xrange(3))
+        index = CourseOverview.rebuild_catalog_visibility_index()
+        self.assertEqual(set(entry.id for entry in index), course_ids)
+
+        # The index is cached in two chunks.
+        version, num_chunks = cache.get(CourseOverview.CATALOG_VISIBILITY_INDEX_CACHE_KEY)
+        self.assertEqual(num_chunks, 2)
+        with self.assertNumQueries(0):
+            self.assertEqual(CourseOverview.get_catalog_visibility_index(), index)
+
+        # If any chunk was evicted, the index is rebuilt.
+        cache.delete('{}.{}.1'.format(CourseOverview.CATALOG_VISIBILITY_INDEX_CACHE_KEY, version))
+        with self.assertNumQueries(1):
+            self.assertEqual(CourseOverview.get_catalog_visibility_index(), index)
+
 
 @attr('shard_3')
 @ddt.ddt
@@ -39,6 +39,28 @@ def get_course_tag(user, course_id, key):
         return None
 
 
+def get_course_tag_for_users(users, course_id, key):
+    """
+    Gets the values of the course tag for the specified key in the specified
+    course_id for each of the given users, using a single query.
+
+    Args:
+        users: iterable of User objects (or user ids)
+        course_id: course identifier (string)
+        key: arbitrary (<=255 char string)
+
+    Returns:
+        dict mapping the id of each user that has a value saved to that value
+    """
+    return dict(
+        UserCourseTag.objects.filter(
+            user__in=users,
+            course_id=course_id,
+            key=key,
+        ).values_list('user_id', 'value')
+    )
+
+
 def set_course_tag(user, course_id, key, value):
     """
     Sets the value of the user's course tag for the specified key in the specified
@@ -26,6 +26,12 @@ class MemoryCourseTagAPI(object):
         """Gets the value of ``key``"""
         self._tags[course_id][key] = value
 
+    def get_course_tag_for_users(self, users, course_id, key):
+        """Gets the value of ``key`` for each of ``users``"""
+        if key not in self._tags[course_id]:
+            return {}
+        return {user.id: self._tags[course_id][key] for user in users}
+
 
 class TestRandomUserPartitionScheme(PartitionTestCase):
     """
@@ -78,6 +84,19 @@ class TestRandomUserPartitionScheme(PartitionTestCase):
 
         self.assertIsNotNone(group)
 
+    def test_get_groups_for_users(self):
+        # users are not assigned to groups in bulk
+        self.assertEqual(
+            RandomUserPartitionScheme.get_groups_for_users(self.MOCK_COURSE_ID, [self.user], self.user_partition),
+            {}
+        )
+
+        group = RandomUserPartitionScheme.get_group_for_user(self.MOCK_COURSE_ID, self.user, self.user_partition)
+        self.assertEqual(
+            RandomUserPartitionScheme.get_groups_for_users(self.MOCK_COURSE_ID, [self.user], self.user_partition),
+            {self.user.id: group}
+        )
+
     def test_empty_partition(self):
         empty_partition = UserPartition(
             self.TEST_ID,
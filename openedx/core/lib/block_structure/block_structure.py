@@ -335,15 +335,15 @@ class TransformerDataMap(dict):
     Transformer's class type.
     """
     def __getitem__(self, key):
-        key = self._translate_key(key)
+        key = self.translate_key(key)
         return dict.__getitem__(self, key)
 
     def __setitem__(self, key, value):
-        key = self._translate_key(key)
+        key = self.translate_key(key)
         dict.__setitem__(self, key, value)
 
     def __delitem__(self, key):
-        key = self._translate_key(key)
+        key = self.translate_key(key)
         dict.__delitem__(self, key)
 
     def get_or_create(self, key):
@@ -359,7 +359,7 @@ class TransformerDataMap(dict):
             self[key] = new_transformer_data
             return new_transformer_data
 
-    def _translate_key(self, key):
+    def translate_key(self, key):
         """
         Allows the given key to be either the transformer's class or name,
         always returning the transformer's name.  This allows
@@ -400,7 +400,7 @@ class BlockStructureBlockData(BlockStructure):
     # update this value whenever the data structure changes. Dependent storage
     # layers can then use this value when serializing/deserializing block
     # structures, and invalidating any previously cached/stored data.
-    VERSION = 1
+    VERSION = 2
 
     def __init__(self, root_block_usage_key):
         super(BlockStructureBlockData, self).__init__(root_block_usage_key)
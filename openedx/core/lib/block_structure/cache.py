@@ -6,7 +6,8 @@ from logging import getLogger
 
 from openedx.core.lib.cache_utils import zpickle, zunpickle
 
-from .block_structure import BlockStructureModulestoreData, BlockStructureBlockData
+from .block_structure import BlockStructureBlockData
+from .compact import CompactBlockStructure
 
 
 logger = getLogger(__name__)  # pylint: disable=C0103
@@ -32,17 +33,14 @@ class BlockStructureCache(object):
 
         The key in the cache is 'root.key.<root_block_usage_key>'.
         The data stored in the cache includes the structure's
-        block relations, transformer data, and block data.
+        block relations, transformer data, and block data, in the
+        form of a CompactBlockStructure.
 
         Arguments:
             block_structure (BlockStructure) - The block structure
                 that is to be serialized to the given cache.
         """
-        data_to_cache = (
-            block_structure._block_relations,
-            block_structure.transformer_data,
-            block_structure._block_data_map,
-        )
+        data_to_cache = CompactBlockStructure.from_block_structure(block_structure)
         zp_data_to_cache = zpickle(data_to_cache)
 
         # Set the timeout value for the cache to 1 day as a fail-safe
@@ -74,8 +72,10 @@ class BlockStructureCache(object):
                 the given cache.
 
         Returns:
-            BlockStructure - The deserialized block structure starting
-            at root_block_usage_key, if found in the cache.
+            CompactBlockStructure - The deserialized, read-only block
+            structure starting at root_block_usage_key, if found in the
+            cache.  Call its to_block_structure method for a copy that
+            can be modified.
 
             NoneType - If the root_block_usage_key is not found in the cache.
         """
@@ -95,31 +95,63 @@ class BlockStructureCache(object):
                 len(zp_data_from_cache),
             )
 
-        # Deserialize and construct the block structure.
-        block_relations, transformer_data, block_data_map = zunpickle(zp_data_from_cache)
-        block_structure = BlockStructureModulestoreData(root_block_usage_key)
-        block_structure._block_relations = block_relations
-        block_structure.transformer_data = transformer_data
-        block_structure._block_data_map = block_data_map
-
-        return block_structure
+        # Deserialize the block structure.
+        return zunpickle(zp_data_from_cache)
 
     def delete(self, root_block_usage_key):
         """
         Deletes the block structure for the given root_block_usage_key
-        from the given cache.
+        from the given cache, along with its stashed copy, if any.
 
         Arguments:
             root_block_usage_key (UsageKey) - The usage_key for the root
                 of the block structure that is to be removed from
                 the cache.
         """
-        self._cache.delete(self._encode_root_cache_key(root_block_usage_key))
+        self._cache.delete_many([
+            self._encode_root_cache_key(root_block_usage_key),
+            self._encode_stash_cache_key(root_block_usage_key),
+        ])
         logger.info(
             "Deleted BlockStructure %r from the cache.",
             root_block_usage_key,
         )
 
+    def stash(self, root_block_usage_key):
+        """
+        Moves the block structure for the given root_block_usage_key
+        aside, so that it is no longer returned by get, but can still be
+        updated incrementally by get_stashed.
+
+        Arguments:
+            root_block_usage_key (UsageKey) - The usage_key for the root
+                of the block structure that is outdated.
+        """
+        cache_key = self._encode_root_cache_key(root_block_usage_key)
+        zp_data_from_cache = self._cache.get(cache_key)
+        if zp_data_from_cache:
+            self._cache.set(
+                self._encode_stash_cache_key(root_block_usage_key),
+                zp_data_from_cache,
+                timeout=60 * 60 * 24,
+            )
+        self._cache.delete(cache_key)
+        logger.info(
+            "Stashed BlockStructure %r in the cache.",
+            root_block_usage_key,
+        )
+
+    def get_stashed(self, root_block_usage_key):
+        """
+        Returns the block structure for the given root_block_usage_key
+        that was last stashed, as a CompactBlockStructure, or None if
+        none was.
+        """
+        zp_data_from_cache = self._cache.get(self._encode_stash_cache_key(root_block_usage_key))
+        if not zp_data_from_cache:
+            return None
+        return zunpickle(zp_data_from_cache)
+
     @classmethod
     def _encode_root_cache_key(cls, root_block_usage_key):
         """
@@ -130,3 +162,11 @@ class BlockStructureCache(object):
             version=unicode(BlockStructureBlockData.VERSION),
             root_usage_key=unicode(root_block_usage_key),
         )
+
+    @classmethod
+    def _encode_stash_cache_key(cls, root_block_usage_key):
+        """
+        Returns the cache key to use for stashing the block structure
+        for the given root_block_usage_key.
+        """
+        return "stashed." + cls._encode_root_cache_key(root_block_usage_key)
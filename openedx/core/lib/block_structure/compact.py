@@ -0,0 +1,424 @@
+"""
+Module with a compact, array-backed representation of block structures.
+
+    CompactBlockStructure - A read-only block structure whose blocks are
+        identified by integer indices into a single table of usage keys.
+
+A BlockStructureBlockData holds a _BlockRelations object with Python
+lists of usage keys for every block, and a BlockData object with its own
+dicts for every block.  For large courses, this is a very large number
+of small objects to pickle into and unpickle from the cache.  Instead,
+a CompactBlockStructure stores:
+
+    * the usage keys of all of its blocks in one list, so that each key
+      is stored exactly once and every other reference to a block is an
+      integer index into that list,
+    * the parent to child and child to parent edges as flat integer
+      arrays in CSR (compressed sparse row) format, and
+    * each collected xBlock field and each transformer's block field as
+      one column of values across all blocks.
+
+It supports the same read and traversal API as BlockStructureBlockData,
+so the block structure cache serves it as is to code that only reads
+collected data.  It is converted to a mutable BlockStructureModulestoreData
+only for transformers, which modify the structure they are given.
+"""
+from array import array
+
+from openedx.core.lib.graph_traversals import traverse_topologically, traverse_post_order
+
+from .block_structure import BlockStructureModulestoreData, TransformerDataMap, TRANSFORMER_VERSION_KEY
+
+
+class _Column(object):
+    """
+    Columnar storage of the values of a single field across all the
+    blocks of a CompactBlockStructure.
+
+    Values are stored in a list that is indexed by block index.  Since
+    any value (including None) can be collected for a field, whether a
+    block has a value is recorded separately in a bytearray mask.
+    """
+    __slots__ = ('mask', 'values')
+
+    def __init__(self, num_blocks):
+        self.mask = bytearray(num_blocks)
+        self.values = [None] * num_blocks
+
+    def __getstate__(self):
+        return self.mask, self.values
+
+    def __setstate__(self, state):
+        self.mask, self.values = state
+
+    def set(self, index, value):
+        """
+        Sets the value for the block at the given index.
+        """
+        self.mask[index] = 1
+        self.values[index] = value
+
+    def get(self, index, default=None):
+        """
+        Returns the value for the block at the given index, or default
+        if the block has no value for this field.
+        """
+        return self.values[index] if self.mask[index] else default
+
+    def iteritems(self):
+        """
+        Returns an iterator of (index, value) pairs for all blocks that
+        have a value for this field.
+        """
+        return (
+            (index, value)
+            for index, (present, value) in enumerate(zip(self.mask, self.values))
+            if present
+        )
+
+
+class _CompactBlockData(object):
+    """
+    Read-only view of the location and collected xBlock fields of a
+    single block of a CompactBlockStructure, with the same attribute
+    access as BlockData.
+    """
+    __slots__ = ('_compact', '_index')
+
+    def __init__(self, compact, index):
+        self._compact = compact
+        self._index = index
+
+    @property
+    def location(self):
+        """
+        Returns the usage key of the block.
+        """
+        return self._compact.block_keys[self._index]
+
+    def __getattr__(self, field_name):
+        column = self._compact.xblock_fields.get(field_name)
+        if column is None or not column.mask[self._index]:
+            raise AttributeError("Field {0} does not exist".format(field_name))
+        return column.values[self._index]
+
+
+def _to_csr(num_blocks, adjacency):
+    """
+    Converts the given adjacency lists of block indices into CSR format.
+
+    Arguments:
+        num_blocks (int) - The number of blocks.
+        adjacency (list(list(int))) - For each block index, the list of
+            adjacent block indices.
+
+    Returns:
+        (array, array) - The offsets and the flattened indices. The
+        neighbors of block i are indices[offsets[i]:offsets[i + 1]].
+    """
+    offsets = array('l', [0] * (num_blocks + 1))
+    indices = array('l')
+    for index in xrange(num_blocks):
+        indices.extend(adjacency[index])
+        offsets[index + 1] = len(indices)
+    return offsets, indices
+
+
+class CompactBlockStructure(object):
+    """
+    A compact, read-only block structure.  See the module docstring for
+    details of its storage.
+    """
+    def __init__(self, root_block_usage_key, block_keys):
+        """
+        Arguments:
+            root_block_usage_key (UsageKey) - The usage key of the root
+                block for this structure.
+
+            block_keys (list(UsageKey)) - The usage keys of all of the
+                blocks in this structure.  The position of a usage key
+                in this list is its block index.
+        """
+        # The usage key of the root block for this structure.
+        # UsageKey
+        self.root_block_usage_key = root_block_usage_key
+
+        # Table of the usage keys of all blocks, indexed by block index.
+        # list [UsageKey]
+        self.block_keys = block_keys
+
+        # CSR arrays of block indices for children and for parents.
+        # array('l')
+        self._child_offsets, self._child_indices = array('l', [0] * (len(block_keys) + 1)), array('l')
+        self._parent_offsets, self._parent_indices = array('l', [0] * (len(block_keys) + 1)), array('l')
+
+        # Mask of the blocks that have collected block data (even if
+        # none of their fields were collected).
+        # bytearray
+        self._block_data_mask = bytearray(len(block_keys))
+
+        # Map of an xBlock field name to its values for all blocks.
+        # dict {string: _Column}
+        self.xblock_fields = {}
+
+        # Map of a transformer's name to a map of its block field names to
+        # their values for all blocks.
+        # dict {string: dict {string: _Column}}
+        self.transformer_block_fields = {}
+
+        # Map of a transformer's name to its non-block-specific data.
+        self.transformer_data = TransformerDataMap()
+
+        self._block_indices = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The reverse lookup table is derived from block_keys, so
+        # don't store it.
+        state['_block_indices'] = None
+        return state
+
+    def __iter__(self):
+        return self.get_block_keys()
+
+    def __len__(self):
+        return len(self.block_keys)
+
+    def __contains__(self, usage_key):
+        return usage_key in self._get_block_indices()
+
+    def __getitem__(self, usage_key):
+        """
+        Returns a read-only view of the collected data of the block
+        identified by the given usage_key, or None if it has none.
+        """
+        index = self._get_block_indices().get(usage_key)
+        if index is None or not self._block_data_mask[index]:
+            return None
+        return _CompactBlockData(self, index)
+
+    @classmethod
+    def from_block_structure(cls, block_structure):
+        """
+        Creates and returns a CompactBlockStructure with the same
+        blocks, relations, xBlock fields and transformer data as the
+        given block structure.
+
+        Arguments:
+            block_structure (BlockStructureBlockData) - The block
+                structure to convert.
+        """
+        # pylint: disable=protected-access
+        block_keys = list(block_structure.get_block_keys())
+        compact = cls(block_structure.root_block_usage_key, block_keys)
+        block_indices = compact._get_block_indices()
+        num_blocks = len(block_keys)
+
+        compact._child_offsets, compact._child_indices = _to_csr(num_blocks, [
+            [block_indices[child] for child in block_structure.get_children(block_key)]
+            for block_key in block_keys
+        ])
+        compact._parent_offsets, compact._parent_indices = _to_csr(num_blocks, [
+            [block_indices[parent] for parent in block_structure.get_parents(block_key)]
+            for block_key in block_keys
+        ])
+
+        for block_key, block_data in block_structure.iteritems():
+            index = block_indices.get(block_key)
+            if index is None:
+                continue
+            compact._block_data_mask[index] = 1
+            for field_name, value in block_data.fields.iteritems():
+                compact._get_or_create_column(compact.xblock_fields, field_name).set(index, value)
+            for transformer_name, transformer_block_data in block_data.transformer_data.iteritems():
+                transformer_fields = compact.transformer_block_fields.setdefault(transformer_name, {})
+                for key, value in transformer_block_data.fields.iteritems():
+                    compact._get_or_create_column(transformer_fields, key).set(index, value)
+
+        compact.transformer_data = block_structure.transformer_data
+        return compact
+
+    def to_block_structure(self, block_structure_cls=BlockStructureModulestoreData):
+        """
+        Creates and returns a mutable block structure of the given class
+        with the same blocks, relations, xBlock fields and transformer
+        data as this structure.
+
+        Arguments:
+            block_structure_cls (class) - A subclass of
+                BlockStructureBlockData to instantiate.
+        """
+        # pylint: disable=protected-access
+        block_structure = block_structure_cls(self.root_block_usage_key)
+        block_keys = self.block_keys
+
+        for index, block_key in enumerate(block_keys):
+            block_structure._add_block(block_structure._block_relations, block_key)
+            relations = block_structure._block_relations[block_key]
+            relations.children = [block_keys[child] for child in self._iter_children(index)]
+            relations.parents = [block_keys[parent] for parent in self._iter_parents(index)]
+            if self._block_data_mask[index]:
+                block_structure._get_or_create_block(block_key)
+
+        for field_name, column in self.xblock_fields.iteritems():
+            for index, value in column.iteritems():
+                setattr(block_structure._get_or_create_block(block_keys[index]), field_name, value)
+
+        for transformer_name, transformer_fields in self.transformer_block_fields.iteritems():
+            for key, column in transformer_fields.iteritems():
+                for index, value in column.iteritems():
+                    block_structure.set_transformer_block_field(block_keys[index], transformer_name, key, value)
+
+        block_structure.transformer_data = self.transformer_data
+        return block_structure
+
+    #--- Block structure relation methods ---#
+
+    def get_parents(self, usage_key):
+        """
+        Returns the parents of the block identified by the given
+        usage_key.
+
+        Returns:
+            [UsageKey] - A list of usage keys of the block's parents.
+        """
+        index = self._get_block_indices().get(usage_key)
+        if index is None:
+            return []
+        return [self.block_keys[parent] for parent in self._iter_parents(index)]
+
+    def get_children(self, usage_key):
+        """
+        Returns the children of the block identified by the given
+        usage_key.
+
+        Returns:
+            [UsageKey] - A list of usage keys of the block's children.
+        """
+        index = self._get_block_indices().get(usage_key)
+        if index is None:
+            return []
+        return [self.block_keys[child] for child in self._iter_children(index)]
+
+    def get_block_keys(self):
+        """
+        Returns an iterator of the usage keys of all the blocks in the
+        block structure.
+        """
+        return iter(self.block_keys)
+
+    #--- Block structure traversal methods ---#
+
+    def topological_traversal(
+            self,
+            filter_func=None,
+            yield_descendants_of_unyielded=False,
+            start_node=None,
+    ):
+        """
+        Performs a topological sort of the block structure and yields
+        the usage_key of each block as it is encountered.
+
+        See BlockStructure.topological_traversal.
+        """
+        return traverse_topologically(
+            start_node=start_node or self.root_block_usage_key,
+            get_parents=self.get_parents,
+            get_children=self.get_children,
+            filter_func=filter_func,
+            yield_descendants_of_unyielded=yield_descendants_of_unyielded,
+        )
+
+    def post_order_traversal(
+            self,
+            filter_func=None,
+            start_node=None,
+    ):
+        """
+        Performs a post-order sort of the block structure and yields
+        the usage_key of each block as it is encountered.
+
+        See BlockStructure.post_order_traversal.
+        """
+        return traverse_post_order(
+            start_node=start_node or self.root_block_usage_key,
+            get_children=self.get_children,
+            filter_func=filter_func,
+        )
+
+    #--- Block data methods ---#
+
+    def get_xblock_field(self, usage_key, field_name, default=None):
+        """
+        Returns the collected value of the xBlock field for the
+        requested block for the requested field_name; returns default if
+        not found.
+        """
+        index = self._get_block_indices().get(usage_key)
+        column = self.xblock_fields.get(field_name)
+        if index is None or column is None:
+            return default
+        return column.get(index, default)
+
+    def get_transformer_data(self, transformer, key, default=None):
+        """
+        Returns the value associated with the given key from the given
+        transformer's data dictionary; returns default if not found.
+        """
+        try:
+            return getattr(self.transformer_data[transformer], key, default)
+        except KeyError:
+            return default
+
+    def get_transformer_block_field(self, usage_key, transformer, key, default=None):
+        """
+        Returns the value associated with the given key for the given
+        transformer for the block identified by the given usage_key;
+        returns default if not found.
+        """
+        index = self._get_block_indices().get(usage_key)
+        transformer_fields = self.transformer_block_fields.get(self.transformer_data.translate_key(transformer))
+        if index is None or not transformer_fields or key not in transformer_fields:
+            return default
+        return transformer_fields[key].get(index, default)
+
+    #--- Internal methods ---#
+
+    def _get_transformer_data_version(self, transformer):
+        """
+        Returns the version number stored for the given transformer.
+        """
+        return self.get_transformer_data(transformer, TRANSFORMER_VERSION_KEY, 0)
+
+    def _get_block_indices(self):
+        """
+        Returns the map of usage key to block index, building it if
+        needed.
+        """
+        if self._block_indices is None:
+            self._block_indices = {block_key: index for index, block_key in enumerate(self.block_keys)}
+        return self._block_indices
+
+    def _iter_children(self, index):
+        """
+        Returns the block indices of the children of the block at the
+        given index.
+        """
+        return self._child_indices[self._child_offsets[index]:self._child_offsets[index + 1]]
+
+    def _iter_parents(self, index):
+        """
+        Returns the block indices of the parents of the block at the
+        given index.
+        """
+        return self._parent_indices[self._parent_offsets[index]:self._parent_offsets[index + 1]]
+
+    def _get_or_create_column(self, columns, field_name):
+        """
+        Returns the _Column for the given field_name in the given map of
+        columns, creating it if needed.
+        """
+        column = columns.get(field_name)
+        if column is None:
+            column = columns[field_name] = _Column(len(self.block_keys))
+        return column
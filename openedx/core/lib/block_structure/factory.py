@@ -4,6 +4,12 @@ Module for factory class for BlockStructure objects.
 from .block_structure import BlockStructureModulestoreData
 
 
+# xBlock fields that are collected for every block so that changes to
+# the block or to its subtree can be detected when the block structure
+# is incrementally updated.
+EDIT_INFO_FIELDS = ('edited_on', 'subtree_edited_on')
+
+
 class BlockStructureFactory(object):
     """
     Factory class for BlockStructure objects.
@@ -32,30 +38,146 @@ class BlockStructureFactory(object):
                 root_block_usage_key is not found in the modulestore.
         """
         block_structure = BlockStructureModulestoreData(root_block_usage_key)
-        blocks_visited = set()
+        block_structure.request_xblock_fields(*EDIT_INFO_FIELDS)
+
+        root_xblock = modulestore.get_item(root_block_usage_key, depth=None)
+        cls._add_xblock_subtree(block_structure, root_xblock, set())
+        return block_structure
+
+    @classmethod
+    def update_from_modulestore(cls, block_structure, modulestore):
+        """
+        Updates the given previously collected block structure with any
+        changes in the modulestore, reloading only the subtrees of the
+        blocks that changed.
+
+        Changed blocks are found by comparing the edited_on and
+        subtree_edited_on values collected for each block with those
+        in the modulestore, only descending into subtrees that were
+        edited.  The data collected for each changed block and its
+        descendants is removed from the block structure, and the
+        subtree is reloaded (with instantiated xBlocks) from the
+        modulestore.
 
-        def build_block_structure(xblock):
+        Arguments:
+            block_structure (BlockStructureModulestoreData) - A block
+                structure with previously collected data.
+
+            modulestore (ModuleStoreRead) - The modulestore that
+                contains the data for the xBlocks within the block
+                structure.
+
+        Returns:
+            [UsageKey] - The usage keys of the roots of the reloaded
+                subtrees, or None if the changes cannot be applied
+                incrementally and the block structure must be
+                recreated instead.
+        """
+        # pylint: disable=protected-access
+        changed_usage_keys = []
+
+        def find_changed_blocks(xblock):
             """
-            Recursively update the block structure with the given xBlock
-            and its descendants.
+            Recursively finds the changed blocks in the subtree of the
+            given xBlock, returning False if the changes can't be
+            determined.
             """
-            # Check if the xblock was already visited (can happen in
-            # DAGs).
-            if xblock.location in blocks_visited:
-                return
+            usage_key = xblock.location
+            if usage_key not in block_structure:
+                return False
+
+            collected_subtree_edited_on = block_structure.get_xblock_field(usage_key, 'subtree_edited_on')
+            subtree_edited_on = getattr(xblock, 'subtree_edited_on', None)
+            if collected_subtree_edited_on is None or subtree_edited_on is None:
+                return False
+            if collected_subtree_edited_on == subtree_edited_on:
+                return True
+
+            if block_structure.get_xblock_field(usage_key, 'edited_on') != getattr(xblock, 'edited_on', None):
+                changed_usage_keys.append(usage_key)
+                return True
+
+            # Only the block's descendants changed, so its children are
+            # the same as when it was collected.
+            block_structure._get_or_create_block(usage_key).subtree_edited_on = subtree_edited_on
+            return all(find_changed_blocks(child) for child in xblock.get_children())
+
+        root_xblock = modulestore.get_item(block_structure.root_block_usage_key, depth=0)
+        if not find_changed_blocks(root_xblock):
+            return None
+        if block_structure.root_block_usage_key in changed_usage_keys:
+            return None
+
+        block_structure.request_xblock_fields(*EDIT_INFO_FIELDS)
+        for usage_key in changed_usage_keys:
+            if not cls._remove_subtree(block_structure, usage_key):
+                return None
+            xblock = modulestore.get_item(usage_key, depth=None)
+            cls._add_xblock_subtree(block_structure, xblock, set())
+
+        return changed_usage_keys
 
-            # Add the xBlock.
-            blocks_visited.add(xblock.location)
-            block_structure._add_xblock(xblock.location, xblock)  # pylint: disable=protected-access
+    @classmethod
+    def _add_xblock_subtree(cls, block_structure, xblock, blocks_visited):
+        """
+        Recursively update the block structure with the given xBlock
+        and its descendants.
 
-            # Add relations with its children and recurse.
-            for child in xblock.get_children():
-                block_structure._add_relation(xblock.location, child.location)  # pylint: disable=protected-access
-                build_block_structure(child)
+        Arguments:
+            block_structure (BlockStructureModulestoreData) - The block
+                structure to update.
 
-        root_xblock = modulestore.get_item(root_block_usage_key, depth=None)
-        build_block_structure(root_xblock)
-        return block_structure
+            xblock (XBlock) - The root of the subtree to add.
+
+            blocks_visited (set(UsageKey)) - The usage keys of blocks
+                that were already added (can happen in DAGs).
+        """
+        # pylint: disable=protected-access
+        # Check if the xblock was already visited (can happen in
+        # DAGs).
+        if xblock.location in blocks_visited:
+            return
+
+        # Add the xBlock.
+        blocks_visited.add(xblock.location)
+        block_structure._add_xblock(xblock.location, xblock)
+
+        # Add relations with its children and recurse.
+        for child in xblock.get_children():
+            block_structure._add_relation(xblock.location, child.location)
+            cls._add_xblock_subtree(block_structure, child, blocks_visited)
+
+    @classmethod
+    def _remove_subtree(cls, block_structure, usage_key):
+        """
+        Removes the descendants of the block identified by usage_key,
+        and the data collected for the block and its descendants, from
+        the block structure.  The block itself is kept, along with its
+        relations to its parents.
+
+        Returns False, without modifying the block structure, if any
+        descendant is also reachable from outside of the subtree (which
+        can happen in DAGs).
+        """
+        # pylint: disable=protected-access
+        descendants = [
+            block_key
+            for block_key in block_structure.post_order_traversal(start_node=usage_key)
+            if block_key != usage_key
+        ]
+        subtree = set(descendants)
+        subtree.add(usage_key)
+        if any(
+                parent not in subtree
+                for block_key in descendants
+                for parent in block_structure.get_parents(block_key)
+        ):
+            return False
+
+        for block_key in descendants:
+            block_structure.remove_block(block_key, keep_descendants=False)
+        block_structure._block_data_map.pop(usage_key, None)
+        return True
 
     @classmethod
     def create_from_cache(cls, root_block_usage_key, block_structure_cache):
@@ -76,8 +198,9 @@ class BlockStructureFactory(object):
                 deserialized.
 
         Returns:
-            BlockStructure - The deserialized block structure starting
-            at root_block_usage_key, if found in the cache.
+            CompactBlockStructure - The deserialized, read-only block
+            structure starting at root_block_usage_key, if found in the
+            cache.
 
             NoneType - If the root_block_usage_key is not found in the cache.
         """
@@ -3,13 +3,18 @@ Top-level module for the Block Structure framework with a class for managing
 BlockStructures.
 """
 from contextlib import contextmanager
+from logging import getLogger
 
 from .cache import BlockStructureCache
+from .compact import CompactBlockStructure
 from .factory import BlockStructureFactory
 from .exceptions import UsageKeyNotInBlockStructure
 from .transformers import BlockStructureTransformers
 
 
+logger = getLogger(__name__)  # pylint: disable=invalid-name
+
+
 class BlockStructureManager(object):
     """
     Top-level class for managing Block Structures.
@@ -55,6 +60,10 @@ class BlockStructureManager(object):
                 starting at starting_block_usage_key.
         """
         block_structure = self.get_collected()
+        if isinstance(block_structure, CompactBlockStructure):
+            # Transformers modify the block structure, so they are given
+            # a mutable copy of the read-only one from the cache.
+            block_structure = block_structure.to_block_structure()
         if starting_block_usage_key:
             # Override the root_block_usage_key so traversals start at the
             # requested location.  The rest of the structure will be pruned
@@ -79,9 +88,10 @@ class BlockStructureManager(object):
         transformers data is collected if needed.
 
         Returns:
-            BlockStructureBlockData - A collected block structure,
-                starting at root_block_usage_key, with collected data
-                from each registered transformer.
+            BlockStructureBlockData or CompactBlockStructure - A collected
+                block structure, starting at root_block_usage_key, with
+                collected data from each registered transformer.  It is
+                read-only if it was found in the cache.
         """
         block_structure = BlockStructureFactory.create_from_cache(
             self.root_block_usage_key,
@@ -98,13 +108,23 @@ class BlockStructureManager(object):
                 self.block_structure_cache.add(block_structure)
         return block_structure
 
-    def update_collected(self):
+    def update_collected(self, incremental=False):
         """
         Updates the collected Block Structure for the root_block_usage_key.
 
         Details: The cache is cleared and updated by collecting transformers
         data from the modulestore.
+
+        Arguments:
+            incremental (bool) - If True, only the subtrees of blocks that
+                changed in the modulestore since the cached (or stashed)
+                Block Structure was collected are reloaded and recollected,
+                as long as all registered transformers support incremental
+                collection.  Otherwise (or if that isn't possible), the
+                entire Block Structure is recollected.
         """
+        if incremental and self._update_collected_incrementally():
+            return
         self.clear()
         self.get_collected()
 
@@ -115,6 +135,53 @@ class BlockStructureManager(object):
         """
         self.block_structure_cache.delete(self.root_block_usage_key)
 
+    def stash(self):
+        """
+        Stops serving the cached block structure associated with the given
+        root block key, but keeps it aside so that update_collected can
+        update it incrementally.
+        """
+        self.block_structure_cache.stash(self.root_block_usage_key)
+
+    def _update_collected_incrementally(self):
+        """
+        Updates the cached Block Structure by reloading and recollecting
+        only the changed subtrees of the cached Block Structure, or of the
+        stashed one if nothing was cached since it was stashed.
+
+        Returns whether the update succeeded. If not, the cache is left
+        unchanged.
+        """
+        if not BlockStructureTransformers.supports_incremental_collect():
+            return False
+
+        block_structure = BlockStructureFactory.create_from_cache(
+            self.root_block_usage_key,
+            self.block_structure_cache
+        ) or self.block_structure_cache.get_stashed(self.root_block_usage_key)
+        if block_structure is None or BlockStructureTransformers.is_collected_outdated(block_structure):
+            return False
+        block_structure = block_structure.to_block_structure()
+
+        with self._bulk_operations():
+            changed_usage_keys = BlockStructureFactory.update_from_modulestore(block_structure, self.modulestore)
+            if changed_usage_keys is None:
+                return False
+            if changed_usage_keys and not BlockStructureTransformers.collect_incremental(
+                    block_structure, changed_usage_keys
+            ):
+                return False
+            # Replace the stashed Block Structure, if any, with the updated one.
+            self.block_structure_cache.delete(self.root_block_usage_key)
+            self.block_structure_cache.add(block_structure)
+
+        logger.info(
+            "Incrementally updated BlockStructure %s for changed blocks %s.",
+            self.root_block_usage_key,
+            [unicode(usage_key) for usage_key in changed_usage_keys],
+        )
+        return True
+
     @contextmanager
     def _bulk_operations(self):
         """
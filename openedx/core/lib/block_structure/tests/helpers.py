@@ -106,7 +106,14 @@ class MockCache(object):
         """
         Deletes the given key from the cache.
         """
-        del self.map[key]
+        self.map.pop(key, None)
+
+    def delete_many(self, keys):
+        """
+        Deletes the given keys from the cache.
+        """
+        for key in keys:
+            self.delete(key)
 
 
 class MockModulestoreFactory(object):
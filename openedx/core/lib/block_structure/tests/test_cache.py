@@ -5,6 +5,7 @@ from nose.plugins.attrib import attr
 from unittest import TestCase
 
 from ..cache import BlockStructureCache
+from ..compact import CompactBlockStructure
 from .helpers import ChildrenMapTestMixin, MockCache, MockTransformer
 
 
@@ -39,7 +40,7 @@ class TestBlockStructureCache(ChildrenMapTestMixin, TestCase):
         self.assertEquals(self.mock_cache.timeout_from_last_call, 60 * 60 * 24)
 
         cached_value = self.block_structure_cache.get(self.block_structure.root_block_usage_key)
-        self.assertIsNotNone(cached_value)
+        self.assertIsInstance(cached_value, CompactBlockStructure)
         self.assert_block_structure(cached_value, self.children_map)
 
     def test_get_none(self):
@@ -0,0 +1,88 @@
+"""
+Tests for block_structure/compact.py
+"""
+import pickle
+
+import ddt
+from nose.plugins.attrib import attr
+from unittest import TestCase
+
+from ..block_structure import BlockStructureModulestoreData
+from ..compact import CompactBlockStructure
+from .helpers import ChildrenMapTestMixin, MockTransformer
+
+
+@attr('shard_2')
+@ddt.ddt
+class TestCompactBlockStructure(ChildrenMapTestMixin, TestCase):
+    """
+    Tests for CompactBlockStructure
+    """
+    def create_compact(self, children_map):
+        """
+        Returns a CompactBlockStructure, with some collected data, for
+        the given children_map.
+        """
+        block_structure = self.create_block_structure(children_map)
+        block_structure._add_transformer(MockTransformer)  # pylint: disable=protected-access
+        for block_key in range(len(children_map)):
+            block_data = block_structure._get_or_create_block(block_key)  # pylint: disable=protected-access
+            block_data.display_name = 'Block {}'.format(block_key)
+            if block_key % 2:
+                block_structure.set_transformer_block_field(block_key, MockTransformer, 'odd', block_key)
+        return block_structure, CompactBlockStructure.from_block_structure(block_structure)
+
+    @ddt.data(
+        ChildrenMapTestMixin.SIMPLE_CHILDREN_MAP,
+        ChildrenMapTestMixin.LINEAR_CHILDREN_MAP,
+        ChildrenMapTestMixin.DAG_CHILDREN_MAP,
+    )
+    def test_relations(self, children_map):
+        __, compact = self.create_compact(children_map)
+        self.assert_block_structure(compact, children_map)
+        self.assertEquals(len(compact), len(children_map))
+        self.assertNotIn(len(children_map), compact)
+        self.assertEquals(compact.get_children(len(children_map)), [])
+
+    @ddt.data(
+        ChildrenMapTestMixin.SIMPLE_CHILDREN_MAP,
+        ChildrenMapTestMixin.DAG_CHILDREN_MAP,
+    )
+    def test_traversals(self, children_map):
+        block_structure, compact = self.create_compact(children_map)
+        self.assertEquals(list(compact.topological_traversal()), list(block_structure.topological_traversal()))
+        self.assertEquals(list(compact.post_order_traversal()), list(block_structure.post_order_traversal()))
+
+    def test_block_data(self):
+        __, compact = self.create_compact(self.SIMPLE_CHILDREN_MAP)
+        self.assertEquals(compact.get_xblock_field(3, 'display_name'), 'Block 3')
+        self.assertEquals(compact.get_xblock_field(3, 'no_such_field', 'default'), 'default')
+        self.assertEquals(compact.get_transformer_block_field(3, MockTransformer, 'odd'), 3)
+        self.assertEquals(compact.get_transformer_block_field(2, MockTransformer, 'odd', 'even'), 'even')
+        self.assertEquals(compact.get_transformer_data(MockTransformer, '_version'), MockTransformer.VERSION)
+
+    def test_block_view(self):
+        __, compact = self.create_compact(self.SIMPLE_CHILDREN_MAP)
+        block = compact[3]
+        self.assertEquals(block.location, 3)
+        self.assertEquals(block.display_name, 'Block 3')
+        self.assertIsNone(getattr(block, 'no_such_field', None))
+        self.assertIsNone(compact[len(self.SIMPLE_CHILDREN_MAP)])
+
+    def test_pickle_and_round_trip(self):
+        block_structure, compact = self.create_compact(self.DAG_CHILDREN_MAP)
+        unpickled = pickle.loads(pickle.dumps(compact, pickle.HIGHEST_PROTOCOL))
+        self.assert_block_structure(unpickled, self.DAG_CHILDREN_MAP)
+
+        restored = unpickled.to_block_structure()
+        self.assertIsInstance(restored, BlockStructureModulestoreData)
+        self.assert_block_structure(restored, self.DAG_CHILDREN_MAP)
+        for block_key in range(len(self.DAG_CHILDREN_MAP)):
+            self.assertEquals(
+                restored.get_xblock_field(block_key, 'display_name'),
+                block_structure.get_xblock_field(block_key, 'display_name'),
+            )
+            self.assertEquals(
+                restored.get_transformer_block_field(block_key, MockTransformer, 'odd'),
+                block_structure.get_transformer_block_field(block_key, MockTransformer, 'odd'),
+            )
@@ -12,6 +12,16 @@ from .helpers import (
 )
 
 
+def _set_edit_info(modulestore, block_key, edited_on, subtree_edited_on):
+    """
+    Sets the edit info fields of the given mock xBlock.
+    """
+    modulestore.blocks[block_key].field_map.update(
+        edited_on=edited_on,
+        subtree_edited_on=subtree_edited_on,
+    )
+
+
 @attr('shard_2')
 class TestBlockStructureFactory(TestCase, ChildrenMapTestMixin):
     """
@@ -54,3 +64,41 @@ class TestBlockStructureFactory(TestCase, ChildrenMapTestMixin):
                 block_structure_cache=cache,
             )
         )
+
+    def _create_with_edit_info(self):
+        """
+        Returns a block structure, with collected edit info, for the
+        mock modulestore.
+        """
+        for block_key in range(len(self.children_map)):
+            _set_edit_info(self.modulestore, block_key, 1, 1)
+        block_structure = BlockStructureFactory.create_from_modulestore(
+            root_block_usage_key=0, modulestore=self.modulestore
+        )
+        block_structure._collect_requested_xblock_fields()  # pylint: disable=protected-access
+        return block_structure
+
+    def test_update_from_modulestore(self):
+        block_structure = self._create_with_edit_info()
+        self.assertEquals(BlockStructureFactory.update_from_modulestore(block_structure, self.modulestore), [])
+
+        # Edit block 1, which updates the subtree_edited_on of its ancestors.
+        _set_edit_info(self.modulestore, 1, 2, 2)
+        _set_edit_info(self.modulestore, 0, 1, 2)
+        self.assertEquals(BlockStructureFactory.update_from_modulestore(block_structure, self.modulestore), [1])
+        block_structure._collect_requested_xblock_fields()  # pylint: disable=protected-access
+        self.assert_block_structure(block_structure, self.children_map)
+        self.assertEquals(block_structure.get_xblock_field(1, 'edited_on'), 2)
+        self.assertEquals(block_structure.get_xblock_field(0, 'subtree_edited_on'), 2)
+
+    def test_update_from_modulestore_root_changed(self):
+        block_structure = self._create_with_edit_info()
+        _set_edit_info(self.modulestore, 0, 2, 2)
+        self.assertIsNone(BlockStructureFactory.update_from_modulestore(block_structure, self.modulestore))
+
+    def test_update_from_modulestore_without_edit_info(self):
+        block_structure = BlockStructureFactory.create_from_modulestore(
+            root_block_usage_key=0, modulestore=self.modulestore
+        )
+        block_structure._collect_requested_xblock_fields()  # pylint: disable=protected-access
+        self.assertIsNone(BlockStructureFactory.update_from_modulestore(block_structure, self.modulestore))
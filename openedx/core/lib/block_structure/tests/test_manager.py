@@ -1,11 +1,13 @@
 """
 Tests for manager.py
 """
+from mock import patch
 from nose.plugins.attrib import attr
 from unittest import TestCase
 
-from ..block_structure import BlockStructureBlockData
+from ..block_structure import BlockStructureBlockData, BlockStructureModulestoreData
 from ..exceptions import UsageKeyNotInBlockStructure
+from ..factory import BlockStructureFactory
 from ..manager import BlockStructureManager
 from ..transformers import BlockStructureTransformers
 from .helpers import (
@@ -166,3 +168,43 @@ class TestBlockStructureManager(TestCase, ChildrenMapTestMixin):
         self.bs_manager.clear()
         self.collect_and_verify(expect_modulestore_called=True, expect_cache_updated=True)
         self.assertEquals(TestTransformer1.collect_call_count, 2)
+
+    def test_get_transformed_cached(self):
+        self.collect_and_verify(expect_modulestore_called=True, expect_cache_updated=True)
+        with mock_registered_transformers(self.registered_transformers):
+            block_structure = self.bs_manager.get_transformed(self.transformers)
+        self.assertIsInstance(block_structure, BlockStructureModulestoreData)
+        self.assert_block_structure(block_structure, self.children_map)
+        TestTransformer1.assert_transformed(block_structure)
+
+    def test_update_collected_incremental_fallback(self):
+        self.collect_and_verify(expect_modulestore_called=True, expect_cache_updated=True)
+        # The mock xBlocks have no edit info, so all blocks are recollected.
+        with mock_registered_transformers(self.registered_transformers):
+            self.bs_manager.update_collected(incremental=True)
+        self.assertEquals(TestTransformer1.collect_call_count, 2)
+        self.collect_and_verify(expect_modulestore_called=False, expect_cache_updated=False)
+
+    def test_update_collected_incremental_unsupported(self):
+        self.collect_and_verify(expect_modulestore_called=True, expect_cache_updated=True)
+        with mock_registered_transformers(self.registered_transformers):
+            self.assertFalse(BlockStructureTransformers.supports_incremental_collect())
+            with patch.object(
+                BlockStructureFactory, 'create_from_cache', wraps=BlockStructureFactory.create_from_cache
+            ) as mock_create_from_cache:
+                self.bs_manager.update_collected(incremental=True)
+        # The cache is only read by the full recollection.
+        self.assertEquals(mock_create_from_cache.call_count, 1)
+        self.assertEquals(TestTransformer1.collect_call_count, 2)
+
+    def test_stash(self):
+        self.collect_and_verify(expect_modulestore_called=True, expect_cache_updated=True)
+        self.bs_manager.stash()
+        self.assertIsNotNone(self.bs_manager.block_structure_cache.get_stashed(0))
+
+        # The stashed block structure is no longer served.
+        self.collect_and_verify(expect_modulestore_called=True, expect_cache_updated=True)
+        self.assertEquals(TestTransformer1.collect_call_count, 2)
+
+        self.bs_manager.clear()
+        self.assertIsNone(self.bs_manager.block_structure_cache.get_stashed(0))
@@ -78,6 +78,38 @@ class BlockStructureTransformer(object):
         """
         pass
 
+    @classmethod
+    def collect_incremental(cls, block_structure, changed_usage_keys):  # pylint: disable=unused-argument
+        """
+        Updates the transformer's previously collected data in the
+        block_structure after the subtrees rooted at changed_usage_keys
+        were reloaded from the modulestore.
+
+        Only the xBlocks within the reloaded subtrees are available
+        through block_structure.get_xblock.  Data collected for all
+        other blocks (including the ancestors of the reloaded subtrees)
+        is still present in the block_structure and may be read.
+
+        Transformers whose collected data for a block depends only on
+        the block itself and its ancestors can usually patch their data
+        by redoing their collect traversal starting at each of the
+        changed_usage_keys.  Transformers whose data depends on
+        descendants or siblings (e.g., counts or aggregates) generally
+        cannot, and should keep the default implementation.
+
+        Arguments:
+            block_structure (BlockStructureModulestoreData) - A mutable
+                block structure with previously collected data.
+
+            changed_usage_keys (list(UsageKey)) - The usage keys of the
+                roots of the subtrees that were reloaded.
+
+        Returns:
+            bool - True if the transformer's collected data was
+                updated, False if a full collect is needed instead.
+        """
+        return False
+
     @abstractmethod
     def transform(self, usage_info, block_structure):
         """
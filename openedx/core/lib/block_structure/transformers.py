@@ -5,7 +5,7 @@ import functools
 from logging import getLogger
 
 from .exceptions import TransformerException
-from .transformer import FilteringTransformerMixin
+from .transformer import BlockStructureTransformer, FilteringTransformerMixin
 from .transformer_registry import TransformerRegistry
 
 
@@ -82,6 +82,46 @@ class BlockStructureTransformers(object):
         # Collect all fields that were requested by the transformers.
         block_structure._collect_requested_xblock_fields()  # pylint: disable=protected-access
 
+    @classmethod
+    def supports_incremental_collect(cls):
+        """
+        Returns whether every registered transformer implements
+        collect_incremental, so that an incremental update is possible.
+        """
+        unsupported_transformers = [
+            transformer.name()
+            for transformer in TransformerRegistry.get_registered_transformers()
+            if transformer.collect_incremental.__func__ is BlockStructureTransformer.collect_incremental.__func__
+        ]
+        if unsupported_transformers:
+            logger.info(
+                "The following transformers do not support incremental collection of Block Structure data: '%s'.",
+                unsupported_transformers,
+            )
+        return not unsupported_transformers
+
+    @classmethod
+    def collect_incremental(cls, block_structure, changed_usage_keys):
+        """
+        Updates the collected data of each registered transformer for
+        the reloaded subtrees rooted at changed_usage_keys.
+
+        Returns whether all transformers were able to update their data.
+        If False is returned, the block structure must be fully
+        recollected.
+        """
+        for transformer in TransformerRegistry.get_registered_transformers():
+            if not transformer.collect_incremental(block_structure, changed_usage_keys):
+                logger.info(
+                    "Transformer '%s' does not support incremental collection of Block Structure data.",
+                    transformer.name(),
+                )
+                return False
+
+        # Collect all fields that were requested by the transformers.
+        block_structure._collect_requested_xblock_fields()  # pylint: disable=protected-access
+        return True
+
     @classmethod
     def is_collected_outdated(cls, block_structure):
         """